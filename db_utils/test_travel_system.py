@@ -8,7 +8,6 @@ import logging
 import sys
 import os
 import time
-import random
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                            QHBoxLayout, QLabel, QPushButton, QComboBox, 
                            QTableWidget, QTableWidgetItem, QTabWidget, 
@@ -32,7 +31,7 @@ logger = logging.getLogger("YakTaa.TestTravelSystem")
 from yaktaa.game import Game
 from yaktaa.world.world_manager import WorldManager
 from yaktaa.world.travel import TravelSystem, CityManager, Building, BuildingType, TravelMethod, WeatherCondition
-from yaktaa.world.building_generator import BuildingGenerator, populate_location_with_buildings
+from yaktaa.world.building_generator import BuildingGenerator
 
 class TravelTestWindow(QMainWindow):
     """
@@ -49,12 +48,10 @@ class TravelTestWindow(QMainWindow):
         self.world_manager = WorldManager(self.game)
         
         # Initialiser le système de déplacement et le gestionnaire de villes
+        # (les bâtiments d'un lieu sont générés à sa première consultation)
         self.city_manager = CityManager(self.world_manager.world_map)
         self.travel_system = TravelSystem(self.world_manager.world_map)
         
-        # Générer des bâtiments pour les lieux existants
-        self._generate_buildings()
-        
         # Créer l'interface utilisateur
         self._create_ui()
         
@@ -68,22 +65,6 @@ class TravelTestWindow(QMainWindow):
         
         logger.info("Fenêtre de test du système de déplacement initialisée")
     
-    def _generate_buildings(self):
-        """Génère des bâtiments pour les lieux existants"""
-        # Générer des bâtiments pour les lieux principaux
-        for location_id in self.world_manager.world_map.locations:
-            location = self.world_manager.world_map.get_location(location_id)
-            if not location.parent_location_id:  # Lieu principal (ville)
-                # Générer entre 5 et 15 bâtiments
-                num_buildings = random.randint(5, 15)
-                populate_location_with_buildings(self.city_manager, location_id, num_buildings)
-            elif location.parent_location_id:  # District
-                # Générer entre 3 et 8 bâtiments
-                num_buildings = random.randint(3, 8)
-                populate_location_with_buildings(self.city_manager, location_id, num_buildings)
-        
-        logger.info(f"Bâtiments générés pour {len(self.city_manager.buildings)} lieux")
-    
     def _create_ui(self):
         """Crée l'interface utilisateur"""
         # Widget central
@@ -0,0 +1,188 @@
+"""
+Script de test pour vérifier le stockage CSR des connexions
+Ce script modifie au hasard les connexions d'une carte en tenant à jour un modèle
+de référence (dictionnaires), puis vérifie le compactage des lignes modifiées,
+la suppression de lieux, le journal des modifications, et que la carte se lit
+de la même façon avant et après compact(), après pickle et après to_dict/from_dict.
+"""
+
+import os
+import sys
+import pickle
+import random
+import logging
+
+# Configuration du logging
+logging.basicConfig(level=logging.WARNING,
+                   format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("TestConnectionStore")
+
+# Ajouter le répertoire parent au path pour pouvoir importer les modules du jeu
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from yaktaa.world.connection_store import CHANGE_LOG_SIZE, ConnectionStore
+from yaktaa.world.locations import Location, WorldMap
+
+TRAVEL_TYPES = ["standard", "train", "metro"]
+
+
+def _random_info(rng: random.Random) -> dict:
+    """Informations d'une connexion tirées au hasard"""
+    return {
+        "travel_type": rng.choice(TRAVEL_TYPES),
+        "travel_time": rng.choice([0.5, 1.0, 2.25]),
+        "travel_cost": rng.randint(0, 9),
+        "requires_hacking": rng.random() < 0.1,
+        "requires_special_access": rng.random() < 0.1
+    }
+
+
+def _snapshot(world_map: WorldMap) -> dict:
+    """Lecture complète de la carte: lieux connectés (dans l'ordre) et sauvegarde"""
+    return {
+        "connected": {loc_id: [loc.id for loc in world_map.get_connected_locations(loc_id)]
+                      for loc_id in world_map.locations},
+        "info": {loc_id: loc.connection_info for loc_id, loc in world_map.locations.items()},
+        "to_dict": world_map.to_dict()
+    }
+
+
+def _check_against_model(world_map: WorldMap, model: dict) -> None:
+    """Compare la carte au modèle de référence {départ: {arrivée: informations}}"""
+    assert set(world_map.locations) == set(model), "Lieux différents du modèle"
+    for loc_id, expected in model.items():
+        location = world_map.locations[loc_id]
+        assert location.connection_info == expected, f"Connexions de {loc_id}: {location.connection_info} != {expected}"
+        assert {loc.id for loc in world_map.get_connected_locations(loc_id)} == set(expected)
+    assert len(world_map.connection_store) == sum(len(row) for row in model.values())
+
+
+def _random_world(seed: int, steps: int = 3000):
+    """
+    Construit une carte par modifications aléatoires (ajouts, suppressions de
+    connexions et de lieux), en tenant à jour un modèle de référence
+
+    Returns:
+        Tuple (carte, modèle)
+    """
+    rng = random.Random(seed)
+    world_map = WorldMap()
+    model = {}
+    for i in range(60):
+        loc_id = f"loc{i}"
+        world_map.add_location(Location(loc_id, loc_id, "", coordinates=(rng.random(), rng.random())))
+        model[loc_id] = {}
+
+    for step in range(steps):
+        source, destination = rng.sample(sorted(model), 2)
+        roll = rng.random()
+        if roll < 0.5:
+            info = _random_info(rng)
+            world_map.add_connection(source, destination, bidirectional=False, **info)
+            model[source][destination] = info
+        elif roll < 0.65:
+            # Modification directe d'un lieu, sans passer par la carte
+            info = _random_info(rng)
+            world_map.locations[source].add_connection(destination, **info)
+            model[source][destination] = info
+        elif roll < 0.95:
+            world_map.locations[source].remove_connection(destination)
+            model[source].pop(destination, None)
+        else:
+            world_map.remove_location(source)
+            del model[source]
+            for row in model.values():
+                row.pop(source, None)
+            new_id = f"new{step}"
+            world_map.add_location(Location(new_id, new_id, "", coordinates=(rng.random(), rng.random())))
+            model[new_id] = {}
+
+    return world_map, model
+
+
+def test_compact_and_round_trips():
+    """
+    Vérifie que compact() fusionne les lignes modifiées sans rien changer à la lecture
+    de la carte, et que pickle et to_dict/from_dict conservent les connexions
+    """
+    world_map, model = _random_world(seed=1)
+    store = world_map.connection_store
+    _check_against_model(world_map, model)
+    assert store._dirty_rows, "Aucune ligne modifiée à compacter"
+
+    before = _snapshot(world_map)
+    store.compact()
+    assert not store._dirty_rows, "Lignes modifiées restantes après compact()"
+    assert None not in store.location_ids, "Lieux supprimés restants après compact()"
+    assert len(store.indptr) == len(store.location_ids) + 1
+    assert _snapshot(world_map) == before, "Lecture différente après compact()"
+    _check_against_model(world_map, model)
+
+    # Nouvelles modifications sur les tableaux compactés, puis pickle (qui compacte)
+    source, destination = sorted(model)[:2]
+    world_map.locations[source].add_connection(destination, travel_time=3.0)
+    model[source][destination] = {"travel_type": "standard", "travel_time": 3.0, "travel_cost": 0,
+                             "requires_hacking": False, "requires_special_access": False}
+    before = _snapshot(world_map)
+    restored = pickle.loads(pickle.dumps(world_map))
+    assert _snapshot(restored) == before, "Lecture différente après pickle"
+    assert restored.locations[source]._connection_store is restored.connection_store
+    _check_against_model(restored, model)
+
+    # Sauvegarde en dictionnaire: ordre canonique, identique après un aller-retour
+    saved = world_map.to_dict()
+    reloaded = WorldMap.from_dict(saved)
+    assert saved["connections"] == sorted(saved["connections"], key=lambda c: (c[0], c[1]))
+    assert reloaded.to_dict() == saved, "Sauvegarde différente après to_dict/from_dict"
+    _check_against_model(reloaded, model)
+
+
+def test_remove_node():
+    """Vérifie que la suppression d'un lieu retire ses connexions entrantes et sortantes"""
+    store = ConnectionStore()
+    store.set_edge("a", "b")
+    store.set_edge("b", "c", travel_time=2.0)
+    store.set_edge("c", "a")
+    store.compact()
+    store.set_edge("c", "b")
+
+    store.remove_node("b")
+    assert store.location_ids == ["a", "c"], store.location_ids
+    assert list(store.iter_edges()) == [("c", "a", store.get_edge("c", "a"))]
+    assert len(store) == 1
+    assert not store.has_edge("a", "b") and store.get_edge("b", "c") is None
+    assert store.destinations("b") == []
+
+
+def test_change_log():
+    """Vérifie le journal des modifications et son dépassement"""
+    store = ConnectionStore()
+    store.set_edge("a", "b")
+    revision = store.revision
+    assert store.changes_since(revision) == []
+
+    store.set_edge("b", "c")
+    store.remove_edge("a", "b")
+    assert not store.remove_edge("a", "b"), "Suppression d'une connexion absente"
+    store.remove_node("c")
+    assert store.changes_since(revision) == [("b", "c"), ("a", "b"), ("c", None)]
+    assert store.changes_since(store.revision + 1) is None
+
+    # Journal dépassé: l'appelant doit tout relire
+    for i in range(CHANGE_LOG_SIZE + 1):
+        store.set_edge("a", f"x{i % 10}")
+    assert store.changes_since(revision) is None
+    assert len(store.changes_since(store.revision - 3)) == 3
+
+
+if __name__ == "__main__":
+    try:
+        test_compact_and_round_trips()
+        print("\n[SUCCES] compact(), pickle et to_dict/from_dict conservent les connexions")
+        test_remove_node()
+        print("[SUCCES] La suppression d'un lieu retire toutes ses connexions")
+        test_change_log()
+        print("[SUCCES] Le journal des modifications est complet ou signale son dépassement")
+    except AssertionError as e:
+        print(f"\n[ECHEC] {e}")
+        sys.exit(1)
@@ -0,0 +1,173 @@
+"""
+Script de test pour vérifier que les requêtes du jeu utilisent les index
+Ce script crée un petit monde avec l'éditeur, capture les requêtes SELECT
+exécutées par le WorldLoader et le ShopManager, puis vérifie avec
+EXPLAIN QUERY PLAN qu'aucune ne parcourt une table entière.
+"""
+
+import os
+import sys
+import logging
+import sqlite3
+import tempfile
+from pathlib import Path
+
+# Configuration du logging
+logging.basicConfig(level=logging.WARNING,
+                   format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("TestQueryPlans")
+
+# Ajouter le répertoire parent au path pour pouvoir importer les modules du jeu
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "yaktaa_world_editor"))
+
+from database import WorldDatabase
+from yaktaa.world import db_pool
+from yaktaa.world.world_loader import WorldLoader
+from yaktaa.items.shop_manager import ShopManager
+
+
+def _create_test_world(db_path: str) -> None:
+    """
+    Crée une base de monde minimale avec l'éditeur (et donc ses index)
+
+    Args:
+        db_path: Chemin du fichier de base de données à créer
+    """
+    db = WorldDatabase(db_path)
+    cursor = db.conn.cursor()
+
+    cursor.execute("INSERT INTO worlds (id, name, description) VALUES ('w1', 'Monde test', '')")
+    cursor.execute("""
+        INSERT INTO locations (id, world_id, name, description, coordinates, location_type, parent_location_id)
+        VALUES ('city1', 'w1', 'Neo Tokyo', '', '(0,0)', 'city', NULL),
+               ('district1', 'w1', 'Shibuya', '', '(0.1,0)', 'district', 'city1')
+    """)
+    cursor.execute("""
+        INSERT INTO connections (id, world_id, source_id, destination_id, travel_type, travel_time)
+        VALUES ('c1', 'w1', 'city1', 'district1', 'local', 0.1)
+    """)
+    cursor.execute("""
+        INSERT INTO characters (id, world_id, name, location_id)
+        VALUES ('ch1', 'w1', 'Kenji', 'city1')
+    """)
+    cursor.execute("""
+        INSERT INTO devices (id, world_id, name, location_id, device_type)
+        VALUES ('dev1', 'w1', 'Terminal', 'city1', 'pc')
+    """)
+    cursor.execute("""
+        INSERT INTO files (id, world_id, name, file_type, device_id, content)
+        VALUES ('f1', 'w1', 'notes.txt', 'txt', 'dev1', 'contenu')
+    """)
+    cursor.execute("""
+        INSERT INTO hardware_items (id, name, description, hardware_type, quality, rarity, level, price, world_id)
+        VALUES ('hardware_1', 'CPU', '', 'cpu', 'std', 'common', 1, 100, 'w1')
+    """)
+    cursor.execute("""
+        INSERT INTO shops (id, world_id, name, description, location_id, shop_type)
+        VALUES ('shop1', 'w1', 'Boutique', '', 'city1', 'general')
+    """)
+    cursor.execute("""
+        INSERT INTO shop_inventory (id, shop_id, item_type, item_id, quantity, price_modifier)
+        VALUES ('inv1', 'shop1', 'hardware', 'hardware_1', 1, 1.0)
+    """)
+
+    db.conn.commit()
+    db.close()
+
+
+def _capture_loader_queries(db_path: str) -> list:
+    """
+    Exécute les chargements du jeu et capture les requêtes SELECT émises
+
+    Args:
+        db_path: Chemin de la base de données de test
+
+    Returns:
+        Liste des requêtes SELECT (avec leurs paramètres déjà substitués)
+    """
+    queries = []
+
+    def trace(statement):
+        if statement.lstrip().upper().startswith("SELECT") and "sqlite_master" not in statement:
+            queries.append(statement)
+
+    # Les connexions du pool sont ouvertes via sqlite3.connect: on y branche la trace
+    original_connect = db_pool.sqlite3.connect
+
+    def traced_connect(*args, **kwargs):
+        conn = original_connect(*args, **kwargs)
+        conn.set_trace_callback(trace)
+        return conn
+
+    db_pool.sqlite3.connect = traced_connect
+    try:
+        world_loader = WorldLoader()
+        world_loader.db_path = Path(db_path)
+
+        world_loader.get_available_worlds()
+        world_loader.load_world("w1")
+
+        shop_manager = ShopManager(world_loader)
+        shop_manager.load_shops_for_world("w1")
+        shop_manager.get_shops_by_type("general")
+        shop_manager.get_city_id_from_location("district1")
+
+        shop_manager.shops = {}
+        shop_manager.get_shop("shop1")
+        shop_manager.get_shops_by_location("city1")
+    finally:
+        db_pool.sqlite3.connect = original_connect
+        db_pool.close_all_pools()
+
+    return queries
+
+
+def _reads_whole_table_by_design(query: str) -> bool:
+    """
+    Indique si une requête lit volontairement toute une table
+    (liste sans filtre, ou recherche de sous-chaîne que nul index ne sert)
+    """
+    normalized = " ".join(query.upper().split())
+    return " WHERE " not in normalized or "LIKE '%" in normalized
+
+
+def test_query_plans():
+    """
+    Vérifie qu'aucune requête filtrée du WorldLoader et du ShopManager
+    ne provoque de parcours complet de table
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "worlds.db")
+        _create_test_world(db_path)
+        queries = _capture_loader_queries(db_path)
+
+        assert queries, "Aucune requête capturée"
+
+        full_scans = []
+        conn = sqlite3.connect(db_path)
+        try:
+            for query in dict.fromkeys(queries):
+                if _reads_whole_table_by_design(query):
+                    continue
+
+                for row in conn.execute(f"EXPLAIN QUERY PLAN {query}"):
+                    detail = row[-1]
+                    if detail.startswith("SCAN ") and " USING " not in detail:
+                        full_scans.append((" ".join(query.split()), detail))
+        finally:
+            conn.close()
+
+    for query, detail in full_scans:
+        logger.error(f"Parcours complet: {detail} <- {query}")
+
+    assert not full_scans, f"{len(full_scans)} requêtes parcourent une table entière"
+
+
+if __name__ == "__main__":
+    try:
+        test_query_plans()
+        print("\n[SUCCES] Toutes les requêtes filtrées utilisent un index")
+    except AssertionError as e:
+        print(f"\n[ECHEC] {e}")
+        sys.exit(1)
@@ -0,0 +1,148 @@
+"""
+Script de test pour vérifier la sauvegarde et le chargement d'une partie
+Ce script crée un petit monde avec l'éditeur, joue quelques actions (voyage,
+attente, crédits, mission), sauvegarde la partie puis la recharge, dans une
+nouvelle session et dans la même session, et compare la progression restaurée.
+"""
+
+import os
+import sys
+import logging
+import tempfile
+from pathlib import Path
+
+# Configuration du logging
+logging.basicConfig(level=logging.WARNING,
+                   format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("TestSaveLoad")
+
+# Ajouter le répertoire parent au path pour pouvoir importer les modules du jeu
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "yaktaa_world_editor"))
+
+from database import WorldDatabase
+from yaktaa.core.game import Game
+from yaktaa.core.save_manager import SaveManager
+from yaktaa.world import db_pool
+
+
+def _create_test_world(db_path: str) -> None:
+    """
+    Crée une base de monde minimale avec l'éditeur: trois villes reliées entre elles
+
+    Args:
+        db_path: Chemin du fichier de base de données à créer
+    """
+    db = WorldDatabase(db_path)
+    cursor = db.conn.cursor()
+
+    cursor.execute("INSERT INTO worlds (id, name, description) VALUES ('w1', 'Monde test', '')")
+    cursor.execute("""
+        INSERT INTO locations (id, world_id, name, description, coordinates, location_type, parent_location_id)
+        VALUES ('city1', 'w1', 'Neo Tokyo', '', '(0,0)', 'city', NULL),
+               ('city2', 'w1', 'Night City', '', '(1,0)', 'city', NULL),
+               ('city3', 'w1', 'Neo Seoul', '', '(0,1)', 'city', NULL)
+    """)
+    cursor.execute("""
+        INSERT INTO connections (id, world_id, source_id, destination_id, travel_type, travel_time)
+        VALUES ('c1', 'w1', 'city1', 'city2', 'train', 2.0),
+               ('c2', 'w1', 'city2', 'city3', 'train', 3.0),
+               ('c3', 'w1', 'city1', 'city3', 'train', 4.0)
+    """)
+
+    db.conn.commit()
+    db.close()
+
+
+def _create_game(db_path: str, save_dir: str) -> Game:
+    """
+    Crée une instance du jeu qui lit le monde de test et sauvegarde dans un dossier temporaire
+
+    Args:
+        db_path: Chemin de la base de données de test
+        save_dir: Dossier des sauvegardes
+    """
+    game = Game()
+    game.save_manager = SaveManager(save_dir)
+    game.world_loader.db_path = Path(db_path)
+    game.world_loader.snapshots = None
+    game.world_loader.overlay_path = Path(save_dir) / "shop_state.db"
+    return game
+
+
+def _progress(game: Game) -> dict:
+    """Progression du joueur comparée entre la partie sauvegardée et la partie chargée"""
+    world_manager = game.world_manager
+    mission_manager = game.mission_manager
+    return {
+        "world_id": game.world_id,
+        "name": game.player.name,
+        "credits": game.player.credits,
+        "level": game.player.level,
+        "experience": game.player.experience,
+        "programming": game.player.skills["programming"].__dict__.copy(),
+        "current_location_id": world_manager.current_location_id,
+        "visited_locations": set(world_manager.visited_locations),
+        "discovered_locations": set(world_manager.discovered_locations),
+        "missions": mission_manager.to_save_data(),
+        "game_time": round(game.game_time)
+    }
+
+
+def test_save_then_load():
+    """
+    Vérifie qu'une partie sauvegardée se recharge avec la même progression
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "worlds.db")
+        _create_test_world(db_path)
+
+        try:
+            game = _create_game(db_path, tmp_dir)
+            assert game.new_game("Neo"), "Échec de la création de la partie"
+
+            # Quelques actions de jeu
+            world_manager = game.world_manager
+            destination = sorted(world_manager.get_current_location().connections)[0]
+            assert world_manager.travel_to(destination), f"Échec du voyage vers {destination}"
+            world_manager.wait(5)
+            game.player.add_credits(1234)
+            game.player.add_experience(300)
+            game.player.improve_skill("programming", 50)
+            mission_id = next(iter(game.mission_manager.available_missions))
+            game.mission_manager.start_mission(mission_id)
+
+            expected = _progress(game)
+            assert game.save_game("test_save"), "Échec de la sauvegarde"
+
+            # Nouvelle session
+            progress_steps = []
+            loaded = _create_game(db_path, tmp_dir)
+            assert loaded.load_game("test_save", lambda percent, message: progress_steps.append(percent)), \
+                "Échec du chargement dans une nouvelle session"
+            assert loaded.running, "Le jeu n'a pas démarré après le chargement"
+            assert progress_steps == sorted(progress_steps) and progress_steps[-1] == 100, \
+                f"Avancement incohérent: {progress_steps}"
+            assert _progress(loaded) == expected, "Progression différente après chargement (nouvelle session)"
+            assert mission_id in loaded.mission_manager.active_missions
+
+            # Même session, après une autre partie: le monde chargé est réutilisé
+            assert game.new_game("Autre")
+            world_map = game.world_manager.world_map
+            assert game.load_game("test_save"), "Échec du chargement dans la même session"
+            assert game.world_manager.world_map is world_map, "Le monde a été rechargé"
+            assert _progress(game) == expected, "Progression différente après chargement (même session)"
+
+            # Sauvegarde inexistante
+            assert not game.load_game("inexistante")
+        finally:
+            db_pool.close_all_pools()
+
+
+if __name__ == "__main__":
+    try:
+        test_save_then_load()
+        print("\n[SUCCES] La partie sauvegardée se recharge avec la même progression")
+    except AssertionError as e:
+        print(f"\n[ECHEC] {e}")
+        sys.exit(1)
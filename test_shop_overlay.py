@@ -0,0 +1,115 @@
+"""
+Script de test pour vérifier les ajouts d'articles aux boutiques
+Ce script crée un petit monde avec l'éditeur, ajoute un article à une boutique
+avec et sans chargement différé des inventaires, puis vérifie que l'article
+n'apparaît qu'une fois et que les deux modes donnent le même inventaire.
+"""
+
+import os
+import sys
+import logging
+import tempfile
+from pathlib import Path
+
+# Configuration du logging
+logging.basicConfig(level=logging.WARNING,
+                   format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("TestShopOverlay")
+
+# Ajouter le répertoire parent au path pour pouvoir importer les modules du jeu
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "yaktaa_world_editor"))
+
+from database import WorldDatabase
+from yaktaa.world import db_pool
+from yaktaa.world.world_loader import WorldLoader
+from yaktaa.items.shop_manager import ShopManager
+
+
+class TestItem:
+    """Article minimal ajouté aux boutiques"""
+    id = "x1"
+    name = "Article test"
+    item_type = "hardware"
+
+
+def _create_test_world(db_path: str) -> None:
+    """
+    Crée une base de monde minimale avec une boutique et un article en stock
+
+    Args:
+        db_path: Chemin du fichier de base de données à créer
+    """
+    db = WorldDatabase(db_path)
+    cursor = db.conn.cursor()
+
+    cursor.execute("INSERT INTO worlds (id, name, description) VALUES ('w1', 'Monde test', '')")
+    cursor.execute("""
+        INSERT INTO locations (id, world_id, name, description, coordinates, location_type, parent_location_id)
+        VALUES ('city1', 'w1', 'Neo Tokyo', '', '(0,0)', 'city', NULL)
+    """)
+    cursor.execute("""
+        INSERT INTO hardware_items (id, name, description, hardware_type, quality, rarity, level, price, world_id)
+        VALUES ('hardware_1', 'CPU', '', 'cpu', 'std', 'common', 1, 100, 'w1')
+    """)
+    cursor.execute("""
+        INSERT INTO shops (id, world_id, name, description, location_id, shop_type)
+        VALUES ('shop1', 'w1', 'Boutique', '', 'city1', 'general')
+    """)
+    cursor.execute("""
+        INSERT INTO shop_inventory (id, shop_id, item_type, item_id, quantity, price_modifier)
+        VALUES ('inv1', 'shop1', 'hardware', 'hardware_1', 1, 1.0)
+    """)
+
+    db.conn.commit()
+    db.close()
+
+
+def _shop_inventory_after_add(db_path: str, lazy: bool) -> list:
+    """
+    Ajoute un article à une boutique et renvoie son inventaire en mémoire
+
+    Args:
+        db_path: Chemin de la base de données de test
+        lazy: Mode de chargement différé des inventaires
+
+    Returns:
+        Liste de tuples (ID de l'article, prix, quantité)
+    """
+    world_loader = WorldLoader()
+    world_loader.db_path = Path(db_path)
+    try:
+        shop_manager = ShopManager(world_loader, lazy_inventories=lazy)
+        shop_manager.load_shops_for_world("w1")
+        assert shop_manager.add_item_to_shop("shop1", TestItem(), 30), "Ajout de l'article refusé"
+        return [(entry.item.id, entry.price, entry.quantity)
+                for entry in shop_manager.get_shop("shop1").inventory]
+    finally:
+        db_pool.close_all_pools()
+
+
+def test_lazy_shop_add():
+    """
+    Vérifie qu'un article ajouté à une boutique différée n'apparaît qu'une fois,
+    comme en mode immédiat
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        eager_path = os.path.join(tmp_dir, "eager.db")
+        lazy_path = os.path.join(tmp_dir, "lazy.db")
+        _create_test_world(eager_path)
+        _create_test_world(lazy_path)
+
+        eager = _shop_inventory_after_add(eager_path, lazy=False)
+        lazy = _shop_inventory_after_add(lazy_path, lazy=True)
+
+    assert [entry for entry in lazy if entry[0] == "x1"] == [("x1", 30, 1)], f"Inventaire différé: {lazy}"
+    assert sorted(lazy) == sorted(eager), f"Inventaires différents: {lazy} != {eager}"
+
+
+if __name__ == "__main__":
+    try:
+        test_lazy_shop_add()
+        print("\n[SUCCES] Un article ajouté à une boutique différée n'apparaît qu'une fois")
+    except AssertionError as e:
+        print(f"\n[ECHEC] {e}")
+        sys.exit(1)
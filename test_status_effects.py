@@ -0,0 +1,273 @@
+"""
+Script de test pour vérifier la planification des effets de statut
+Ce script vérifie l'ordre d'expiration des effets (tas des expirations), leur
+prolongation, leur suppression avant échéance et le cumul des dégâts sur la durée,
+puis compare le système à un décompte naïf des durées sur des séquences aléatoires.
+"""
+
+import os
+import sys
+import random
+import logging
+
+# Configuration du logging
+logging.basicConfig(level=logging.WARNING,
+                   format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("TestStatusEffects")
+
+# Ajouter le répertoire parent au path pour pouvoir importer les modules du jeu
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from yaktaa.characters.player import Player
+from yaktaa.combat.advanced.status_effects import StatusEffectSystem, StatusEffectType
+from yaktaa.combat.engine import CombatEngine
+from yaktaa.combat.enemy import generate_random_enemy
+
+
+class TestTarget:
+    """Cible minimale d'un effet de statut"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.health = 1000
+        self.max_health = 1000
+
+
+class TestWeapon:
+    """Arme minimale pour Player.calculate_weapon_damage"""
+
+    def __init__(self, damage: int):
+        self.name = "Arme de test"
+        self.damage = damage
+        self.damage_type = "PHYSICAL"
+        self.critical_chance = 0.0
+        self.special_effects = []
+
+
+def _expirations(system: StatusEffectSystem, target: TestTarget, turns: int) -> list:
+    """Effets expirés à chacun des prochains tours"""
+    return [system.update_effects(target)["effects_expired"] for _ in range(turns)]
+
+
+def test_expiry_order():
+    """
+    Vérifie que chaque effet expire au tour prévu par sa durée
+    """
+    system = StatusEffectSystem()
+    target = TestTarget("cible")
+
+    system.apply_effect(target, "slowed")       # 2 tours
+    system.apply_effect(target, "bleeding")     # 3 tours
+    system.apply_effect(target, "stunned")      # 1 tour
+    system.apply_effect(target, "vulnerable")   # 3 tours
+
+    assert not system.can_act(target)
+    expired = _expirations(system, target, 4)
+    assert expired[0] == ["stunned"], expired
+    assert expired[1] == ["slowed"], expired
+    assert sorted(expired[2]) == ["bleeding", "vulnerable"], expired
+    assert expired[3] == [] and system.get_active_effects(target) == []
+
+    # Modificateurs recalculés à chaque expiration
+    assert system.can_act(target)
+    assert system.get_stat_modifiers(target) == {}
+    assert system.get_damage_modifiers(target, is_attacker=False) == 1.0
+
+
+def test_extension():
+    """
+    Vérifie qu'un effet réappliqué n'est prolongé que si la nouvelle durée est plus longue
+    """
+    system = StatusEffectSystem()
+    target = TestTarget("cible")
+
+    # Effet non cumulable prolongé: l'ancienne échéance est ignorée
+    system.apply_effect(target, "stunned")
+    system.apply_effect(target, "stunned", duration_modifier=3)
+    expired = _expirations(system, target, 3)
+    assert expired == [[], [], ["stunned"]], expired
+
+    # Durée plus courte: l'échéance n'est pas avancée
+    system.apply_effect(target, "slowed", duration_modifier=2)   # 4 tours
+    system.update_effects(target)
+    system.apply_effect(target, "slowed")                         # 2 tours, soit 1 de moins que le reste
+    durations = {effect["id"]: effect["duration"] for effect in system.get_active_effects(target)}
+    assert durations == {"slowed": 3}, durations
+    expired = _expirations(system, target, 3)
+    assert expired == [[], [], ["slowed"]], expired
+
+    # Effet cumulable: cumul et prolongation
+    system.apply_effect(target, "vulnerable")
+    system.update_effects(target)
+    system.apply_effect(target, "vulnerable")
+    assert system.get_effect_stacks(target, "vulnerable") == 2
+    assert abs(system.get_damage_modifiers(target, is_attacker=False) - 1.30) < 1e-9
+    expired = _expirations(system, target, 3)
+    assert expired == [[], [], ["vulnerable"]], expired
+
+
+def test_cleanse_then_expire():
+    """
+    Vérifie qu'un effet supprimé avant son échéance n'agit plus et n'expire pas une seconde fois
+    """
+    system = StatusEffectSystem()
+    target = TestTarget("cible")
+
+    system.apply_effect(target, "poisoned")       # 4 tours
+    system.apply_effect(target, "strengthened")   # bonus, 3 tours
+    assert system.cleanse_effects(target) == 1
+    assert not system.has_effect(target, "poisoned")
+
+    result = system.update_effects(target)
+    assert result["damage"] == 0 and target.health == 1000, result
+
+    # Réappliqué au tour 1: l'ancienne échéance (tour 4) ne doit pas le retirer
+    system.apply_effect(target, "poisoned")       # expire au tour 5
+    expired = _expirations(system, target, 4)
+    assert expired == [[], ["strengthened"], [], ["poisoned"]], expired
+
+    # Suppression directe
+    system.apply_effect(target, "burning")
+    assert system.remove_effect(target, "burning")
+    assert not system.remove_effect(target, "burning")
+    result = system.update_effects(target)
+    assert result == {"damage": 0, "healing": 0, "effects_expired": []}, result
+
+
+def test_dot_stacking():
+    """
+    Vérifie le cumul d'un effet de dégâts sur la durée (la puissance cumulée est appliquée)
+    """
+    system = StatusEffectSystem()
+    target = TestTarget("cible")
+
+    system.apply_effect(target, "bleeding")
+    assert system.update_effects(target)["damage"] == 3
+
+    system.apply_effect(target, "bleeding")
+    system.apply_effect(target, "bleeding")
+    system.apply_effect(target, "bleeding")
+    assert system.get_effect_stacks(target, "bleeding") == 3
+
+    result = system.update_effects(target)
+    assert result["damage"] == 4, result   # 3 x 1,5
+    assert target.health == 1000 - 3 - 4
+
+
+def _reference_expirations(system: StatusEffectSystem, seed: int, steps: int = 300) -> bool:
+    """
+    Compare les expirations du système à un décompte naïf des durées sur une séquence aléatoire
+
+    Returns:
+        True si les expirations et les durées restantes sont identiques à chaque tour
+    """
+    rng = random.Random(seed)
+    target = TestTarget(f"cible_{seed}")
+    effect_ids = [effect_id for effect_id, definition in system.effect_definitions.items()
+                  if "applies_to" not in definition]
+    cleansed_types = (StatusEffectType.DEBUFF, StatusEffectType.DAMAGE_OVER_TIME, StatusEffectType.CONTROL)
+
+    # Modèle de référence: effet -> durée restante
+    remaining = {}
+    for _ in range(steps):
+        operation = rng.random()
+        if operation < 0.5:
+            effect_id = rng.choice(effect_ids)
+            modifier = rng.choice([0.5, 1.0, 1.5, 3.0])
+            duration = max(1, int(system.effect_definitions[effect_id].get("base_duration", 1) * modifier))
+            system.apply_effect(target, effect_id, duration_modifier=modifier)
+            remaining[effect_id] = max(remaining.get(effect_id, 0), duration)
+        elif operation < 0.6 and remaining:
+            effect_id = rng.choice(sorted(remaining))
+            system.remove_effect(target, effect_id)
+            del remaining[effect_id]
+        elif operation < 0.65:
+            system.cleanse_effects(target)
+            remaining = {effect_id: duration for effect_id, duration in remaining.items()
+                         if system.effect_definitions[effect_id].get("type") not in cleansed_types
+                         or not system.effect_definitions[effect_id].get("can_be_cleansed", True)}
+        else:
+            expired = system.update_effects(target)["effects_expired"]
+            remaining = {effect_id: duration - 1 for effect_id, duration in remaining.items()}
+            expected = sorted(effect_id for effect_id, duration in remaining.items() if duration <= 0)
+            remaining = {effect_id: duration for effect_id, duration in remaining.items() if duration > 0}
+            if sorted(expired) != expected:
+                logger.error(f"Graine {seed}: expirés {sorted(expired)}, attendus {expected}")
+                return False
+
+        durations = {effect["id"]: effect["duration"] for effect in system.get_active_effects(target)}
+        if durations != remaining:
+            logger.error(f"Graine {seed}: durées {durations}, attendues {remaining}")
+            return False
+    return True
+
+
+def test_matches_countdown():
+    """
+    Vérifie que le tas des expirations donne les mêmes résultats qu'un décompte naïf
+    """
+    system = StatusEffectSystem()
+    for seed in range(50):
+        assert _reference_expirations(system, seed), f"Expirations incorrectes (graine {seed})"
+
+
+def _attack_damage(advanced: bool, target_effect: str = None) -> tuple:
+    """
+    Joue une attaque du joueur et un changement de tour
+
+    Returns:
+        Dégâts de l'attaque et dégâts des effets de statut au changement de tour
+    """
+    random.seed(0)
+    player = Player("Testeur")
+    player.health = player.max_health = 100
+    player.active_equipment["weapon"] = TestWeapon(100)
+    enemy = generate_random_enemy(1)
+    enemy.health = enemy.max_health = 10000
+    enemy.resistance_physical = 0
+    engine = CombatEngine(player, [enemy], advanced=advanced)
+    engine.start_combat()
+    if target_effect:
+        engine.status_effect_system.apply_effect(enemy, target_effect)
+
+    health = enemy.health
+    random.seed(1)
+    engine._perform_attack(enemy)
+    attack_damage = health - enemy.health
+
+    health = enemy.health
+    engine._apply_persistent_effects()
+    return attack_damage, health - enemy.health
+
+
+def test_engine_applies_effects_when_advanced():
+    """
+    Vérifie que le moteur de combat n'applique les effets de statut qu'avec les systèmes avancés
+    """
+    basic_damage, basic_effects = _attack_damage(advanced=False)
+    assert basic_effects == 0
+
+    damage, effects = _attack_damage(advanced=True)
+    assert (damage, effects) == (basic_damage, 0), (damage, effects, basic_damage)
+
+    # Vulnérabilité de la cible: +15 % de dégâts subis
+    damage, _ = _attack_damage(advanced=True, target_effect="vulnerable")
+    assert abs(damage - basic_damage * 1.15) <= 1, (damage, basic_damage)
+
+    # Saignement: dégâts à chaque tour
+    _, effects = _attack_damage(advanced=True, target_effect="bleeding")
+    assert effects == 3, effects
+
+
+if __name__ == "__main__":
+    try:
+        test_expiry_order()
+        test_extension()
+        test_cleanse_then_expire()
+        test_dot_stacking()
+        test_matches_countdown()
+        test_engine_applies_effects_when_advanced()
+        print("\n[SUCCES] Les effets de statut expirent aux tours prévus")
+    except AssertionError as e:
+        print(f"\n[ECHEC] {e}")
+        sys.exit(1)
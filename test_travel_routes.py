@@ -0,0 +1,279 @@
+"""
+Script de test pour vérifier le planificateur d'itinéraires du TravelSystem
+Ce script construit une carte aléatoire et compare les itinéraires A* de
+plan_route à une recherche de Dijkstra simple, puis vérifie que le cache des
+itinéraires est invalidé quand les conditions (météo, congestion) évoluent.
+Il vérifie aussi que la synchronisation incrémentale de la table des routes
+(sync_routes) donne la même table qu'une reconstruction complète.
+"""
+
+import os
+import sys
+import heapq
+import random
+import logging
+
+# Configuration du logging
+logging.basicConfig(level=logging.WARNING,
+                   format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("TestTravelRoutes")
+
+# Ajouter le répertoire parent au path pour pouvoir importer les modules du jeu
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from yaktaa.world.connection_store import CHANGE_LOG_SIZE
+from yaktaa.world.locations import Location, WorldMap
+from yaktaa.world.travel import DEFAULT_ROUTE_WEIGHTS, TravelMethod, TravelRoute, TravelSystem
+
+# Tolérance de comparaison des coûts pondérés
+EPSILON = 1e-9
+
+
+def _random_world(seed: int, size: int = 120, degree: int = 3) -> WorldMap:
+    """
+    Construit une carte aléatoire: temps de trajet proportionnels à la distance
+    (à un facteur près), quelques connexions nécessitant du hacking
+
+    Args:
+        seed: Graine de la carte
+        size: Nombre de lieux
+        degree: Nombre de connexions sortantes par lieu
+    """
+    rng = random.Random(seed)
+    world_map = WorldMap()
+    for i in range(size):
+        world_map.add_location(Location(f"loc{i}", f"Lieu {i}", "",
+                                        coordinates=(rng.random() * 10, rng.random() * 10)))
+    for i in range(size):
+        source = world_map.locations[f"loc{i}"]
+        for j in rng.sample(range(size), degree):
+            if i == j:
+                continue
+            destination = world_map.locations[f"loc{j}"]
+            (x1, y1), (x2, y2) = source.coordinates, destination.coordinates
+            straight = ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
+            source.add_connection(destination.id,
+                                  travel_time=straight * rng.uniform(0.5, 2.0),
+                                  travel_cost=rng.randint(0, 50),
+                                  requires_hacking=rng.random() < 0.1)
+    return world_map
+
+
+def _dijkstra_weight(travel_system: TravelSystem, source_id: str, destination_id: str,
+                     can_hack: bool, weights: dict):
+    """Coût pondéré du meilleur itinéraire par Dijkstra simple (None si inaccessible)"""
+    best = {source_id: 0.0}
+    heap = [(0.0, source_id)]
+    while heap:
+        weight, current_id = heapq.heappop(heap)
+        if current_id == destination_id:
+            return weight
+        if weight > best[current_id]:
+            continue
+        for next_id, routes in travel_system.routes.get(current_id, {}).items():
+            usable = [travel_system._route_weight(route, weights) for route in routes
+                      if not route.is_hidden and not (route.requires_hacking and not can_hack)]
+            if not usable:
+                continue
+            candidate = weight + min(usable)
+            if candidate < best.get(next_id, float("inf")):
+                best[next_id] = candidate
+                heapq.heappush(heap, (candidate, next_id))
+    return None
+
+
+def _check_planned_route(travel_system: TravelSystem, source_id: str, destination_id: str,
+                         hacking_level: int, weights: dict) -> None:
+    """Compare un itinéraire planifié à Dijkstra et vérifie la cohérence de ses étapes"""
+    planned = travel_system.plan_route(source_id, destination_id, hacking_level, weights)
+    expected = _dijkstra_weight(travel_system, source_id, destination_id, hacking_level >= 1, weights)
+    query = f"{source_id} -> {destination_id} (hacking {hacking_level}, poids {weights})"
+
+    if expected is None:
+        assert planned is None, f"Itinéraire trouvé vers une destination inaccessible: {query}"
+        return
+    assert planned is not None, f"Aucun itinéraire trouvé: {query}"
+    assert abs(planned.weight - expected) <= EPSILON * max(1.0, expected), \
+        f"Itinéraire non optimal: {planned.weight} != {expected} pour {query}"
+
+    # Étapes enchaînées, praticables, et dont la somme des coûts donne le coût annoncé
+    location_ids = planned.location_ids
+    assert location_ids[0] == source_id and location_ids[-1] == destination_id
+    for leg, (from_id, to_id) in zip(planned.legs, zip(location_ids, location_ids[1:])):
+        assert (leg.source_id, leg.destination_id) == (from_id, to_id), f"Étapes non enchaînées: {query}"
+        assert hacking_level >= 1 or not leg.requires_hacking, f"Étape nécessitant du hacking: {query}"
+    total = sum(travel_system._route_weight(leg, weights) for leg in planned.legs)
+    assert abs(total - planned.weight) <= EPSILON * max(1.0, total), f"Coût des étapes incohérent: {query}"
+
+
+def test_plan_route_matches_dijkstra():
+    """Vérifie que plan_route trouve des itinéraires de coût minimal sur des requêtes aléatoires"""
+    rng = random.Random(7)
+    world_map = _random_world(seed=3)
+    travel_system = TravelSystem(world_map, seed=1)
+    location_ids = sorted(world_map.locations)
+
+    weight_sets = [DEFAULT_ROUTE_WEIGHTS, {"time": 1.0}, {"time": 0.2, "distance": 0.05, "cost": 0.1}]
+    for _ in range(300):
+        source_id, destination_id = rng.choice(location_ids), rng.choice(location_ids)
+        _check_planned_route(travel_system, source_id, destination_id,
+                             rng.choice([0, 1]), rng.choice(weight_sets))
+
+    # Lieux inconnus
+    assert travel_system.plan_route("inconnu", location_ids[0]) is None
+    assert travel_system.plan_route(location_ids[0], "inconnu") is None
+
+
+def test_route_cache_invalidated_on_conditions_tick():
+    """
+    Vérifie que les itinéraires sont mémorisés pendant une époque des conditions,
+    et recalculés (avec les nouvelles conditions) dès qu'elles évoluent
+    """
+    world_map = _random_world(seed=5)
+    travel_system = TravelSystem(world_map, seed=2)
+    location_ids = sorted(world_map.locations)
+
+    planned = None
+    for destination_id in location_ids[1:]:
+        planned = travel_system.plan_route(location_ids[0], destination_id)
+        if planned and len(planned.legs) >= 2:
+            break
+    assert planned and len(planned.legs) >= 2, "Aucun itinéraire en plusieurs étapes trouvé"
+    source_id, destination_id = planned.source_id, planned.destination_id
+
+    assert travel_system.plan_route(source_id, destination_id) is planned, "Itinéraire non mémorisé"
+
+    # Évolution des conditions: le cache est périmé
+    epoch = travel_system.conditions_epoch
+    travel_system.conditions.tick()
+    assert travel_system.conditions_epoch != epoch, "Époque des conditions inchangée"
+    replanned = travel_system.plan_route(source_id, destination_id)
+    assert replanned is not planned, "Itinéraire mémorisé réutilisé après une évolution des conditions"
+    assert len(travel_system._route_cache) == 1, "Cache non vidé après une évolution des conditions"
+    _check_planned_route(travel_system, source_id, destination_id, 0, DEFAULT_ROUTE_WEIGHTS)
+
+    # Congestion maximale sur la première étape: le nouvel itinéraire en tient compte
+    travel_system.conditions.set_congestion(replanned.legs[0].source_id, 1.0)
+    congested = travel_system.plan_route(source_id, destination_id)
+    assert congested is not replanned, "Itinéraire mémorisé réutilisé après un changement de congestion"
+    _check_planned_route(travel_system, source_id, destination_id, 0, DEFAULT_ROUTE_WEIGHTS)
+
+
+def _route_table(travel_system: TravelSystem) -> dict:
+    """
+    Table des routes comparable d'un TravelSystem à l'autre:
+    {(départ, arrivée): [routes]} sans les entrées vides ni le mode de transport
+    (tiré au hasard pour les trajets urbains)
+    """
+    return {
+        (source_id, destination_id): [(route.travel_time, route.travel_cost, route.distance, route.security_risk,
+                                       route.requires_hacking, route.requires_special_access)
+                                      for route in routes]
+        for source_id, destinations in travel_system.routes.items()
+        for destination_id, routes in destinations.items() if routes
+    }
+
+
+def _random_edit(world_map: WorldMap, rng: random.Random, step: int, protected: tuple = ()) -> None:
+    """Modification aléatoire des connexions (ou des lieux, sauf ceux de protected) de la carte"""
+    source_id, destination_id = rng.sample(sorted(world_map.locations), 2)
+    roll = rng.random()
+    if roll < 0.35:
+        world_map.add_connection(source_id, destination_id, travel_time=rng.uniform(0.1, 3.0),
+                                 travel_cost=rng.randint(0, 9), bidirectional=rng.random() < 0.5)
+    elif roll < 0.5:
+        # Modification directe d'un lieu, sans passer par la carte
+        world_map.locations[source_id].add_connection(destination_id, travel_time=rng.uniform(0.1, 3.0),
+                                                      requires_hacking=rng.random() < 0.2)
+    elif roll < 0.8:
+        location = world_map.locations[source_id]
+        if location.connections:
+            location.remove_connection(rng.choice(sorted(location.connections)))
+    elif roll < 0.95:
+        world_map.remove_connection(source_id, destination_id, bidirectional=rng.random() < 0.5)
+    elif source_id not in protected:
+        world_map.remove_location(source_id)
+        new_id = f"new{step}"
+        world_map.add_location(Location(new_id, new_id, "", coordinates=(rng.random() * 10, rng.random() * 10)))
+
+
+def test_sync_routes_matches_rebuild():
+    """
+    Vérifie qu'après des modifications aléatoires de la carte, la table des routes
+    synchronisée de façon incrémentale est identique à celle d'un TravelSystem neuf
+    """
+    rng = random.Random(11)
+    world_map = _random_world(seed=9, size=80)
+    travel_system = TravelSystem(world_map, seed=1)
+
+    for step in range(600):
+        _random_edit(world_map, rng, step)
+        if rng.random() < 0.3:
+            changes = world_map.connection_store.changes_since(travel_system._routes_revision)
+            assert changes is not None, "Journal dépassé pendant la synchronisation incrémentale"
+            travel_system.sync_routes()
+        if step % 100 == 99:
+            travel_system.sync_routes()
+            assert _route_table(travel_system) == _route_table(TravelSystem(world_map)), \
+                f"Table synchronisée différente d'une reconstruction (étape {step})"
+
+    travel_system.sync_routes()
+    assert _route_table(travel_system) == _route_table(TravelSystem(world_map))
+
+
+def test_sync_routes_log_overrun():
+    """
+    Vérifie la reconstruction quand le journal des modifications de la carte ne remonte
+    plus jusqu'à la dernière synchronisation: même table qu'un TravelSystem neuf,
+    routes personnalisées conservées
+    """
+    rng = random.Random(13)
+    world_map = _random_world(seed=4, size=80)
+    travel_system = TravelSystem(world_map, seed=1)
+
+    # Route personnalisée en plus de la route par défaut d'une connexion existante
+    # (entre deux lieux non connectés, elle deviendrait la route par défaut de la connexion créée)
+    source_id, destination_id = next(
+        (a, b) for a in sorted(world_map.locations) for b in sorted(world_map.locations)
+        if a != b and world_map.locations[a].has_connection(b))
+    custom = TravelRoute(source_id, destination_id, TravelMethod.DRONE, 2.0, 5, 1.0, 1)
+    assert travel_system.add_custom_route(source_id, destination_id, custom)
+
+    for step in range(CHANGE_LOG_SIZE + 200):
+        _random_edit(world_map, rng, step, protected=(source_id, destination_id))
+    assert world_map.connection_store.changes_since(travel_system._routes_revision) is None, \
+        "Le journal des modifications aurait dû être dépassé"
+
+    travel_system.sync_routes()
+    assert travel_system._routes_revision == world_map.revision
+    expected = _route_table(TravelSystem(world_map))
+    actual = _route_table(travel_system)
+    # La route personnalisée s'ajoute à la table reconstruite
+    assert any(route is custom for route in travel_system.routes.get(source_id, {}).get(destination_id, [])), \
+        "Route personnalisée perdue lors de la reconstruction"
+    custom_routes = actual.get((source_id, destination_id), [])
+    custom_routes.remove((custom.travel_time, custom.travel_cost, custom.distance, custom.security_risk,
+                          custom.requires_hacking, custom.requires_special_access))
+    if not custom_routes:
+        del actual[(source_id, destination_id)]
+    assert actual == expected, "Table reconstruite différente de celle d'un TravelSystem neuf"
+
+    # Après la reconstruction, la synchronisation redevient incrémentale
+    _random_edit(world_map, rng, -1)
+    assert world_map.connection_store.changes_since(travel_system._routes_revision) is not None
+    travel_system.sync_routes()
+
+
+if __name__ == "__main__":
+    try:
+        test_plan_route_matches_dijkstra()
+        print("\n[SUCCES] plan_route trouve les mêmes coûts que Dijkstra")
+        test_route_cache_invalidated_on_conditions_tick()
+        print("[SUCCES] Le cache des itinéraires est invalidé quand les conditions évoluent")
+        test_sync_routes_matches_rebuild()
+        print("[SUCCES] La synchronisation incrémentale des routes équivaut à une reconstruction")
+        test_sync_routes_log_overrun()
+        print("[SUCCES] Les routes sont reconstruites quand le journal des modifications est dépassé")
+    except AssertionError as e:
+        print(f"\n[ECHEC] {e}")
+        sys.exit(1)
@@ -341,28 +341,31 @@ class Character:
     def from_dict(cls, data: Dict[str, Any]) -> 'Character':
         """Crée un personnage à partir d'un dictionnaire"""
         character = cls(data["name"], data["type"])
-        character.id = data["id"]
-        character.level = data["level"]
-        character.experience = data["experience"]
-        character.credits = data["credits"]
-        character.reputation = data["reputation"]
+        character._restore_state(data)
+        return character
+    
+    def _restore_state(self, data: Dict[str, Any]) -> None:
+        """Restaure l'état commun à tous les personnages (voir to_dict)"""
+        self.id = data["id"]
+        self.level = data["level"]
+        self.experience = data["experience"]
+        self.credits = data["credits"]
+        self.reputation = data["reputation"]
         
         # Charger les attributs
-        character.attributes = {}
+        self.attributes = {}
         for attr_id, attr_data in data["attributes"].items():
-            character.attributes[attr_id] = Attribute(**attr_data)
+            self.attributes[attr_id] = Attribute(**attr_data)
         
         # Charger les compétences
-        character.skills = {}
+        self.skills = {}
         for skill_id, skill_data in data["skills"].items():
-            character.skills[skill_id] = Skill(**skill_data)
+            self.skills[skill_id] = Skill(**skill_data)
         
         # Charger les dates
         from datetime import datetime
-        character.created_at = datetime.fromisoformat(data["created_at"])
-        character.last_active = datetime.now()
-        
-        return character
+        self.created_at = datetime.fromisoformat(data["created_at"])
+        self.last_active = datetime.now()
 
 
 # Fonction pour créer un personnage de test
@@ -4,7 +4,8 @@ Ce module étend la classe Character pour créer un joueur avec des fonctionnali
 """
 
 import logging
-from typing import Dict, List, Optional, Any, Set
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Set
 from datetime import datetime
 import random
 
@@ -60,6 +61,9 @@ class Player(Character):
         # Objectifs actuels
         self.current_objectives: List[Dict[str, Any]] = []
 
+        # Statistiques effectives en cache (None: à recalculer, voir invalidate_effective_stats)
+        self._effective_stats: Optional[Mapping[str, int]] = None
+
         logger.info(f"Nouveau joueur créé : {name}")
 
     def complete_mission(self, mission_id: str, reward_xp: int, reward_credits: int) -> None:
@@ -121,6 +125,7 @@ class Player(Character):
             programming_skill.add_experience(xp_reward)
             network_skill.add_experience(xp_reward)
             crypto_skill.add_experience(xp_reward)
+            self.invalidate_effective_stats()
 
             self.systems_hacked += 1
             logger.info(f"Système {system_id} hacké avec succès. Récompense : {xp_reward} XP")
@@ -210,6 +215,7 @@ class Player(Character):
             return False
 
         self.active_equipment[slot] = item
+        self.invalidate_effective_stats()
         logger.info(f"Objet équipé dans le slot {slot} : {item}")
         return True
 
@@ -221,6 +227,7 @@ class Player(Character):
 
         item = self.active_equipment[slot]
         self.active_equipment[slot] = None
+        self.invalidate_effective_stats()
 
         if item:
             logger.info(f"Objet déséquipé du slot {slot} : {item}")
@@ -241,7 +248,52 @@ class Player(Character):
         """Vérifie si le joueur a débloqué une capacité"""
         return ability_id in self.unlocked_abilities
 
-    def get_effective_stats(self) -> Dict[str, int]:
+    def add_experience(self, amount: int) -> bool:
+        """Ajoute de l'expérience au joueur (un gain de niveau invalide les statistiques effectives)"""
+        leveled_up = super().add_experience(amount)
+        if leveled_up:
+            self.invalidate_effective_stats()
+        return leveled_up
+
+    def add_attribute(self, attribute_id: str, value: int) -> bool:
+        """Définit la valeur d'un attribut existant"""
+        modified = super().add_attribute(attribute_id, value)
+        if modified:
+            self.invalidate_effective_stats()
+        return modified
+
+    def improve_skill(self, skill_id: str, experience: int) -> bool:
+        """Améliore une compétence en ajoutant de l'expérience"""
+        improved = super().improve_skill(skill_id, experience)
+        self.invalidate_effective_stats()  # La compétence a pu être créée
+        return improved
+
+    def add_skill(self, skill: Skill) -> None:
+        """Ajoute une nouvelle compétence au joueur"""
+        super().add_skill(skill)
+        self.invalidate_effective_stats()
+
+    def invalidate_effective_stats(self) -> None:
+        """
+        Marque les statistiques effectives comme à recalculer.
+        À appeler après toute modification directe des attributs, des compétences
+        ou de l'équipement actif (les méthodes du joueur le font elles-mêmes).
+        """
+        self._effective_stats = None
+
+    def get_effective_stats(self) -> Mapping[str, int]:
+        """
+        Statistiques effectives incluant les bonus d'équipement, recalculées seulement
+        après une modification du joueur (voir invalidate_effective_stats)
+
+        Returns:
+            Vue en lecture seule des statistiques (stat -> valeur)
+        """
+        if self._effective_stats is None:
+            self._effective_stats = MappingProxyType(self._compute_effective_stats())
+        return self._effective_stats
+
+    def _compute_effective_stats(self) -> Dict[str, int]:
         """Calcule les statistiques effectives incluant les bonus d'équipement"""
         # Commencer avec les statistiques de base
         effective_stats = {
@@ -270,7 +322,8 @@ class Player(Character):
                     else:
                         effective_stats[stat] = bonus
 
-        logger.debug(f"Statistiques effectives calculées pour {self.name}: {effective_stats}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Statistiques effectives calculées pour {self.name}: {effective_stats}")
         return effective_stats
 
     def calculate_weapon_damage(self, target=None) -> Dict[str, Any]:
@@ -453,6 +506,9 @@ class Player(Character):
                     current_dodge = result["stats_modified"].get("dodge_chance", 0.0)
                     result["stats_modified"]["dodge_chance"] = max(current_dodge, effect_result["dodge_chance"])
 
+        # Les implants ont pu modifier le joueur
+        self.invalidate_effective_stats()
+
         # Journaliser les effets appliqués
         if result["active_effects"]:
             logger.debug(f"Effets d'implants appliqués: {', '.join(result['active_effects'])}")
@@ -482,7 +538,8 @@ class Player(Character):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Player':
         """Crée un joueur à partir d'un dictionnaire"""
-        player = super(Player, cls).from_dict(data)
+        player = cls(data["name"])
+        player._restore_state(data)
 
         # Charger les données spécifiques au joueur
         player.missions_completed = data.get("missions_completed", 0)
@@ -490,14 +547,38 @@ class Player(Character):
         player.systems_hacked = data.get("systems_hacked", 0)
         player.distance_traveled = data.get("distance_traveled", 0)
         player.time_played = data.get("time_played", 0)
-        player.active_equipment = data.get("active_equipment", {})
+        # Les emplacements absents du dictionnaire restent vides
+        player.active_equipment.update(data.get("active_equipment", {}))
         player.unlocked_abilities = set(data.get("unlocked_abilities", []))
         player.contacts = data.get("contacts", {})
         player.current_objectives = data.get("current_objectives", [])
         player.mission_history = data.get("mission_history", [])
+        player.invalidate_effective_stats()
 
         return player
 
+    def to_save_data(self) -> Dict[str, Any]:
+        """
+        Convertit le joueur en données de sauvegarde de partie (sérialisables en JSON)
+
+        Les objets équipés ne sont pas encore sérialisables: leurs emplacements
+        sont sauvegardés vides.
+        """
+        data = self.to_dict()
+        equipment = {}
+        for slot, item in self.active_equipment.items():
+            if item is not None and not isinstance(item, (str, int, float, dict)):
+                logger.warning(f"Objet équipé non sauvegardé (slot {slot}) : {item}")
+                item = None
+            equipment[slot] = item
+        data["active_equipment"] = equipment
+        return data
+
+    @classmethod
+    def from_save_data(cls, data: Dict[str, Any]) -> 'Player':
+        """Recrée le joueur d'une sauvegarde de partie (voir to_save_data)"""
+        return cls.from_dict(data)
+
 
 # Fonction pour créer un joueur de test
 def create_test_player() -> Player:
@@ -3,6 +3,7 @@ Module de combat avancé pour YakTaa
 Ce module étend le système de combat existant avec des fonctionnalités avancées
 """
 
+from .arena import CombatArena
 from .initiative import InitiativeSystem
 from .tactical import TacticalCombatSystem
 from .status_effects import StatusEffectSystem
@@ -15,15 +16,17 @@ from .progression import CombatProgressionSystem
 from .progression_bonuses import CombatProgressionBonuses
 from .equipment_mods import EquipmentModSystem
 from .equipment_mods_manager import EquipmentModManager
-from .armor_mods import ArmorModifications
+from .armor_mods import ArmorModsInitializer
 from .special_weapons import (
     SpecialWeaponSystem, 
     WeaponEvolutionSystem, 
     WeaponCraftingSystem,
     initialize_special_weapons
 )
+from .registries import CombatRegistry, get_combat_registry
 
 __all__ = [
+    'CombatArena',
     'InitiativeSystem',
     'TacticalCombatSystem',
     'StatusEffectSystem',
@@ -36,9 +39,11 @@ __all__ = [
     'CombatProgressionBonuses',
     'EquipmentModSystem',
     'EquipmentModManager',
-    'ArmorModifications',
+    'ArmorModsInitializer',
     'SpecialWeaponSystem',
     'WeaponEvolutionSystem',
     'WeaponCraftingSystem',
-    'initialize_special_weapons'
+    'initialize_special_weapons',
+    'CombatRegistry',
+    'get_combat_registry'
 ]
@@ -7,6 +7,8 @@ import random
 from typing import Dict, List, Any, Optional, Tuple
 from enum import Enum, auto
 
+from .arena import CombatArena
+
 logger = logging.getLogger("YakTaa.Combat.Advanced.EnemyAI")
 
 class TacticType(Enum):
@@ -25,8 +27,14 @@ class EnemyAISystem:
     Système qui gère l'intelligence artificielle des ennemis en combat
     """
     
-    def __init__(self):
-        """Initialise le système d'IA des ennemis"""
+    def __init__(self, arena: Optional[CombatArena] = None):
+        """
+        Initialise le système d'IA des ennemis
+        
+        Args:
+            arena: Grille de l'arène partagée avec les autres systèmes (créée si None)
+        """
+        self.arena = arena if arena is not None else CombatArena()
         self.enemy_tactics = {}  # Ennemi -> tactique
         self.threat_levels = {}  # Ennemi -> dict de menaces (cible -> niveau)
         self.group_tactics = {}  # Groupe -> tactique de groupe
@@ -280,8 +288,8 @@ class EnemyAISystem:
                 score += (1 - health_ratio) * 30
             elif tactic == TacticType.DEFENSIVE:
                 # Préférer les cibles proches
-                if hasattr(enemy, "position") and hasattr(target, "position"):
-                    distance = self._calculate_distance(enemy.position, target.position)
+                distance = self._distance_between(enemy, target)
+                if distance is not None:
                     score += (1 - min(1, distance / 10)) * 20
             elif tactic == TacticType.SUPPORT:
                 # Préférer les cibles qui menacent les alliés
@@ -294,8 +302,8 @@ class EnemyAISystem:
                     score += 30
             elif tactic == TacticType.RANGED:
                 # Préférer les cibles à distance
-                if hasattr(enemy, "position") and hasattr(target, "position"):
-                    distance = self._calculate_distance(enemy.position, target.position)
+                distance = self._distance_between(enemy, target)
+                if distance is not None:
                     score += min(30, distance * 3)
             
             # Les soigneurs sont généralement des cibles prioritaires
@@ -318,6 +326,14 @@ class EnemyAISystem:
         """Calcule la distance entre deux positions"""
         return ((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2) ** 0.5
     
+    def _distance_between(self, actor: Any, target: Any) -> Optional[float]:
+        """Distance entre deux combattants d'après l'arène (None si l'un n'a pas de position)"""
+        actor_position = self.arena.actor_position(actor)
+        target_position = self.arena.actor_position(target)
+        if actor_position is None or target_position is None:
+            return None
+        return self._calculate_distance(actor_position, target_position)
+    
     def _get_allies(self, enemy: Any) -> List[Any]:
         """Récupère les alliés d'un ennemi"""
         allies = []
@@ -0,0 +1,208 @@
+"""
+Grille spatiale de l'arène de combat pour YakTaa
+Ce module indexe les positions des combattants et des éléments de l'environnement
+dans une grille uniforme partagée par les systèmes tactique, d'environnement et d'IA:
+les requêtes de zone (rayon d'une zone de contrôle, d'une explosion...) ne visitent
+que les cellules proches au lieu de parcourir tous les éléments.
+"""
+
+import logging
+import math
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("YakTaa.Combat.Advanced.Arena")
+
+# Taille d'une cellule de la grille, en unités de l'arène: de l'ordre du rayon
+# des zones de contrôle et des explosions (2 à 5 unités)
+DEFAULT_ARENA_CELL_SIZE = 4
+
+# Couches de la grille
+ACTORS = "actors"                # Combattants
+INTERACTABLES = "interactables"  # Éléments interactifs (couvertures, terminaux, pièges...)
+DESTRUCTIBLES = "destructibles"  # Éléments destructibles
+
+ArenaPosition = Tuple[int, int]
+
+
+class CombatArena:
+    """
+    Grille uniforme creuse, par couche: chaque cellule occupée contient les éléments
+    qui s'y trouvent. Les positions des combattants suivis doivent être modifiées
+    par move_actor pour que l'index reste à jour.
+    """
+
+    def __init__(self, cell_size: int = DEFAULT_ARENA_CELL_SIZE):
+        """
+        Initialise une arène vide
+
+        Args:
+            cell_size: Taille d'une cellule de la grille, en unités de l'arène
+        """
+        if cell_size <= 0:
+            raise ValueError(f"Taille de cellule invalide: {cell_size}")
+        self.cell_size = cell_size
+        # Couche -> cellule -> {élément: position}
+        self._cells: Dict[str, Dict[Tuple[int, int], Dict[Hashable, ArenaPosition]]] = {}
+        # Couche -> {élément: position}
+        self._positions: Dict[str, Dict[Hashable, ArenaPosition]] = {}
+
+    def _cell(self, position: ArenaPosition) -> Tuple[int, int]:
+        """Cellule contenant une position"""
+        return math.floor(position[0] / self.cell_size), math.floor(position[1] / self.cell_size)
+
+    def count(self, layer: str) -> int:
+        """Nombre d'éléments d'une couche"""
+        return len(self._positions.get(layer, {}))
+
+    # ------------------------------------------------------------------
+    # Placement
+    # ------------------------------------------------------------------
+
+    def place(self, layer: str, key: Hashable, position: ArenaPosition) -> None:
+        """
+        Place un élément, ou le déplace s'il est déjà indexé
+
+        Args:
+            layer: Couche de l'élément
+            key: Élément (combattant) ou identifiant de l'élément
+            position: Position (x, y)
+        """
+        self.remove(layer, key)
+        position = (position[0], position[1])
+        self._positions.setdefault(layer, {})[key] = position
+        self._cells.setdefault(layer, {}).setdefault(self._cell(position), {})[key] = position
+
+    def remove(self, layer: str, key: Hashable) -> bool:
+        """
+        Retire un élément
+
+        Returns:
+            True si l'élément était indexé, False sinon
+        """
+        position = self._positions.get(layer, {}).pop(key, None)
+        if position is None:
+            return False
+        cells = self._cells[layer]
+        cell = self._cell(position)
+        cells[cell].pop(key, None)
+        if not cells[cell]:
+            del cells[cell]
+        return True
+
+    def position_of(self, layer: str, key: Hashable) -> Optional[ArenaPosition]:
+        """Position d'un élément (None s'il n'est pas indexé)"""
+        return self._positions.get(layer, {}).get(key)
+
+    def clear(self, layer: Optional[str] = None) -> None:
+        """Vide une couche (toutes les couches si None)"""
+        if layer is None:
+            self._cells = {}
+            self._positions = {}
+        else:
+            self._cells.pop(layer, None)
+            self._positions.pop(layer, None)
+
+    # ------------------------------------------------------------------
+    # Combattants
+    # ------------------------------------------------------------------
+
+    def track_actor(self, actor: Any, default: ArenaPosition = (0, 0)) -> ArenaPosition:
+        """
+        Suit un combattant à sa position actuelle (attribut position)
+
+        Args:
+            actor: Le combattant
+            default: Position utilisée si le combattant n'a pas de position
+
+        Returns:
+            Position indexée du combattant
+        """
+        position = self.position_of(ACTORS, actor)
+        if position is None:
+            position = getattr(actor, "position", None) or default
+            self.place(ACTORS, actor, position)
+        return position
+
+    def move_actor(self, actor: Any, position: ArenaPosition) -> None:
+        """
+        Déplace un combattant (attribut position et index)
+
+        Args:
+            actor: Le combattant
+            position: Nouvelle position (x, y)
+        """
+        actor.position = position
+        self.place(ACTORS, actor, position)
+
+    def actor_position(self, actor: Any) -> Optional[ArenaPosition]:
+        """Position d'un combattant: position indexée, sinon son attribut position (None si aucune)"""
+        position = self.position_of(ACTORS, actor)
+        if position is None:
+            position = getattr(actor, "position", None)
+        return position
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+
+    def _cells_in_range(self, layer: str, min_cell: Tuple[int, int],
+                        max_cell: Tuple[int, int]) -> Iterator[Dict[Hashable, ArenaPosition]]:
+        """Cellules occupées d'une couche comprises entre deux cellules (bornes incluses)"""
+        cells = self._cells.get(layer)
+        if not cells:
+            return
+        width = max_cell[0] - min_cell[0] + 1
+        height = max_cell[1] - min_cell[1] + 1
+        if width * height > len(cells):
+            # Zone plus grande que la partie occupée de la grille: parcourir les cellules occupées
+            for (cx, cy), elements in cells.items():
+                if min_cell[0] <= cx <= max_cell[0] and min_cell[1] <= cy <= max_cell[1]:
+                    yield elements
+            return
+        for cx in range(min_cell[0], max_cell[0] + 1):
+            for cy in range(min_cell[1], max_cell[1] + 1):
+                elements = cells.get((cx, cy))
+                if elements:
+                    yield elements
+
+    def at(self, layer: str, position: ArenaPosition) -> List[Hashable]:
+        """
+        Éléments situés exactement à une position
+
+        Args:
+            layer: Couche à interroger
+            position: Position (x, y)
+
+        Returns:
+            Éléments de la position, dans l'ordre de placement
+        """
+        elements = self._cells.get(layer, {}).get(self._cell(position), {})
+        return [key for key, element_position in elements.items()
+                if element_position[0] == position[0] and element_position[1] == position[1]]
+
+    def within_radius(self, layer: str, center: ArenaPosition, radius: float) -> List[Tuple[float, Hashable]]:
+        """
+        Éléments situés à une distance inférieure ou égale à un rayon
+
+        Args:
+            layer: Couche à interroger
+            center: Position du centre (x, y)
+            radius: Rayon, en unités de l'arène
+
+        Returns:
+            Couples (distance, élément), du plus proche au plus éloigné
+        """
+        if radius < 0:
+            return []
+        cx, cy = center
+        result = []
+        min_cell = self._cell((cx - radius, cy - radius))
+        max_cell = self._cell((cx + radius, cy + radius))
+        for elements in self._cells_in_range(layer, min_cell, max_cell):
+            for key, (x, y) in elements.items():
+                distance = math.hypot(x - cx, y - cy)
+                if distance <= radius:
+                    result.append((distance, key))
+        # Tri sur la distance seule: les éléments (combattants) ne sont pas comparables
+        result.sort(key=lambda item: item[0])
+        return result
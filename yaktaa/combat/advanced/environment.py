@@ -7,6 +7,8 @@ import random
 from typing import Dict, List, Any, Optional, Tuple
 from enum import Enum, auto
 
+from .arena import ACTORS, DESTRUCTIBLES, INTERACTABLES, CombatArena
+
 logger = logging.getLogger("YakTaa.Combat.Advanced.Environment")
 
 class EnvironmentType(Enum):
@@ -33,8 +35,14 @@ class CombatEnvironmentSystem:
     Système qui gère l'environnement de combat et ses interactions
     """
     
-    def __init__(self):
-        """Initialise le système d'environnement de combat"""
+    def __init__(self, arena: Optional[CombatArena] = None):
+        """
+        Initialise le système d'environnement de combat
+        
+        Args:
+            arena: Grille de l'arène partagée avec les autres systèmes (créée si None)
+        """
+        self.arena = arena if arena is not None else CombatArena()
         self.environment_type = EnvironmentType.URBAN
         self.interactables = {}  # ID -> élément interactif
         self.destructibles = {}  # ID -> élément destructible
@@ -129,6 +137,7 @@ class CombatEnvironmentSystem:
             "used": False,
             "health": properties.get("health", 100)
         }
+        self.arena.place(INTERACTABLES, interactable_id, position)
         
         logger.debug(f"Élément interactif ajouté: {interactable_id} ({interactable_type.name})")
     
@@ -151,6 +160,7 @@ class CombatEnvironmentSystem:
             "properties": properties,
             "destroyed": False
         }
+        self.arena.place(DESTRUCTIBLES, destructible_id, position)
         
         logger.debug(f"Élément destructible ajouté: {destructible_id}")
     
@@ -192,9 +202,8 @@ class CombatEnvironmentSystem:
         Returns:
             Élément interactif ou None
         """
-        for interactable_id, interactable in self.interactables.items():
-            if interactable["position"] == position:
-                return interactable
+        for interactable_id in self.arena.at(INTERACTABLES, position):
+            return self.interactables[interactable_id]
         return None
     
     def get_destructible_at_position(self, position: Tuple[int, int]) -> Optional[Dict[str, Any]]:
@@ -207,9 +216,8 @@ class CombatEnvironmentSystem:
         Returns:
             Élément destructible ou None
         """
-        for destructible_id, destructible in self.destructibles.items():
-            if destructible["position"] == position:
-                return destructible
+        for destructible_id in self.arena.at(DESTRUCTIBLES, position):
+            return self.destructibles[destructible_id]
         return None
     
     def get_terrain_modifiers_at_position(self, position: Tuple[int, int]) -> Dict[str, float]:
@@ -640,33 +648,41 @@ class CombatEnvironmentSystem:
         """
         affected_destructibles = []
         
-        # Trouver les éléments destructibles dans la zone
-        for destructible_id, destructible in self.destructibles.items():
-            # Calculer la distance
-            dest_pos = destructible["position"]
-            distance = ((dest_pos[0] - position[0]) ** 2 + (dest_pos[1] - position[1]) ** 2) ** 0.5
-            
-            # Vérifier si l'élément est dans le rayon
-            if distance <= radius:
-                # Calculer les dégâts en fonction de la distance
-                distance_factor = 1 - (distance / radius)
-                final_damage = int(damage * distance_factor)
-                
-                # Appliquer les dégâts
-                result = self.damage_destructible(destructible_id, final_damage, damage_type)
-                
-                affected_destructibles.append({
-                    "id": destructible_id,
-                    "damage": final_damage,
-                    "destroyed": result.get("destroyed", False)
-                })
+        # Trouver les éléments destructibles dans la zone (cellules proches seulement)
+        for distance, destructible_id in self.arena.within_radius(DESTRUCTIBLES, position, radius):
+            # Calculer les dégâts en fonction de la distance
+            distance_factor = 1 - (distance / radius) if radius > 0 else 1
+            final_damage = int(damage * distance_factor)
+            
+            # Appliquer les dégâts
+            result = self.damage_destructible(destructible_id, final_damage, damage_type)
+            
+            affected_destructibles.append({
+                "id": destructible_id,
+                "damage": final_damage,
+                "destroyed": result.get("destroyed", False)
+            })
         
         return {
             "success": True,
             "message": f"Dégâts environnementaux appliqués ({damage} {damage_type})",
-            "affected_destructibles": affected_destructibles
+            "affected_destructibles": affected_destructibles,
+            "affected_actors": self.get_actors_in_area(position, radius)
         }
     
+    def get_actors_in_area(self, position: Tuple[int, int], radius: int) -> List[Any]:
+        """
+        Récupère les combattants suivis dans l'arène qui se trouvent dans une zone
+        
+        Args:
+            position: Position centrale (x, y)
+            radius: Rayon de la zone
+            
+        Returns:
+            Combattants de la zone, du plus proche au plus éloigné
+        """
+        return [actor for _, actor in self.arena.within_radius(ACTORS, position, radius)]
+    
     def get_environment_modifiers(self) -> Dict[str, Any]:
         """
         Récupère les modificateurs globaux de l'environnement
@@ -681,3 +697,5 @@ class CombatEnvironmentSystem:
         self.interactables = {}
         self.destructibles = {}
         self.terrain_modifiers = {}
+        self.arena.clear(INTERACTABLES)
+        self.arena.clear(DESTRUCTIBLES)
@@ -0,0 +1,79 @@
+"""
+Registres partagés du système de combat avancé
+Les tables de définitions (effets de statut, actions spéciales, catalogue des armes
+spéciales, seuils d'évolution, composants de fabrication) ne dépendent d'aucun combat:
+elles sont construites une seule fois par processus, en lecture seule, et partagées
+par tous les moteurs de combat. Chaque combat ne crée que son état propre.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
+
+from .status_effects import StatusEffectSystem
+from .special_actions import SpecialActionSystem
+from .special_weapons import (
+    SpecialWeaponSystem,
+    WeaponEvolutionSystem,
+    WeaponCraftingSystem,
+    initialize_special_weapons
+)
+from .special_weapons.crafting import WeaponComponentType
+from .special_weapons.evolution import EvolutionTrigger
+
+logger = logging.getLogger("YakTaa.Combat.Advanced.Registries")
+
+
+@dataclass(frozen=True)
+class CombatRegistry:
+    """
+    Tables de définitions partagées par tous les combats.
+    Les tables sont des vues en lecture seule: leur contenu ne doit pas être modifié
+    (les systèmes copient ce qu'ils font évoluer, comme les instances d'armes).
+    """
+    effect_definitions: Mapping[str, Dict[str, Any]]
+    action_definitions: Mapping[str, Dict[str, Any]]
+    weapon_templates: Mapping[str, Dict[str, Any]]
+    evolution_thresholds: Mapping[EvolutionTrigger, Dict[str, int]]
+    crafting_components: Mapping[WeaponComponentType, List[Dict[str, Any]]]
+
+
+_registry: Optional[CombatRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def _build_registry() -> CombatRegistry:
+    """Construit les tables en utilisant les systèmes eux-mêmes (une seule fois)"""
+    weapon_system = SpecialWeaponSystem()
+    initialize_special_weapons(weapon_system)
+    evolution_system = WeaponEvolutionSystem(weapon_system)
+    crafting_system = WeaponCraftingSystem(weapon_system)
+
+    return CombatRegistry(
+        effect_definitions=MappingProxyType(StatusEffectSystem().effect_definitions),
+        action_definitions=MappingProxyType(SpecialActionSystem().action_definitions),
+        weapon_templates=MappingProxyType(dict(weapon_system.weapons_catalog)),
+        evolution_thresholds=MappingProxyType(evolution_system.evolution_thresholds),
+        crafting_components=MappingProxyType({component_type: tuple(components)
+                                              for component_type, components
+                                              in crafting_system.available_components.items()})
+    )
+
+
+def get_combat_registry() -> CombatRegistry:
+    """
+    Fournit les registres partagés du combat, construits au premier appel
+
+    Returns:
+        Registres du processus
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = _build_registry()
+                logger.info(f"Registres de combat construits: {len(_registry.weapon_templates)} armes spéciales, "
+                            f"{len(_registry.effect_definitions)} effets, {len(_registry.action_definitions)} actions")
+    return _registry
@@ -4,7 +4,7 @@ Système d'actions spéciales pour le combat dans YakTaa
 
 import logging
 import random
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Mapping
 from enum import Enum, auto
 
 logger = logging.getLogger("YakTaa.Combat.Advanced.SpecialActions")
@@ -32,11 +32,16 @@ class SpecialActionSystem:
     Système qui gère les actions spéciales en combat
     """
     
-    def __init__(self):
-        """Initialise le système d'actions spéciales"""
+    def __init__(self, action_definitions: Optional[Mapping[str, Dict[str, Any]]] = None):
+        """
+        Initialise le système d'actions spéciales
+        
+        Args:
+            action_definitions: Définitions partagées des actions (lecture seule), créées si None
+        """
         self.available_actions = {}  # Acteur -> liste d'actions disponibles
         self.cooldowns = {}          # Acteur -> dict d'actions en recharge
-        self.action_definitions = self._create_action_definitions()
+        self.action_definitions = action_definitions if action_definitions is not None else self._create_action_definitions()
         
         logger.debug("Système d'actions spéciales initialisé")
     
@@ -2,9 +2,11 @@
 Classes de base pour le système d'armes spéciales
 """
 
+import copy
 import logging
 import random
-from typing import Dict, List, Any, Optional, Tuple, Callable
+from collections import ChainMap
+from typing import Dict, List, Any, Optional, Tuple, Callable, Mapping
 from enum import Enum, auto
 
 logger = logging.getLogger("YakTaa.Combat.Advanced.SpecialWeapons")
@@ -30,9 +32,16 @@ class SpecialWeaponSystem:
     Système qui gère les armes spéciales et leurs effets
     """
     
-    def __init__(self):
-        """Initialise le système d'armes spéciales"""
-        self.weapons_catalog = {}  # ID -> arme spéciale
+    def __init__(self, shared_catalog: Optional[Mapping[str, Dict[str, Any]]] = None):
+        """
+        Initialise le système d'armes spéciales
+        
+        Args:
+            shared_catalog: Catalogue partagé (lecture seule); les armes enregistrées
+                ensuite (fabrication) ne sont ajoutées qu'à ce système
+        """
+        # ID -> arme spéciale
+        self.weapons_catalog = ChainMap({}, shared_catalog) if shared_catalog is not None else {}
         self.weapon_instances = {}  # (joueur_id, arme_id) -> infos de l'instance
         self.active_effects = {}   # ID -> effet actif
         self.evolution_progress = {}  # (joueur_id, arme_id) -> progression
@@ -144,7 +153,7 @@ class SpecialWeaponSystem:
         weapon_instance = {
             "player_id": player_id,
             "weapon_id": weapon_id,
-            "weapon_data": weapon_data.copy(),
+            "weapon_data": copy.deepcopy(weapon_data),  # Les évolutions modifient les effets de l'instance
             "current_charge": 0,
             "max_charge": weapon_data.get("max_charge", 100),
             "cooldowns": {},
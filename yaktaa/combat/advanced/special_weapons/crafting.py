@@ -4,7 +4,7 @@ Système de fabrication d'armes spéciales pour YakTaa
 
 import logging
 import random
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Mapping
 from enum import Enum, auto
 
 from .core import SpecialWeaponSystem, SpecialWeaponType, SpecialWeaponRarity
@@ -27,20 +27,27 @@ class WeaponCraftingSystem:
     Système de fabrication d'armes spéciales
     """
     
-    def __init__(self, special_weapon_system: SpecialWeaponSystem):
+    def __init__(self, special_weapon_system: SpecialWeaponSystem,
+                 shared_components: Optional[Mapping[WeaponComponentType, List[Dict[str, Any]]]] = None):
         """
         Initialise le système de fabrication d'armes
         
         Args:
             special_weapon_system: Le système d'armes spéciales à utiliser
+            shared_components: Composants de base partagés (lecture seule), créés si None
         """
         self.weapon_system = special_weapon_system
         self.available_components = {}  # Type de composant -> liste de composants
         self.crafting_recipes = {}      # Recettes pour des armes prédéfinies
         self.crafted_weapons = {}       # (joueur_id, arme_id) -> info d'arme fabriquée
         
-        # Initialiser les composants disponibles
-        self._init_available_components()
+        # Initialiser les composants disponibles (listes propres à ce système:
+        # register_component peut en ajouter sans modifier les composants partagés)
+        if shared_components is not None:
+            self.available_components = {component_type: list(components)
+                                         for component_type, components in shared_components.items()}
+        else:
+            self._init_available_components()
         
         logger.debug("Système de fabrication d'armes spéciales initialisé")
     
@@ -4,7 +4,7 @@ Système d'évolution des armes spéciales pour YakTaa
 
 import logging
 import random
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Mapping
 from enum import Enum, auto
 
 from .core import SpecialWeaponSystem, SpecialWeaponRarity
@@ -25,12 +25,14 @@ class WeaponEvolutionSystem:
     Système qui gère l'évolution des armes spéciales
     """
     
-    def __init__(self, special_weapon_system: SpecialWeaponSystem):
+    def __init__(self, special_weapon_system: SpecialWeaponSystem,
+                 evolution_thresholds: Optional[Mapping[EvolutionTrigger, Dict[str, int]]] = None):
         """
         Initialise le système d'évolution des armes
         
         Args:
             special_weapon_system: Le système d'armes spéciales à utiliser
+            evolution_thresholds: Seuils d'évolution partagés (lecture seule), créés si None
         """
         self.weapon_system = special_weapon_system
         self.evolution_thresholds = {}  # Type de déclencheur -> seuil
@@ -38,7 +40,10 @@ class WeaponEvolutionSystem:
         self.applied_evolutions = {}    # (joueur_id, arme_id) -> évolutions appliquées
         
         # Initialiser les seuils d'évolution par défaut
-        self._init_evolution_thresholds()
+        if evolution_thresholds is not None:
+            self.evolution_thresholds = evolution_thresholds
+        else:
+            self._init_evolution_thresholds()
         
         logger.debug("Système d'évolution des armes spéciales initialisé")
     
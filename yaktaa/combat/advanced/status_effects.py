@@ -2,8 +2,9 @@
 Système d'effets de statut pour le combat dans YakTaa
 """
 
+import heapq
 import logging
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Mapping
 from enum import Enum, auto
 import random
 
@@ -23,14 +24,27 @@ class StatusEffectSystem:
     Système qui gère les effets de statut pendant le combat
     """
     
-    def __init__(self):
-        """Initialise le système d'effets de statut"""
+    def __init__(self, effect_definitions: Optional[Mapping[str, Dict[str, Any]]] = None):
+        """
+        Initialise le système d'effets de statut
+        
+        Args:
+            effect_definitions: Définitions partagées des effets (lecture seule), créées si None
+        """
         self.active_effects = {}  # Acteur -> liste d'effets actifs
         self.immunities = {}      # Acteur -> liste d'immunités
         self.resistances = {}     # Acteur -> dict de résistances (type -> pourcentage)
         
+        # Ordonnancement des effets: chaque acteur a son compteur de tours (appels à update_effects)
+        # et un tas des expirations, pour ne traiter que les effets qui expirent
+        self._turns = {}             # Acteur -> nombre de tours écoulés
+        self._expirations = {}       # Acteur -> tas de (tour d'expiration, ordre, effet)
+        self._expiration_order = 0   # Départage les expirations d'un même tour
+        self._periodic_effects = {}  # Acteur -> effets appliqués à chaque tour (dégâts/soins)
+        self._modifier_cache = {}    # Acteur -> modificateurs agrégés des effets actifs
+        
         # Définir les effets de statut standard
-        self.effect_definitions = self._create_effect_definitions()
+        self.effect_definitions = effect_definitions if effect_definitions is not None else self._create_effect_definitions()
         
         logger.debug("Système d'effets de statut initialisé")
     
@@ -53,7 +67,7 @@ class StatusEffectSystem:
                 "icon": "bleeding",
                 "stackable": True,
                 "max_stacks": 3,
-                "on_stack": lambda effect: effect["damage_per_turn"] * 1.5,
+                "on_stack": lambda effect: effect["base_power"] * 1.5,
                 "can_be_cleansed": True
             },
             "burning": {
@@ -66,7 +80,7 @@ class StatusEffectSystem:
                 "icon": "burning",
                 "stackable": True,
                 "max_stacks": 2,
-                "on_stack": lambda effect: effect["damage_per_turn"] * 1.3,
+                "on_stack": lambda effect: effect["base_power"] * 1.3,
                 "can_be_cleansed": True
             },
             "poisoned": {
@@ -79,7 +93,7 @@ class StatusEffectSystem:
                 "icon": "poisoned",
                 "stackable": True,
                 "max_stacks": 3,
-                "on_stack": lambda effect: effect["damage_per_turn"] * 1.2,
+                "on_stack": lambda effect: effect["base_power"] * 1.2,
                 "can_be_cleansed": True
             },
             "electrocuted": {
@@ -294,19 +308,20 @@ class StatusEffectSystem:
                                            effect_def.get("max_stacks", 1))
             
             # Mettre à jour la durée si la nouvelle est plus longue
-            existing_effect["duration"] = max(existing_effect["duration"], final_duration)
+            self._extend_effect(target, existing_effect, final_duration)
             
             # Appliquer la fonction de cumul si elle existe
-            if "on_stack" in effect_def and callable(effect_def["on_stack"]):
+            if "on_stack" in effect_def and callable(effect_def["on_stack"]) and existing_effect.get("base_power") is not None:
                 existing_effect["power"] = effect_def["on_stack"](existing_effect)
             
+            self._modifier_cache.pop(target, None)
             logger.debug(f"Effet {effect_id} cumulé sur {getattr(target, 'name', str(target))} "
                         f"(cumuls: {existing_effect['stacks']}, durée: {existing_effect['duration']})")
             return True
         
         # Si l'effet n'est pas cumulable et qu'il est déjà actif, mettre à jour la durée
         elif existing_effect:
-            existing_effect["duration"] = max(existing_effect["duration"], final_duration)
+            self._extend_effect(target, existing_effect, final_duration)
             logger.debug(f"Durée de l'effet {effect_id} mise à jour pour {getattr(target, 'name', str(target))} "
                         f"(nouvelle durée: {existing_effect['duration']})")
             return True
@@ -329,6 +344,7 @@ class StatusEffectSystem:
                 "source": source,
                 "level": level,
                 "power": power,
+                "base_power": power,
                 "stacks": 1 if effect_def.get("stackable", False) else None,
                 "icon": effect_def.get("icon", "default_effect")
             }
@@ -340,13 +356,43 @@ class StatusEffectSystem:
                               "heal_per_turn", "applies_to", "can_be_cleansed"]:
                     new_effect[key] = value
             
-            # Ajouter l'effet à la liste
+            # Ajouter l'effet à la liste et planifier son expiration
             self.active_effects[target].append(new_effect)
+            new_effect["expires_at"] = self._turns.get(target, 0) + final_duration
+            self._schedule_expiration(target, new_effect)
+            if power is not None and new_effect["type"] in (StatusEffectType.DAMAGE_OVER_TIME,
+                                                            StatusEffectType.HEAL_OVER_TIME):
+                self._periodic_effects.setdefault(target, []).append(new_effect)
+            self._modifier_cache.pop(target, None)
             
             logger.debug(f"Effet {effect_id} appliqué à {getattr(target, 'name', str(target))} "
                         f"(durée: {final_duration}, niveau: {level})")
             return True
     
+    def _schedule_expiration(self, target: Any, effect: Dict[str, Any]) -> None:
+        """Ajoute l'expiration d'un effet au tas de sa cible"""
+        self._expiration_order += 1
+        heapq.heappush(self._expirations.setdefault(target, []),
+                       (effect["expires_at"], self._expiration_order, effect))
+    
+    def _extend_effect(self, target: Any, effect: Dict[str, Any], duration: int) -> None:
+        """Prolonge un effet actif si la nouvelle durée dépasse la durée restante"""
+        expires_at = self._turns.get(target, 0) + duration
+        if expires_at > effect["expires_at"]:
+            # L'ancienne entrée du tas est ignorée à son échéance (tour d'expiration différent)
+            effect["expires_at"] = expires_at
+            self._schedule_expiration(target, effect)
+        effect["duration"] = effect["expires_at"] - self._turns.get(target, 0)
+    
+    def _discard_effect(self, target: Any, effect: Dict[str, Any]) -> None:
+        """Retire un effet actif de sa cible (son entrée dans le tas devient caduque)"""
+        self.active_effects[target].remove(effect)
+        periodic = self._periodic_effects.get(target)
+        if periodic and effect in periodic:
+            periodic.remove(effect)
+        effect["expires_at"] = None
+        self._modifier_cache.pop(target, None)
+    
     def remove_effect(self, target: Any, effect_id: str) -> bool:
         """
         Supprime un effet de statut d'une cible
@@ -363,9 +409,9 @@ class StatusEffectSystem:
             return False
         
         # Rechercher l'effet
-        for effect in self.active_effects[target][:]:  # Copie de la liste pour éviter les problèmes de modification pendant l'itération
+        for effect in self.active_effects[target]:
             if effect["id"] == effect_id:
-                self.active_effects[target].remove(effect)
+                self._discard_effect(target, effect)
                 logger.debug(f"Effet {effect_id} supprimé de {getattr(target, 'name', str(target))}")
                 return True
         
@@ -396,7 +442,7 @@ class StatusEffectSystem:
             effect_def = self.effect_definitions.get(effect["id"], {})
             if (effect["type"] in effect_types and 
                 effect_def.get("can_be_cleansed", True)):
-                self.active_effects[target].remove(effect)
+                self._discard_effect(target, effect)
                 count += 1
         
         if count > 0:
@@ -417,14 +463,17 @@ class StatusEffectSystem:
         if target not in self.active_effects:
             return {"damage": 0, "healing": 0, "effects_expired": []}
         
+        turn = self._turns.get(target, 0) + 1
+        self._turns[target] = turn
+        
         total_damage = 0
         total_healing = 0
         effects_expired = []
         
-        # Traiter chaque effet
-        for effect in self.active_effects[target][:]:  # Copie de la liste
+        # Appliquer les effets périodiques (seuls effets à traiter à chaque tour)
+        for effect in self._periodic_effects.get(target, ()):
             # Appliquer les effets de dégâts sur la durée
-            if effect["type"] == StatusEffectType.DAMAGE_OVER_TIME and "power" in effect:
+            if effect["type"] == StatusEffectType.DAMAGE_OVER_TIME:
                 damage = effect["power"]
                 damage_type = effect.get("damage_type", "PHYSICAL")
                 
@@ -439,7 +488,7 @@ class StatusEffectSystem:
                 logger.debug(f"{effect['name']} inflige {final_damage} dégâts à {getattr(target, 'name', str(target))}")
             
             # Appliquer les effets de soins sur la durée
-            elif effect["type"] == StatusEffectType.HEAL_OVER_TIME and "power" in effect:
+            else:
                 healing = effect["power"]
                 
                 # Appliquer les soins
@@ -447,15 +496,16 @@ class StatusEffectSystem:
                 total_healing += healing
                 
                 logger.debug(f"{effect['name']} soigne {healing} PV à {getattr(target, 'name', str(target))}")
-            
-            # Réduire la durée
-            effect["duration"] -= 1
-            
-            # Supprimer les effets expirés
-            if effect["duration"] <= 0:
-                self.active_effects[target].remove(effect)
-                effects_expired.append(effect["id"])
-                logger.debug(f"Effet {effect['name']} expiré pour {getattr(target, 'name', str(target))}")
+        
+        # Supprimer les effets expirés (sommet du tas)
+        heap = self._expirations.get(target)
+        while heap and heap[0][0] <= turn:
+            expires_at, _, effect = heapq.heappop(heap)
+            if effect["expires_at"] != expires_at:
+                continue  # Effet prolongé ou déjà retiré
+            self._discard_effect(target, effect)
+            effects_expired.append(effect["id"])
+            logger.debug(f"Effet {effect['name']} expiré pour {getattr(target, 'name', str(target))}")
         
         return {
             "damage": total_damage,
@@ -473,7 +523,12 @@ class StatusEffectSystem:
         Returns:
             Liste des effets actifs
         """
-        return self.active_effects.get(target, [])
+        effects = self.active_effects.get(target, [])
+        # Durée restante, déduite du tour d'expiration
+        turn = self._turns.get(target, 0)
+        for effect in effects:
+            effect["duration"] = effect["expires_at"] - turn
+        return effects
     
     def has_effect(self, target: Any, effect_id: str) -> bool:
         """
@@ -581,6 +636,57 @@ class StatusEffectSystem:
             
         return self.resistances[target].get(effect_type, 0)
     
+    def _get_modifiers(self, target: Any) -> Dict[str, Any]:
+        """
+        Modificateurs agrégés des effets actifs d'une cible, recalculés seulement
+        après l'ajout, le retrait ou le cumul d'un effet
+        
+        Args:
+            target: La cible
+            
+        Returns:
+            Dictionnaire des modificateurs agrégés
+        """
+        modifiers = self._modifier_cache.get(target)
+        if modifiers is not None:
+            return modifiers
+        
+        modifiers = {
+            "stats": {},
+            "damage_dealt": 1.0,
+            "damage_taken": 1.0,
+            "prevents_actions": False,
+            "prevents_movement": False,
+            "action_failure_chance": 0.0,
+            "friendly_fire_chance": 0.0,
+            "crit_chance": 0.0
+        }
+        
+        for effect in self.active_effects.get(target, []):
+            # Modificateurs de stats
+            for stat, value in effect.get("stat_modifiers", {}).items():
+                modifiers["stats"][stat] = modifiers["stats"].get(stat, 0) + value
+            
+            # Modificateurs de dégâts infligés (attaquant) et subis (victime)
+            for key, modifier_key in (("damage_dealt", "damage_dealt_modifier"),
+                                      ("damage_taken", "damage_taken_modifier")):
+                if modifier_key in effect:
+                    modifier = effect[modifier_key]
+                    modifiers[key] *= modifier(effect.get("stacks") or 1) if callable(modifier) else modifier
+            
+            # Effets de contrôle
+            modifiers["prevents_actions"] = modifiers["prevents_actions"] or effect.get("prevents_actions", False)
+            modifiers["prevents_movement"] = modifiers["prevents_movement"] or effect.get("prevents_movement", False)
+            modifiers["action_failure_chance"] = max(modifiers["action_failure_chance"],
+                                                     effect.get("action_failure_chance", 0.0))
+            modifiers["friendly_fire_chance"] = max(modifiers["friendly_fire_chance"],
+                                                    effect.get("friendly_fire_chance", 0.0))
+            modifiers["crit_chance"] += effect.get("crit_chance_modifier", 0.0)
+        
+        if target in self.active_effects:
+            self._modifier_cache[target] = modifiers
+        return modifiers
+    
     def get_stat_modifiers(self, target: Any) -> Dict[str, int]:
         """
         Récupère les modificateurs de statistiques dus aux effets actifs
@@ -591,15 +697,7 @@ class StatusEffectSystem:
         Returns:
             Dictionnaire des modificateurs (stat -> valeur)
         """
-        modifiers = {}
-        
-        for effect in self.active_effects.get(target, []):
-            # Vérifier si l'effet a des modificateurs de stats
-            if "stat_modifiers" in effect:
-                for stat, value in effect["stat_modifiers"].items():
-                    modifiers[stat] = modifiers.get(stat, 0) + value
-        
-        return modifiers
+        return dict(self._get_modifiers(target)["stats"])
     
     def get_damage_modifiers(self, target: Any, is_attacker: bool = True) -> float:
         """
@@ -612,24 +710,7 @@ class StatusEffectSystem:
         Returns:
             Multiplicateur de dégâts
         """
-        modifier = 1.0
-        
-        for effect in self.active_effects.get(target, []):
-            # Modificateur pour les dégâts infligés (attaquant)
-            if is_attacker and "damage_dealt_modifier" in effect:
-                if callable(effect["damage_dealt_modifier"]):
-                    modifier *= effect["damage_dealt_modifier"](effect.get("stacks", 1))
-                else:
-                    modifier *= effect["damage_dealt_modifier"]
-            
-            # Modificateur pour les dégâts subis (victime)
-            elif not is_attacker and "damage_taken_modifier" in effect:
-                if callable(effect["damage_taken_modifier"]):
-                    modifier *= effect["damage_taken_modifier"](effect.get("stacks", 1))
-                else:
-                    modifier *= effect["damage_taken_modifier"]
-        
-        return modifier
+        return self._get_modifiers(target)["damage_dealt" if is_attacker else "damage_taken"]
     
     def can_act(self, target: Any) -> bool:
         """
@@ -641,10 +722,7 @@ class StatusEffectSystem:
         Returns:
             True si la cible peut agir, False sinon
         """
-        for effect in self.active_effects.get(target, []):
-            if effect.get("prevents_actions", False):
-                return False
-        return True
+        return not self._get_modifiers(target)["prevents_actions"]
     
     def can_move(self, target: Any) -> bool:
         """
@@ -656,10 +734,7 @@ class StatusEffectSystem:
         Returns:
             True si la cible peut se déplacer, False sinon
         """
-        for effect in self.active_effects.get(target, []):
-            if effect.get("prevents_movement", False):
-                return False
-        return True
+        return not self._get_modifiers(target)["prevents_movement"]
     
     def get_action_failure_chance(self, target: Any) -> float:
         """
@@ -671,12 +746,7 @@ class StatusEffectSystem:
         Returns:
             Chance d'échec (0.0 - 1.0)
         """
-        failure_chance = 0.0
-        
-        for effect in self.active_effects.get(target, []):
-            failure_chance = max(failure_chance, effect.get("action_failure_chance", 0.0))
-        
-        return failure_chance
+        return self._get_modifiers(target)["action_failure_chance"]
     
     def get_friendly_fire_chance(self, target: Any) -> float:
         """
@@ -688,12 +758,7 @@ class StatusEffectSystem:
         Returns:
             Chance de tir ami (0.0 - 1.0)
         """
-        friendly_fire_chance = 0.0
-        
-        for effect in self.active_effects.get(target, []):
-            friendly_fire_chance = max(friendly_fire_chance, effect.get("friendly_fire_chance", 0.0))
-        
-        return friendly_fire_chance
+        return self._get_modifiers(target)["friendly_fire_chance"]
     
     def get_critical_chance_modifier(self, target: Any) -> float:
         """
@@ -705,13 +770,12 @@ class StatusEffectSystem:
         Returns:
             Modificateur de chance de coup critique
         """
-        modifier = 0.0
-        
-        for effect in self.active_effects.get(target, []):
-            modifier += effect.get("crit_chance_modifier", 0.0)
-        
-        return modifier
+        return self._get_modifiers(target)["crit_chance"]
     
     def reset_combat_effects(self) -> None:
         """Réinitialise tous les effets de combat"""
         self.active_effects = {}
+        self._turns = {}
+        self._expirations = {}
+        self._periodic_effects = {}
+        self._modifier_cache = {}
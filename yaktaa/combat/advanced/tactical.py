@@ -7,6 +7,8 @@ import random
 from typing import Dict, List, Any, Optional, Tuple
 from enum import Enum, auto
 
+from .arena import ACTORS, CombatArena
+
 logger = logging.getLogger("YakTaa.Combat.Advanced.Tactical")
 
 class CoverType(Enum):
@@ -28,12 +30,19 @@ class TacticalCombatSystem:
     Système de combat tactique qui gère les positions, couvertures et zones de contrôle
     """
     
-    def __init__(self):
-        """Initialise le système de combat tactique"""
+    def __init__(self, arena: Optional[CombatArena] = None):
+        """
+        Initialise le système de combat tactique
+        
+        Args:
+            arena: Grille de l'arène partagée avec les autres systèmes (créée si None)
+        """
+        self.arena = arena if arena is not None else CombatArena()
         self.cover_status = {}  # Acteur -> type de couverture
         self.positions = {}     # Acteur -> position
         self.control_zones = {} # Acteur -> liste de zones contrôlées
         self.flanking = {}      # Acteur -> liste d'acteurs qu'il prend à revers
+        self._max_zone_radius = 0  # Plus grand rayon de zone (rayon des requêtes dans l'arène)
         
         logger.debug("Système de combat tactique initialisé")
     
@@ -138,6 +147,10 @@ class TacticalCombatSystem:
             "radius": radius
         })
         
+        # Les zones sont centrées sur leur contrôleur: le suivre dans l'arène
+        self.arena.track_actor(actor)
+        self._max_zone_radius = max(self._max_zone_radius, radius)
+        
         logger.debug(f"{getattr(actor, 'name', str(actor))} contrôle maintenant la zone {zone_id} (rayon: {radius})")
     
     def is_in_control_zone(self, actor: Any, target_position: Tuple[int, int]) -> List[Any]:
@@ -153,23 +166,16 @@ class TacticalCombatSystem:
         """
         controllers = []
         
-        for controller, zones in self.control_zones.items():
+        # Seuls les combattants proches de la position peuvent la contrôler
+        for distance, controller in self.arena.within_radius(ACTORS, target_position, self._max_zone_radius):
             # Ne pas compter ses propres zones
             if controller == actor:
                 continue
-                
-            # Position du contrôleur
-            controller_position = getattr(controller, "position", (0, 0))
             
-            # Vérifier chaque zone
-            for zone in zones:
-                # Calculer la distance
-                distance = self._calculate_distance(controller_position, target_position)
-                
-                # Vérifier si la position est dans la zone
-                if distance <= zone["radius"]:
-                    controllers.append(controller)
-                    break  # Un acteur ne peut contrôler qu'une fois
+            # Un acteur ne peut contrôler qu'une fois
+            zones = self.control_zones.get(controller, ())
+            if any(distance <= zone["radius"] for zone in zones):
+                controllers.append(controller)
         
         return controllers
     
@@ -278,3 +284,4 @@ class TacticalCombatSystem:
         self.positions = {}
         self.control_zones = {}
         self.flanking = {}
+        self._max_zone_radius = 0
@@ -37,16 +37,25 @@ class ActionType(Enum):
     SCAN = auto()        # Analyse des points faibles de l'ennemi
     SPECIAL = auto()     # Action spéciale
 
+# Actions proposées à l'IA pour un tour de combat simple (ennemis, combats simulés)
+AI_TURN_ACTIONS = [
+    {"id": "attack", "name": "Attaque", "category": "ATTACK"},
+    {"id": "defend", "name": "Défense", "category": "DEFENSE"}
+]
+
 class CombatEngine:
     """Moteur de gestion des combats"""
     
-    def __init__(self, player: Any, enemies: List[Any], environment: Dict[str, Any] = None):
+    def __init__(self, player: Any, enemies: List[Any], environment: Dict[str, Any] = None,
+                 advanced: bool = False):
         """Initialise un nouveau combat
         
         Args:
             player: Le joueur participant au combat
             enemies: Liste des ennemis à combattre
             environment: Propriétés de l'environnement pouvant influencer le combat
+            advanced: Active les systèmes de combat avancés (initiative, effets de statut,
+                IA tactique...); par défaut, le moteur de base est utilisé
         """
         self.player = player
         self.enemies = enemies
@@ -58,8 +67,10 @@ class CombatEngine:
         self.log_messages = []      # Historique des messages de combat
         self.active_effects = {}    # Effets de statut actifs pour chaque participant
         
-        # Initialisation des systèmes avancés
-        self._init_advanced_systems()
+        # Initialisation des systèmes avancés (sur demande uniquement)
+        self.advanced_systems_enabled = False
+        if advanced:
+            self._init_advanced_systems()
         
         # Logging
         logger.info(f"Combat initialisé entre {player.name} et {len(enemies)} ennemi(s)")
@@ -69,6 +80,7 @@ class CombatEngine:
         try:
             # Import des systèmes avancés
             from .advanced import (
+                CombatArena,
                 InitiativeSystem, 
                 TacticalCombatSystem,
                 StatusEffectSystem,
@@ -81,28 +93,38 @@ class CombatEngine:
                 SpecialWeaponSystem,
                 WeaponEvolutionSystem,
                 WeaponCraftingSystem,
-                initialize_special_weapons
+                get_combat_registry
             )
             
-            # Initialisation des systèmes
+            # Tables de définitions partagées par tous les combats (construites une seule fois)
+            registry = get_combat_registry()
+            
+            # Grille de l'arène partagée par les systèmes tactique, d'environnement et d'IA
+            self.arena = CombatArena()
+            for participant in [self.player] + self.enemies:
+                if getattr(participant, 'position', None) is not None:
+                    self.arena.track_actor(participant)
+            
+            # Initialisation des systèmes (état propre au combat)
             self.initiative_system = InitiativeSystem()
-            self.tactical_system = TacticalCombatSystem()
-            self.status_effect_system = StatusEffectSystem()
-            self.special_action_system = SpecialActionSystem()
+            self.tactical_system = TacticalCombatSystem(self.arena)
+            self.status_effect_system = StatusEffectSystem(registry.effect_definitions)
+            self.special_action_system = SpecialActionSystem(registry.action_definitions)
             self.defense_system = DefenseSystem()
-            self.ai_system = EnemyAISystem()
-            self.environment_system = CombatEnvironmentSystem()
+            self.ai_system = EnemyAISystem(self.arena)
+            self.environment_system = CombatEnvironmentSystem(self.arena)
             self.group_system = GroupCombatSystem()
             self.progression_system = CombatProgressionSystem()
             
             # Initialisation du système d'armes spéciales
-            self.special_weapon_system = SpecialWeaponSystem()
-            initialize_special_weapons(self.special_weapon_system)
-            self.weapon_evolution_system = WeaponEvolutionSystem(self.special_weapon_system)
-            self.weapon_crafting_system = WeaponCraftingSystem(self.special_weapon_system)
+            self.special_weapon_system = SpecialWeaponSystem(registry.weapon_templates)
+            self.weapon_evolution_system = WeaponEvolutionSystem(self.special_weapon_system,
+                                                                 registry.evolution_thresholds)
+            self.weapon_crafting_system = WeaponCraftingSystem(self.special_weapon_system,
+                                                               registry.crafting_components)
             
             self.advanced_systems_enabled = True
-            logger.info("Systèmes de combat avancés initialisés avec succès")
+            logger.debug("Systèmes de combat avancés initialisés avec succès")
         except ImportError as e:
             logger.warning(f"Impossible d'initialiser les systèmes de combat avancés: {e}")
             self.advanced_systems_enabled = False
@@ -194,10 +216,65 @@ class CombatEngine:
             "message": f"C'est au tour de {self.current_actor.name}"
         }
     
+    def is_player_turn(self) -> bool:
+        """Indique si c'est au tour du joueur"""
+        return self.current_actor is self.player
+    
+    def execute_enemy_turn(self) -> Dict[str, Any]:
+        """
+        Fait jouer l'ennemi dont c'est le tour, puis passe au participant suivant
+        
+        Returns:
+            Résultat de l'action de l'ennemi
+        """
+        if self.status != CombatStatus.IN_PROGRESS:
+            return {"success": False, "message": "Le combat est terminé"}
+        
+        enemy = self.current_actor
+        if enemy is self.player:
+            return {"success": False, "message": "C'est au tour du joueur"}
+        
+        # Un ennemi vaincu passe son tour
+        if enemy.health <= 0:
+            self.next_turn()
+            return {"success": False, "message": f"{enemy.name} est hors de combat", "damage": 0}
+        
+        # Choix de l'action par l'IA si les systèmes avancés sont disponibles, attaque sinon
+        action = None
+        if getattr(self, 'advanced_systems_enabled', False):
+            target = self.ai_system.select_target(enemy, [self.player])
+            action = self.ai_system.select_action(enemy, target, AI_TURN_ACTIONS)
+        
+        if action and action["id"] == "defend":
+            result = {"success": True, "message": f"{enemy.name} adopte une posture défensive", "damage": 0}
+        else:
+            result = enemy.attack(self.player)
+            if result.get("damage", 0) > 0:
+                self.player.health -= result["damage"]
+        
+        if getattr(self, 'advanced_systems_enabled', False):
+            self.ai_system.record_action(enemy, {"action": action["id"] if action else "attack",
+                                                 "turn": self.current_turn,
+                                                 "damage": result.get("damage", 0)})
+        
+        self.log_message(result["message"])
+        self.next_turn()
+        return result
+    
     def _apply_persistent_effects(self):
         """Applique les effets persistants à tous les participants"""
-        # Implémentation des effets persistants comme saignement, poison, etc.
-        pass
+        # Effets persistants comme saignement, poison, régénération (systèmes avancés uniquement)
+        if not getattr(self, 'advanced_systems_enabled', False):
+            return
+        
+        for participant in self.initiative_order:
+            if participant.health <= 0:
+                continue
+            result = self.status_effect_system.update_effects(participant)
+            if result["damage"]:
+                self.log_message(f"{participant.name} subit {result['damage']} dégâts des effets de statut")
+            if result["healing"]:
+                self.log_message(f"{participant.name} récupère {result['healing']} PV grâce aux effets de statut")
         
     def _check_combat_status(self) -> None:
         """Vérifie si le combat est terminé"""
@@ -322,7 +399,9 @@ class CombatEngine:
         if not active_weapon:
             return None
             
-        # Vérifier si l'arme est une arme spéciale
+        # Vérifier si l'arme est une arme spéciale (les armes spéciales sont des dictionnaires)
+        if not isinstance(active_weapon, dict):
+            return None
         weapon_id = active_weapon.get('id')
         if not weapon_id:
             return None
@@ -358,6 +437,11 @@ class CombatEngine:
         damage_type = damage_result.get("type", "PHYSICAL")
         resistance = getattr(target, f"resistance_{damage_type.lower()}", 0)
         damage_multiplier = 1.0 - (resistance / 100)
+        
+        # Modificateurs des effets de statut (force renforcée, vulnérabilité...), systèmes avancés uniquement
+        if getattr(self, 'advanced_systems_enabled', False):
+            damage_multiplier *= (self.status_effect_system.get_damage_modifiers(self.player, is_attacker=True) *
+                                  self.status_effect_system.get_damage_modifiers(target, is_attacker=False))
         final_damage = max(1, int(damage_result["damage"] * damage_multiplier))
         
         # Appliquer les dégâts à la cible
@@ -0,0 +1,292 @@
+# YakTaa - Simulateur de combats sans interface
+"""
+Simulateur de combats en lot pour l'équilibrage
+Ce module enchaîne des combats complets sans interface: le joueur et les ennemis
+sont pilotés par l'IA de combat (systèmes avancés) ou attaquent à chaque tour
+(moteur de base), chaque combat est reproductible à partir de sa graine, et les
+combats sont répartis sur plusieurs processus.
+"""
+
+import logging
+import multiprocessing
+import os
+import random
+import statistics
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from yaktaa.characters.player import Player
+from yaktaa.combat.engine import AI_TURN_ACTIONS, ActionType, CombatEngine, CombatStatus
+from yaktaa.combat.enemy import generate_random_enemy
+
+logger = logging.getLogger("YakTaa.Combat.Simulator")
+
+# Nombre maximal de tours avant d'interrompre un combat (combat bloqué)
+DEFAULT_MAX_TURNS = 100
+
+# Nombre de combats envoyés à la fois à un processus de travail
+DEFAULT_CHUNK_SIZE = 64
+
+
+@dataclass(frozen=True)
+class Matchup:
+    """Configuration d'un affrontement simulé (joueur contre groupe d'ennemis)"""
+    player_level: int = 1
+    player_health: int = 100
+    weapon_damage: int = 15
+    weapon_damage_type: str = "PHYSICAL"
+    weapon_critical_chance: float = 0.05
+    enemy_difficulty: int = 1
+    enemy_count: int = 1
+    location_type: Optional[str] = None
+    max_turns: int = DEFAULT_MAX_TURNS
+    advanced: bool = False  # Systèmes de combat avancés (IA, effets de statut...) ou moteur de base
+
+
+@dataclass
+class FightResult:
+    """Résultat d'un combat simulé"""
+    seed: int
+    status: str
+    turns: int
+    damage_dealt: int
+    damage_taken: int
+    action_times: List[float] = field(default_factory=list)  # Durée de chaque action, en secondes
+
+
+@dataclass
+class SimulationReport:
+    """Statistiques d'une série de combats simulés"""
+    matchup: Matchup
+    fights: int
+    outcomes: Dict[str, int]
+    win_rate: float
+    turns: Dict[str, float]
+    damage_dealt: Dict[str, float]
+    damage_taken: Dict[str, float]
+    action_time_us: Dict[str, float]
+    wall_time: float
+    workers: int
+
+    @property
+    def fights_per_second(self) -> float:
+        """Débit de la simulation"""
+        return self.fights / self.wall_time if self.wall_time > 0 else 0.0
+
+    def summary(self) -> str:
+        """Résumé lisible de la simulation"""
+        outcomes = ", ".join(f"{status}: {count}" for status, count in sorted(self.outcomes.items()))
+        return (
+            f"{self.fights} combats en {self.wall_time:.2f} s ({self.fights_per_second:.0f} combats/s, "
+            f"{self.workers} processus)\n"
+            f"Victoires du joueur: {self.win_rate:.1%} ({outcomes})\n"
+            f"Tours: moyenne {self.turns['mean']:.1f}, médiane {self.turns['p50']:.0f}, p90 {self.turns['p90']:.0f}\n"
+            f"Dégâts infligés: moyenne {self.damage_dealt['mean']:.1f}, p90 {self.damage_dealt['p90']:.0f}\n"
+            f"Dégâts subis: moyenne {self.damage_taken['mean']:.1f}, p90 {self.damage_taken['p90']:.0f}\n"
+            f"Durée d'une action: médiane {self.action_time_us['p50']:.1f} µs, p99 {self.action_time_us['p99']:.1f} µs"
+        )
+
+
+class _SimulatedWeapon:
+    """Arme minimale pour Player.calculate_weapon_damage"""
+
+    def __init__(self, damage: int, damage_type: str, critical_chance: float):
+        self.name = "Arme de simulation"
+        self.damage = damage
+        self.damage_type = damage_type
+        self.critical_chance = critical_chance
+        self.special_effects = []
+
+
+def _create_player(matchup: Matchup) -> Player:
+    """Crée le joueur d'un combat simulé"""
+    player = Player("Simulation")
+    player.level = matchup.player_level
+    player.max_health = matchup.player_health
+    player.health = matchup.player_health
+    player.active_equipment["weapon"] = _SimulatedWeapon(matchup.weapon_damage, matchup.weapon_damage_type,
+                                                         matchup.weapon_critical_chance)
+    return player
+
+
+def simulate_fight(matchup: Matchup, seed: int) -> FightResult:
+    """
+    Joue un combat complet, reproductible à partir de sa graine
+
+    Le moteur, les ennemis et l'IA tirent leurs nombres aléatoires du module random:
+    il est réinitialisé avec la graine au début du combat.
+
+    Args:
+        matchup: Configuration de l'affrontement
+        seed: Graine du combat
+
+    Returns:
+        Résultat du combat
+    """
+    random.seed(seed)
+    player = _create_player(matchup)
+    enemies = [generate_random_enemy(matchup.enemy_difficulty, matchup.location_type)
+               for _ in range(matchup.enemy_count)]
+    enemy_health = sum(enemy.health for enemy in enemies)
+
+    engine = CombatEngine(player, enemies, {"type": matchup.location_type} if matchup.location_type else None,
+                          advanced=matchup.advanced)
+    engine.start_combat()
+    ai_system = engine.ai_system if engine.advanced_systems_enabled else None
+
+    action_times = []
+    clock = time.perf_counter
+    while engine.status == CombatStatus.IN_PROGRESS and engine.current_turn <= matchup.max_turns:
+        start = clock()
+        if engine.is_player_turn():
+            living = [enemy for enemy in enemies if enemy.health > 0]
+            target = ai_system.select_target(player, living) if ai_system else living[0]
+            action = ai_system.select_action(player, target, AI_TURN_ACTIONS) if ai_system else None
+            if action and action["id"] == "defend":
+                engine.perform_action(ActionType.DEFEND)
+            else:
+                engine.perform_action(ActionType.ATTACK, target)
+        else:
+            engine.execute_enemy_turn()
+        action_times.append(clock() - start)
+
+    status = engine.status.name if engine.status != CombatStatus.IN_PROGRESS else "TURN_LIMIT"
+    return FightResult(
+        seed=seed,
+        status=status,
+        turns=engine.current_turn,
+        damage_dealt=enemy_health - sum(max(0, enemy.health) for enemy in enemies),
+        damage_taken=matchup.player_health - max(0, player.health),
+        action_times=action_times
+    )
+
+
+def _run_chunk(job: Tuple[Matchup, Sequence[int]]) -> List[FightResult]:
+    """Joue une série de combats (dans un processus de travail)"""
+    matchup, seeds = job
+    return [simulate_fight(matchup, seed) for seed in seeds]
+
+
+def _init_worker(log_level: int) -> None:
+    """Initialise un processus de travail (journalisation réduite)"""
+    logging.disable(log_level)
+
+
+def _distribution(values: Sequence[float]) -> Dict[str, float]:
+    """Moyenne, extrêmes et percentiles d'une série de valeurs"""
+    if not values:
+        return {"mean": 0.0, "min": 0.0, "max": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0}
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    return {
+        "mean": statistics.fmean(ordered),
+        "min": ordered[0],
+        "max": ordered[-1],
+        "p50": ordered[round(last * 0.5)],
+        "p90": ordered[round(last * 0.9)],
+        "p99": ordered[round(last * 0.99)]
+    }
+
+
+class CombatSimulator:
+    """
+    Simulateur de combats en lot, réparti sur plusieurs processus.
+    Les résultats ne dépendent que des graines, pas du nombre de processus.
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 quiet: bool = True):
+        """
+        Initialise le simulateur
+
+        Args:
+            workers: Nombre de processus (None: nombre de cœurs; 1: dans le processus courant)
+            chunk_size: Nombre de combats envoyés à la fois à un processus
+            quiet: Si vrai, les journaux de niveau INFO et inférieur sont coupés pendant les combats
+        """
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.chunk_size = max(1, chunk_size)
+        self.log_level = logging.INFO if quiet else logging.NOTSET
+
+    def run_fights(self, matchup: Matchup, fights: int, seed: int = 0) -> List[FightResult]:
+        """
+        Joue une série de combats
+
+        Args:
+            matchup: Configuration de l'affrontement
+            fights: Nombre de combats
+            seed: Graine du premier combat (les suivants utilisent seed + 1, seed + 2...)
+
+        Returns:
+            Résultats des combats, dans l'ordre des graines
+        """
+        seeds = range(seed, seed + fights)
+        jobs = [(matchup, seeds[i:i + self.chunk_size]) for i in range(0, fights, self.chunk_size)]
+
+        if self.workers == 1 or len(jobs) == 1:
+            previous_level = logging.root.manager.disable
+            logging.disable(self.log_level)
+            try:
+                chunks = [_run_chunk(job) for job in jobs]
+            finally:
+                logging.disable(previous_level)
+        else:
+            with multiprocessing.Pool(min(self.workers, len(jobs)), initializer=_init_worker,
+                                      initargs=(self.log_level,)) as pool:
+                chunks = pool.map(_run_chunk, jobs)
+
+        return [result for chunk in chunks for result in chunk]
+
+    def run(self, matchup: Matchup, fights: int, seed: int = 0) -> SimulationReport:
+        """
+        Joue une série de combats et en calcule les statistiques
+
+        Args:
+            matchup: Configuration de l'affrontement
+            fights: Nombre de combats
+            seed: Graine du premier combat
+
+        Returns:
+            Rapport de simulation
+        """
+        start = time.perf_counter()
+        results = self.run_fights(matchup, fights, seed)
+        wall_time = time.perf_counter() - start
+
+        outcomes = Counter(result.status for result in results)
+        report = SimulationReport(
+            matchup=matchup,
+            fights=len(results),
+            outcomes=dict(outcomes),
+            win_rate=outcomes[CombatStatus.PLAYER_VICTORY.name] / len(results) if results else 0.0,
+            turns=_distribution([result.turns for result in results]),
+            damage_dealt=_distribution([result.damage_dealt for result in results]),
+            damage_taken=_distribution([result.damage_taken for result in results]),
+            action_time_us=_distribution([duration * 1e6 for result in results for duration in result.action_times]),
+            wall_time=wall_time,
+            workers=self.workers
+        )
+        logger.info(f"Simulation terminée: {report.fights} combats, {report.win_rate:.1%} de victoires")
+        return report
+
+    def run_matchups(self, matchups: Sequence[Matchup], fights: int, seed: int = 0) -> List[SimulationReport]:
+        """
+        Simule plusieurs affrontements avec les mêmes graines
+
+        Args:
+            matchups: Configurations à comparer
+            fights: Nombre de combats par configuration
+            seed: Graine du premier combat de chaque configuration
+
+        Returns:
+            Un rapport par configuration
+        """
+        return [self.run(matchup, fights, seed) for matchup in matchups]
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    simulator = CombatSimulator()
+    print(simulator.run(Matchup(enemy_difficulty=2, enemy_count=2), fights=2000).summary())
@@ -44,6 +44,19 @@ class Config:
         "show_tooltips": True,
         "animation_speed": 1.0,
         
+        # Paramètres de base de données
+        "db_pool_size": 4,  # connexions inactives conservées par thread
+        "world_snapshot_cache": True,  # instantanés binaires des mondes pour les démarrages rapides
+        "world_snapshot_dir": None,  # None: dossier "cache" à côté du fichier de configuration
+        "file_content_cache_size": 64,  # contenus de fichiers du monde gardés en mémoire
+        "shop_lazy_inventories": True,  # inventaires des boutiques chargés à la première visite
+        "shop_inventory_cache_size": 16,  # inventaires de boutiques gardés en mémoire
+        "world_db_read_only": True,  # base des mondes ouverte en lecture seule (partageable entre instances)
+        "world_db_mmap_size": 256 * 1024 * 1024,  # octets lus par projection mémoire
+        "world_db_cache_size": -16 * 1024,  # cache de pages SQLite (négatif: en Kio)
+        "world_db_temp_store": "MEMORY",  # tables temporaires en mémoire
+        "shop_state_db": None,  # None: "shop_state.db" à côté du fichier de configuration
+        
         # Paramètres de développement
         "debug_mode": False,
         "dev_console": False,
@@ -132,6 +145,25 @@ class Config:
         # Sauvegarde après réinitialisation
         self.save()
     
+    def get_world_snapshot_dir(self) -> Optional[str]:
+        """Retourne le dossier des instantanés de monde, ou None s'ils sont désactivés"""
+        if not self.get("world_snapshot_cache", True):
+            return None
+        return self.get("world_snapshot_dir") or os.path.join(os.path.dirname(self.config_file), 'cache')
+    
+    def get_world_db_pragmas(self) -> Dict[str, Any]:
+        """Retourne les PRAGMA des connexions à la base des mondes"""
+        return {
+            "busy_timeout": 5000,
+            "temp_store": self.get("world_db_temp_store", "MEMORY"),
+            "mmap_size": int(self.get("world_db_mmap_size", 0)),
+            "cache_size": int(self.get("world_db_cache_size", -2000)),
+        }
+    
+    def get_shop_state_db_path(self) -> str:
+        """Retourne le chemin de la base de surcouche de l'état des boutiques"""
+        return self.get("shop_state_db") or os.path.join(os.path.dirname(self.config_file), 'shop_state.db')
+    
     def get_all(self) -> Dict[str, Any]:
         """Retourne toutes les valeurs de configuration"""
         return self.config_data.copy()
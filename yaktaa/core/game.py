@@ -3,9 +3,10 @@ Module principal du jeu YakTaa qui gère l'état global et la logique du jeu
 """
 
 import logging
+import threading
 import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
 
 from yaktaa.core.config import Config
 from yaktaa.core.save_manager import SaveManager
@@ -16,6 +17,7 @@ from yaktaa.missions.mission_manager import MissionManager
 from yaktaa.ui.ui_manager import UIManager
 from yaktaa.items.shop_manager import ShopManager
 from yaktaa.world.world_loader import WorldLoader
+from yaktaa.world.db_pool import close_all_pools
 
 logger = logging.getLogger("YakTaa.Game")
 
@@ -23,21 +25,44 @@ class Game:
     """Classe principale qui gère l'état global du jeu et coordonne les différents systèmes"""
     
     def __init__(self):
-        """Initialise une nouvelle instance du jeu"""
+        """
+        Initialise une nouvelle instance du jeu.
+        
+        Le cycle de vie est découpé en étapes: amorçage (ici: configuration, sauvegardes,
+        accès à la base), choix du monde (select_world) puis chargement du monde
+        (load_world). Les gestionnaires liés au monde sont construits une seule fois,
+        au premier chargement, puis simplement rattachés au monde choisi.
+        """
         self.config = Config()
         self.save_manager = SaveManager()
-        self.player = Player(name="Joueur")  # Créer un joueur par défaut
-        self.mission_manager = MissionManager(self)
-        self.world_manager = WorldManager(self)  # Initialiser le gestionnaire de monde
-        self.city_manager = CityManager(self)  # Initialiser le gestionnaire de ville
         
-        # Créer le chargeur de monde
-        world_loader = WorldLoader()
-        self.shop_manager = ShopManager(world_loader)  # Initialiser le gestionnaire de boutiques
+        # Créer le chargeur de monde (et son pool de connexions partagé)
+        self.world_loader = WorldLoader(
+            pool_size=self.config.get("db_pool_size", 4),
+            snapshot_dir=self.config.get_world_snapshot_dir(),
+            file_cache_size=self.config.get("file_content_cache_size", 64),
+            read_only=self.config.get("world_db_read_only", True),
+            db_pragmas=self.config.get_world_db_pragmas(),
+            overlay_path=self.config.get_shop_state_db_path()
+        )
         
-        # Charger les boutiques pour le monde disponible dans la base de données
-        world_id = self.shop_manager.get_first_world_id()
-        self.shop_manager.load_shops_for_world(world_id)
+        self.player = Player(name="Joueur")  # Créer un joueur par défaut
+        
+        # Sous-systèmes (gestionnaires de monde, de villes et de boutiques construits par load_world)
+        self._mission_manager: Optional[MissionManager] = None
+        self._world_manager: Optional[WorldManager] = None
+        self._city_manager: Optional[CityManager] = None
+        self._shop_manager: Optional[ShopManager] = None
+        
+        # Monde choisi, et monde auquel chaque sous-système est actuellement rattaché
+        self.world_id: Optional[str] = None
+        self._world_selected = False
+        self._world_manager_world_id: Optional[str] = None
+        self._shops_world_id: Optional[str] = None
+        self._loading_world = False
+        # Protège le chargement du monde et l'affectation des gestionnaires
+        # (thread de chargement et thread de l'interface)
+        self._world_lock = threading.RLock()
         
         self.ui_manager = None  # Sera initialisé plus tard car il a besoin d'une référence au MainWindow
         self.running = False
@@ -48,40 +73,186 @@ class Game:
         # Référence à l'interface de combat active (le cas échéant)
         self.active_combat_ui = None
         
-        logger.info("Instance de jeu initialisée avec un monde par défaut")
+        logger.info("Instance de jeu initialisée (monde chargé à la demande)")
     
-    def new_game(self, player_name: str) -> bool:
-        """Démarre une nouvelle partie avec un nouveau joueur"""
-        try:
-            logger.info(f"Création d'une nouvelle partie pour le joueur: {player_name}")
+    @property
+    def mission_manager(self) -> MissionManager:
+        """Gestionnaire de missions, créé au premier accès"""
+        if self._mission_manager is None:
+            self._mission_manager = MissionManager(self)
+        return self._mission_manager
+    
+    @mission_manager.setter
+    def mission_manager(self, value: MissionManager) -> None:
+        self._mission_manager = value
+    
+    @property
+    def world_manager(self) -> Optional[WorldManager]:
+        """Gestionnaire de monde (None tant que le monde n'est pas chargé, voir load_world)"""
+        return self._world_manager
+    
+    @world_manager.setter
+    def world_manager(self, value: WorldManager) -> None:
+        self._world_manager = value
+    
+    @property
+    def city_manager(self) -> Optional[CityManager]:
+        """Gestionnaire de villes (None tant que le monde n'est pas chargé, voir load_world)"""
+        return self._city_manager
+    
+    @city_manager.setter
+    def city_manager(self, value: CityManager) -> None:
+        self._city_manager = value
+    
+    @property
+    def shop_manager(self) -> Optional[ShopManager]:
+        """Gestionnaire de boutiques (None tant que le monde n'est pas chargé, voir load_world)"""
+        return self._shop_manager
+    
+    @shop_manager.setter
+    def shop_manager(self, value: ShopManager) -> None:
+        self._shop_manager = value
+    
+    def select_world(self, world_id: Optional[str] = None) -> Optional[str]:
+        """
+        Choisit le monde à charger (n'effectue pas le chargement, voir load_world)
+        
+        Args:
+            world_id: ID du monde, ou None pour le premier monde de la base de données
             
-            # Création du joueur
-            self.player = Player(name=player_name)
+        Returns:
+            ID du monde choisi (None si la base n'en contient aucun: monde par défaut)
+        """
+        if world_id is None:
+            worlds = self.world_loader.get_available_worlds()
+            world_id = worlds[0]["id"] if worlds else None
+        
+        self.world_id = world_id
+        self._world_selected = True
+        logger.info(f"Monde choisi: {world_id or 'monde par défaut'}")
+        return world_id
+    
+    def load_world(self, progress_callback: Optional[Callable[[int, str], None]] = None) -> bool:
+        """
+        Charge le monde choisi et y rattache les gestionnaires de monde, de villes et de boutiques.
+        Les gestionnaires existants sont réutilisés; rien n'est rechargé si le monde est déjà chargé.
+        
+        Args:
+            progress_callback: Fonction (pourcentage, étape) appelée à chaque étape du chargement
             
-            # Initialisation du gestionnaire de missions (avant le monde pour que les missions puissent être chargées)
-            self.mission_manager = MissionManager(self)
+        Returns:
+            True si le monde est chargé, False en cas d'erreur
+        """
+        with self._world_lock:
+            if self._loading_world:
+                return False
             
-            # Initialisation du monde
-            self.world_manager = WorldManager(self)
+            if not self._world_selected:
+                self.select_world()
             
-            # Initialisation du gestionnaire de ville
-            self.city_manager = CityManager(self)
+            if self.is_world_loaded():
+                logger.debug(f"Monde {self.world_id} déjà chargé, aucun rechargement")
+                return True
             
-            # Initialisation du gestionnaire de boutiques
-            from yaktaa.world.world_loader import WorldLoader
-            world_loader = WorldLoader()
-            self.shop_manager = ShopManager(world_loader)
+            self._loading_world = True
+            try:
+                self._report_progress(progress_callback, 15, "Chargement du monde...")
+                if self._world_manager is None:
+                    self._world_manager = WorldManager(self, self.world_id)
+                elif self._world_manager_world_id != self.world_id:
+                    self._world_manager.load_specific_world(self.world_id)
+                self._world_manager_world_id = self.world_id
+            
+                # Les villes ne dépendent pas du monde choisi: construites une seule fois
+                self._report_progress(progress_callback, 50, "Chargement des villes...")
+                if self._city_manager is None:
+                    self._city_manager = CityManager(self, self.world_loader)
+            
+                self._report_progress(progress_callback, 65, "Chargement des boutiques...")
+                if self._shop_manager is None:
+                    self._shop_manager = self._create_shop_manager()
+                if self._shops_world_id != self.world_id or not self._shop_manager.shops:
+                    self._reload_shops()
             
-            # Charger les boutiques pour le monde disponible dans la base de données
-            world_id = self.shop_manager.get_first_world_id()
-            self.shop_manager.load_shops_for_world(world_id)
+                return True
+            except Exception as e:
+                logger.error(f"Erreur lors du chargement du monde {self.world_id}: {str(e)}", exc_info=True)
+                return False
+            finally:
+                self._loading_world = False
+    
+    def is_world_loaded(self) -> bool:
+        """Indique si tous les sous-systèmes sont construits et rattachés au monde choisi"""
+        return (self._world_selected
+                and self._world_manager is not None and self._world_manager_world_id == self.world_id
+                and self._city_manager is not None
+                and self._shop_manager is not None and self._shops_world_id == self.world_id)
+    
+    def _reload_shops(self) -> None:
+        """Recharge les boutiques du monde choisi dans le gestionnaire existant"""
+        self._shop_manager.load_shops_for_world(self.world_id or self._shop_manager.get_first_world_id())
+        self._shops_world_id = self.world_id
+    
+    def _create_shop_manager(self) -> ShopManager:
+        """Crée le gestionnaire de boutiques selon la configuration (inventaires différés ou non)"""
+        return ShopManager(
+            self.world_loader,
+            lazy_inventories=self.config.get("shop_lazy_inventories", True),
+            inventory_cache_size=self.config.get("shop_inventory_cache_size", 16)
+        )
+    
+    @staticmethod
+    def _report_progress(progress_callback: Optional[Callable[[int, str], None]], percent: int, message: str) -> None:
+        """Transmet l'avancement d'un chargement (écran de chargement), si demandé"""
+        logger.debug(f"Chargement {percent}%: {message}")
+        if progress_callback:
+            progress_callback(percent, message)
+    
+    def new_game(self, player_name: str, progress_callback: Optional[Callable[[int, str], None]] = None) -> bool:
+        """
+        Démarre une nouvelle partie avec un nouveau joueur
+        
+        Args:
+            player_name: Nom du joueur
+            progress_callback: Fonction (pourcentage, étape) appelée à chaque étape du chargement;
+                peut être appelée depuis un thread de chargement
+        """
+        try:
+            logger.info(f"Création d'une nouvelle partie pour le joueur: {player_name}")
             
-            # Chargement explicite des missions de test
-            if hasattr(self.world_manager, 'load_test_missions'):
-                self.world_manager.load_test_missions()
-                logger.info("Missions de test chargées explicitement")
+            # Aucune mise à jour du jeu pendant le chargement
+            self.running = False
             
+            # Joueur et gestionnaires remplacés sous le verrou du monde
+            with self._world_lock:
+                # Création du joueur
+                self._report_progress(progress_callback, 5, "Création du personnage...")
+                self.player = Player(name=player_name)
+                
+                # Nouveau gestionnaire de missions (avant le monde pour que les missions puissent être chargées)
+                self._report_progress(progress_callback, 10, "Préparation des missions...")
+                self.mission_manager = MissionManager(self)
+                
+                if not self.is_world_loaded():
+                    # Premier chargement du monde: les missions de test sont chargées avec lui
+                    if not self.load_world(progress_callback):
+                        return False
+                else:
+                    # Monde déjà chargé dans cette session: seule la progression du joueur est réinitialisée
+                    self._report_progress(progress_callback, 50, "Réinitialisation du monde...")
+                    self._world_manager.reset_progress()
+                    
+                    # Les achats d'une partie précédente ne doivent pas subsister
+                    if any(shop.inventory_modified for shop in self._shop_manager.shops.values()):
+                        self._report_progress(progress_callback, 65, "Chargement des boutiques...")
+                        self._reload_shops()
+                    
+                    # Missions de test pour le nouveau gestionnaire de missions
+                    self._report_progress(progress_callback, 90, "Chargement des missions...")
+                    self._world_manager.load_test_missions()
+                
             # Démarrage du jeu
+            self._report_progress(progress_callback, 100, "Entrée dans le monde...")
             self.running = True
             self.start_time = time.time()
             
@@ -92,25 +263,57 @@ class Game:
             logger.error(f"Erreur lors de la création d'une nouvelle partie: {str(e)}", exc_info=True)
             return False
     
-    def load_game(self, save_id: str) -> bool:
-        """Charge une partie sauvegardée"""
+    def load_game(self, save_id: str, progress_callback: Optional[Callable[[int, str], None]] = None) -> bool:
+        """
+        Charge une partie sauvegardée
+        
+        Args:
+            save_id: ID de la sauvegarde
+            progress_callback: Fonction (pourcentage, étape) appelée à chaque étape du chargement;
+                peut être appelée depuis un thread de chargement
+        """
         try:
             logger.info(f"Chargement de la sauvegarde: {save_id}")
             
+            # Aucune mise à jour du jeu pendant le chargement
+            self.running = False
+            
             # Chargement des données de sauvegarde
+            self._report_progress(progress_callback, 5, "Lecture de la sauvegarde...")
             save_data = self.save_manager.load_game(save_id)
             if not save_data:
                 logger.error(f"Impossible de charger la sauvegarde: {save_id}")
                 return False
             
-            # Restauration de l'état du jeu
-            self.player = Player.from_save_data(save_data.get("player", {}))
-            self.world_manager = WorldManager.from_save_data(self, save_data.get("world", {}))
-            self.mission_manager = MissionManager.from_save_data(self, save_data.get("missions", {}))
-            self.city_manager = CityManager(self)  # Initialiser un nouveau gestionnaire de ville
+            # Joueur et gestionnaires remplacés sous le verrou du monde
+            with self._world_lock:
+                # Restauration de l'état du jeu
+                self._report_progress(progress_callback, 10, "Restauration du personnage...")
+                self.player = Player.from_save_data(save_data.get("player", {}))
+                
+                # Monde de la sauvegarde: réutilisé s'il est déjà chargé dans cette session
+                world_id = save_data.get("world_id")
+                if not self._world_selected or self.world_id != world_id:
+                    self.select_world(world_id)
+                if not self.load_world(progress_callback):
+                    return False
+                
+                self._report_progress(progress_callback, 80, "Restauration de la progression...")
+                self._world_manager.restore_save_data(save_data.get("world", {}))
+                
+                # Les achats d'une partie précédente ne doivent pas subsister
+                if any(shop.inventory_modified for shop in self._shop_manager.shops.values()):
+                    self._report_progress(progress_callback, 85, "Chargement des boutiques...")
+                    self._reload_shops()
+                
+                # Missions restaurées après le monde, qui charge ses missions de test
+                self._report_progress(progress_callback, 90, "Restauration des missions...")
+                self.mission_manager = MissionManager.from_save_data(self, save_data.get("missions", {}))
+            
             self.game_time = save_data.get("game_time", 0)
             
             # Démarrage du jeu
+            self._report_progress(progress_callback, 100, "Entrée dans le monde...")
             self.running = True
             self.start_time = time.time() - self.game_time
             
@@ -134,6 +337,7 @@ class Game:
             # Préparation des données de sauvegarde
             save_data = {
                 "player": self.player.to_save_data(),
+                "world_id": self.world_id,
                 "world": self.world_manager.to_save_data(),
                 "missions": self.mission_manager.to_save_data(),
                 "game_time": self.game_time,
@@ -171,6 +375,41 @@ class Game:
         if self.city_manager:
             self.city_manager.update(delta_time)
     
+    def simulate_until(self, game_time: float) -> Dict[str, Any]:
+        """
+        Avance le jeu jusqu'à un instant donné en un seul saut, pour les voyages longs
+        et les attentes, au lieu d'enchaîner les mises à jour image par image.
+        Les sous-systèmes étant indépendants, chacun traite directement, dans l'ordre,
+        les événements survenus pendant l'intervalle.
+        Appelé par WorldManager.travel_to (durée du trajet) et WorldManager.wait.
+        
+        Args:
+            game_time: Instant visé, en secondes de temps de jeu
+            
+        Returns:
+            Résumé du saut: durée simulée, missions expirées, évolutions des conditions de voyage
+        """
+        self.update_game_time()
+        elapsed = game_time - self.game_time
+        summary = {"elapsed": 0.0, "expired_missions": [], "condition_updates": 0}
+        if elapsed <= 0:
+            return summary
+        
+        # Sous-systèmes déjà construits seulement (aucun chargement pendant une attente)
+        if self._mission_manager:
+            summary["expired_missions"] = self._mission_manager.advance_time(elapsed)
+        if self._world_manager:
+            summary["condition_updates"] = self._world_manager.advance_time(elapsed)
+        
+        # Décaler l'origine de l'horloge: le temps de jeu reprend depuis l'instant visé
+        self.start_time -= elapsed
+        self.game_time = game_time
+        summary["elapsed"] = elapsed
+        
+        logger.info(f"Temps de jeu avancé de {elapsed:.0f} s: {len(summary['expired_missions'])} mission(s) expirée(s), "
+                    f"{summary['condition_updates']} évolution(s) des conditions")
+        return summary
+    
     def update_game_time(self) -> None:
         """Met à jour le compteur de temps de jeu"""
         if self.running and not self.paused:
@@ -200,9 +439,12 @@ class Game:
         if self.config.get("auto_save_on_quit", True):
             self.save_game("auto_save")
         
-        # Nettoyage des ressources
-        if self.world_manager:
-            self.world_manager.cleanup()
+        # Nettoyage des ressources (sans charger le monde s'il ne l'a jamais été)
+        if self._world_manager:
+            self._world_manager.cleanup()
+        
+        # Fermeture des connexions à la base de données
+        close_all_pools()
         
         logger.info(f"Jeu terminé. Temps de jeu total: {self.format_game_time()}")
     
@@ -675,6 +675,7 @@ class InventoryManager:
         
         # Équiper le nouveau composant
         self.player.active_equipment[slot] = hardware
+        self.player.invalidate_effective_stats()
         logger.debug(f"Composant équipé: {hardware.name}")
         
         return {
@@ -711,6 +712,7 @@ class InventoryManager:
         # Déséquiper le composant
         hardware_name = current.name
         self.player.active_equipment[slot] = None
+        self.player.invalidate_effective_stats()
         logger.debug(f"Composant déséquipé: {hardware_name}")
         
         return {
@@ -903,6 +905,7 @@ class InventoryManager:
                     self.player.active_equipment[slot] = self.hardware[hw_id]
                 else:
                     self.player.active_equipment[slot] = None
+            self.player.invalidate_effective_stats()
             
             logger.info(f"Inventaire chargé depuis {filepath}")
             return True
@@ -0,0 +1,128 @@
+"""
+Module du registre des définitions d'articles pour YakTaa
+Ce module fournit un registre de définitions partagées (poids-mouche): chaque
+article du catalogue est construit une seule fois par (item_type, item_id), et
+les boutiques ne conservent que des entrées légères (définition, prix, quantité).
+"""
+
+import copy
+import logging
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .item import Item
+
+logger = logging.getLogger("YakTaa.Items.ItemRegistry")
+
+
+class ShopEntry(tuple):
+    """
+    Entrée d'inventaire de boutique.
+    Se comporte comme le couple (article, prix) historique, et porte en plus
+    la quantité en stock. L'article est une définition partagée entre boutiques:
+    il ne doit pas être modifié, voir ItemRegistry.instantiate.
+    """
+
+    def __new__(cls, item: Item, price: int, quantity: int = 1):
+        entry = super().__new__(cls, (item, price))
+        entry.quantity = max(1, int(quantity or 1))
+        return entry
+
+    @property
+    def item(self) -> Item:
+        """Définition de l'article"""
+        return self[0]
+
+    @property
+    def price(self) -> int:
+        """Prix de vente dans cette boutique"""
+        return self[1]
+
+    def __repr__(self) -> str:
+        return f"ShopEntry(item={self[0]!r}, price={self[1]}, quantity={self.quantity})"
+
+
+class ItemRegistry:
+    """
+    Registre des définitions d'articles, indexées par (item_type, item_id).
+    """
+
+    def __init__(self):
+        """Initialise un registre vide"""
+        self._definitions: Dict[Tuple[str, str], Item] = {}
+
+        # Statistiques
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, item_type: str, item_id: str) -> Optional[Item]:
+        """
+        Récupère une définition déjà construite
+
+        Args:
+            item_type: Type d'article tel qu'enregistré dans l'inventaire
+            item_id: ID de l'article
+
+        Returns:
+            Définition partagée, ou None si elle n'a pas encore été construite
+        """
+        definition = self._definitions.get((item_type, item_id))
+        if definition is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return definition
+
+    def register(self, item_type: str, item_id: str, definition: Item) -> Item:
+        """
+        Enregistre une définition (la première enregistrée pour une clé est conservée)
+
+        Args:
+            item_type: Type d'article
+            item_id: ID de l'article
+            definition: Article construit
+
+        Returns:
+            Définition partagée pour cette clé
+        """
+        return self._definitions.setdefault((item_type, item_id), definition)
+
+    def get_or_create(self, item_type: str, item_id: str, factory: Callable[[], Item]) -> Item:
+        """
+        Récupère une définition, en la construisant au premier appel
+
+        Args:
+            item_type: Type d'article
+            item_id: ID de l'article
+            factory: Fonction construisant l'article s'il est absent
+
+        Returns:
+            Définition partagée
+        """
+        definition = self.get(item_type, item_id)
+        if definition is None:
+            definition = self.register(item_type, item_id, factory())
+        return definition
+
+    @staticmethod
+    def instantiate(definition: Any) -> Any:
+        """
+        Crée un exemplaire indépendant d'une définition, par exemple pour
+        l'inventaire du joueur après un achat
+
+        Args:
+            definition: Définition partagée
+
+        Returns:
+            Copie de l'article, modifiable sans affecter les boutiques
+        """
+        return copy.deepcopy(definition)
+
+    def clear(self) -> None:
+        """Vide le registre"""
+        self._definitions.clear()
+
+    def __len__(self) -> int:
+        return len(self._definitions)
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self._definitions
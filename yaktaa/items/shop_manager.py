@@ -9,6 +9,7 @@ import random
 import uuid
 import logging
 import sqlite3
+from collections import OrderedDict
 from typing import Dict, List, Optional, Union, Tuple, Any
 
 # Importation des classes nécessaires du jeu
@@ -21,11 +22,16 @@ from .weapon import WeaponItem
 from .implant import ImplantItem
 from .clothing import ClothingItem
 from .inventory_manager import InventoryManager
+from .item_registry import ItemRegistry, ShopEntry
+from .shop_overlay import ShopStateOverlay
 from ..world.world_loader import WorldLoader
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
 
+# Nombre d'inventaires de boutiques gardés en mémoire par défaut en mode différé
+DEFAULT_INVENTORY_CACHE_SIZE = 16
+
 class Shop:
     """Représente une boutique dans le monde YakTaa."""
     
@@ -73,8 +79,53 @@ class Shop:
         if data:
             self._load_from_data(data)
         
-        # Inventaire de la boutique
-        self.inventory = []
+        # Inventaire de la boutique (vide par défaut; set_inventory_loader le remet à None
+        # jusqu'au premier accès, qui appelle le chargeur différé)
+        self._inventory = []
+        self._inventory_loader = None
+        self.inventory_modified = False
+    
+    @property
+    def inventory(self) -> List[Tuple[Item, int]]:
+        """Inventaire de la boutique, chargé au premier accès en mode différé"""
+        if self._inventory is None:
+            self._inventory = []
+            if self._inventory_loader:
+                self._inventory_loader(self)
+        return self._inventory
+    
+    @inventory.setter
+    def inventory(self, value: List[Tuple[Item, int]]) -> None:
+        self._inventory = value
+    
+    @property
+    def inventory_loaded(self) -> bool:
+        """Indique si l'inventaire est actuellement en mémoire"""
+        return self._inventory is not None
+    
+    def set_inventory_loader(self, loader) -> None:
+        """
+        Diffère le chargement de l'inventaire jusqu'au premier accès.
+        
+        Args:
+            loader: Fonction appelée avec la boutique pour remplir son inventaire
+        """
+        self._inventory_loader = loader
+        self._inventory = None
+        self.inventory_modified = False
+    
+    def unload_inventory(self) -> bool:
+        """
+        Libère l'inventaire chargé; il sera rechargé au prochain accès.
+        Un inventaire modifié en jeu (achats) n'est pas libéré pour ne pas perdre ces changements.
+        
+        Returns:
+            True si l'inventaire a été libéré, False sinon
+        """
+        if not self._inventory_loader or self.inventory_modified or self._inventory is None:
+            return False
+        self._inventory = None
+        return True
     
     def _load_from_data(self, data: Dict) -> None:
         """Charge les données supplémentaires depuis un dictionnaire."""
@@ -156,11 +207,15 @@ class Shop:
         if item_index < 0 or item_index >= len(self.inventory):
             return False, "Article introuvable.", None, player_credits
         
-        item, price = self.inventory[item_index]
+        entry = self.inventory[item_index]
+        definition, price = entry
         
         if player_credits < price:
             return False, "Crédits insuffisants.", None, player_credits
         
+        # La définition est partagée entre boutiques: le joueur reçoit son propre exemplaire
+        item = ItemRegistry.instantiate(definition)
+        
         # Mise à jour des crédits du joueur
         remaining_credits = player_credits - price
         
@@ -172,8 +227,13 @@ class Shop:
             # Si c'est un InventoryManager, utiliser sa méthode add_item
             player_inventory.add_item(item)
         
-        # Suppression de l'article de l'inventaire de la boutique
-        self.inventory.pop(item_index)
+        # Retrait d'un exemplaire du stock de la boutique
+        quantity = getattr(entry, 'quantity', 1)
+        if quantity > 1:
+            self.inventory[item_index] = ShopEntry(definition, price, quantity - 1)
+        else:
+            self.inventory.pop(item_index)
+        self.inventory_modified = True
         
         return True, f"{item.name} acheté pour {price} crédits.", item, remaining_credits
     
@@ -267,18 +327,37 @@ class Shop:
 class ShopManager:
     """Gestionnaire des boutiques dans le monde YakTaa."""
     
-    def __init__(self, world_loader: WorldLoader):
+    # Nombre maximal de paramètres par requête IN (SQLite en accepte au moins 999)
+    SQL_IN_CHUNK_SIZE = 500
+    
+    def __init__(self, world_loader: WorldLoader, lazy_inventories: bool = False,
+                 inventory_cache_size: int = DEFAULT_INVENTORY_CACHE_SIZE):
         """
         Initialise le gestionnaire de boutiques.
         
         Args:
             world_loader: Chargeur de monde pour accéder à la base de données
+            lazy_inventories: Si True, les inventaires ne sont chargés qu'au premier accès
+            inventory_cache_size: Nombre d'inventaires gardés en mémoire en mode différé
         """
         self.world_loader = world_loader
+        self.schema = world_loader.get_schema()  # Instantané du schéma, partagé par fichier de base
         self.shops = {}  # Dictionnaire des boutiques par ID
         self.location_shops = {}  # Dictionnaire des boutiques par emplacement
+        self.world_id: Optional[str] = None  # Monde des boutiques chargées
         self.item_factory = None  # Sera défini après
         
+        # Définitions d'articles partagées entre les inventaires des boutiques
+        self.item_registry = ItemRegistry()
+        
+        # Modifications des inventaires faites en jeu (base de surcouche, la base des mondes peut être en lecture seule)
+        self.overlay = ShopStateOverlay(world_loader.get_overlay_connection)
+        
+        # Mode différé: inventaires chargés à la demande, les moins récents sont libérés
+        self.lazy_inventories = lazy_inventories
+        self.inventory_cache_size = inventory_cache_size
+        self._loaded_inventories: "OrderedDict[str, Shop]" = OrderedDict()
+        
         # Initialiser les tables de boutiques si elles n'existent pas
         self._initialize_shop_tables()
     
@@ -286,6 +365,70 @@ class ShopManager:
         """Définit la factory d'items pour créer les objets vendus."""
         self.item_factory = item_factory
     
+    def _defer_inventory(self, shop: Shop) -> None:
+        """Enregistre une boutique dont l'inventaire sera chargé au premier accès"""
+        shop.set_inventory_loader(self._load_deferred_inventory)
+    
+    def _load_deferred_inventory(self, shop: Shop) -> None:
+        """Charge l'inventaire d'une boutique différée lors de son premier accès"""
+        logger.debug(f"[SHOP_MANAGER] Chargement différé de l'inventaire de {shop.name}")
+        self._load_shop_inventory(shop)
+        self._touch_inventory(shop)
+    
+    def _touch_inventory(self, shop: Shop) -> None:
+        """
+        Marque l'inventaire d'une boutique comme récemment utilisé et libère
+        les inventaires les moins récemment utilisés au-delà de la taille du cache.
+        
+        Args:
+            shop: Boutique dont l'inventaire vient d'être utilisé
+        """
+        if not self.lazy_inventories or not shop.inventory_loaded or self.shops.get(shop.id) is not shop:
+            return
+        
+        self._loaded_inventories[shop.id] = shop
+        self._loaded_inventories.move_to_end(shop.id)
+        
+        excess = len(self._loaded_inventories) - self.inventory_cache_size
+        for shop_id in list(self._loaded_inventories):
+            if excess <= 0:
+                break
+            candidate = self._loaded_inventories[shop_id]
+            if candidate is shop:
+                continue
+            # Les inventaires modifiés en jeu restent en mémoire
+            if candidate.unload_inventory() or not candidate.inventory_loaded:
+                del self._loaded_inventories[shop_id]
+                excess -= 1
+                logger.debug(f"[SHOP_MANAGER] Inventaire de {candidate.name} libéré de la mémoire")
+    
+    def _get_or_create_shop(self, shop_id: str, name: str, description: str,
+                            shop_type: str, location_id: str) -> Shop:
+        """
+        Retourne la boutique déjà enregistrée pour cet emplacement, ou en crée une nouvelle
+        
+        Args:
+            shop_id: ID de la boutique
+            name: Nom de la boutique
+            description: Description de la boutique
+            shop_type: Type de boutique
+            location_id: Emplacement auquel la boutique est présentée
+            
+        Returns:
+            Boutique (inventaire éventuellement différé)
+        """
+        shop = self.shops.get(shop_id)
+        if shop is not None and shop.location_id == location_id:
+            return shop
+        
+        return Shop(
+            shop_id=shop_id,
+            name=name if name else f"Boutique {str(shop_id)[:8]}",
+            description=description if description else "Une boutique mystérieuse",
+            shop_type=shop_type if shop_type else "general",
+            location_id=location_id
+        )
+    
     def load_shops(self):
         """
         Charge tous les magasins depuis la base de données
@@ -298,13 +441,9 @@ class ShopManager:
             conn = self.world_loader.get_connection()
             cursor = conn.cursor()
             
-            # Vérifier la structure de la table shops
-            cursor.execute("PRAGMA table_info(shops)")
-            columns = [col[1] for col in cursor.fetchall()]
-            
-            # Déterminer le nom des colonnes
+            # Déterminer le nom des colonnes d'après le schéma en cache
             id_column = "id"
-            type_column = "shop_type" if "shop_type" in columns else "type"
+            type_column = self.schema.pick_column("shops", "shop_type", "type")
             
             # Récupérer tous les magasins
             cursor.execute(f"SELECT {id_column}, name, description, {type_column}, location_id FROM shops")
@@ -313,7 +452,6 @@ class ShopManager:
             for row in cursor.fetchall():
                 shop_id, name, description, shop_type, location_id = row
                 shop = Shop(shop_id, name, description, shop_type, location_id)
-                self._load_shop_inventory(shop)
                 all_shops.append(shop)
                 
                 # Stocker la boutique dans le dictionnaire principal
@@ -325,6 +463,10 @@ class ShopManager:
                         self.location_shops[location_id] = []
                     self.location_shops[location_id].append(shop)
             
+            # Charger tous les inventaires en bloc
+            self._load_shop_inventories(conn, shops=all_shops)
+            conn.close()
+            
             logger.info(f"[SHOP_MANAGER] {len(all_shops)} boutiques chargées avec succès")
             return all_shops
             
@@ -348,398 +490,249 @@ class ShopManager:
             data=data
         )
     
-    def _load_shop_inventories(self, conn, world_id: str) -> None:
-        """Charge les inventaires pour toutes les boutiques chargées."""
-        cursor = conn.cursor()
+    def _load_shop_inventories(self, conn, world_id: Optional[str] = None,
+                               shops: Optional[List[Shop]] = None) -> None:
+        """
+        Charge en bloc les inventaires de plusieurs boutiques.
         
-        for shop_id, shop in self.shops.items():
-            cursor.execute("""
-                SELECT * FROM shop_inventory
-                WHERE shop_id = ?
-            """, (shop_id,))
+        Les lignes de shop_inventory sont lues en une requête (par monde ou par
+        lots d'IDs de boutiques), puis chaque table d'articles est interrogée une
+        seule fois avec WHERE id IN (...), quel que soit le nombre de boutiques.
+        
+        Args:
+            conn: Connexion à la base de données
+            world_id: ID du monde dont on charge les inventaires (optionnel)
+            shops: Boutiques à remplir (par défaut, toutes les boutiques chargées)
+        """
+        shops_by_id = {shop.id: shop for shop in (self.shops.values() if shops is None else shops)}
+        if not shops_by_id:
+            return
+        
+        try:
+            cursor = conn.cursor()
             
-            # Récupérer les noms de colonnes
-            column_names = [description[0] for description in cursor.description]
+            # Déterminer les colonnes disponibles (schéma en cache)
+            columns_inventory = self.schema.columns("shop_inventory")
+            shop_id_column = "shop_id" if "shop_id" in columns_inventory else "id"
+            available_columns = ["item_id", "item_type", "quantity", "price_modifier"]
+            if "is_special" in columns_inventory:
+                available_columns.append("is_special")
+            if "metadata" in columns_inventory:
+                available_columns.append("metadata")
+            columns_str = ", ".join(f"si.{column}" for column in available_columns)
+            
+            # Récupérer toutes les lignes d'inventaire en une seule requête (ou par lots)
+            inventory_rows = []
+            if world_id is not None:
+                world_column = self.schema.pick_column("shops", "world_id", "world")
+                cursor.execute(f"""
+                    SELECT si.{shop_id_column}, {columns_str}
+                    FROM shop_inventory si
+                    JOIN shops s ON s.id = si.{shop_id_column}
+                    WHERE s.{world_column} = ?
+                """, (world_id,))
+                inventory_rows.extend(cursor.fetchall())
+            else:
+                shop_ids = list(shops_by_id)
+                for start in range(0, len(shop_ids), self.SQL_IN_CHUNK_SIZE):
+                    chunk = shop_ids[start:start + self.SQL_IN_CHUNK_SIZE]
+                    placeholders = ", ".join("?" * len(chunk))
+                    cursor.execute(f"""
+                        SELECT si.{shop_id_column}, {columns_str}
+                        FROM shop_inventory si
+                        WHERE si.{shop_id_column} IN ({placeholders})
+                    """, chunk)
+                    inventory_rows.extend(cursor.fetchall())
+            
+            # Associer chaque ligne à sa boutique
+            entries = []
+            for row in inventory_rows:
+                if row[0] in shops_by_id:
+                    entries.append((row[0], dict(zip(available_columns, row[1:]))))
+            
+            # Résoudre tous les articles avec une requête par table
+            items = self._load_items_bulk(conn, [(data['item_type'], data['item_id']) for _, data in entries])
+            
+            for shop in shops_by_id.values():
+                shop.inventory = []
+            
+            for (shop_id, item_data), item in zip(entries, items):
+                try:
+                    if item:
+                        # Calcul du prix avec le modificateur spécifique à cet article dans l'inventaire
+                        price_modifier = item_data.get('price_modifier', 1.0)
+                        price = int(item.price * price_modifier) if hasattr(item, 'price') else int(100 * price_modifier)
+                        
+                        # Ajout à l'inventaire de la boutique (définition partagée)
+                        shops_by_id[shop_id].inventory.append(ShopEntry(item, price, item_data.get('quantity', 1)))
+                except Exception as item_error:
+                    logger.error(f"Erreur lors du traitement d'un item de l'inventaire: {item_error}")
+                    continue
             
-            inventory_items = cursor.fetchall()
-            shop.inventory = []
+            self._apply_overlay(conn, shops_by_id.values())
             
-            for inv_item in inventory_items:
-                # Créer un dictionnaire en associant les noms de colonnes aux valeurs
-                item_data = {column_names[i]: inv_item[i] for i in range(len(column_names))}
-                
-                item_type = item_data['item_type']
-                item_id = item_data['item_id']
-                
-                # Chargement des détails de l'article selon son type
-                item = self._load_item_details(conn, item_type, item_id)
-                
-                if item:
-                    # Calcul du prix avec le modificateur spécifique à cet article dans l'inventaire
-                    price_modifier = item_data.get('price_modifier', 1.0)
-                    price = int(item.price * price_modifier) if hasattr(item, 'price') else int(100 * price_modifier)
-                    
-                    # Ajout à l'inventaire de la boutique
-                    shop.inventory.append((item, price))
+            logger.debug(f"[SHOP_MANAGER] {len(entries)} articles chargés pour {len(shops_by_id)} boutiques")
+            
+        except Exception as e:
+            logger.error(f"[SHOP_MANAGER] Erreur lors du chargement groupé des inventaires: {e}")
+            import traceback
+            logger.error(f"[SHOP_MANAGER] Traceback: {traceback.format_exc()}")
+            # Générer un inventaire par défaut en cas d'erreur, mais ne pas écraser un inventaire existant
+            for shop in shops_by_id.values():
+                if not shop.inventory:
+                    shop.inventory = self._generate_default_inventory(shop)
     
-    def _load_item_details(self, conn, item_type: str, item_id: str):
+    def _apply_overlay(self, conn, shops) -> None:
         """
-        Charge les détails d'un article spécifique selon son type.
+        Applique aux inventaires chargés les modifications enregistrées dans la surcouche.
         
         Args:
-            conn: Connexion à la base de données
-            item_type: Type d'article (hardware, software, consumable)
+            conn: Connexion à la base des mondes (résolution des articles ajoutés)
+            shops: Boutiques dont l'inventaire vient d'être chargé
+        """
+        added = []
+        for shop in shops:
+            for item_type, item_id, delta, price in self.overlay.get_changes(shop.id):
+                if delta < 0:
+                    self._remove_inventory_entries(shop, item_id, -delta)
+                else:
+                    added.append((shop, item_type, item_id, delta, price))
+        
+        if not added:
+            return
+        
+        items = self._load_items_bulk(conn, [(item_type, item_id) for _, item_type, item_id, _, _ in added])
+        for (shop, _, _, quantity, price), item in zip(added, items):
+            if item:
+                if price is None:
+                    price = int(getattr(item, 'price', 100))
+                shop.inventory.append(ShopEntry(item, price, quantity))
+    
+    @staticmethod
+    def _remove_inventory_entries(shop: Shop, item_id: str, count: int = 1) -> int:
+        """
+        Retire des exemplaires d'un article de l'inventaire en mémoire d'une boutique.
+        
+        Args:
+            shop: Boutique concernée
             item_id: ID de l'article
+            count: Nombre d'exemplaires à retirer
             
         Returns:
-            Instance de l'article ou None si non trouvé
+            Nombre d'exemplaires effectivement retirés
         """
-        try:
-            cursor = conn.cursor()
-            cursor.row_factory = sqlite3.Row
-            
-            # Normaliser le type d'article en minuscules
-            item_type_lower = item_type.lower()
-            
-            # Extraire l'ID réel
-            real_item_id = item_id
-            
-            # Si l'item_id contient déjà le préfixe correspondant à son type, l'utiliser tel quel
-            # C'est souvent le cas des items provenant directement de la base de données
-            if (item_id.startswith('hardware_') and item_type_lower in ['hardware', 'cpu', 'ram', 'ssd', 'tool']) or \
-               (item_id.startswith('software_') and item_type_lower in ['software', 'os', 'firewall', 'vpn']) or \
-               (item_id.startswith('weapon_') and item_type_lower in ['weapon', 'knife', 'pistol', 'rifle']) or \
-               (item_id.startswith('implant_') and item_type_lower in ['implant', 'neural', 'optical']) or \
-               (item_id.startswith('clothing_') and item_type_lower in ['clothing', 'armor', 'jacket']):
-                # L'ID est déjà préfixé correctement, pas besoin de modifier
-                pass
+        removed = 0
+        index = 0
+        while removed < count and index < len(shop.inventory):
+            entry = shop.inventory[index]
+            item, price = entry
+            if getattr(item, 'id', None) != item_id:
+                index += 1
+                continue
+            
+            quantity = getattr(entry, 'quantity', 1)
+            taken = min(quantity, count - removed)
+            removed += taken
+            if quantity > taken:
+                shop.inventory[index] = ShopEntry(item, price, quantity - taken)
+                index += 1
             else:
-                # Si on a un préfixe de type mais pas le bon, extraire l'ID sans préfixe
-                if '_' in item_id:
-                    prefix, id_part = item_id.split('_', 1)
-                    recognized_prefixes = ['hardware', 'software', 'weapon', 'implant', 'clothing', 'consumable']
-                    if prefix.lower() in recognized_prefixes:
-                        real_item_id = id_part
-                        logger.debug(f"[SHOP_MANAGER] ID extrait du préfixe: {item_id} -> {real_item_id}")
-            
-            # Déterminer la table appropriée en fonction du type d'article
-            table_name = None
-            
-            if item_type_lower.startswith('software') or item_type_lower in ['os', 'firewall', 'data_broker', 'vpn', 'crypto', 'cloud_storage']:
-                table_name = 'software_items'
-            elif item_type_lower.startswith('hardware') or item_type_lower in ['cpu', 'ram', 'ssd', 'tool']:
-                table_name = 'hardware_items'
-            elif item_type_lower.startswith('consumable') or item_type_lower in ['drink', 'stimulant', 'food']:
-                table_name = 'consumable_items'
-            elif item_type_lower.startswith('implant') or item_type_lower in ['neural', 'optical', 'skeletal', 'dermal', 'circulatory']:
-                table_name = 'implant_items'
-                # Vérifier si la table implant_items existe
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='implant_items'")
-                if not cursor.fetchone():
-                    # Si la table n'existe pas, créer un item générique
-                    logger.info(f"[SHOP_MANAGER] Table implant_items non trouvée, création d'un implant générique pour {item_id}")
-                    return self._create_generic_item(item_id, item_type)
-            elif item_type_lower.startswith('clothing') or item_type_lower in ['armor', 'jacket', 'pants', 'shirt', 'boots', 'hat', 'gloves']:
-                table_name = 'clothing_items'
-            elif item_type_lower == 'weapon' or item_type_lower in ['knife', 'pistol', 'rifle', 'shotgun', 'smg', 'sniper']:
-                table_name = 'weapon_items'
-            else:
-                # Tenter de déterminer le type réel à partir du préfixe de l'ID
-                if item_id.startswith('weapon_') and item_type_lower != 'weapon':
-                    logger.info(f"[SHOP_MANAGER] Type d'article corrigé: {item_type} -> weapon")
-                    item_type_lower = 'weapon'
-                    table_name = 'weapon_items'
-                elif item_id.startswith('clothing_') and item_type_lower != 'clothing':
-                    logger.info(f"[SHOP_MANAGER] Type d'article corrigé: {item_type} -> clothing")
-                    item_type_lower = 'clothing'
-                    table_name = 'clothing_items'
-                elif item_id.startswith('hardware_') and item_type_lower != 'hardware':
-                    logger.info(f"[SHOP_MANAGER] Type d'article corrigé: {item_type} -> hardware")
-                    item_type_lower = 'hardware'
-                    table_name = 'hardware_items'
-                elif item_id.startswith('software_') and item_type_lower != 'software':
-                    logger.info(f"[SHOP_MANAGER] Type d'article corrigé: {item_type} -> software")
-                    item_type_lower = 'software'
-                    table_name = 'software_items'
-                elif item_id.startswith('consumable_') and item_type_lower != 'consumable':
-                    logger.info(f"[SHOP_MANAGER] Type d'article corrigé: {item_type} -> consumable")
-                    item_type_lower = 'consumable'
-                    table_name = 'consumable_items'
-                elif item_id.startswith('implant_') and item_type_lower != 'implant':
-                    logger.info(f"[SHOP_MANAGER] Type d'article corrigé: {item_type} -> implant")
-                    item_type_lower = 'implant'
-                    table_name = 'implant_items'
-                elif item_id.startswith('food_') and item_type_lower != 'food':
-                    logger.info(f"[SHOP_MANAGER] Type d'article corrigé: {item_type} -> food")
-                    item_type_lower = 'food'
-                    table_name = 'food_items'
-                else:
-                    logger.info(f"[SHOP_MANAGER] Type d'article non reconnu: {item_type}, création d'un article générique")
-                    return self._create_generic_item(item_id, item_type)
-            
-            # Vérifier si la table existe
-            cursor.execute(f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table_name}'")
-            if not cursor.fetchone():
-                logger.info(f"[SHOP_MANAGER] Table {table_name} non trouvée dans la base de données, création d'un article générique")
-                return self._create_generic_item(item_id, item_type)
+                shop.inventory.pop(index)
+        return removed
+    
+    def _load_missing_inventories(self, conn, shops: List[Shop]) -> None:
+        """
+        Charge en bloc les inventaires des boutiques qui ne sont pas encore en mémoire.
+        
+        Args:
+            conn: Connexion à la base de données
+            shops: Boutiques à présenter au joueur
+        """
+        # Les boutiques déjà enregistrées gardent leur inventaire (et les achats effectués)
+        missing = [shop for shop in shops if self.shops.get(shop.id) is not shop or not shop.inventory_loaded]
+        if missing:
+            self._load_shop_inventories(conn, shops=missing)
+        for shop in shops:
+            self._touch_inventory(shop)
+    
+    def _load_items_bulk(self, conn, entries: List[Tuple[str, str]]) -> List[Any]:
+        """
+        Charge plusieurs articles avec une seule requête par table d'articles.
+        Chaque (item_type, item_id) n'est construit qu'une fois: les définitions
+        déjà présentes dans le registre sont réutilisées.
+        
+        Args:
+            conn: Connexion à la base de données
+            entries: Liste de couples (item_type, item_id)
             
-            # Essayer avec l'ID original complet
-            cursor.execute(f"SELECT * FROM {table_name} WHERE id = ?", (item_id,))
-            data = cursor.fetchone()
-            
-            # Si rien trouvé, essayer avec l'ID extrait
-            if not data and item_id != real_item_id:
-                cursor.execute(f"SELECT * FROM {table_name} WHERE id = ?", (real_item_id,))
-                data = cursor.fetchone()
-            
-            # Essayer avec préfixe + ID réel
-            if not data:
-                # Ajouter le préfixe correct basé sur le type de table
-                prefixed_id = None
-                if table_name == 'hardware_items':
-                    prefixed_id = f"hardware_{real_item_id}"
-                elif table_name == 'software_items':
-                    prefixed_id = f"software_{real_item_id}"
-                elif table_name == 'weapon_items':
-                    prefixed_id = f"weapon_{real_item_id}"
-                elif table_name == 'implant_items':
-                    prefixed_id = f"implant_{real_item_id}"
-                elif table_name == 'clothing_items':
-                    prefixed_id = f"clothing_{real_item_id}"
-                elif table_name == 'food_items':
-                    prefixed_id = f"food_{real_item_id}"
-                
-                if prefixed_id:
-                    cursor.execute(f"SELECT * FROM {table_name} WHERE id = ?", (prefixed_id,))
-                    data = cursor.fetchone()
+        Returns:
+            Liste des définitions d'articles, dans le même ordre que les entrées
+        """
+        # Clés encore absentes du registre, sans doublons
+        pending = [key for key in dict.fromkeys(entries) if key not in self.item_registry]
+        
+        resolved = []
+        wanted_ids: Dict[str, set] = {}
+        for item_type, item_id in pending:
+            try:
+                table_name, item_type_lower, candidate_ids = self._resolve_item_table(item_type, item_id)
+            except Exception as e:
+                logger.error(f"[SHOP_MANAGER] Erreur lors du chargement de l'article {item_id}: {e}")
+                table_name, item_type_lower, candidate_ids = None, None, []
+            resolved.append((table_name, item_type_lower, candidate_ids))
+            if table_name:
+                wanted_ids.setdefault(table_name, set()).update(candidate_ids)
+        
+        rows_by_table = {
+            table_name: self._fetch_item_rows(conn, table_name, ids)
+            for table_name, ids in wanted_ids.items()
+        }
+        
+        for (item_type, item_id), (table_name, item_type_lower, candidate_ids) in zip(pending, resolved):
+            try:
+                if not table_name:
+                    item = self._create_generic_item(item_id, item_type)
+                else:
+                    table_rows = rows_by_table[table_name]
+                    item_data = next((table_rows[c] for c in candidate_ids if c in table_rows), None)
+                    if item_data is None:
+                        logger.info(f"[SHOP_MANAGER] Article {item_id} non trouvé dans la table {table_name}, création d'un article générique")
+                        item = self._create_generic_item(item_id, item_type)
+                    else:
+                        item = self._build_item(item_type, item_type_lower, item_id, item_data)
+            except Exception as e:
+                logger.error(f"[SHOP_MANAGER] Erreur lors du chargement de l'article {item_id}: {e}")
+                item = self._create_generic_item(item_id, item_type)
             
-            if not data:
-                logger.info(f"[SHOP_MANAGER] Article {item_id} non trouvé dans la table {table_name}, création d'un article générique")
-                return self._create_generic_item(item_id, item_type)
+            if item is not None:
+                self.item_registry.register(item_type, item_id, item)
+        
+        return [self.item_registry.get(item_type, item_id) for item_type, item_id in entries]
+    
+    def _fetch_item_rows(self, conn, table_name: str, item_ids) -> Dict[str, Dict[str, Any]]:
+        """
+        Récupère les lignes d'une table d'articles pour un ensemble d'IDs.
+        
+        Args:
+            conn: Connexion à la base de données
+            table_name: Table d'articles
+            item_ids: IDs à récupérer
             
-            # Récupérer les noms de colonnes
+        Returns:
+            Dictionnaire {id: données de la ligne}
+        """
+        item_ids = list(item_ids)
+        rows = {}
+        cursor = conn.cursor()
+        for start in range(0, len(item_ids), self.SQL_IN_CHUNK_SIZE):
+            chunk = item_ids[start:start + self.SQL_IN_CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            cursor.execute(f"SELECT * FROM {table_name} WHERE id IN ({placeholders})", chunk)
             column_names = [description[0] for description in cursor.description]
-            # Créer un dictionnaire des données
-            item_data = {column_names[i]: data[i] for i in range(len(column_names))}
-            
-            # Créer l'instance d'article appropriée selon le type
-            if item_type_lower in ['hardware', 'cpu', 'ram', 'ssd', 'tool']:
-                try:
-                    # Convertir la chaîne 'type' en énumération HardwareType si possible
-                    from .hardware import HardwareType
-                    hw_type = item_data.get('hardware_type') or item_type
-                    if isinstance(hw_type, str):
-                        try:
-                            for t in HardwareType:
-                                if t.value == hw_type.lower():
-                                    hw_type = t
-                                    break
-                            if isinstance(hw_type, str):
-                                hw_type = HardwareType.TOOL  # Type par défaut
-                        except Exception as e:
-                            logger.error(f"[SHOP_MANAGER] Erreur lors de la conversion du type hardware: {e}")
-                            hw_type = HardwareType.TOOL
-                    
-                    # Convertir la chaîne 'rarity' en énumération HardwareRarity si possible
-                    from .hardware import HardwareRarity
-                    hw_rarity = item_data.get('rarity', 'common')
-                    if isinstance(hw_rarity, str):
-                        try:
-                            for r in HardwareRarity:
-                                if r.value == hw_rarity.lower():
-                                    hw_rarity = r
-                                    break
-                            if isinstance(hw_rarity, str):
-                                hw_rarity = HardwareRarity.COMMON  # Rareté par défaut
-                        except Exception as e:
-                            logger.error(f"[SHOP_MANAGER] Erreur lors de la conversion de la rareté hardware: {e}")
-                            hw_rarity = HardwareRarity.COMMON
-                    
-                    hardware_params = {
-                        'id': item_data.get('id') or item_id,
-                        'name': item_data.get('name') or f"Hardware {item_type.capitalize()}",
-                        'type': hw_type,
-                        'description': item_data.get('description') or f"Un équipement de type {item_type}",
-                        'level': 1,  # Valeur par défaut
-                        'rarity': hw_rarity,
-                        'price': item_data.get('price', 100)
-                    }
-                    
-                    # Ajouter stats si présent dans metadata
-                    if 'metadata' in item_data and item_data['metadata']:
-                        try:
-                            if isinstance(item_data['metadata'], str):
-                                metadata = json.loads(item_data['metadata'])
-                                if 'stats' in metadata:
-                                    hardware_params['stats'] = metadata['stats']
-                        except Exception as e:
-                            logger.error(f"[SHOP_MANAGER] Erreur lors du parsing des stats hardware: {e}")
-                    
-                    return HardwareItem(**hardware_params)
-                except Exception as e:
-                    logger.error(f"[SHOP_MANAGER] Erreur lors de la création de l'article hardware {item_id}: {e}")
-                    return self._create_generic_item(item_id, item_type, item_data)
-                    
-            elif item_type_lower in ['software', 'os', 'firewall', 'data_broker', 'vpn', 'crypto', 'cloud_storage']:
-                try:
-                    software_params = {
-                        'id': item_data.get('id') or item_id,
-                        'name': item_data.get('name') or f"Logiciel {item_type.capitalize()}",
-                        'software_type': item_data.get('software_type') or item_type.upper(),
-                        'description': item_data.get('description') or f"Un logiciel de type {item_type}",
-                        'level': 1,  # Valeur par défaut
-                        'version': item_data.get('version', '1.0'),
-                        'price': item_data.get('price', 100)
-                    }
-                    
-                    # Ajouter features si présent dans metadata
-                    if 'metadata' in item_data and item_data['metadata']:
-                        try:
-                            if isinstance(item_data['metadata'], str):
-                                metadata = json.loads(item_data['metadata'])
-                                if 'features' in metadata:
-                                    software_params['features'] = metadata['features']
-                        except Exception as e:
-                            logger.error(f"[SHOP_MANAGER] Erreur lors du parsing des features software: {e}")
-                    
-                    return SoftwareItem(**software_params)
-                except Exception as e:
-                    logger.error(f"[SHOP_MANAGER] Erreur lors de la création de l'article software {item_id}: {e}")
-                    return self._create_generic_item(item_id, item_type, item_data)
-            
-            elif item_type_lower in ['consumable', 'drink', 'stimulant', 'food']:
-                try:
-                    consumable_params = {
-                        'id': item_data.get('id') or item_id,
-                        'name': item_data.get('name') or f"Consommable {item_type.capitalize()}",
-                        'item_type': item_data.get('consumable_type') or item_type.upper(),
-                        'description': item_data.get('description') or f"Un consommable de type {item_type}",
-                        'price': item_data.get('price', 50),
-                        'uses': item_data.get('uses', 1),
-                        'rarity': item_data.get('rarity', 'Common')
-                    }
-                    
-                    # Ajouter effects si présent dans metadata
-                    if 'metadata' in item_data and item_data['metadata']:
-                        try:
-                            if isinstance(item_data['metadata'], str):
-                                metadata = json.loads(item_data['metadata'])
-                                if 'effects' in metadata:
-                                    consumable_params['effects'] = metadata['effects']
-                        except Exception as e:
-                            logger.error(f"[SHOP_MANAGER] Erreur lors du parsing des effects consumable: {e}")
-                    
-                    return ConsumableItem(**consumable_params)
-                except Exception as e:
-                    logger.error(f"[SHOP_MANAGER] Erreur lors de la création de l'article consumable {item_id}: {e}")
-                    return self._create_generic_item(item_id, item_type, item_data)
-                    
-            elif item_type_lower in ['implant', 'neural', 'optical', 'skeletal', 'dermal', 'circulatory']:
-                try:
-                    implant_params = {
-                        'id': item_data.get('id') or item_id,
-                        'name': item_data.get('name') or f"Implant {item_type.capitalize()}",
-                        'implant_type': item_data.get('implant_type') or item_type.upper(),
-                        'description': item_data.get('description') or f"Un implant de type {item_type}",
-                        'level': 1,  # Valeur par défaut
-                        'price': item_data.get('price', 100),
-                        'rarity': item_data.get('rarity', 'COMMON')
-                    }
-                    
-                    # Ajouter stats_bonus si présent dans metadata
-                    if 'metadata' in item_data and item_data['metadata']:
-                        try:
-                            if isinstance(item_data['metadata'], str):
-                                metadata = json.loads(item_data['metadata'])
-                                if 'stats_bonus' in metadata:
-                                    implant_params['stats_bonus'] = metadata['stats_bonus']
-                        except Exception as e:
-                            logger.error(f"[SHOP_MANAGER] Erreur lors du parsing des stats_bonus implant: {e}")
-                    
-                    return ImplantItem(**implant_params)
-                except Exception as e:
-                    logger.error(f"[SHOP_MANAGER] Erreur lors de la création de l'article implant {item_id}: {e}")
-                    return self._create_generic_item(item_id, item_type, item_data)
-            
-            elif item_type_lower in ['weapon', 'pistol', 'rifle', 'melee']:
-                try:
-                    # Extraire les données d'arme de metadata si disponible
-                    weapon_metadata = {}
-                    if 'metadata' in item_data and item_data['metadata']:
-                        try:
-                            if isinstance(item_data['metadata'], str):
-                                weapon_metadata = json.loads(item_data['metadata'])
-                        except Exception as e:
-                            logger.error(f"[SHOP_MANAGER] Erreur lors du parsing des metadata d'arme: {e}")
-                    
-                    return WeaponItem(
-                        id=item_data.get('id') or item_id,
-                        name=item_data.get('name') or f"Arme {item_type.capitalize()}",
-                        weapon_type=item_type,
-                        description=item_data.get('description') or f"Une arme de type {item_type}",
-                        damage=weapon_metadata.get('damage', 10),
-                        damage_type=weapon_metadata.get('damage_type', 'PHYSICAL'),
-                        range=weapon_metadata.get('range', 10),
-                        accuracy=weapon_metadata.get('accuracy', 70),
-                        price=item_data.get('price', 200)
-                    )
-                except Exception as e:
-                    logger.error(f"[SHOP_MANAGER] Erreur lors de la création de l'article weapon {item_id}: {e}")
-                    return self._create_generic_item(item_id, item_type)
-            
-            elif item_type_lower in ['clothing', 'armor', 'jacket', 'pants', 'shirt', 'boots', 'hat', 'gloves']:
-                try:
-                    clothing_params = {
-                        'id': item_data.get('id') or item_id,
-                        'name': item_data.get('name') or f"Vêtement {item_type.capitalize()}",
-                        'clothing_type': item_data.get('clothing_type') or item_type.upper(),
-                        'description': item_data.get('description') or f"Un vêtement de type {item_type}",
-                        'price': item_data.get('price', 50),
-                        'rarity': item_data.get('rarity', 'Common')
-                    }
-                    
-                    # Ajouter stats si présent dans metadata
-                    if 'metadata' in item_data and item_data['metadata']:
-                        try:
-                            if isinstance(item_data['metadata'], str):
-                                metadata = json.loads(item_data['metadata'])
-                                if 'stats' in metadata:
-                                    clothing_params['stats'] = metadata['stats']
-                        except Exception as e:
-                            logger.error(f"[SHOP_MANAGER] Erreur lors du parsing des stats clothing: {e}")
-                    
-                    return ClothingItem(**clothing_params)
-                except Exception as e:
-                    logger.error(f"[SHOP_MANAGER] Erreur lors de la création de l'article clothing {item_id}: {e}")
-                    return self._create_generic_item(item_id, item_type, item_data)
-            
-            elif item_type_lower in ['food']:
-                try:
-                    food_params = {
-                        'id': item_data.get('id') or item_id,
-                        'name': item_data.get('name') or f"Nourriture {item_type.capitalize()}",
-                        'food_type': item_data.get('food_type') or item_type.upper(),
-                        'description': item_data.get('description') or f"Un aliment de type {item_type}",
-                        'price': item_data.get('price', 50),
-                        'health_restore': item_data.get('health_restore', 10),
-                        'energy_restore': item_data.get('energy_restore', 10),
-                        'mental_restore': item_data.get('mental_restore', 5),
-                        'uses': item_data.get('uses', 1),
-                        'rarity': item_data.get('rarity', 'Common')
-                    }
-                    
-                    return FoodItem(**food_params)
-                except Exception as e:
-                    logger.error(f"[SHOP_MANAGER] Erreur lors de la création de l'article food {item_id}: {e}")
-                    return self._create_generic_item(item_id, item_type, item_data)
-            
-            else:
-                # Article générique pour les autres types
-                return self._create_generic_item(item_id, item_type)
-                
-        except Exception as e:
-            logger.error(f"[SHOP_MANAGER] Erreur lors du chargement de l'article {item_id}: {e}")
-            return self._create_generic_item(item_id, item_type)
+            for row in cursor.fetchall():
+                item_data = dict(zip(column_names, row))
+                rows[item_data['id']] = item_data
+        return rows
     
     def _create_generic_item(self, item_id, item_type, item_data=None):
         """Crée un article générique lorsque les détails spécifiques ne sont pas disponibles"""
@@ -941,8 +934,7 @@ class ShopManager:
             cursor = conn.cursor()
             
             # Vérifier si la table shops existe
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='shops'")
-            if not cursor.fetchone():
+            if not self.schema.has_table('shops'):
                 logger.error("[SHOP_MANAGER] Table 'shops' non trouvée dans la base de données")
                 return []
             
@@ -974,18 +966,12 @@ class ShopManager:
                     
                     for shop_data in shops_data:
                         shop_id, name, description, shop_type, world_id = shop_data
-                        shop = Shop(
-                            shop_id=shop_id,
-                            name=name if name else f"Boutique {shop_id[:8]}",
-                            description=description if description else "Une boutique mystérieuse",
-                            shop_type=shop_type if shop_type else "general",
-                            location_id=location_id
-                        )
-                        shop.inventory = self._load_shop_inventory(shop)
+                        shop = self._get_or_create_shop(shop_id, name, description, shop_type, location_id)
                         shops.append(shop)
                     
-                    # Si des boutiques sont trouvées, retourner immédiatement
+                    # Si des boutiques sont trouvées, charger leurs inventaires en bloc et retourner immédiatement
                     if shops:
+                        self._load_missing_inventories(conn, shops)
                         return shops
             except Exception as e:
                 logger.warning(f"[SHOP_MANAGER] Erreur lors de la recherche par location_id: {e}")
@@ -1007,18 +993,12 @@ class ShopManager:
                         
                         for shop_data in shops_data:
                             shop_id, name, description, shop_type, shop_location_name = shop_data
-                            shop = Shop(
-                                shop_id=shop_id,
-                                name=name if name else f"Boutique {shop_id[:8]}",
-                                description=description if description else "Une boutique mystérieuse",
-                                shop_type=shop_type if shop_type else "general",
-                                location_id=location_id
-                            )
-                            shop.inventory = self._load_shop_inventory(shop)
+                            shop = self._get_or_create_shop(shop_id, name, description, shop_type, location_id)
                             shops.append(shop)
                         
-                        # Si des boutiques sont trouvées, retourner immédiatement
+                        # Si des boutiques sont trouvées, charger leurs inventaires en bloc et retourner immédiatement
                         if shops:
+                            self._load_missing_inventories(conn, shops)
                             return shops
                 except Exception as e:
                     logger.warning(f"[SHOP_MANAGER] Erreur lors de la recherche par jointure: {e}")
@@ -1046,14 +1026,7 @@ class ShopManager:
                                 # Vérifier si la ville est mentionnée dans la description ou les métadonnées
                                 if (description and city_name.lower() in description.lower()) or \
                                    (metadata and city_name.lower() in metadata.lower()):
-                                    shop = Shop(
-                                        shop_id=shop_id,
-                                        name=name if name else f"Boutique {shop_id[:8]}",
-                                        description=description if description else "Une boutique mystérieuse",
-                                        shop_type=shop_type if shop_type else "general",
-                                        location_id=location_id
-                                    )
-                                    shop.inventory = self._load_shop_inventory(shop)
+                                    shop = self._get_or_create_shop(shop_id, name, description, shop_type, location_id)
                                     shops.append(shop)
                 except Exception as e:
                     logger.warning(f"[SHOP_MANAGER] Erreur lors de la recherche par world_id: {e}")
@@ -1080,14 +1053,7 @@ class ShopManager:
                             # Associer temporairement ces boutiques à l'emplacement actuel
                             for shop_data in shops_data:
                                 shop_id, name, description, shop_type, shop_location_name = shop_data
-                                shop = Shop(
-                                    shop_id=shop_id,
-                                    name=name if name else f"Boutique {shop_id[:8]}",
-                                    description=description if description else "Une boutique mystérieuse",
-                                    shop_type=shop_type if shop_type else "general",
-                                    location_id=location_id
-                                )
-                                shop.inventory = self._load_shop_inventory(shop)
+                                shop = self._get_or_create_shop(shop_id, name, description, shop_type, location_id)
                                 shops.append(shop)
                             
                             # Ajouter un log pour indiquer que ce sont des boutiques temporairement relocalisées
@@ -1096,6 +1062,9 @@ class ShopManager:
             except Exception as e:
                 logger.error(f"[SHOP_MANAGER] Erreur lors de la recherche de toutes les boutiques: {e}")
 
+            # Charger les inventaires de toutes les boutiques trouvées en bloc
+            self._load_missing_inventories(conn, shops)
+            
             logger.info(f"[SHOP_MANAGER] {len(shops)} boutiques trouvées pour l'emplacement: {location_id}")
             return shops
             
@@ -1123,18 +1092,18 @@ class ShopManager:
         # Si déjà en cache, retourner directement
         if shop_id in self.shops:
             logger.debug(f"[SHOP_MANAGER] Boutique {shop_id} récupérée depuis le cache")
-            return self.shops[shop_id]
+            shop = self.shops[shop_id]
+            self._touch_inventory(shop)
+            return shop
         
+        conn = None
         try:
-            cursor = self.world_loader.get_connection().cursor()
-            
-            # D'abord, vérifions la structure de la table shops
-            cursor.execute("PRAGMA table_info(shops)")
-            columns = [col[1] for col in cursor.fetchall()]
+            conn = self.world_loader.get_connection()
+            cursor = conn.cursor()
             
-            # Déterminer le nom des colonnes
+            # Déterminer le nom des colonnes d'après le schéma en cache
             id_column = "id"
-            type_column = "shop_type" if "shop_type" in columns else "type"
+            type_column = self.schema.pick_column("shops", "shop_type", "type")
             
             # Vérifier si la table shops existe et a les bonnes colonnes
             query = f"SELECT {id_column}, name, description, {type_column}, location_id FROM shops WHERE {id_column} = ?"
@@ -1192,91 +1161,28 @@ class ShopManager:
             import traceback
             logger.error(f"[SHOP_MANAGER] Traceback: {traceback.format_exc()}")
             return None
+        finally:
+            if conn:
+                conn.close()
             
     def _load_shop_inventory(self, shop):
         """Charge l'inventaire d'un magasin depuis la base de données"""
-        logger.debug(f"Chargement de l'inventaire pour {shop.name}")
-        
         if not shop:
             return []
-            
-        # S'assurer que l'inventaire est initialisé comme une liste vide
-        if not hasattr(shop, 'inventory') or shop.inventory is None:
-            shop.inventory = []
-            
+        
+        logger.debug(f"Chargement de l'inventaire pour {shop.name}")
+        
+        conn = None
         try:
             conn = self.world_loader.get_connection()
-            cursor = conn.cursor()
-            
-            # Vérifier la structure de la table shops
-            cursor.execute("PRAGMA table_info(shops)")
-            columns_shops = [col[1] for col in cursor.fetchall()]
-            
-            # Vérifier la structure de la table shop_inventory
-            cursor.execute("PRAGMA table_info(shop_inventory)")
-            columns_inventory = [col[1] for col in cursor.fetchall()]
-            
-            # Déterminer le nom des colonnes
-            shop_id_column = "shop_id" if "shop_id" in columns_inventory else "id"
-            
-            # Déterminer les colonnes disponibles pour la requête
-            available_columns = ["item_id", "item_type", "quantity", "price_modifier"]
-            if "is_special" in columns_inventory:
-                available_columns.append("is_special")
-            if "metadata" in columns_inventory:
-                available_columns.append("metadata")
-                
-            # Construire la requête dynamiquement
-            columns_str = ", ".join(available_columns)
-            
-            # Charger l'inventaire depuis la base de données
-            query = f"""
-                SELECT {columns_str} 
-                FROM shop_inventory 
-                WHERE {shop_id_column} = ?
-            """
-            
-            logger.debug(f"Requête d'inventaire: {query} avec paramètre: {shop.id}")
-            cursor.execute(query, (shop.id,))
-            
-            # Récupérer les noms de colonnes
-            column_names = [description[0] for description in cursor.description]
-            
-            inventory_items = cursor.fetchall()
-            
-            # Assurons-nous que nous avons bien une liste pour l'inventaire
-            if shop.inventory is None:
-                shop.inventory = []
-            
-            for inv_item in inventory_items:
-                try:
-                    # Créer un dictionnaire en associant les noms de colonnes aux valeurs
-                    item_data = {column_names[i]: inv_item[i] for i in range(len(column_names))}
-                    
-                    item_type = item_data['item_type']
-                    item_id = item_data['item_id']
-                    
-                    # Chargement des détails de l'article selon son type
-                    item = self._load_item_details(conn, item_type, item_id)
-                    
-                    if item:
-                        # Calcul du prix avec le modificateur spécifique à cet article dans l'inventaire
-                        price_modifier = item_data.get('price_modifier', 1.0)
-                        price = int(item.price * price_modifier) if hasattr(item, 'price') else int(100 * price_modifier)
-                        
-                        # Ajout à l'inventaire de la boutique
-                        shop.inventory.append((item, price))
-                except Exception as item_error:
-                    logger.error(f"Erreur lors du traitement d'un item de l'inventaire: {item_error}")
-                    continue
-                    
+            self._load_shop_inventories(conn, shops=[shop])
         except Exception as e:
             logger.error(f"[SHOP_MANAGER] Erreur lors du chargement de l'inventaire de la boutique {shop.name}: {e}")
-            import traceback
-            logger.error(f"[SHOP_MANAGER] Traceback: {traceback.format_exc()}")
-            # Générer un inventaire par défaut en cas d'erreur, mais ne pas écraser un inventaire existant
-            if not shop.inventory or len(shop.inventory) == 0:
+            if not shop.inventory:
                 shop.inventory = self._generate_default_inventory(shop)
+        finally:
+            if conn:
+                conn.close()
         
         # Retourner l'inventaire chargé ou généré
         return shop.inventory
@@ -1413,41 +1319,21 @@ class ShopManager:
             logger.debug(f"[SHOP_MANAGER] Prix calculé pour {item.name}: {price} crédits (base: {base_price}, mult: {type_multiplier})")
         
         try:
-            # Vérifier si l'item existe déjà dans la base de données
-            cursor = self.world_loader.get_connection().cursor()
-            cursor.execute("SELECT id FROM items WHERE id = ?", (item.id,))
-            if not cursor.fetchone():
-                # Sauvegarder l'item dans la base de données
-                logger.debug(f"[SHOP_MANAGER] Ajout de l'item {item.id} à la table des items")
-                
-                # Préparer les propriétés au format JSON
-                properties = {}
-                for attr in dir(item):
-                    if not attr.startswith('_') and attr not in ['id', 'name', 'description', 'item_type', 'rarity']:
-                        properties[attr] = getattr(item, attr)
-                
-                properties_json = json.dumps(properties)
-                
-                cursor.execute(
-                    """INSERT INTO items (id, name, item_type, description, properties, rarity) 
-                    VALUES (?, ?, ?, ?, ?, ?)""",
-                    (item.id, item.name, getattr(item, 'item_type', 'misc'), 
-                     getattr(item, 'description', ''), properties_json, getattr(item, 'rarity', 'common'))
-                )
-            
-            # Ajouter à l'inventaire de la boutique
+            # Enregistrer l'ajout dans la surcouche (la base des mondes n'est pas modifiée)
+            item_type = getattr(item, 'item_type', None) or getattr(item, 'type', None) or 'misc'
             logger.debug(f"[SHOP_MANAGER] Ajout de l'item {item.id} à l'inventaire de la boutique {shop_id} (prix: {price})")
-            cursor.execute(
-                """INSERT OR REPLACE INTO shop_inventory (shop_id, item_id, price) 
-                VALUES (?, ?, ?)""",
-                (shop_id, item.id, price)
-            )
-            
-            self.world_loader.get_connection().commit()
+            # Charger l'inventaire avant d'enregistrer l'ajout: un chargement paresseux
+            # appliquerait la surcouche et ajouterait l'article une seconde fois
+            inventory = shop.inventory
+            if not self.overlay.record_added(shop_id, item_type, item.id, price):
+                return False
             logger.info(f"[SHOP_MANAGER] Item {item.name} ajouté à la boutique {shop.name} avec succès")
             
-            # Mettre à jour l'objet boutique en mémoire
-            shop.add_to_inventory(item, price)
+            # Mettre à jour l'objet boutique en mémoire; l'article devient la définition
+            # utilisée pour recharger cette entrée
+            definition = self.item_registry.register(item_type, item.id, item)
+            inventory.append(ShopEntry(definition, price))
+            shop.inventory_modified = True
             
             return True
         except Exception as e:
@@ -1472,28 +1358,22 @@ class ShopManager:
             return False
         
         # Récupération de l'article à supprimer
-        item, _ = shop.inventory[item_index]
+        entry = shop.inventory[item_index]
+        item, price = entry
         
-        # Suppression de l'inventaire
-        shop.inventory.pop(item_index)
-        
-        # Synchronisation avec la base de données
-        try:
-            conn = self.world_loader.get_connection()
-            cursor = conn.cursor()
-            
-            # Suppression de l'entrée d'inventaire
-            cursor.execute("""
-                DELETE FROM shop_inventory
-                WHERE shop_id = ? AND item_id = ?
-            """, (shop_id, item.id))
-            
-            conn.commit()
-            return True
-            
-        except Exception as e:
-            logger.error(f"Erreur lors de la suppression d'un article de la boutique: {e}")
+        # Enregistrement du retrait dans la surcouche (la base des mondes n'est pas modifiée)
+        item_type = getattr(item, 'item_type', None) or getattr(item, 'type', None) or 'misc'
+        if not self.overlay.record_removed(shop_id, item_type, item.id):
             return False
+        
+        # Retrait d'un exemplaire de l'inventaire en mémoire
+        quantity = getattr(entry, 'quantity', 1)
+        if quantity > 1:
+            shop.inventory[item_index] = ShopEntry(item, price, quantity - 1)
+        else:
+            shop.inventory.pop(item_index)
+        shop.inventory_modified = True
+        return True
     
     def is_player_in_compatible_location(self, player_location_id: str, shop_location_id: str) -> bool:
         """
@@ -1510,6 +1390,11 @@ class ShopManager:
         # Correspondance directe
         if player_location_id == shop_location_id:
             return True
+        
+        # La boutique est dans le quartier ou la ville où se trouve le joueur
+        district_id, city_id = self._get_location_hierarchy().get(player_location_id, (None, None))
+        if shop_location_id in (district_id, city_id):
+            return True
             
         # Vérifier si le joueur est dans un bâtiment de la ville de la boutique
         # Format conventionnel des IDs de bâtiment: "building_{city_id}_{unique_suffix}"
@@ -1524,17 +1409,23 @@ class ShopManager:
                     
         return False
     
+    def _get_location_hierarchy(self) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """Hiérarchie des lieux du monde chargé: {lieu: (quartier, ville)}, partagée par le WorldLoader"""
+        if not self.world_id:
+            return {}
+        return self.world_loader.get_location_hierarchy(self.world_id)
+    
     def get_city_id_from_location(self, location_id: str) -> str:
         """
         Extrait l'ID de la ville à partir d'un ID de localisation.
-        Si le joueur est dans un bâtiment, on extrait l'ID de la ville du bâtiment.
-        Sinon, on suppose que le joueur est directement dans une ville.
+        La ville est lue dans la hiérarchie des lieux du monde (quartiers et bâtiments
+        compris); à défaut, l'ID de la ville est extrait d'un ID de bâtiment conventionnel.
         
         Args:
-            location_id: ID de la localisation (ville ou bâtiment)
+            location_id: ID de la localisation (ville, quartier ou bâtiment)
             
         Returns:
-            ID de la ville correspondante ou l'ID original si ce n'est pas un bâtiment
+            ID de la ville correspondante ou l'ID original si aucune ville n'est trouvée
         """
         logger.debug(f"[SHOP_MANAGER] Extraction de l'ID de ville à partir de: {location_id}")
         
@@ -1543,6 +1434,11 @@ class ShopManager:
             logger.warning("[SHOP_MANAGER] ID de localisation vide, utilisation de 'default'")
             return 'default'
         
+        entry = self._get_location_hierarchy().get(location_id)
+        if entry and entry[1]:
+            logger.debug(f"[SHOP_MANAGER] Ville de '{location_id}' trouvée dans la hiérarchie: {entry[1]}")
+            return entry[1]
+        
         # Format attendu des IDs de bâtiment: "building_{city_id}_{unique_suffix}"
         if location_id.startswith("building_") and "_" in location_id:
             parts = location_id.split("_", 2)
@@ -1550,54 +1446,6 @@ class ShopManager:
                 city_id = parts[1]
                 logger.debug(f"[SHOP_MANAGER] ID de ville extrait du bâtiment: {city_id}")
                 return city_id
-        
-        # Si ce n'est pas un bâtiment ou si le format est invalide,
-        # on suppose que c'est directement une ville
-        # Essayons de voir si nous pouvons trouver l'ID de la ville dans la base de données
-        try:
-            conn = self.world_loader.get_connection()
-            if conn:
-                cursor = conn.cursor()
-                
-                # Vérifier si la table locations existe
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='locations'")
-                if cursor.fetchone():
-                    # Vérifier si l'ID correspond à une localisation existante
-                    cursor.execute("PRAGMA table_info(locations)")
-                    columns = [col[1] for col in cursor.fetchall()]
-                    
-                    # Déterminer le nom de la colonne ID (id ou location_id)
-                    id_column = "location_id" if "location_id" in columns else "id"
-                    
-                    # Déterminer le nom de la colonne type (location_type ou type)
-                    type_column = "location_type" if "location_type" in columns else "type"
-                    
-                    # Chercher par ID
-                    query = f"SELECT {id_column}, name, {type_column} FROM locations WHERE {id_column} = ?"
-                    cursor.execute(query, (location_id,))
-                    location_data = cursor.fetchone()
-                    
-                    if location_data:
-                        # Si c'est une ville, utiliser son ID
-                        loc_type = location_data[2] if location_data[2] else ""
-                        if loc_type.lower() in ['city', 'town', 'village', 'metropolis']:
-                            logger.debug(f"[SHOP_MANAGER] Localisation '{location_id}' identifiée comme une ville")
-                            return location_id
-                        # Si c'est un bâtiment, chercher sa ville
-                        else:
-                            # Chercher la ville de ce bâtiment s'il y a une relation
-                            if 'parent_id' in columns or 'parent_location_id' in columns:
-                                parent_column = "parent_location_id" if "parent_location_id" in columns else "parent_id"
-                                # Exécuter une nouvelle requête pour récupérer le parent_id
-                                parent_query = f"SELECT {parent_column} FROM locations WHERE {id_column} = ?"
-                                cursor.execute(parent_query, (location_id,))
-                                parent_row = cursor.fetchone()
-                                if parent_row and parent_row[0]:
-                                    parent_id = parent_row[0]
-                                    logger.debug(f"[SHOP_MANAGER] Bâtiment trouvé avec parent_id: {parent_id}")
-                                    return parent_id
-        except Exception as e:
-            logger.error(f"[SHOP_MANAGER] Erreur lors de la recherche dans la base de données: {str(e)}")
     
         # Par défaut, retourner l'ID original
         logger.debug(f"[SHOP_MANAGER] Utilisation de l'ID non modifié comme ID de ville: {location_id}")
@@ -1610,13 +1458,13 @@ class ShopManager:
         Returns:
             str: ID du premier monde trouvé, ou "default" si aucun monde n'est trouvé
         """
+        conn = None
         try:
             conn = self.world_loader.get_connection()
             cursor = conn.cursor()
             
             # Vérifier si la table worlds existe
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='worlds';")
-            if not cursor.fetchone():
+            if not self.schema.has_table('worlds'):
                 logger.warning("La table worlds n'existe pas dans la base de données.")
                 return "default"
             
@@ -1644,11 +1492,21 @@ class ShopManager:
         except Exception as e:
             logger.error(f"Erreur lors de la récupération du premier monde: {e}")
             return "default"
+        finally:
+            if conn:
+                conn.close()
     
     def _initialize_shop_tables(self):
         """
         Initialise les tables de boutiques dans la base de données si elles n'existent pas.
         """
+        if self.schema.has_table("shops") and self.schema.has_table("shop_inventory"):
+            return
+        
+        if getattr(self.world_loader, 'read_only', False):
+            logger.warning("Tables de boutiques absentes d'une base des mondes ouverte en lecture seule")
+            return
+        
         try:
             conn = self.world_loader.get_connection()
             cursor = conn.cursor()
@@ -1695,6 +1553,7 @@ class ShopManager:
             
             conn.commit()
             conn.close()
+            self.schema.invalidate()
             logger.info("Tables de boutiques initialisées avec succès")
             
             # Créer des boutiques de démonstration pour le monde par défaut
@@ -1713,13 +1572,9 @@ class ShopManager:
             conn = self.world_loader.get_connection()
             cursor = conn.cursor()
             
-            # Vérifier la structure de la table shops
-            cursor.execute("PRAGMA table_info(shops)")
-            columns = [col[1] for col in cursor.fetchall()]
-            
-            # Déterminer le nom des colonnes
+            # Déterminer le nom des colonnes d'après le schéma en cache
             id_column = "id"
-            type_column = "shop_type" if "shop_type" in columns else "type"
+            type_column = self.schema.pick_column("shops", "shop_type", "type")
             
             # Vérifier si des boutiques existent déjà
             cursor.execute("SELECT COUNT(*) FROM shops")
@@ -1780,100 +1635,86 @@ class ShopManager:
 
     def load_shops_for_world(self, world_id: str) -> bool:
         """
-        Charge toutes les boutiques pour un monde spu00e9cifique.
+        Charge toutes les boutiques pour un monde spécifique.
+        
+        Le chargement est ensembliste: une requête pour les boutiques du monde,
+        une pour leurs inventaires, puis une par table d'articles, quel que soit
+        le nombre de boutiques.
         
         Args:
             world_id: Identifiant du monde
         
         Returns:
-            True si le chargement est ru00e9ussi, False sinon
+            True si le chargement est réussi, False sinon
         """
         logger.info(f"[SHOP_MANAGER] Chargement des boutiques pour le monde: {world_id}")
         
+        conn = None
         try:
-            # Ru00e9initialiser la liste des boutiques
+            # Réinitialiser la liste des boutiques
             self.shops = {}
             self.location_shops = {}
+            self.world_id = world_id
             
-            # Obtenir une connexion u00e0 la base de donnu00e9es
+            # Obtenir une connexion à la base de données
             conn = self.world_loader.get_connection()
             if not conn:
-                logger.error("[SHOP_MANAGER] Impossible d'obtenir une connexion u00e0 la base de donnu00e9es")
+                logger.error("[SHOP_MANAGER] Impossible d'obtenir une connexion à la base de données")
+                return False
+            
+            if not self.schema.has_table('shops'):
+                logger.error("[SHOP_MANAGER] Table 'shops' non trouvée dans la base de données")
                 return False
             
             cursor = conn.cursor()
             
-            # Ru00e9cupu00e9rer toutes les villes de ce monde
-            logger.debug(f"[SHOP_MANAGER] Ru00e9cupu00e9ration des villes du monde {world_id}")
-            cursor.execute("PRAGMA table_info(locations)")
-            columns = [col[1] for col in cursor.fetchall()]
+            # Déterminer le nom des colonnes d'après le schéma en cache
+            type_column = self.schema.pick_column("shops", "shop_type", "type")
+            world_column = self.schema.pick_column("shops", "world_id", "world")
             
-            # Du00e9terminer les noms de colonnes corrects
-            id_column = "location_id" if "location_id" in columns else "id"
-            world_column = "world_id" if "world_id" in columns else "world"
-            type_column = "location_type" if "location_type" in columns else "type"
+            # Récupérer toutes les boutiques du monde en une seule requête
+            cursor.execute(f"""
+                SELECT id, name, description, {type_column}, location_id
+                FROM shops
+                WHERE {world_column} = ?
+            """, (world_id,))
+            
+            for shop_id, name, description, shop_type, location_id in cursor.fetchall():
+                shop = Shop(
+                    shop_id=shop_id,
+                    name=name if name else f"Boutique {str(shop_id)[:8]}",
+                    description=description if description else "Une boutique mystérieuse",
+                    shop_type=shop_type if shop_type else "general",
+                    location_id=location_id
+                )
+                self.shops[shop_id] = shop
+                
+                # Enregistrer les boutiques par emplacement
+                if location_id:
+                    self.location_shops.setdefault(location_id, []).append(shop)
+            
+            logger.info(f"[SHOP_MANAGER] Total: {len(self.shops)} boutiques chargées pour le monde {world_id}")
             
-            # Si la colonne de type n'existe pas, utiliser une autre mu00e9thode pour identifier les villes
-            city_query = ""
-            if type_column in columns:
-                city_query = f"SELECT {id_column}, name FROM locations WHERE {world_column} = ? AND {type_column} = 'city'"
+            if self.lazy_inventories:
+                # Les inventaires seront chargés à la première visite de chaque boutique
+                self._loaded_inventories.clear()
+                for shop in self.shops.values():
+                    self._defer_inventory(shop)
+                logger.debug("[SHOP_MANAGER] Chargement des inventaires différé")
             else:
-                # Si pas de colonne de type, chercher par d'autres moyens (parent_id NULL ou tags contenant 'ville')
-                if 'parent_id' in columns or 'parent_location_id' in columns:
-                    parent_column = "parent_location_id" if "parent_location_id" in columns else "parent_id"
-                    city_query = f"SELECT {id_column}, name FROM locations WHERE {world_column} = ? AND {parent_column} IS NULL"
-                elif 'tags' in columns:
-                    city_query = f"SELECT {id_column}, name FROM locations WHERE {world_column} = ? AND tags LIKE '%ville%' OR tags LIKE '%city%'"
-                else:
-                    # Si aucun moyen de du00e9terminer les villes, utiliser toutes les locations
-                    city_query = f"SELECT {id_column}, name FROM locations WHERE {world_column} = ?"
-                    logger.warning("[SHOP_MANAGER] Impossible de du00e9terminer quelles locations sont des villes - utilisation de toutes les locations")
-        
-            # Exu00e9cuter la requu00eate pour ru00e9cupu00e9rer les villes
-            try:
-                cursor.execute(city_query, (world_id,))
-                cities = cursor.fetchall()
-                logger.info(f"[SHOP_MANAGER] {len(cities)} villes trouvu00e9es dans le monde {world_id}")
-            except Exception as e:
-                logger.error(f"[SHOP_MANAGER] Erreur lors de la ru00e9cupu00e9ration des villes: {str(e)}")
-                # Si la requu00e9te u00e9choue, essayer une requu00e9te plus simple sans filtrage par type
-                cursor.execute(f"SELECT {id_column}, name FROM locations WHERE {world_column} = ?", (world_id,))
-                cities = cursor.fetchall()
-                logger.info(f"[SHOP_MANAGER] {len(cities)} locations trouvu00e9es dans le monde {world_id} (sans filtrage par type)")
-        
-            # Ru00e9cupu00e9rer les boutiques pour chaque ville
-            total_shops = 0
-            for city_id, city_name in cities:
-                logger.debug(f"[SHOP_MANAGER] Chargement des boutiques pour la ville: {city_name} (ID: {city_id})")
-                shops = self.get_shops_by_location(city_id)
-                
-                # Enregistrer les boutiques par ville
-                if shops:
-                    self.location_shops[city_id] = shops
-                    logger.info(f"[SHOP_MANAGER] {len(shops)} boutiques trouvu00e9es pour {city_name} (ID: {city_id})")
-                    total_shops += len(shops)
-                    
-                    # Ajouter u00e9galement les boutiques au dictionnaire principal
-                    for shop in shops:
-                        self.shops[shop.id] = shop
-        
-            logger.info(f"[SHOP_MANAGER] Total: {total_shops} boutiques chargu00e9es pour le monde {world_id}")
-        
-            # Chargement des inventaires pour chaque boutique
-            logger.debug("[SHOP_MANAGER] Chargement des inventaires des boutiques")
-            for shop_id, shop in self.shops.items():
-                try:
-                    shop.inventory = self._load_shop_inventory(shop)
-                    logger.debug(f"[SHOP_MANAGER] Inventaire chargu00e9 pour la boutique {shop.name}: {len(shop.inventory)} objets")
-                except Exception as e:
-                    logger.error(f"[SHOP_MANAGER] Erreur lors du chargement de l'inventaire de la boutique {shop.name}: {str(e)}")
-        
+                # Chargement des inventaires de toutes les boutiques du monde
+                logger.debug("[SHOP_MANAGER] Chargement des inventaires des boutiques")
+                self._load_shop_inventories(conn, world_id=world_id)
+            
             return True
         except Exception as e:
             logger.error(f"[SHOP_MANAGER] Erreur lors du chargement des boutiques: {str(e)}")
             import traceback
             logger.error(f"[SHOP_MANAGER] Traceback: {traceback.format_exc()}")
             return False
+        finally:
+            if conn:
+                conn.close()
     
     def get_shops_by_type(self, shop_type: str) -> List[Shop]:
         """
@@ -1889,13 +1730,9 @@ class ShopManager:
             conn = self.world_loader.get_connection()
             cursor = conn.cursor()
             
-            # Vérifier la structure de la table shops
-            cursor.execute("PRAGMA table_info(shops)")
-            columns = [col[1] for col in cursor.fetchall()]
-            
-            # Déterminer le nom des colonnes
+            # Déterminer le nom des colonnes d'après le schéma en cache
             id_column = "id"
-            type_column = "shop_type" if "shop_type" in columns else "type"
+            type_column = self.schema.pick_column("shops", "shop_type", "type")
             
             # Récupérer les magasins par type
             cursor.execute(f"""
@@ -1908,8 +1745,11 @@ class ShopManager:
             for row in cursor.fetchall():
                 shop_id, name, description, shop_type, location_id = row
                 shop = Shop(shop_id, name, description, shop_type, location_id)
-                self._load_shop_inventory(shop)
                 shops.append(shop)
+            
+            # Charger tous les inventaires en bloc
+            self._load_shop_inventories(conn, shops=shops)
+            conn.close()
                 
             return shops
             
@@ -1929,349 +1769,371 @@ class ShopManager:
         Returns:
             Instance de l'article ou None si non trouvé
         """
+        definition = self.item_registry.get(item_type, item_id)
+        if definition is not None:
+            return definition
+        
         try:
-            cursor = conn.cursor()
-            cursor.row_factory = sqlite3.Row
-            
-            # Normaliser le type d'article en minuscules
-            item_type_lower = item_type.lower()
-            
-            # Extraire l'ID réel
-            real_item_id = item_id
-            
-            # Si l'item_id contient déjà le préfixe correspondant à son type, l'utiliser tel quel
-            # C'est souvent le cas des items provenant directement de la base de données
-            if (item_id.startswith('hardware_') and item_type_lower in ['hardware', 'cpu', 'ram', 'ssd', 'tool']) or \
-               (item_id.startswith('software_') and item_type_lower in ['software', 'os', 'firewall', 'vpn']) or \
-               (item_id.startswith('weapon_') and item_type_lower in ['weapon', 'knife', 'pistol', 'rifle']) or \
-               (item_id.startswith('implant_') and item_type_lower in ['implant', 'neural', 'optical']) or \
-               (item_id.startswith('clothing_') and item_type_lower in ['clothing', 'armor', 'jacket']):
-                # L'ID est déjà préfixé correctement, pas besoin de modifier
-                pass
-            else:
-                # Si on a un préfixe de type mais pas le bon, extraire l'ID sans préfixe
-                if '_' in item_id:
-                    prefix, id_part = item_id.split('_', 1)
-                    recognized_prefixes = ['hardware', 'software', 'weapon', 'implant', 'clothing', 'consumable']
-                    if prefix.lower() in recognized_prefixes:
-                        real_item_id = id_part
-                        logger.debug(f"[SHOP_MANAGER] ID extrait du préfixe: {item_id} -> {real_item_id}")
-            
-            # Déterminer la table appropriée en fonction du type d'article
-            table_name = None
-            
-            if item_type_lower.startswith('software') or item_type_lower in ['os', 'firewall', 'data_broker', 'vpn', 'crypto', 'cloud_storage']:
-                table_name = 'software_items'
-            elif item_type_lower.startswith('hardware') or item_type_lower in ['cpu', 'ram', 'ssd', 'tool']:
-                table_name = 'hardware_items'
-            elif item_type_lower.startswith('consumable') or item_type_lower in ['drink', 'stimulant', 'food']:
-                table_name = 'consumable_items'
-            elif item_type_lower.startswith('implant') or item_type_lower in ['neural', 'optical', 'skeletal', 'dermal', 'circulatory']:
-                table_name = 'implant_items'
-                # Vérifier si la table implant_items existe
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='implant_items'")
-                if not cursor.fetchone():
-                    # Si la table n'existe pas, créer un item générique
-                    logger.info(f"[SHOP_MANAGER] Table implant_items non trouvée, création d'un implant générique pour {item_id}")
-                    return self._create_generic_item(item_id, item_type)
-            elif item_type_lower.startswith('clothing') or item_type_lower in ['armor', 'jacket', 'pants', 'shirt', 'boots', 'hat', 'gloves']:
-                table_name = 'clothing_items'
-            elif item_type_lower == 'weapon' or item_type_lower in ['knife', 'pistol', 'rifle', 'shotgun', 'smg', 'sniper']:
-                table_name = 'weapon_items'
-            else:
-                # Tenter de déterminer le type réel à partir du préfixe de l'ID
-                if item_id.startswith('weapon_') and item_type_lower != 'weapon':
-                    logger.info(f"[SHOP_MANAGER] Type d'article corrigé: {item_type} -> weapon")
-                    item_type_lower = 'weapon'
-                    table_name = 'weapon_items'
-                elif item_id.startswith('clothing_') and item_type_lower != 'clothing':
-                    logger.info(f"[SHOP_MANAGER] Type d'article corrigé: {item_type} -> clothing")
-                    item_type_lower = 'clothing'
-                    table_name = 'clothing_items'
-                elif item_id.startswith('hardware_') and item_type_lower != 'hardware':
-                    logger.info(f"[SHOP_MANAGER] Type d'article corrigé: {item_type} -> hardware")
-                    item_type_lower = 'hardware'
-                    table_name = 'hardware_items'
-                elif item_id.startswith('software_') and item_type_lower != 'software':
-                    logger.info(f"[SHOP_MANAGER] Type d'article corrigé: {item_type} -> software")
-                    item_type_lower = 'software'
-                    table_name = 'software_items'
-                elif item_id.startswith('consumable_') and item_type_lower != 'consumable':
-                    logger.info(f"[SHOP_MANAGER] Type d'article corrigé: {item_type} -> consumable")
-                    item_type_lower = 'consumable'
-                    table_name = 'consumable_items'
-                elif item_id.startswith('implant_') and item_type_lower != 'implant':
-                    logger.info(f"[SHOP_MANAGER] Type d'article corrigé: {item_type} -> implant")
-                    item_type_lower = 'implant'
-                    table_name = 'implant_items'
-                elif item_id.startswith('food_') and item_type_lower != 'food':
-                    logger.info(f"[SHOP_MANAGER] Type d'article corrigé: {item_type} -> food")
-                    item_type_lower = 'food'
-                    table_name = 'food_items'
-                else:
-                    logger.info(f"[SHOP_MANAGER] Type d'article non reconnu: {item_type}, création d'un article générique")
-                    return self._create_generic_item(item_id, item_type)
-            
-            # Vérifier si la table existe
-            cursor.execute(f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table_name}'")
-            if not cursor.fetchone():
-                logger.info(f"[SHOP_MANAGER] Table {table_name} non trouvée dans la base de données, création d'un article générique")
+            table_name, item_type_lower, candidate_ids = self._resolve_item_table(item_type, item_id)
+            if not table_name:
                 return self._create_generic_item(item_id, item_type)
             
-            # Essayer avec l'ID original complet
-            cursor.execute(f"SELECT * FROM {table_name} WHERE id = ?", (item_id,))
-            data = cursor.fetchone()
-            
-            # Si rien trouvé, essayer avec l'ID extrait
-            if not data and item_id != real_item_id:
-                cursor.execute(f"SELECT * FROM {table_name} WHERE id = ?", (real_item_id,))
-                data = cursor.fetchone()
-            
-            # Essayer avec préfixe + ID réel
-            if not data:
-                # Ajouter le préfixe correct basé sur le type de table
-                prefixed_id = None
-                if table_name == 'hardware_items':
-                    prefixed_id = f"hardware_{real_item_id}"
-                elif table_name == 'software_items':
-                    prefixed_id = f"software_{real_item_id}"
-                elif table_name == 'weapon_items':
-                    prefixed_id = f"weapon_{real_item_id}"
-                elif table_name == 'implant_items':
-                    prefixed_id = f"implant_{real_item_id}"
-                elif table_name == 'clothing_items':
-                    prefixed_id = f"clothing_{real_item_id}"
-                elif table_name == 'food_items':
-                    prefixed_id = f"food_{real_item_id}"
-                
-                if prefixed_id:
-                    cursor.execute(f"SELECT * FROM {table_name} WHERE id = ?", (prefixed_id,))
-                    data = cursor.fetchone()
+            # Une seule requête pour tous les IDs candidats
+            rows = self._fetch_item_rows(conn, table_name, candidate_ids)
+            item_data = next((rows[c] for c in candidate_ids if c in rows), None)
             
-            if not data:
+            if not item_data:
                 logger.info(f"[SHOP_MANAGER] Article {item_id} non trouvé dans la table {table_name}, création d'un article générique")
                 return self._create_generic_item(item_id, item_type)
             
-            # Récupérer les noms de colonnes
-            column_names = [description[0] for description in cursor.description]
-            # Créer un dictionnaire des données
-            item_data = {column_names[i]: data[i] for i in range(len(column_names))}
-            
-            # Créer l'instance d'article appropriée selon le type
-            if item_type_lower in ['hardware', 'cpu', 'ram', 'ssd', 'tool']:
-                try:
-                    # Convertir la chaîne 'type' en énumération HardwareType si possible
-                    from .hardware import HardwareType
-                    hw_type = item_data.get('hardware_type') or item_type
-                    if isinstance(hw_type, str):
-                        try:
-                            for t in HardwareType:
-                                if t.value == hw_type.lower():
-                                    hw_type = t
-                                    break
-                            if isinstance(hw_type, str):
-                                hw_type = HardwareType.TOOL  # Type par défaut
-                        except Exception as e:
-                            logger.error(f"[SHOP_MANAGER] Erreur lors de la conversion du type hardware: {e}")
-                            hw_type = HardwareType.TOOL
-                    
-                    # Convertir la chaîne 'rarity' en énumération HardwareRarity si possible
-                    from .hardware import HardwareRarity
-                    hw_rarity = item_data.get('rarity', 'common')
-                    if isinstance(hw_rarity, str):
-                        try:
-                            for r in HardwareRarity:
-                                if r.value == hw_rarity.lower():
-                                    hw_rarity = r
-                                    break
-                            if isinstance(hw_rarity, str):
-                                hw_rarity = HardwareRarity.COMMON  # Rareté par défaut
-                        except Exception as e:
-                            logger.error(f"[SHOP_MANAGER] Erreur lors de la conversion de la rareté hardware: {e}")
-                            hw_rarity = HardwareRarity.COMMON
-                    
-                    hardware_params = {
-                        'id': item_data.get('id') or item_id,
-                        'name': item_data.get('name') or f"Hardware {item_type.capitalize()}",
-                        'type': hw_type,
-                        'description': item_data.get('description') or f"Un équipement de type {item_type}",
-                        'level': 1,  # Valeur par défaut
-                        'rarity': hw_rarity,
-                        'price': item_data.get('price', 100)
-                    }
-                    
-                    # Ajouter stats si présent dans metadata
-                    if 'metadata' in item_data and item_data['metadata']:
-                        try:
-                            if isinstance(item_data['metadata'], str):
-                                metadata = json.loads(item_data['metadata'])
-                                if 'stats' in metadata:
-                                    hardware_params['stats'] = metadata['stats']
-                        except Exception as e:
-                            logger.error(f"[SHOP_MANAGER] Erreur lors du parsing des stats hardware: {e}")
-                    
-                    return HardwareItem(**hardware_params)
-                except Exception as e:
-                    logger.error(f"[SHOP_MANAGER] Erreur lors de la création de l'article hardware {item_id}: {e}")
-                    return self._create_generic_item(item_id, item_type, item_data)
-                    
-            elif item_type_lower in ['software', 'os', 'firewall', 'data_broker', 'vpn', 'crypto', 'cloud_storage']:
-                try:
-                    software_params = {
-                        'id': item_data.get('id') or item_id,
-                        'name': item_data.get('name') or f"Logiciel {item_type.capitalize()}",
-                        'software_type': item_data.get('software_type') or item_type.upper(),
-                        'description': item_data.get('description') or f"Un logiciel de type {item_type}",
-                        'level': 1,  # Valeur par défaut
-                        'version': item_data.get('version', '1.0'),
-                        'price': item_data.get('price', 100)
-                    }
-                    
-                    # Ajouter features si présent dans metadata
-                    if 'metadata' in item_data and item_data['metadata']:
-                        try:
-                            if isinstance(item_data['metadata'], str):
-                                metadata = json.loads(item_data['metadata'])
-                                if 'features' in metadata:
-                                    software_params['features'] = metadata['features']
-                        except Exception as e:
-                            logger.error(f"[SHOP_MANAGER] Erreur lors du parsing des features software: {e}")
-                    
-                    return SoftwareItem(**software_params)
-                except Exception as e:
-                    logger.error(f"[SHOP_MANAGER] Erreur lors de la création de l'article software {item_id}: {e}")
-                    return self._create_generic_item(item_id, item_type, item_data)
-            
-            elif item_type_lower in ['consumable', 'drink', 'stimulant', 'food']:
-                try:
-                    consumable_params = {
-                        'id': item_data.get('id') or item_id,
-                        'name': item_data.get('name') or f"Consommable {item_type.capitalize()}",
-                        'item_type': item_data.get('consumable_type') or item_type.upper(),
-                        'description': item_data.get('description') or f"Un consommable de type {item_type}",
-                        'price': item_data.get('price', 50),
-                        'uses': item_data.get('uses', 1),
-                        'rarity': item_data.get('rarity', 'Common')
-                    }
-                    
-                    # Ajouter effects si présent dans metadata
-                    if 'metadata' in item_data and item_data['metadata']:
-                        try:
-                            if isinstance(item_data['metadata'], str):
-                                metadata = json.loads(item_data['metadata'])
-                                if 'effects' in metadata:
-                                    consumable_params['effects'] = metadata['effects']
-                        except Exception as e:
-                            logger.error(f"[SHOP_MANAGER] Erreur lors du parsing des effects consumable: {e}")
-                    
-                    return ConsumableItem(**consumable_params)
-                except Exception as e:
-                    logger.error(f"[SHOP_MANAGER] Erreur lors de la création de l'article consumable {item_id}: {e}")
-                    return self._create_generic_item(item_id, item_type, item_data)
-                    
-            elif item_type_lower in ['implant', 'neural', 'optical', 'skeletal', 'dermal', 'circulatory']:
-                try:
-                    implant_params = {
-                        'id': item_data.get('id') or item_id,
-                        'name': item_data.get('name') or f"Implant {item_type.capitalize()}",
-                        'implant_type': item_data.get('implant_type') or item_type.upper(),
-                        'description': item_data.get('description') or f"Un implant de type {item_type}",
-                        'level': 1,  # Valeur par défaut
-                        'price': item_data.get('price', 100),
-                        'rarity': item_data.get('rarity', 'COMMON')
-                    }
-                    
-                    # Ajouter stats_bonus si présent dans metadata
-                    if 'metadata' in item_data and item_data['metadata']:
-                        try:
-                            if isinstance(item_data['metadata'], str):
-                                metadata = json.loads(item_data['metadata'])
-                                if 'stats_bonus' in metadata:
-                                    implant_params['stats_bonus'] = metadata['stats_bonus']
-                        except Exception as e:
-                            logger.error(f"[SHOP_MANAGER] Erreur lors du parsing des stats_bonus implant: {e}")
-                    
-                    return ImplantItem(**implant_params)
-                except Exception as e:
-                    logger.error(f"[SHOP_MANAGER] Erreur lors de la création de l'article implant {item_id}: {e}")
-                    return self._create_generic_item(item_id, item_type, item_data)
-            
-            elif item_type_lower in ['weapon', 'pistol', 'rifle', 'melee']:
-                try:
-                    # Extraire les données d'arme de metadata si disponible
-                    weapon_metadata = {}
-                    if 'metadata' in item_data and item_data['metadata']:
-                        try:
-                            if isinstance(item_data['metadata'], str):
-                                weapon_metadata = json.loads(item_data['metadata'])
-                        except Exception as e:
-                            logger.error(f"[SHOP_MANAGER] Erreur lors du parsing des metadata d'arme: {e}")
-                    
-                    return WeaponItem(
-                        id=item_data.get('id') or item_id,
-                        name=item_data.get('name') or f"Arme {item_type.capitalize()}",
-                        weapon_type=item_type,
-                        description=item_data.get('description') or f"Une arme de type {item_type}",
-                        damage=weapon_metadata.get('damage', 10),
-                        damage_type=weapon_metadata.get('damage_type', 'PHYSICAL'),
-                        range=weapon_metadata.get('range', 10),
-                        accuracy=weapon_metadata.get('accuracy', 70),
-                        price=item_data.get('price', 200)
-                    )
-                except Exception as e:
-                    logger.error(f"[SHOP_MANAGER] Erreur lors de la création de l'article weapon {item_id}: {e}")
-                    return self._create_generic_item(item_id, item_type)
-            
-            elif item_type_lower in ['clothing', 'armor', 'jacket', 'pants', 'shirt', 'boots', 'hat', 'gloves']:
-                try:
-                    clothing_params = {
-                        'id': item_data.get('id') or item_id,
-                        'name': item_data.get('name') or f"Vêtement {item_type.capitalize()}",
-                        'clothing_type': item_data.get('clothing_type') or item_type.upper(),
-                        'description': item_data.get('description') or f"Un vêtement de type {item_type}",
-                        'price': item_data.get('price', 50),
-                        'rarity': item_data.get('rarity', 'Common')
-                    }
-                    
-                    # Ajouter stats si présent dans metadata
-                    if 'metadata' in item_data and item_data['metadata']:
-                        try:
-                            if isinstance(item_data['metadata'], str):
-                                metadata = json.loads(item_data['metadata'])
-                                if 'stats' in metadata:
-                                    clothing_params['stats'] = metadata['stats']
-                        except Exception as e:
-                            logger.error(f"[SHOP_MANAGER] Erreur lors du parsing des stats clothing: {e}")
-                    
-                    return ClothingItem(**clothing_params)
-                except Exception as e:
-                    logger.error(f"[SHOP_MANAGER] Erreur lors de la création de l'article clothing {item_id}: {e}")
-                    return self._create_generic_item(item_id, item_type, item_data)
-            
-            elif item_type_lower in ['food']:
-                try:
-                    food_params = {
-                        'id': item_data.get('id') or item_id,
-                        'name': item_data.get('name') or f"Nourriture {item_type.capitalize()}",
-                        'food_type': item_data.get('food_type') or item_type.upper(),
-                        'description': item_data.get('description') or f"Un aliment de type {item_type}",
-                        'price': item_data.get('price', 50),
-                        'health_restore': item_data.get('health_restore', 10),
-                        'energy_restore': item_data.get('energy_restore', 10),
-                        'mental_restore': item_data.get('mental_restore', 5),
-                        'uses': item_data.get('uses', 1),
-                        'rarity': item_data.get('rarity', 'Common')
-                    }
-                    
-                    return FoodItem(**food_params)
-                except Exception as e:
-                    logger.error(f"[SHOP_MANAGER] Erreur lors de la création de l'article food {item_id}: {e}")
-                    return self._create_generic_item(item_id, item_type, item_data)
+            return self.item_registry.register(
+                item_type, item_id, self._build_item(item_type, item_type_lower, item_id, item_data)
+            )
+                
+        except Exception as e:
+            logger.error(f"[SHOP_MANAGER] Erreur lors du chargement de l'article {item_id}: {e}")
+            return self._create_generic_item(item_id, item_type)
+
+    def _resolve_item_table(self, item_type: str, item_id: str) -> Tuple[Optional[str], str, List[str]]:
+        """
+        Détermine la table d'un article et les IDs sous lesquels le chercher.
+        
+        Args:
+            item_type: Type d'article (hardware, software, consumable)
+            item_id: ID de l'article
             
+        Returns:
+            Tuple (table, type normalisé, IDs candidats par ordre de préférence);
+            la table vaut None si l'article doit être générique
+        """
+        # Normaliser le type d'article en minuscules
+        item_type_lower = item_type.lower()
+        
+        # Extraire l'ID réel
+        real_item_id = item_id
+        
+        # Si l'item_id contient déjà le préfixe correspondant à son type, l'utiliser tel quel
+        # C'est souvent le cas des items provenant directement de la base de données
+        if (item_id.startswith('hardware_') and item_type_lower in ['hardware', 'cpu', 'ram', 'ssd', 'tool']) or \
+           (item_id.startswith('software_') and item_type_lower in ['software', 'os', 'firewall', 'vpn']) or \
+           (item_id.startswith('weapon_') and item_type_lower in ['weapon', 'knife', 'pistol', 'rifle']) or \
+           (item_id.startswith('implant_') and item_type_lower in ['implant', 'neural', 'optical']) or \
+           (item_id.startswith('clothing_') and item_type_lower in ['clothing', 'armor', 'jacket']):
+            # L'ID est déjà préfixé correctement, pas besoin de modifier
+            pass
+        else:
+            # Si on a un préfixe de type mais pas le bon, extraire l'ID sans préfixe
+            if '_' in item_id:
+                prefix, id_part = item_id.split('_', 1)
+                recognized_prefixes = ['hardware', 'software', 'weapon', 'implant', 'clothing', 'consumable']
+                if prefix.lower() in recognized_prefixes:
+                    real_item_id = id_part
+                    logger.debug(f"[SHOP_MANAGER] ID extrait du préfixe: {item_id} -> {real_item_id}")
+        
+        # Déterminer la table appropriée en fonction du type d'article
+        table_name = None
+        
+        if item_type_lower.startswith('software') or item_type_lower in ['os', 'firewall', 'data_broker', 'vpn', 'crypto', 'cloud_storage']:
+            table_name = 'software_items'
+        elif item_type_lower.startswith('hardware') or item_type_lower in ['cpu', 'ram', 'ssd', 'tool']:
+            table_name = 'hardware_items'
+        elif item_type_lower.startswith('consumable') or item_type_lower in ['drink', 'stimulant', 'food']:
+            table_name = 'consumable_items'
+        elif item_type_lower.startswith('implant') or item_type_lower in ['neural', 'optical', 'skeletal', 'dermal', 'circulatory']:
+            table_name = 'implant_items'
+            # Vérifier si la table implant_items existe
+            if not self.schema.has_table('implant_items'):
+                # Si la table n'existe pas, créer un item générique
+                logger.info(f"[SHOP_MANAGER] Table implant_items non trouvée, création d'un implant générique pour {item_id}")
+                return None, item_type_lower, []
+        elif item_type_lower.startswith('clothing') or item_type_lower in ['armor', 'jacket', 'pants', 'shirt', 'boots', 'hat', 'gloves']:
+            table_name = 'clothing_items'
+        elif item_type_lower == 'weapon' or item_type_lower in ['knife', 'pistol', 'rifle', 'shotgun', 'smg', 'sniper']:
+            table_name = 'weapon_items'
+        else:
+            # Tenter de déterminer le type réel à partir du préfixe de l'ID
+            if item_id.startswith('weapon_') and item_type_lower != 'weapon':
+                logger.info(f"[SHOP_MANAGER] Type d'article corrigé: {item_type} -> weapon")
+                item_type_lower = 'weapon'
+                table_name = 'weapon_items'
+            elif item_id.startswith('clothing_') and item_type_lower != 'clothing':
+                logger.info(f"[SHOP_MANAGER] Type d'article corrigé: {item_type} -> clothing")
+                item_type_lower = 'clothing'
+                table_name = 'clothing_items'
+            elif item_id.startswith('hardware_') and item_type_lower != 'hardware':
+                logger.info(f"[SHOP_MANAGER] Type d'article corrigé: {item_type} -> hardware")
+                item_type_lower = 'hardware'
+                table_name = 'hardware_items'
+            elif item_id.startswith('software_') and item_type_lower != 'software':
+                logger.info(f"[SHOP_MANAGER] Type d'article corrigé: {item_type} -> software")
+                item_type_lower = 'software'
+                table_name = 'software_items'
+            elif item_id.startswith('consumable_') and item_type_lower != 'consumable':
+                logger.info(f"[SHOP_MANAGER] Type d'article corrigé: {item_type} -> consumable")
+                item_type_lower = 'consumable'
+                table_name = 'consumable_items'
+            elif item_id.startswith('implant_') and item_type_lower != 'implant':
+                logger.info(f"[SHOP_MANAGER] Type d'article corrigé: {item_type} -> implant")
+                item_type_lower = 'implant'
+                table_name = 'implant_items'
+            elif item_id.startswith('food_') and item_type_lower != 'food':
+                logger.info(f"[SHOP_MANAGER] Type d'article corrigé: {item_type} -> food")
+                item_type_lower = 'food'
+                table_name = 'food_items'
             else:
-                # Article générique pour les autres types
+                logger.info(f"[SHOP_MANAGER] Type d'article non reconnu: {item_type}, création d'un article générique")
+                return None, item_type_lower, []
+        
+        # Vérifier si la table existe
+        if not self.schema.has_table(table_name):
+            logger.info(f"[SHOP_MANAGER] Table {table_name} non trouvée dans la base de données, création d'un article générique")
+            return None, item_type_lower, []
+        
+        # IDs candidats: l'ID original complet, l'ID extrait, puis le préfixe de la table + l'ID réel
+        candidate_ids = [item_id]
+        if real_item_id != item_id:
+            candidate_ids.append(real_item_id)
+        
+        table_prefixes = {
+            'hardware_items': 'hardware',
+            'software_items': 'software',
+            'weapon_items': 'weapon',
+            'implant_items': 'implant',
+            'clothing_items': 'clothing',
+            'food_items': 'food',
+        }
+        if table_name in table_prefixes:
+            prefixed_id = f"{table_prefixes[table_name]}_{real_item_id}"
+            if prefixed_id not in candidate_ids:
+                candidate_ids.append(prefixed_id)
+        
+        return table_name, item_type_lower, candidate_ids
+
+    def _build_item(self, item_type: str, item_type_lower: str, item_id: str, item_data: Dict[str, Any]):
+        """
+        Crée l'instance d'article appropriée à partir d'une ligne de sa table.
+        
+        Args:
+            item_type: Type d'article tel qu'enregistré dans l'inventaire
+            item_type_lower: Type d'article normalisé
+            item_id: ID de l'article
+            item_data: Données de la ligne de la table d'articles
+            
+        Returns:
+            Instance de l'article
+        """
+        # Créer l'instance d'article appropriée selon le type
+        if item_type_lower in ['hardware', 'cpu', 'ram', 'ssd', 'tool']:
+            try:
+                # Convertir la chaîne 'type' en énumération HardwareType si possible
+                from .hardware import HardwareType
+                hw_type = item_data.get('hardware_type') or item_type
+                if isinstance(hw_type, str):
+                    try:
+                        for t in HardwareType:
+                            if t.value == hw_type.lower():
+                                hw_type = t
+                                break
+                        if isinstance(hw_type, str):
+                            hw_type = HardwareType.TOOL  # Type par défaut
+                    except Exception as e:
+                        logger.error(f"[SHOP_MANAGER] Erreur lors de la conversion du type hardware: {e}")
+                        hw_type = HardwareType.TOOL
+                
+                # Convertir la chaîne 'rarity' en énumération HardwareRarity si possible
+                from .hardware import HardwareRarity
+                hw_rarity = item_data.get('rarity', 'common')
+                if isinstance(hw_rarity, str):
+                    try:
+                        for r in HardwareRarity:
+                            if r.value == hw_rarity.lower():
+                                hw_rarity = r
+                                break
+                        if isinstance(hw_rarity, str):
+                            hw_rarity = HardwareRarity.COMMON  # Rareté par défaut
+                    except Exception as e:
+                        logger.error(f"[SHOP_MANAGER] Erreur lors de la conversion de la rareté hardware: {e}")
+                        hw_rarity = HardwareRarity.COMMON
+                
+                hardware_params = {
+                    'id': item_data.get('id') or item_id,
+                    'name': item_data.get('name') or f"Hardware {item_type.capitalize()}",
+                    'type': hw_type,
+                    'description': item_data.get('description') or f"Un équipement de type {item_type}",
+                    'level': 1,  # Valeur par défaut
+                    'rarity': hw_rarity,
+                    'price': item_data.get('price', 100)
+                }
+                
+                # Ajouter stats si présent dans metadata
+                if 'metadata' in item_data and item_data['metadata']:
+                    try:
+                        if isinstance(item_data['metadata'], str):
+                            metadata = json.loads(item_data['metadata'])
+                            if 'stats' in metadata:
+                                hardware_params['stats'] = metadata['stats']
+                    except Exception as e:
+                        logger.error(f"[SHOP_MANAGER] Erreur lors du parsing des stats hardware: {e}")
+                
+                return HardwareItem(**hardware_params)
+            except Exception as e:
+                logger.error(f"[SHOP_MANAGER] Erreur lors de la création de l'article hardware {item_id}: {e}")
+                return self._create_generic_item(item_id, item_type, item_data)
+                
+        elif item_type_lower in ['software', 'os', 'firewall', 'data_broker', 'vpn', 'crypto', 'cloud_storage']:
+            try:
+                software_params = {
+                    'id': item_data.get('id') or item_id,
+                    'name': item_data.get('name') or f"Logiciel {item_type.capitalize()}",
+                    'software_type': item_data.get('software_type') or item_type.upper(),
+                    'description': item_data.get('description') or f"Un logiciel de type {item_type}",
+                    'level': 1,  # Valeur par défaut
+                    'version': item_data.get('version', '1.0'),
+                    'price': item_data.get('price', 100)
+                }
+                
+                # Ajouter features si présent dans metadata
+                if 'metadata' in item_data and item_data['metadata']:
+                    try:
+                        if isinstance(item_data['metadata'], str):
+                            metadata = json.loads(item_data['metadata'])
+                            if 'features' in metadata:
+                                software_params['features'] = metadata['features']
+                    except Exception as e:
+                        logger.error(f"[SHOP_MANAGER] Erreur lors du parsing des features software: {e}")
+                
+                return SoftwareItem(**software_params)
+            except Exception as e:
+                logger.error(f"[SHOP_MANAGER] Erreur lors de la création de l'article software {item_id}: {e}")
+                return self._create_generic_item(item_id, item_type, item_data)
+        
+        elif item_type_lower in ['consumable', 'drink', 'stimulant', 'food']:
+            try:
+                consumable_params = {
+                    'id': item_data.get('id') or item_id,
+                    'name': item_data.get('name') or f"Consommable {item_type.capitalize()}",
+                    'item_type': item_data.get('consumable_type') or item_type.upper(),
+                    'description': item_data.get('description') or f"Un consommable de type {item_type}",
+                    'price': item_data.get('price', 50),
+                    'uses': item_data.get('uses', 1),
+                    'rarity': item_data.get('rarity', 'Common')
+                }
+                
+                # Ajouter effects si présent dans metadata
+                if 'metadata' in item_data and item_data['metadata']:
+                    try:
+                        if isinstance(item_data['metadata'], str):
+                            metadata = json.loads(item_data['metadata'])
+                            if 'effects' in metadata:
+                                consumable_params['effects'] = metadata['effects']
+                    except Exception as e:
+                        logger.error(f"[SHOP_MANAGER] Erreur lors du parsing des effects consumable: {e}")
+                
+                return ConsumableItem(**consumable_params)
+            except Exception as e:
+                logger.error(f"[SHOP_MANAGER] Erreur lors de la création de l'article consumable {item_id}: {e}")
+                return self._create_generic_item(item_id, item_type, item_data)
+                
+        elif item_type_lower in ['implant', 'neural', 'optical', 'skeletal', 'dermal', 'circulatory']:
+            try:
+                implant_params = {
+                    'id': item_data.get('id') or item_id,
+                    'name': item_data.get('name') or f"Implant {item_type.capitalize()}",
+                    'implant_type': item_data.get('implant_type') or item_type.upper(),
+                    'description': item_data.get('description') or f"Un implant de type {item_type}",
+                    'level': 1,  # Valeur par défaut
+                    'price': item_data.get('price', 100),
+                    'rarity': item_data.get('rarity', 'COMMON')
+                }
+                
+                # Ajouter stats_bonus si présent dans metadata
+                if 'metadata' in item_data and item_data['metadata']:
+                    try:
+                        if isinstance(item_data['metadata'], str):
+                            metadata = json.loads(item_data['metadata'])
+                            if 'stats_bonus' in metadata:
+                                implant_params['stats_bonus'] = metadata['stats_bonus']
+                    except Exception as e:
+                        logger.error(f"[SHOP_MANAGER] Erreur lors du parsing des stats_bonus implant: {e}")
+                
+                return ImplantItem(**implant_params)
+            except Exception as e:
+                logger.error(f"[SHOP_MANAGER] Erreur lors de la création de l'article implant {item_id}: {e}")
+                return self._create_generic_item(item_id, item_type, item_data)
+        
+        elif item_type_lower in ['weapon', 'pistol', 'rifle', 'melee']:
+            try:
+                # Extraire les données d'arme de metadata si disponible
+                weapon_metadata = {}
+                if 'metadata' in item_data and item_data['metadata']:
+                    try:
+                        if isinstance(item_data['metadata'], str):
+                            weapon_metadata = json.loads(item_data['metadata'])
+                    except Exception as e:
+                        logger.error(f"[SHOP_MANAGER] Erreur lors du parsing des metadata d'arme: {e}")
+                
+                return WeaponItem(
+                    id=item_data.get('id') or item_id,
+                    name=item_data.get('name') or f"Arme {item_type.capitalize()}",
+                    weapon_type=item_type,
+                    description=item_data.get('description') or f"Une arme de type {item_type}",
+                    damage=weapon_metadata.get('damage', 10),
+                    damage_type=weapon_metadata.get('damage_type', 'PHYSICAL'),
+                    range=weapon_metadata.get('range', 10),
+                    accuracy=weapon_metadata.get('accuracy', 70),
+                    price=item_data.get('price', 200)
+                )
+            except Exception as e:
+                logger.error(f"[SHOP_MANAGER] Erreur lors de la création de l'article weapon {item_id}: {e}")
                 return self._create_generic_item(item_id, item_type)
+        
+        elif item_type_lower in ['clothing', 'armor', 'jacket', 'pants', 'shirt', 'boots', 'hat', 'gloves']:
+            try:
+                clothing_params = {
+                    'id': item_data.get('id') or item_id,
+                    'name': item_data.get('name') or f"Vêtement {item_type.capitalize()}",
+                    'clothing_type': item_data.get('clothing_type') or item_type.upper(),
+                    'description': item_data.get('description') or f"Un vêtement de type {item_type}",
+                    'price': item_data.get('price', 50),
+                    'rarity': item_data.get('rarity', 'Common')
+                }
                 
-        except Exception as e:
-            logger.error(f"[SHOP_MANAGER] Erreur lors du chargement de l'article {item_id}: {e}")
+                # Ajouter stats si présent dans metadata
+                if 'metadata' in item_data and item_data['metadata']:
+                    try:
+                        if isinstance(item_data['metadata'], str):
+                            metadata = json.loads(item_data['metadata'])
+                            if 'stats' in metadata:
+                                clothing_params['stats'] = metadata['stats']
+                    except Exception as e:
+                        logger.error(f"[SHOP_MANAGER] Erreur lors du parsing des stats clothing: {e}")
+                
+                return ClothingItem(**clothing_params)
+            except Exception as e:
+                logger.error(f"[SHOP_MANAGER] Erreur lors de la création de l'article clothing {item_id}: {e}")
+                return self._create_generic_item(item_id, item_type, item_data)
+        
+        elif item_type_lower in ['food']:
+            try:
+                food_params = {
+                    'id': item_data.get('id') or item_id,
+                    'name': item_data.get('name') or f"Nourriture {item_type.capitalize()}",
+                    'food_type': item_data.get('food_type') or item_type.upper(),
+                    'description': item_data.get('description') or f"Un aliment de type {item_type}",
+                    'price': item_data.get('price', 50),
+                    'health_restore': item_data.get('health_restore', 10),
+                    'energy_restore': item_data.get('energy_restore', 10),
+                    'mental_restore': item_data.get('mental_restore', 5),
+                    'uses': item_data.get('uses', 1),
+                    'rarity': item_data.get('rarity', 'Common')
+                }
+                
+                return FoodItem(**food_params)
+            except Exception as e:
+                logger.error(f"[SHOP_MANAGER] Erreur lors de la création de l'article food {item_id}: {e}")
+                return self._create_generic_item(item_id, item_type, item_data)
+        
+        else:
+            # Article générique pour les autres types
             return self._create_generic_item(item_id, item_type)
+
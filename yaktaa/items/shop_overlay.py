@@ -0,0 +1,140 @@
+"""
+Module de surcouche de l'état des boutiques pour YakTaa
+Ce module enregistre les modifications des inventaires de boutiques faites en
+jeu (articles ajoutés ou retirés) dans une base séparée, en écriture, pour que
+la base des mondes puisse rester ouverte en lecture seule.
+"""
+
+import logging
+import sqlite3
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("YakTaa.Items.ShopOverlay")
+
+OVERLAY_TABLE = "shop_inventory_overlay"
+
+
+class ShopStateOverlay:
+    """
+    Modifications des inventaires de boutiques, appliquées par-dessus la base des mondes.
+    Chaque ligne porte une variation de quantité par (boutique, article): positive pour
+    les articles ajoutés (avec leur prix), négative pour les articles retirés.
+    """
+
+    def __init__(self, connection_factory: Callable):
+        """
+        Initialise la surcouche
+
+        Args:
+            connection_factory: Fonction fournissant une connexion en écriture
+                (typiquement WorldLoader.get_overlay_connection)
+        """
+        self._connect = connection_factory
+
+        # Modifications connues, chargées au premier accès puis tenues à jour:
+        # {shop_id: {item_id: [item_type, variation de quantité, prix]}}
+        self._changes: Optional[Dict[str, Dict[str, list]]] = None
+
+    def _ensure_table(self, conn) -> None:
+        """Crée la table de surcouche si elle n'existe pas"""
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {OVERLAY_TABLE} (
+                shop_id TEXT NOT NULL,
+                item_id TEXT NOT NULL,
+                item_type TEXT NOT NULL,
+                quantity_delta INTEGER NOT NULL DEFAULT 0,
+                price INTEGER,
+                PRIMARY KEY (shop_id, item_id)
+            )
+        """)
+
+    def _load(self) -> Dict[str, Dict[str, list]]:
+        """Charge toutes les modifications enregistrées (la surcouche reste petite)"""
+        if self._changes is not None:
+            return self._changes
+
+        changes: Dict[str, Dict[str, list]] = {}
+        conn = None
+        try:
+            conn = self._connect()
+            # La table n'est créée qu'à la première modification: une simple lecture n'écrit rien
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (OVERLAY_TABLE,)
+            ).fetchone()
+            rows = conn.execute(
+                f"SELECT shop_id, item_id, item_type, quantity_delta, price FROM {OVERLAY_TABLE}"
+            ) if exists else []
+            for row in rows:
+                changes.setdefault(row[0], {})[row[1]] = [row[2], row[3], row[4]]
+        except sqlite3.Error as e:
+            logger.warning(f"Surcouche des boutiques indisponible, état de la base des mondes seul: {e}")
+        finally:
+            if conn:
+                conn.close()
+
+        self._changes = changes
+        return changes
+
+    def _record(self, shop_id: str, item_type: str, item_id: str, delta: int, price: Optional[int]) -> bool:
+        """
+        Enregistre une variation de quantité d'un article d'une boutique
+
+        Args:
+            shop_id: ID de la boutique
+            item_type: Type de l'article
+            item_id: ID de l'article
+            delta: Variation de la quantité
+            price: Prix de vente (None pour conserver le prix connu)
+
+        Returns:
+            True si la modification a été enregistrée, False sinon
+        """
+        changes = self._load()
+        conn = None
+        try:
+            conn = self._connect()
+            self._ensure_table(conn)
+            conn.execute(f"""
+                INSERT INTO {OVERLAY_TABLE} (shop_id, item_id, item_type, quantity_delta, price)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (shop_id, item_id) DO UPDATE SET
+                    quantity_delta = quantity_delta + excluded.quantity_delta,
+                    price = COALESCE(excluded.price, price)
+            """, (shop_id, item_id, item_type, delta, price))
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Erreur lors de l'enregistrement de l'inventaire de la boutique {shop_id}: {e}")
+            return False
+        finally:
+            if conn:
+                conn.close()
+
+        change = changes.setdefault(shop_id, {}).setdefault(item_id, [item_type, 0, None])
+        change[1] += delta
+        if price is not None:
+            change[2] = price
+        return True
+
+    def record_added(self, shop_id: str, item_type: str, item_id: str, price: int) -> bool:
+        """Enregistre l'ajout d'un exemplaire d'un article à une boutique"""
+        return self._record(shop_id, item_type, item_id, 1, price)
+
+    def record_removed(self, shop_id: str, item_type: str, item_id: str) -> bool:
+        """Enregistre le retrait d'un exemplaire d'un article d'une boutique"""
+        return self._record(shop_id, item_type, item_id, -1, None)
+
+    def get_changes(self, shop_id: str) -> List[Tuple[str, str, int, Optional[int]]]:
+        """
+        Récupère les modifications d'une boutique
+
+        Args:
+            shop_id: ID de la boutique
+
+        Returns:
+            Liste de tuples (item_type, item_id, variation de quantité, prix)
+        """
+        return [
+            (item_type, item_id, delta, price)
+            for item_id, (item_type, delta, price) in self._load().get(shop_id, {}).items()
+            if delta
+        ]
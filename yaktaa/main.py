@@ -492,31 +492,10 @@ class MainWindow(QMainWindow):
                     logger.error("Impossible d'initialiser ShopScreen: instance de jeu non disponible")
                     raise ImportError("Game instance requise pour ShopScreen")
                 
-                # Réinitialiser le shop_manager si nécessaire
-                if not hasattr(self.game, 'shop_manager') or self.game.shop_manager is None:
-                    try:
-                        logger.warning("ShopManager non disponible lors de l'initialisation - tentative de réinitialisation")
-                        from yaktaa.items.shop_manager import ShopManager
-                        from yaktaa.world.world_loader import WorldLoader
-                        
-                        # Créer une nouvelle instance
-                        world_loader = WorldLoader()
-                        self.game.shop_manager = ShopManager(world_loader)
-                        
-                        # Charger les boutiques pour le monde actuel
-                        world_id = "default"
-                        if hasattr(self.game, 'world_manager') and self.game.world_manager:
-                            current_world = getattr(self.game.world_manager, 'current_world_id', None)
-                            if current_world:
-                                world_id = current_world
-                        
-                        self.game.shop_manager.load_shops_for_world(world_id)
-                        logger.info(f"ShopManager réinitialisé avec succès pour le monde {world_id}")
-                    except Exception as e:
-                        logger.error(f"Erreur lors de la réinitialisation de ShopManager: {str(e)}")
-                        import traceback
-                        logger.error(f"Traceback: {traceback.format_exc()}")
-                        raise ImportError(f"Erreur de réinitialisation du ShopManager: {str(e)}")
+                # Le gestionnaire de boutiques est construit avec le monde, par l'écran de chargement
+                # (après la création de l'interface): l'écran de boutique le lit au moment de l'affichage
+                if self.game._shop_manager is None:
+                    logger.debug("ShopManager pas encore chargé: il sera disponible après le chargement du monde")
                 
                 # Créer l'instance avec gestion d'erreurs détaillée
                 try:
@@ -1024,7 +1003,9 @@ class MainWindow(QMainWindow):
                             if item.id == item_id:
                                 logger.debug(f"[SHOP] Item trouvé dans l'inventaire de la boutique: {item.name}")
                                 
-                                # Ajouter à l'inventaire du joueur
+                                # Ajouter à l'inventaire du joueur un exemplaire propre (la définition est partagée entre boutiques)
+                                from yaktaa.items.item_registry import ItemRegistry
+                                item = ItemRegistry.instantiate(item)
                                 self.game.player.inventory.add_item(item)
                                 logger.info(f"[SHOP] Item {item.name} ajouté à l'inventaire du joueur")
                                 
@@ -1176,6 +1157,12 @@ class MainWindow(QMainWindow):
         logger.info("[SHOP] === Début du chargement de l'écran de boutique ===")
         
         try:
+            # Monde et boutiques disponibles seulement après le chargement d'une partie
+            if self.game.world_manager is None or self.game.shop_manager is None:
+                logger.warning("[SHOP] Monde non chargé: aucune boutique à afficher")
+                self.status_label.setText("Aucune partie en cours.")
+                return
+            
             # Récupérer l'ID d'emplacement actuel depuis le gestionnaire de monde
             current_location = self.game.world_manager.current_location_id
             logger.debug(f"[SHOP] Emplacement actuel: {current_location}")
@@ -100,6 +100,39 @@ class HackingObjective(Objective):
         else:
             return "Analysez le système avant de tenter une intrusion."
 
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit l'objectif en dictionnaire pour la sauvegarde"""
+        data = super().to_dict()
+        data.update({
+            "title": self.title,
+            "target_system": self.target_system,
+            "security_level": self.security_level.name,
+            "puzzle_type": self.puzzle_type.name if self.puzzle_type else None,
+            "location_id": self.location_id,
+            "reward_xp": self.reward_xp,
+            "reward_money": self.reward_money,
+            "metadata": self.metadata
+        })
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'HackingObjective':
+        """Crée un objectif de hacking à partir d'un dictionnaire"""
+        objective = cls(
+            title=data["title"],
+            description=data["description"],
+            target_system=data["target_system"],
+            security_level=SecurityLevel[data["security_level"]],
+            puzzle_type=HackingPuzzleType[data["puzzle_type"]] if data.get("puzzle_type") else None,
+            location_id=data.get("location_id"),
+            reward_xp=data.get("reward_xp", 100),
+            reward_money=data.get("reward_money", 500)
+        )
+        objective.id = data["id"]
+        objective.metadata.update(data.get("metadata", {}))
+        objective._restore_state(data)
+        return objective
 
 class HackingMission(Mission):
     """Mission spécialisée dans le hacking"""
@@ -201,6 +234,33 @@ class HackingMission(Mission):
         
         self.add_objective(objective)
         return objective
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'HackingMission':
+        """Crée une mission de hacking à partir d'un dictionnaire"""
+        metadata = data.get("metadata", {})
+        mission = cls(
+            title=data["title"],
+            description=data["description"],
+            difficulty=data["difficulty"],
+            target_corporation=metadata.get("target_corporation")
+        )
+        mission.id = data["id"]
+        mission.location_id = data["location_id"]
+        mission.giver_id = data["giver_id"]
+        mission.faction = data["faction"]
+        mission.time_limit = data["time_limit"]
+        mission.prerequisites = data["prerequisites"]
+        mission.progress = data.get("progress", 0)
+        mission.metadata.update(metadata)
+        mission._restore_state(data)
+        return mission
+    
+    def _objective_from_dict(self, data: Dict[str, Any]) -> Objective:
+        """Crée un objectif de la mission (de hacking ou non) à partir d'un dictionnaire"""
+        if "target_system" in data:
+            return HackingObjective.from_dict(data)
+        return Objective.from_dict(data)
 
 
 class HackingMissionGenerator:
@@ -138,14 +138,19 @@ class Mission:
         else:
             self.rewards[reward_type] = value
     
-    def start(self) -> bool:
-        """Démarre la mission"""
+    def start(self, now: Optional[datetime] = None) -> bool:
+        """
+        Démarre la mission
+        
+        Args:
+            now: Date courante du jeu (None = horloge système)
+        """
         if self.status != MissionStatus.AVAILABLE:
             logger.warning(f"Tentative de démarrer une mission non disponible : {self.title}")
             return False
         
         self.status = MissionStatus.ACTIVE
-        self.start_time = datetime.now()
+        self.start_time = now or datetime.now()
         
         # Définir la date d'expiration si un délai est spécifié
         if self.time_limit:
@@ -179,12 +184,17 @@ class Mission:
         logger.info(f"Mission échouée : {self.title}")
         return True
     
-    def check_expiration(self) -> bool:
-        """Vérifie si la mission a expiré"""
+    def check_expiration(self, now: Optional[datetime] = None) -> bool:
+        """
+        Vérifie si la mission a expiré
+        
+        Args:
+            now: Date courante du jeu (None = horloge système)
+        """
         if self.status != MissionStatus.ACTIVE or not self.end_time:
             return False
         
-        if datetime.now() > self.end_time:
+        if (now or datetime.now()) > self.end_time:
             self.status = MissionStatus.EXPIRED
             logger.info(f"Mission expirée : {self.title}")
             return True
@@ -219,12 +229,12 @@ class Mission:
         total_progress = sum(obj.progress for obj in self.objectives)
         return total_progress / len(self.objectives)
     
-    def get_remaining_time(self) -> Optional[timedelta]:
-        """Récupère le temps restant avant expiration"""
+    def get_remaining_time(self, now: Optional[datetime] = None) -> Optional[timedelta]:
+        """Récupère le temps restant avant expiration (now: date courante du jeu, None = horloge système)"""
         if not self.end_time or self.status != MissionStatus.ACTIVE:
             return None
         
-        remaining = self.end_time - datetime.now()
+        remaining = self.end_time - (now or datetime.now())
         return remaining if remaining.total_seconds() > 0 else timedelta(0)
     
     def to_dict(self) -> Dict[str, Any]:
@@ -234,7 +244,8 @@ class Mission:
             "title": self.title,
             "description": self.description,
             "mission_type": self.mission_type.name,
-            "difficulty": self.difficulty.name,
+            # Les missions de hacking ont une difficulté entière (1-10)
+            "difficulty": self.difficulty.name if isinstance(self.difficulty, MissionDifficulty) else self.difficulty,
             "location_id": self.location_id,
             "giver_id": self.giver_id,
             "faction": self.faction,
@@ -267,22 +278,28 @@ class Mission:
             progress=data.get("progress", 0),
             metadata=data.get("metadata", {})
         )
-        
-        mission.status = MissionStatus[data["status"]]
-        mission.rewards = data["rewards"]
-        mission.tags = set(data["tags"])
+        mission._restore_state(data)
+        return mission
+    
+    def _restore_state(self, data: Dict[str, Any]) -> None:
+        """Restaure l'avancement de la mission (statut, dates, objectifs) depuis un dictionnaire"""
+        self.status = MissionStatus[data["status"]]
+        self.rewards = data["rewards"]
+        self.tags = set(data["tags"])
         
         if data["start_time"]:
-            mission.start_time = datetime.fromisoformat(data["start_time"])
+            self.start_time = datetime.fromisoformat(data["start_time"])
         
         if data["end_time"]:
-            mission.end_time = datetime.fromisoformat(data["end_time"])
+            self.end_time = datetime.fromisoformat(data["end_time"])
         
         # Charger les objectifs
         for obj_data in data["objectives"]:
-            mission.objectives.append(Objective.from_dict(obj_data))
-        
-        return mission
+            self.objectives.append(self._objective_from_dict(obj_data))
+    
+    def _objective_from_dict(self, data: Dict[str, Any]) -> 'Objective':
+        """Crée un objectif de la mission à partir d'un dictionnaire"""
+        return Objective.from_dict(data)
 
 
 class ObjectiveType(Enum):
@@ -379,11 +396,13 @@ class Objective:
             optional=data["optional"],
             objective_id=data["id"]
         )
-        
-        objective.progress = data["progress"]
-        objective.completed = data["completed"]
-        
+        objective._restore_state(data)
         return objective
+    
+    def _restore_state(self, data: Dict[str, Any]) -> None:
+        """Restaure la progression de l'objectif depuis un dictionnaire"""
+        self.progress = data["progress"]
+        self.completed = data["completed"]
 
 
 class MissionManager:
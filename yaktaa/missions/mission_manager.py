@@ -8,7 +8,7 @@ import json
 import os
 import random
 from typing import Dict, List, Optional, Any, Set, Tuple, TYPE_CHECKING
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from yaktaa.missions.mission import Mission, Objective, MissionStatus, MissionType, MissionDifficulty, ObjectiveType
 from yaktaa.missions.hacking_missions import HackingMission, HackingObjective, HackingMissionGenerator
@@ -37,6 +37,9 @@ class MissionManager:
         self.completed_missions: Dict[str, Mission] = {}
         self.failed_missions: Dict[str, Mission] = {}
         
+        # Avance de l'horloge des missions sur l'horloge système (temps passé en accéléré)
+        self.time_offset = timedelta(0)
+        
         # Charger les missions de test pour le développement
         self._load_test_missions()
         
@@ -187,7 +190,7 @@ class MissionManager:
             return False
         
         mission = self.available_missions.pop(mission_id)
-        if mission.start():
+        if mission.start(self.now()):
             self.active_missions[mission_id] = mission
             logger.info(f"Mission démarrée : {mission.title}")
             return True
@@ -267,18 +270,44 @@ class MissionManager:
         logger.warning(f"Objectif non trouvé : {objective_id}")
         return False
     
+    def now(self) -> datetime:
+        """Date courante de l'horloge des missions"""
+        return datetime.now() + self.time_offset
+    
     def check_mission_expirations(self) -> List[str]:
         """Vérifie les missions actives pour les expirations"""
         expired_missions = []
+        now = self.now()
         
-        for mission_id, mission in list(self.active_missions.items()):
-            if mission.check_expiration():
+        # Par ordre d'échéance, pour que les expirations soient traitées dans l'ordre où elles surviennent
+        deadlines = sorted(
+            (mission.end_time, mission_id) for mission_id, mission in self.active_missions.items()
+            if mission.end_time
+        )
+        for _, mission_id in deadlines:
+            mission = self.active_missions[mission_id]
+            if mission.check_expiration(now):
                 self.active_missions.pop(mission_id)
                 self.failed_missions[mission_id] = mission
                 expired_missions.append(mission_id)
         
         return expired_missions
     
+    def advance_time(self, seconds: float) -> List[str]:
+        """
+        Avance l'horloge des missions en un saut (voyage long, attente) et traite les
+        expirations survenues pendant l'intervalle
+        
+        Args:
+            seconds: Durée écoulée, en secondes de temps de jeu
+            
+        Returns:
+            IDs des missions expirées, par ordre d'échéance
+        """
+        if seconds > 0:
+            self.time_offset += timedelta(seconds=seconds)
+        return self.check_mission_expirations()
+    
     def add_mission(self, mission: Mission) -> None:
         """Ajoute une nouvelle mission au gestionnaire"""
         self.available_missions[mission.id] = mission
@@ -329,12 +358,7 @@ class MissionManager:
             os.makedirs(os.path.dirname(save_path), exist_ok=True)
             
             # Préparer les données
-            data = {
-                "available": {mission_id: mission.to_dict() for mission_id, mission in self.available_missions.items()},
-                "active": {mission_id: mission.to_dict() for mission_id, mission in self.active_missions.items()},
-                "completed": {mission_id: mission.to_dict() for mission_id, mission in self.completed_missions.items()},
-                "failed": {mission_id: mission.to_dict() for mission_id, mission in self.failed_missions.items()}
-            }
+            data = self.to_save_data()
             
             # Sauvegarder dans un fichier JSON
             with open(save_path, 'w', encoding='utf-8') as f:
@@ -359,27 +383,7 @@ class MissionManager:
             with open(save_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             
-            # Réinitialiser les missions actuelles
-            self.available_missions.clear()
-            self.active_missions.clear()
-            self.completed_missions.clear()
-            self.failed_missions.clear()
-            
-            # Charger les missions disponibles
-            for mission_id, mission_data in data.get("available", {}).items():
-                self.available_missions[mission_id] = Mission.from_dict(mission_data)
-            
-            # Charger les missions actives
-            for mission_id, mission_data in data.get("active", {}).items():
-                self.active_missions[mission_id] = Mission.from_dict(mission_data)
-            
-            # Charger les missions terminées
-            for mission_id, mission_data in data.get("completed", {}).items():
-                self.completed_missions[mission_id] = Mission.from_dict(mission_data)
-            
-            # Charger les missions échouées
-            for mission_id, mission_data in data.get("failed", {}).items():
-                self.failed_missions[mission_id] = Mission.from_dict(mission_data)
+            self._restore_missions(data)
             
             logger.info(f"Missions chargées depuis {save_path}")
             return True
@@ -388,6 +392,64 @@ class MissionManager:
             logger.error(f"Erreur lors du chargement des missions : {e}")
             return False
     
+    def to_save_data(self) -> Dict[str, Any]:
+        """Convertit l'état des missions en données de sauvegarde (sérialisables en JSON)"""
+        return {
+            "available": {mission_id: mission.to_dict() for mission_id, mission in self.available_missions.items()},
+            "active": {mission_id: mission.to_dict() for mission_id, mission in self.active_missions.items()},
+            "completed": {mission_id: mission.to_dict() for mission_id, mission in self.completed_missions.items()},
+            "failed": {mission_id: mission.to_dict() for mission_id, mission in self.failed_missions.items()},
+            "time_offset": self.time_offset.total_seconds()
+        }
+    
+    @classmethod
+    def from_save_data(cls, game, data: Dict[str, Any]) -> 'MissionManager':
+        """
+        Recrée le gestionnaire de missions d'une sauvegarde de partie (voir to_save_data)
+        
+        Args:
+            game: Référence au jeu principal
+            data: Données de sauvegarde des missions
+        """
+        manager = cls(game)
+        manager._restore_missions(data)
+        return manager
+    
+    def _restore_missions(self, data: Dict[str, Any]) -> None:
+        """Remplace les missions actuelles par celles d'une sauvegarde"""
+        # Réinitialiser les missions actuelles
+        self.available_missions.clear()
+        self.active_missions.clear()
+        self.completed_missions.clear()
+        self.failed_missions.clear()
+        
+        # Charger les missions disponibles
+        for mission_id, mission_data in data.get("available", {}).items():
+            self.available_missions[mission_id] = self._mission_from_dict(mission_data)
+        
+        # Charger les missions actives
+        for mission_id, mission_data in data.get("active", {}).items():
+            self.active_missions[mission_id] = self._mission_from_dict(mission_data)
+        
+        # Charger les missions terminées
+        for mission_id, mission_data in data.get("completed", {}).items():
+            self.completed_missions[mission_id] = self._mission_from_dict(mission_data)
+        
+        # Charger les missions échouées
+        for mission_id, mission_data in data.get("failed", {}).items():
+            self.failed_missions[mission_id] = self._mission_from_dict(mission_data)
+        
+        # Avance de l'horloge des missions
+        if "time_offset" in data:
+            self.time_offset = timedelta(seconds=data["time_offset"])
+    
+    @staticmethod
+    def _mission_from_dict(data: Dict[str, Any]) -> Mission:
+        """Crée une mission (de hacking ou non) à partir d'un dictionnaire"""
+        if data.get("metadata", {}).get("type") == "hacking":
+            return HackingMission.from_dict(data)
+        return Mission.from_dict(data)
+    
     def create_custom_mission(self, title: str, description: str, mission_type: MissionType, 
                             difficulty: MissionDifficulty, location_id: Optional[str] = None,
                             faction: Optional[str] = None) -> Mission:
@@ -156,13 +156,18 @@ class MissionGenerator:
         # Ajout des templates
         self.templates.extend([data_retrieval, informant_meeting, network_hack])
     
-    def generate_mission(self, template_id: Optional[str] = None, difficulty: Optional[MissionDifficulty] = None) -> Mission:
+    def generate_mission(self, template_id: Optional[str] = None, difficulty: Optional[MissionDifficulty] = None,
+                         origin_location_id: Optional[str] = None,
+                         max_travel_time: Optional[float] = None) -> Mission:
         """
         Génère une mission procédurale
         
         Args:
             template_id: ID du template à utiliser (None = aléatoire)
             difficulty: Difficulté souhaitée (None = aléatoire)
+            origin_location_id: Lieu de départ du joueur; seuls les lieux accessibles
+                depuis celui-ci sont retenus (None = tous les lieux)
+            max_travel_time: Durée maximale du trajet en heures depuis le lieu de départ
             
         Returns:
             Mission: Mission générée
@@ -208,7 +213,8 @@ class MissionGenerator:
         )
         
         # Sélection des lieux et personnages
-        available_locations = self._get_suitable_locations(template.required_locations)
+        available_locations = self._get_suitable_locations(template.required_locations,
+                                                           origin_location_id, max_travel_time)
         available_characters = self._get_suitable_characters(template.required_characters)
         
         # Génération des objectifs
@@ -246,12 +252,31 @@ class MissionGenerator:
         
         return f"{random.choice(adjectives)} {random.choice(nouns)}"
     
-    def _get_suitable_locations(self, required_types: List[str]) -> List[Location]:
-        """Récupère les lieux adaptés aux types requis"""
+    def _get_suitable_locations(self, required_types: List[str],
+                                origin_location_id: Optional[str] = None,
+                                max_travel_time: Optional[float] = None) -> List[Location]:
+        """
+        Récupère les lieux adaptés aux types requis
+        
+        Args:
+            required_types: Types de lieux acceptés (vide = tous)
+            origin_location_id: Lieu de départ; filtre les lieux inaccessibles (None = pas de filtre)
+            max_travel_time: Durée maximale du trajet en heures depuis le lieu de départ
+            
+        Returns:
+            Liste des lieux candidats
+        """
+        candidates = self.world_map.locations.values()
+        if origin_location_id:
+            # Consultation de l'oracle des temps de trajet plutôt qu'une recherche de chemin par lieu
+            oracle = self.world_map.get_travel_oracle()
+            reachable = oracle.reachable_from(origin_location_id, max_travel_time)
+            candidates = [self.world_map.locations[loc_id] for loc_id in reachable]
+        
         if not required_types:
-            return list(self.world_map.locations.values())
+            return list(candidates)
         
-        return [loc for loc in self.world_map.locations.values() 
+        return [loc for loc in candidates 
                 if hasattr(loc, 'location_type') and loc.location_type in required_types]
     
     def _get_suitable_characters(self, required_types: List[str]) -> List[Character]:
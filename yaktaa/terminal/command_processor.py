@@ -163,8 +163,12 @@ class CommandProcessor:
         # Récupération du chemin
         path = args[0] if args else self.current_directory
         
+        # Si connecté à un appareil du monde, lister ses fichiers
+        device = self._get_connected_device()
+        if device is not None:
+            files = [{"name": f["name"], "type": "file", "size": f.get("size", 0)} for f in device["files"]]
         # Si connecté à un système distant
-        if self.connected_system:
+        elif self.connected_system:
             # TODO: Implémenter la navigation dans les systèmes distants
             files = [
                 {"name": "readme.txt", "type": "file", "size": 1024},
@@ -241,8 +245,18 @@ class CommandProcessor:
         
         filename = args[0]
         
-        # Vérification de l'existence du fichier
-        # TODO: Implémenter la vérification réelle
+        # Fichier d'un appareil du monde: le contenu est lu à la demande
+        device = self._get_connected_device()
+        if device is not None:
+            file_info = next((f for f in device["files"] if f["name"] == filename), None)
+            if file_info is None:
+                return {"type": "error", "message": f"Fichier non trouvé: {filename}"}
+            
+            world_loader = getattr(self.game, "world_loader", None)
+            content = world_loader.get_file_content(file_info["id"]) if world_loader else None
+            if content is None:
+                return {"type": "error", "message": f"Impossible de lire le fichier: {filename}"}
+            return {"type": "success", "message": content}
         
         # Contenu du fichier (exemple)
         if filename == "welcome.txt":
@@ -257,6 +271,28 @@ Bon jeu!
         
         return {"type": "error", "message": f"Fichier non trouvé: {filename}"}
     
+    def _get_connected_device(self) -> Optional[Dict[str, Any]]:
+        """
+        Retrouve l'appareil du monde correspondant au système connecté
+        
+        Returns:
+            Données de l'appareil (ID ou nom égal à l'hôte), ou None
+        """
+        if not self.connected_system:
+            return None
+        
+        world_manager = getattr(self.game, "world_manager", None)
+        world_map = getattr(world_manager, "world_map", None)
+        devices = getattr(world_map, "devices", None)
+        if not devices:
+            return None
+        
+        host = self.connected_system["host"]
+        device = devices.get(host)
+        if device is None:
+            device = next((d for d in devices.values() if (d["name"] or "").lower() == host.lower()), None)
+        return device
+    
     def _cmd_ping(self, args: List[str]) -> Dict[str, Any]:
         """Vérifie la connectivité avec un hôte"""
         if not args:
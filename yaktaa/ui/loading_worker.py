@@ -0,0 +1,51 @@
+"""
+Module du thread de chargement du jeu YakTaa
+Ce module exécute les chargements longs (monde, villes, boutiques) hors du
+thread de l'interface et transmet leur progression par signaux Qt.
+"""
+
+import logging
+from typing import Callable
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+logger = logging.getLogger("YakTaa.UI.LoadingWorker")
+
+# Fonction de progression transmise aux tâches: (pourcentage 0-100, message)
+ProgressCallback = Callable[[int, str], None]
+
+
+class LoadingWorker(QThread):
+    """
+    Thread exécutant une tâche de chargement.
+    La tâche reçoit une fonction de progression et retourne True en cas de succès;
+    les signaux sont émis depuis le thread de travail et reçus dans le thread de l'interface.
+    """
+
+    progress_changed = pyqtSignal(int, str)  # (pourcentage, étape en cours)
+    loading_finished = pyqtSignal(bool)  # succès du chargement
+
+    def __init__(self, task: Callable[[ProgressCallback], bool], parent=None):
+        """
+        Initialise le thread de chargement
+
+        Args:
+            task: Tâche à exécuter, appelée avec une fonction de progression
+            parent: Objet Qt parent
+        """
+        super().__init__(parent)
+        self.task = task
+
+    def report_progress(self, percent: int, message: str = "") -> None:
+        """Transmet la progression de la tâche à l'interface"""
+        self.progress_changed.emit(max(0, min(100, int(percent))), message)
+
+    def run(self) -> None:
+        """Exécute la tâche dans le thread de travail"""
+        try:
+            success = bool(self.task(self.report_progress))
+        except Exception as e:
+            logger.error(f"Erreur lors du chargement en arrière-plan: {str(e)}", exc_info=True)
+            success = False
+
+        self.loading_finished.emit(success)
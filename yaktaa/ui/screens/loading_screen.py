@@ -4,16 +4,17 @@ Module pour l'écran de chargement du jeu YakTaa
 
 import logging
 import random
-from typing import Optional, List
+from typing import Callable, Optional, List
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QProgressBar, 
-    QSpacerItem, QSizePolicy
+    QSpacerItem, QSizePolicy, QMessageBox
 )
-from PyQt6.QtCore import Qt, QTimer, QSize
+from PyQt6.QtCore import Qt, QSize
 from PyQt6.QtGui import QFont
 
 from yaktaa.ui.screens.base_screen import BaseScreen
+from yaktaa.ui.loading_worker import LoadingWorker, ProgressCallback
 from yaktaa.core.game import Game
 
 logger = logging.getLogger("YakTaa.UI.LoadingScreen")
@@ -49,15 +50,12 @@ class LoadingScreen(BaseScreen):
         """Initialise l'écran de chargement"""
         super().__init__(game, parent)
         
-        # Timer pour simuler le chargement
-        self.loading_timer = QTimer(self)
-        self.loading_timer.timeout.connect(self.update_progress)
-        
-        # Progression du chargement
+        # Chargement en cours (exécuté dans un thread de travail)
+        self.worker: Optional[LoadingWorker] = None
         self.progress = 0
-        self.target_progress = 100
-        self.progress_step = 1
         self.next_screen = None
+        self.error_screen = "main_menu"
+        self.error_message = None
         
         logger.info("Écran de chargement initialisé")
     
@@ -99,6 +97,12 @@ class LoadingScreen(BaseScreen):
         """)
         self.layout.addWidget(self.progress_bar)
         
+        # Étape de chargement en cours
+        self.stage_label = QLabel(self)
+        self.stage_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.stage_label.setStyleSheet(f"color: {self.main_window.theme.get_color('secondary')};")
+        self.layout.addWidget(self.stage_label)
+        
         # Conseil
         self.tip_label = QLabel(self)
         tip_font = QFont("Segoe UI", 12)
@@ -116,62 +120,84 @@ class LoadingScreen(BaseScreen):
         """Appelé lorsque l'écran est affiché"""
         super().on_show()
         
-        # Réinitialisation de la progression
-        self.progress = 0
-        self.progress_bar.setValue(0)
+        # Réinitialisation de la progression (sauf si un chargement est déjà en cours)
+        if not self.is_loading():
+            self.set_progress(0, "")
         
         # Affichage d'un conseil aléatoire
         self.tip_label.setText(f"Conseil: {random.choice(self.TIPS)}")
-        
-        # Démarrage du timer de chargement
-        self.loading_timer.start(30)  # Mise à jour toutes les 30ms
     
-    def on_hide(self) -> None:
-        """Appelé lorsque l'écran est masqué"""
-        super().on_hide()
-        
-        # Arrêt du timer de chargement
-        self.loading_timer.stop()
+    def is_loading(self) -> bool:
+        """Indique si un chargement est en cours"""
+        return self.worker is not None and self.worker.isRunning()
     
-    def update_progress(self) -> None:
-        """Met à jour la progression du chargement"""
-        # Incrémentation de la progression
-        self.progress += self.progress_step
-        
-        # Mise à jour de la barre de progression
-        self.progress_bar.setValue(self.progress)
-        
-        # Si le chargement est terminé
-        if self.progress >= self.target_progress:
-            # Arrêt du timer
-            self.loading_timer.stop()
-            
-            # Passage à l'écran suivant
-            if self.next_screen:
-                self.show_screen(self.next_screen)
-            else:
-                # Par défaut, retour au menu principal
-                self.show_screen("main_menu")
+    def set_progress(self, value: int, message: str = "") -> None:
+        """
+        Met à jour la progression affichée
+        
+        Args:
+            value: Progression réelle du chargement (0-100)
+            message: Étape en cours
+        """
+        self.progress = value
+        self.progress_bar.setValue(value)
+        if message:
+            self.stage_label.setText(message)
     
-    def start_loading(self, next_screen: str, duration_ms: int = 3000) -> None:
-        """Démarre le chargement vers l'écran spécifié"""
+    def start_loading(self, next_screen: str, task: Callable[[ProgressCallback], bool],
+                      error_message: Optional[str] = None, error_screen: str = "main_menu") -> bool:
+        """
+        Démarre un chargement en arrière-plan, puis affiche l'écran spécifié
+        
+        Args:
+            next_screen: Écran affiché quand la tâche réussit
+            task: Tâche de chargement, appelée dans un thread de travail avec une fonction
+                de progression (pourcentage, message); retourne True en cas de succès
+            error_message: Message affiché si la tâche échoue
+            error_screen: Écran affiché si la tâche échoue
+            
+        Returns:
+            True si le chargement a démarré, False si un autre chargement est en cours
+        """
+        if self.is_loading():
+            logger.warning(f"Chargement déjà en cours, demande ignorée (écran: {next_screen})")
+            return False
+        
         # Configuration du chargement
         self.next_screen = next_screen
-        self.progress = 0
-        self.progress_bar.setValue(0)
-        
-        # Calcul du pas de progression en fonction de la durée
-        update_interval = self.loading_timer.interval()
-        num_updates = duration_ms / update_interval
-        self.progress_step = self.target_progress / num_updates
+        self.error_screen = error_screen
+        self.error_message = error_message
+        self.set_progress(0, "Préparation...")
         
         # Affichage d'un conseil aléatoire
         self.tip_label.setText(f"Conseil: {random.choice(self.TIPS)}")
         
-        # Démarrage du timer
-        self.loading_timer.start(update_interval)
+        # Exécution de la tâche hors du thread de l'interface
+        self.worker = LoadingWorker(task, self)
+        self.worker.progress_changed.connect(self.set_progress)
+        self.worker.loading_finished.connect(self._on_loading_finished)
+        self.worker.start()
         
-        logger.info(f"Chargement démarré vers l'écran: {next_screen} (durée: {duration_ms}ms)")
+        logger.info(f"Chargement démarré vers l'écran: {next_screen}")
+        return True
+    
+    def _on_loading_finished(self, success: bool) -> None:
+        """Appelé dans le thread de l'interface à la fin de la tâche de chargement"""
+        worker, self.worker = self.worker, None
+        if worker is not None:
+            worker.wait()
+            worker.deleteLater()
+        
+        if success:
+            self.set_progress(100, "Chargement terminé")
+            logger.info(f"Chargement terminé, passage à l'écran: {self.next_screen}")
+            self.show_screen(self.next_screen or "main_menu")
+            return
+        
+        logger.error(f"Échec du chargement vers l'écran: {self.next_screen}")
+        if self.error_message:
+            QMessageBox.critical(self, "Erreur", self.error_message)
+        self.show_screen(self.error_screen)
     
     def update_ui(self, delta_time: float) -> None:
         """Met à jour l'interface utilisateur"""
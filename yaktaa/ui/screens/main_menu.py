@@ -118,25 +118,11 @@ class MainMenuScreen(BaseScreen):
             player_name = dialog.get_player_name()
             
             if player_name:
-                # Affichage de l'écran de chargement
-                self.show_screen("loading")
-                
-                # Création d'une nouvelle partie
-                success = self.game.new_game(player_name)
-                
-                if success:
-                    # Passage à l'écran de jeu
-                    self.show_screen("game")
-                else:
-                    # Affichage d'un message d'erreur
-                    QMessageBox.critical(
-                        self,
-                        "Erreur",
-                        "Impossible de créer une nouvelle partie. Consultez les logs pour plus d'informations."
-                    )
-                    
-                    # Retour au menu principal
-                    self.show_screen("main_menu")
+                # Création de la partie en arrière-plan, l'écran de chargement suit sa progression
+                self._load_in_background(
+                    lambda progress: self.game.new_game(player_name, progress),
+                    "Impossible de créer une nouvelle partie. Consultez les logs pour plus d'informations."
+                )
     
     def on_load_game(self) -> None:
         """Gère le clic sur le bouton Charger Partie"""
@@ -157,25 +143,24 @@ class MainMenuScreen(BaseScreen):
             save_id = dialog.get_selected_save_id()
             
             if save_id:
-                # Affichage de l'écran de chargement
-                self.show_screen("loading")
-                
-                # Chargement de la partie
-                success = self.game.load_game(save_id)
-                
-                if success:
-                    # Passage à l'écran de jeu
-                    self.show_screen("game")
-                else:
-                    # Affichage d'un message d'erreur
-                    QMessageBox.critical(
-                        self,
-                        "Erreur",
-                        "Impossible de charger la partie. Consultez les logs pour plus d'informations."
-                    )
-                    
-                    # Retour au menu principal
-                    self.show_screen("main_menu")
+                # Chargement de la partie en arrière-plan, l'écran de chargement suit sa progression
+                self._load_in_background(
+                    lambda progress: self.game.load_game(save_id, progress),
+                    "Impossible de charger la partie. Consultez les logs pour plus d'informations."
+                )
+    
+    def _load_in_background(self, task, error_message: str) -> None:
+        """
+        Affiche l'écran de chargement et y exécute une tâche dans un thread de travail
+        
+        Args:
+            task: Tâche appelée avec une fonction de progression, retourne True en cas de succès
+            error_message: Message affiché si la tâche échoue
+        """
+        self.show_screen("loading")
+        loading_screen = self.main_window.screens.get("loading")
+        if loading_screen:
+            loading_screen.start_loading("game", task, error_message)
     
     def on_settings(self) -> None:
         """Gère le clic sur le bouton Paramètres"""
@@ -50,7 +50,6 @@ class ShopScreen(BaseScreen):
         if not hasattr(self, 'game') or self.game is None:
             self.game = game
             
-        self.shop_manager = getattr(game, 'shop_manager', None)
         self.player_data = {'credits': 1000}  # Valeurs par défaut
         
         if hasattr(game, 'player') and game.player:
@@ -68,6 +67,11 @@ class ShopScreen(BaseScreen):
         self.back_to_game.connect(self.shop_closed.emit)
         self.update_player_credits.connect(self.update_credits_display)
     
+    @property
+    def shop_manager(self) -> Optional[ShopManager]:
+        """Gestionnaire de boutiques du jeu (None tant que le monde n'est pas chargé)"""
+        return getattr(self.game, 'shop_manager', None)
+    
     def _init_ui(self):
         """Surcharge de la méthode _init_ui de BaseScreen."""
         # Utiliser le layout déjà créé par BaseScreen
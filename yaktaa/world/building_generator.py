@@ -4,6 +4,7 @@ Ce module contient les fonctions et classes nécessaires pour générer
 des bâtiments et des structures urbaines de manière procédurale.
 """
 
+import hashlib
 import logging
 import random
 from typing import Dict, List, Optional, Any, Tuple
@@ -14,6 +15,24 @@ from yaktaa.world.travel import Building, BuildingType, CityManager
 
 logger = logging.getLogger("YakTaa.World.BuildingGenerator")
 
+# Répartition des types de bâtiments générés (dans l'ordre de BuildingType)
+BUILDING_TYPE_WEIGHTS = {
+    BuildingType.RESIDENTIAL: 0.2,
+    BuildingType.COMMERCIAL: 0.15,
+    BuildingType.INDUSTRIAL: 0.1,
+    BuildingType.GOVERNMENT: 0.1,
+    BuildingType.CORPORATE: 0.15,
+    BuildingType.MEDICAL: 0.05,
+    BuildingType.EDUCATIONAL: 0.1,
+    BuildingType.ENTERTAINMENT: 0.1,
+    BuildingType.SECURITY: 0.03,
+    BuildingType.UNDERGROUND: 0.02
+}
+
+# Nombre de bâtiments générés par lieu: (minimum, maximum)
+CITY_BUILDING_COUNT = (5, 15)
+DISTRICT_BUILDING_COUNT = (3, 8)
+
 # Noms génériques pour les bâtiments
 CORPORATE_NAMES = [
     "NeoTech", "CyberCorp", "Digitex", "SynthSys", "QuantumDyne",
@@ -186,18 +205,41 @@ ROOM_NAMES = {
 }
 
 
+def location_seed(world_id: str, location_id: str) -> int:
+    """
+    Graine de génération d'un lieu, stable d'une exécution à l'autre
+    (contrairement à hash(), dont le résultat varie selon PYTHONHASHSEED)
+    
+    Args:
+        world_id: ID du monde
+        location_id: ID du lieu
+        
+    Returns:
+        Graine entière sur 64 bits
+    """
+    digest = hashlib.sha256(f"{world_id}:{location_id}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
 class BuildingGenerator:
     """
     Générateur procédural de bâtiments pour YakTaa
     """
     
-    def __init__(self, city_manager: CityManager):
-        """Initialise le générateur de bâtiments"""
+    def __init__(self, city_manager: CityManager, seed: Optional[int] = None):
+        """
+        Initialise le générateur de bâtiments
+        
+        Args:
+            city_manager: Gestionnaire de villes
+            seed: Graine du générateur aléatoire (None: non déterministe)
+        """
         self.city_manager = city_manager
         self.world_map = city_manager.world_map
         self.building_counter = 0
+        self.rng = random.Random(seed)
         
-        logger.info("Générateur de bâtiments initialisé")
+        logger.debug("Générateur de bâtiments initialisé")
     
     def generate_building(self, location_id: str, building_type: BuildingType = None) -> Optional[Building]:
         """
@@ -210,6 +252,66 @@ class BuildingGenerator:
         Returns:
             Le bâtiment généré, ou None en cas d'échec
         """
+        # Générer un ID unique
+        self.building_counter += 1
+        building = self._create_building(location_id, building_type, self.building_counter)
+        if building is None:
+            return None
+        
+        # Ajouter le bâtiment au gestionnaire de villes
+        if self.city_manager.add_building(building):
+            logger.info(f"Bâtiment généré avec succès: {building.name} ({building.id})")
+            return building
+        else:
+            logger.warning(f"Échec de l'ajout du bâtiment {building.name} au gestionnaire de villes")
+            return None
+    
+    def generate_location_buildings(self, location_id: str, num_buildings: Optional[int] = None) -> List[Building]:
+        """
+        Génère l'ensemble des bâtiments d'un lieu sans les enregistrer dans le gestionnaire
+        de villes. Avec une graine dérivée de location_seed(), le résultat (IDs, pièces
+        comprises) est identique à chaque appel, ce qui permet de régénérer un lieu à la demande.
+        
+        Args:
+            location_id: ID du lieu à peupler
+            num_buildings: Nombre de bâtiments (None: selon le type de lieu)
+            
+        Returns:
+            Liste des bâtiments générés
+        """
+        location = self.world_map.get_location(location_id)
+        if not location:
+            logger.warning(f"Impossible de générer les bâtiments: lieu {location_id} introuvable")
+            return []
+        
+        if num_buildings is None:
+            minimum, maximum = DISTRICT_BUILDING_COUNT if location.parent_location_id else CITY_BUILDING_COUNT
+            num_buildings = self.rng.randint(minimum, maximum)
+        
+        building_types = list(BUILDING_TYPE_WEIGHTS)
+        weights = list(BUILDING_TYPE_WEIGHTS.values())
+        buildings = []
+        for index in range(1, num_buildings + 1):
+            building_type = self.rng.choices(building_types, weights=weights, k=1)[0]
+            building = self._create_building(location_id, building_type, index)
+            if building:
+                buildings.append(building)
+        
+        logger.debug(f"Généré {len(buildings)} bâtiments pour le lieu {location_id}")
+        return buildings
+    
+    def _create_building(self, location_id: str, building_type: Optional[BuildingType], number: int) -> Optional[Building]:
+        """
+        Crée un bâtiment et ses pièces
+        
+        Args:
+            location_id: ID du lieu du bâtiment
+            building_type: Type de bâtiment (aléatoire si None)
+            number: Numéro du bâtiment, utilisé dans son ID
+            
+        Returns:
+            Le bâtiment créé, ou None si le lieu est introuvable
+        """
         location = self.world_map.get_location(location_id)
         if not location:
             logger.warning(f"Impossible de générer un bâtiment: lieu {location_id} introuvable")
@@ -217,17 +319,15 @@ class BuildingGenerator:
         
         # Déterminer le type de bâtiment si non spécifié
         if building_type is None:
-            building_type = random.choice(list(BuildingType))
+            building_type = self.rng.choice(list(BuildingType))
         
-        # Générer un ID unique
-        self.building_counter += 1
-        building_id = f"building_{location_id}_{building_type.name.lower()}_{self.building_counter}"
+        building_id = f"building_{location_id}_{building_type.name.lower()}_{number}"
         
         # Générer un nom en fonction du type
         name = self._generate_building_name(building_type)
         
         # Générer une description
-        description = random.choice(BUILDING_DESCRIPTIONS.get(building_type, ["Un bâtiment ordinaire."]))
+        description = self.rng.choice(BUILDING_DESCRIPTIONS.get(building_type, ["Un bâtiment ordinaire."]))
         
         # Déterminer le nombre d'étages en fonction du type
         floors = self._determine_floors(building_type)
@@ -242,8 +342,8 @@ class BuildingGenerator:
         tags = [building_type.name.lower()] + self._determine_tags(building_type)
         
         # Déterminer si le bâtiment nécessite un accès spécial
-        requires_special_access = random.random() < 0.2
-        requires_hacking = random.random() < 0.15
+        requires_special_access = self.rng.random() < 0.2
+        requires_hacking = self.rng.random() < 0.15
         
         # Créer le bâtiment
         building = Building(
@@ -265,88 +365,82 @@ class BuildingGenerator:
         # Générer des pièces pour le bâtiment
         self._generate_rooms(building)
         
-        # Ajouter le bâtiment au gestionnaire de villes
-        if self.city_manager.add_building(building):
-            logger.info(f"Bâtiment généré avec succès: {name} ({building_id})")
-            return building
-        else:
-            logger.warning(f"Échec de l'ajout du bâtiment {name} au gestionnaire de villes")
-            return None
+        return building
     
     def _generate_building_name(self, building_type: BuildingType) -> str:
         """Génère un nom pour un bâtiment en fonction de son type"""
         if building_type == BuildingType.RESIDENTIAL:
-            return random.choice(RESIDENTIAL_NAMES)
+            return self.rng.choice(RESIDENTIAL_NAMES)
         elif building_type == BuildingType.COMMERCIAL:
-            return random.choice(SHOP_NAMES)
+            return self.rng.choice(SHOP_NAMES)
         elif building_type == BuildingType.CORPORATE:
-            return random.choice(CORPORATE_NAMES) + " " + random.choice(["Inc.", "Corp.", "Technologies", "Systems", "Industries"])
+            return self.rng.choice(CORPORATE_NAMES) + " " + self.rng.choice(["Inc.", "Corp.", "Technologies", "Systems", "Industries"])
         elif building_type == BuildingType.MEDICAL:
-            return random.choice(MEDICAL_NAMES)
+            return self.rng.choice(MEDICAL_NAMES)
         elif building_type == BuildingType.ENTERTAINMENT:
-            return random.choice(ENTERTAINMENT_NAMES)
+            return self.rng.choice(ENTERTAINMENT_NAMES)
         elif building_type == BuildingType.GOVERNMENT:
-            return random.choice(GOVERNMENT_NAMES)
+            return self.rng.choice(GOVERNMENT_NAMES)
         elif building_type == BuildingType.SECURITY:
-            return random.choice(SECURITY_NAMES)
+            return self.rng.choice(SECURITY_NAMES)
         elif building_type == BuildingType.EDUCATIONAL:
-            return random.choice(EDUCATIONAL_NAMES)
+            return self.rng.choice(EDUCATIONAL_NAMES)
         elif building_type == BuildingType.INDUSTRIAL:
-            return random.choice(CORPORATE_NAMES) + " " + random.choice(["Industries", "Manufacturing", "Production", "Factory", "Works"])
+            return self.rng.choice(CORPORATE_NAMES) + " " + self.rng.choice(["Industries", "Manufacturing", "Production", "Factory", "Works"])
         elif building_type == BuildingType.UNDERGROUND:
-            return random.choice(["Le Bunker", "Souterrain", "Catacombes", "L'Abri", "Tunnels", "La Tanière", "Refuge"]) + " " + random.choice(["Secret", "Caché", "Oublié", "Interdit", "Clandestin"])
+            return self.rng.choice(["Le Bunker", "Souterrain", "Catacombes", "L'Abri", "Tunnels", "La Tanière", "Refuge"]) + " " + self.rng.choice(["Secret", "Caché", "Oublié", "Interdit", "Clandestin"])
         else:
-            return "Bâtiment " + str(random.randint(1000, 9999))
+            return "Bâtiment " + str(self.rng.randint(1000, 9999))
     
     def _determine_floors(self, building_type: BuildingType) -> int:
         """Détermine le nombre d'étages en fonction du type de bâtiment"""
         if building_type == BuildingType.RESIDENTIAL:
-            return random.randint(5, 30)
+            return self.rng.randint(5, 30)
         elif building_type == BuildingType.COMMERCIAL:
-            return random.randint(1, 5)
+            return self.rng.randint(1, 5)
         elif building_type == BuildingType.CORPORATE:
-            return random.randint(20, 100)
+            return self.rng.randint(20, 100)
         elif building_type == BuildingType.MEDICAL:
-            return random.randint(3, 15)
+            return self.rng.randint(3, 15)
         elif building_type == BuildingType.ENTERTAINMENT:
-            return random.randint(1, 5)
+            return self.rng.randint(1, 5)
         elif building_type == BuildingType.GOVERNMENT:
-            return random.randint(3, 20)
+            return self.rng.randint(3, 20)
         elif building_type == BuildingType.SECURITY:
-            return random.randint(1, 10)
+            return self.rng.randint(1, 10)
         elif building_type == BuildingType.EDUCATIONAL:
-            return random.randint(2, 10)
+            return self.rng.randint(2, 10)
         elif building_type == BuildingType.INDUSTRIAL:
-            return random.randint(1, 5)
+            return self.rng.randint(1, 5)
         elif building_type == BuildingType.UNDERGROUND:
-            return random.randint(1, 5)  # Niveaux souterrains
+            return self.rng.randint(1, 5)  # Niveaux souterrains
         else:
-            return random.randint(1, 10)
+            return self.rng.randint(1, 10)
     
     def _determine_security_level(self, building_type: BuildingType, location: Location) -> int:
         """Détermine le niveau de sécurité en fonction du type de bâtiment et du lieu"""
         base_security = location.security_level
         
         if building_type == BuildingType.RESIDENTIAL:
-            return max(1, min(10, base_security + random.randint(-1, 1)))
+            return max(1, min(10, base_security + self.rng.randint(-1, 1)))
         elif building_type == BuildingType.COMMERCIAL:
-            return max(1, min(10, base_security + random.randint(-1, 1)))
+            return max(1, min(10, base_security + self.rng.randint(-1, 1)))
         elif building_type == BuildingType.CORPORATE:
-            return max(1, min(10, base_security + random.randint(1, 3)))
+            return max(1, min(10, base_security + self.rng.randint(1, 3)))
         elif building_type == BuildingType.MEDICAL:
-            return max(1, min(10, base_security + random.randint(0, 2)))
+            return max(1, min(10, base_security + self.rng.randint(0, 2)))
         elif building_type == BuildingType.ENTERTAINMENT:
-            return max(1, min(10, base_security + random.randint(-2, 1)))
+            return max(1, min(10, base_security + self.rng.randint(-2, 1)))
         elif building_type == BuildingType.GOVERNMENT:
-            return max(1, min(10, base_security + random.randint(2, 4)))
+            return max(1, min(10, base_security + self.rng.randint(2, 4)))
         elif building_type == BuildingType.SECURITY:
-            return max(1, min(10, base_security + random.randint(3, 5)))
+            return max(1, min(10, base_security + self.rng.randint(3, 5)))
         elif building_type == BuildingType.EDUCATIONAL:
-            return max(1, min(10, base_security + random.randint(-1, 1)))
+            return max(1, min(10, base_security + self.rng.randint(-1, 1)))
         elif building_type == BuildingType.INDUSTRIAL:
-            return max(1, min(10, base_security + random.randint(0, 2)))
+            return max(1, min(10, base_security + self.rng.randint(0, 2)))
         elif building_type == BuildingType.UNDERGROUND:
-            return max(1, min(10, base_security + random.randint(-3, 3)))
+            return max(1, min(10, base_security + self.rng.randint(-3, 3)))
         else:
             return max(1, min(10, base_security))
     
@@ -356,34 +450,34 @@ class BuildingGenerator:
         
         if building_type == BuildingType.RESIDENTIAL:
             possible_services = ["logement", "sécurité", "maintenance", "divertissement", "restauration"]
-            services = random.sample(possible_services, random.randint(1, 3))
+            services = self.rng.sample(possible_services, self.rng.randint(1, 3))
         elif building_type == BuildingType.COMMERCIAL:
             possible_services = ["vente", "réparation", "personnalisation", "échange", "information", "restauration"]
-            services = random.sample(possible_services, random.randint(2, 4))
+            services = self.rng.sample(possible_services, self.rng.randint(2, 4))
         elif building_type == BuildingType.CORPORATE:
             possible_services = ["finance", "technologie", "sécurité", "recherche", "développement", "administration"]
-            services = random.sample(possible_services, random.randint(2, 4))
+            services = self.rng.sample(possible_services, self.rng.randint(2, 4))
         elif building_type == BuildingType.MEDICAL:
             possible_services = ["soins", "chirurgie", "implants", "pharmacie", "réhabilitation", "diagnostic"]
-            services = random.sample(possible_services, random.randint(2, 5))
+            services = self.rng.sample(possible_services, self.rng.randint(2, 5))
         elif building_type == BuildingType.ENTERTAINMENT:
             possible_services = ["divertissement", "restauration", "boissons", "jeux", "spectacles", "réalité virtuelle"]
-            services = random.sample(possible_services, random.randint(2, 4))
+            services = self.rng.sample(possible_services, self.rng.randint(2, 4))
         elif building_type == BuildingType.GOVERNMENT:
             possible_services = ["administration", "sécurité", "justice", "régulation", "surveillance", "information"]
-            services = random.sample(possible_services, random.randint(2, 4))
+            services = self.rng.sample(possible_services, self.rng.randint(2, 4))
         elif building_type == BuildingType.SECURITY:
             possible_services = ["sécurité", "détention", "surveillance", "formation", "armement", "investigation"]
-            services = random.sample(possible_services, random.randint(2, 4))
+            services = self.rng.sample(possible_services, self.rng.randint(2, 4))
         elif building_type == BuildingType.EDUCATIONAL:
             possible_services = ["éducation", "recherche", "information", "formation", "certification", "bibliothèque"]
-            services = random.sample(possible_services, random.randint(2, 4))
+            services = self.rng.sample(possible_services, self.rng.randint(2, 4))
         elif building_type == BuildingType.INDUSTRIAL:
             possible_services = ["production", "assemblage", "stockage", "distribution", "maintenance", "recyclage"]
-            services = random.sample(possible_services, random.randint(2, 4))
+            services = self.rng.sample(possible_services, self.rng.randint(2, 4))
         elif building_type == BuildingType.UNDERGROUND:
             possible_services = ["marché noir", "refuge", "information", "contrebande", "réparation", "trafic"]
-            services = random.sample(possible_services, random.randint(1, 3))
+            services = self.rng.sample(possible_services, self.rng.randint(1, 3))
         
         return services
     
@@ -393,7 +487,7 @@ class BuildingGenerator:
         
         # Tags communs à tous les types
         common_tags = ["urbain", "moderne", "cyberpunk"]
-        tags.append(random.choice(common_tags))
+        tags.append(self.rng.choice(common_tags))
         
         # Tags spécifiques au type
         if building_type == BuildingType.RESIDENTIAL:
@@ -420,31 +514,31 @@ class BuildingGenerator:
             specific_tags = []
         
         if specific_tags:
-            tags.append(random.choice(specific_tags))
+            tags.append(self.rng.choice(specific_tags))
         
         # Ajouter un tag aléatoire de qualité
         quality_tags = ["luxe", "standard", "délabré", "high-tech", "rétro", "abandonné", "rénové", "sécurisé"]
-        tags.append(random.choice(quality_tags))
+        tags.append(self.rng.choice(quality_tags))
         
         return tags
     
     def _generate_owner(self, building_type: BuildingType) -> str:
         """Génère un propriétaire pour le bâtiment"""
         if building_type == BuildingType.CORPORATE:
-            return random.choice(CORPORATE_NAMES)
+            return self.rng.choice(CORPORATE_NAMES)
         elif building_type == BuildingType.GOVERNMENT:
             return "Gouvernement"
         elif building_type == BuildingType.SECURITY:
-            if random.random() < 0.5:
+            if self.rng.random() < 0.5:
                 return "Forces de l'ordre"
             else:
-                return random.choice(CORPORATE_NAMES) + " Security"
+                return self.rng.choice(CORPORATE_NAMES) + " Security"
         elif building_type == BuildingType.EDUCATIONAL:
             return "Institution Académique"
         else:
-            if random.random() < 0.3:
-                return random.choice(CORPORATE_NAMES)
-            elif random.random() < 0.5:
+            if self.rng.random() < 0.3:
+                return self.rng.choice(CORPORATE_NAMES)
+            elif self.rng.random() < 0.5:
                 return "Propriétaire privé"
             else:
                 return "Inconnu"
@@ -452,7 +546,7 @@ class BuildingGenerator:
     def _generate_rooms(self, building: Building) -> None:
         """Génère des pièces pour un bâtiment"""
         # Déterminer le nombre de pièces par étage
-        rooms_per_floor = random.randint(2, 6)
+        rooms_per_floor = self.rng.randint(2, 6)
         
         # Générer des pièces pour chaque étage
         for floor in range(1, building.floors + 1):
@@ -461,10 +555,10 @@ class BuildingGenerator:
                 
                 # Sélectionner un nom de pièce en fonction du type de bâtiment
                 room_names = ROOM_NAMES.get(building.building_type, ["Pièce"])
-                room_name = random.choice(room_names)
+                room_name = self.rng.choice(room_names)
                 
                 # Déterminer si la pièce nécessite du hacking (plus probable aux étages supérieurs)
-                requires_hacking = random.random() < (0.05 + (floor / building.floors) * 0.2)
+                requires_hacking = self.rng.random() < (0.05 + (floor / building.floors) * 0.2)
                 
                 # Ajouter la pièce au bâtiment
                 building.add_room(
@@ -472,7 +566,7 @@ class BuildingGenerator:
                     name=room_name,
                     floor=floor,
                     description=f"{room_name} au {floor}e étage de {building.name}.",
-                    is_accessible=random.random() > 0.1,  # 10% de chance d'être inaccessible
+                    is_accessible=self.rng.random() > 0.1,  # 10% de chance d'être inaccessible
                     requires_hacking=requires_hacking
                 )
         
@@ -495,22 +589,11 @@ def populate_location_with_buildings(city_manager: CityManager, location_id: str
     buildings = []
     
     # Déterminer la distribution des types de bâtiments
-    building_types = list(BuildingType)
-    weights = [
-        0.2,  # RESIDENTIAL
-        0.15,  # COMMERCIAL
-        0.1,   # INDUSTRIAL
-        0.1,   # GOVERNMENT
-        0.15,  # CORPORATE
-        0.05,  # MEDICAL
-        0.1,   # EDUCATIONAL
-        0.1,   # ENTERTAINMENT
-        0.03,  # SECURITY
-        0.02   # UNDERGROUND
-    ]
+    building_types = list(BUILDING_TYPE_WEIGHTS)
+    weights = list(BUILDING_TYPE_WEIGHTS.values())
     
     for _ in range(num_buildings):
-        building_type = random.choices(building_types, weights=weights, k=1)[0]
+        building_type = generator.rng.choices(building_types, weights=weights, k=1)[0]
         building = generator.generate_building(location_id, building_type)
         if building:
             buildings.append(building)
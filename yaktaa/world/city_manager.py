@@ -4,12 +4,11 @@ Ce module contient la classe CityManager qui gère les villes et leurs caractér
 """
 
 import logging
-import os
 import sqlite3
-from pathlib import Path
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Tuple
 
 from yaktaa.world.locations import Location
+from yaktaa.world.world_loader import WorldLoader
 
 logger = logging.getLogger("YakTaa.World.CityManager")
 
@@ -19,57 +18,42 @@ class CityManager:
     Gère les caractéristiques des villes, les quartiers, et les points d'intérêt
     """
     
-    def __init__(self, game=None):
+    def __init__(self, game=None, world_loader: Optional[WorldLoader] = None):
         """
         Initialise le gestionnaire de villes
         
         Args:
             game: Référence au jeu principal
+            world_loader: Chargeur de monde partagé (et son pool de connexions)
         """
         self.game = game
+        self.world_loader = world_loader or WorldLoader()
         self.cities = {}  # Dictionnaire des villes {city_id: city_data}
         self.districts = {}  # Dictionnaire des quartiers {district_id: district_data}
         self.points_of_interest = {}  # Dictionnaire des points d'intérêt {poi_id: poi_data}
+        self.cities_by_location = {}  # Index des villes par lieu {location_id: city_id}
         
         # Charger les villes depuis la base de données
         self._load_cities()
     
-    def _get_db_path(self) -> Path:
-        """
-        Récupère le chemin vers la base de données
-        
-        Returns:
-            Path: Chemin vers la base de données
-        """
-        # Chemin vers la base de données dans le dossier dbworld
-        db_path = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) / "dbworld" / "worlds.db"
-        
-        if db_path.exists():
-            logger.info(f"Base de données trouvée: {db_path}")
-            return db_path
-        
-        logger.warning(f"Base de données non trouvée: {db_path}")
-        return db_path
-    
     def _load_cities(self):
         """
         Charge les villes depuis la base de données
         """
         logger.info("Chargement des villes depuis la base de données")
         
-        db_path = self._get_db_path()
+        db_path = self.world_loader.db_path
         if not db_path.exists():
             logger.error(f"Base de données non trouvée: {db_path}")
             return
         
         try:
-            conn = sqlite3.connect(str(db_path))
-            conn.row_factory = sqlite3.Row
+            conn = self.world_loader.get_connection()
             cursor = conn.cursor()
+            schema = self.world_loader.get_schema()
             
             # Vérifier si la table cities existe
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='cities'")
-            if not cursor.fetchone():
+            if not schema.has_table('cities'):
                 logger.warning("Table 'cities' non trouvée dans la base de données")
                 conn.close()
                 return
@@ -96,12 +80,13 @@ class CityManager:
                         "location_id": row["location_id"],
                         "districts": []
                     }
+                    if row["location_id"]:
+                        self.cities_by_location.setdefault(row["location_id"], city_id)
             except sqlite3.OperationalError:
                 logger.warning("Structure de table 'cities' incomplète ou incompatible")
             
             # Vérifier si la table districts existe
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='districts'")
-            if cursor.fetchone():
+            if schema.has_table('districts'):
                 try:
                     # Charger les quartiers
                     cursor.execute("""
@@ -132,8 +117,7 @@ class CityManager:
                     logger.warning("Structure de table 'districts' incomplète ou incompatible")
             
             # Vérifier si la table points_of_interest existe
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='points_of_interest'")
-            if cursor.fetchone():
+            if schema.has_table('points_of_interest'):
                 try:
                     # Charger les points d'intérêt
                     cursor.execute("""
@@ -239,9 +223,24 @@ class CityManager:
         
         return [self.points_of_interest.get(poi_id) for poi_id in district["points_of_interest"]]
     
+    def get_location_hierarchy(self, location_id: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Récupère le quartier et la ville d'un lieu du monde en cours
+        
+        Args:
+            location_id: Identifiant du lieu (ville, quartier ou bâtiment)
+            
+        Returns:
+            Tuple[Optional[str], Optional[str]]: IDs du lieu-quartier et du lieu-ville, (None, None) si inconnu
+        """
+        world_id = getattr(self.game, "world_id", None)
+        if not world_id:
+            return None, None
+        return self.world_loader.get_location_hierarchy(world_id).get(location_id, (None, None))
+    
     def get_city_for_location(self, location_id: str) -> Optional[Dict[str, Any]]:
         """
-        Récupère la ville associée à un lieu
+        Récupère la ville associée à un lieu, ou au quartier ou à la ville qui le contient
         
         Args:
             location_id: Identifiant du lieu
@@ -249,7 +248,9 @@ class CityManager:
         Returns:
             Dict[str, Any]: Informations sur la ville ou None si aucune ville n'est associée
         """
-        for city_id, city_data in self.cities.items():
-            if city_data.get("location_id") == location_id:
-                return city_data
-        return None
+        city_id = self.cities_by_location.get(location_id)
+        if city_id is None:
+            district_location_id, city_location_id = self.get_location_hierarchy(location_id)
+            city_id = (self.cities_by_location.get(district_location_id)
+                       or self.cities_by_location.get(city_location_id))
+        return self.cities.get(city_id) if city_id is not None else None
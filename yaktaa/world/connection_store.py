@@ -0,0 +1,329 @@
+"""
+Module de stockage compact des connexions entre lieux de YakTaa
+Ce module range les connexions d'une carte sous forme de matrice creuse CSR
+(compressed sparse row): une ligne par lieu de départ, et des tableaux parallèles
+pour la destination, le temps de trajet, le coût, le type et les restrictions.
+"""
+
+import logging
+from array import array
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("YakTaa.World.ConnectionStore")
+
+# Bits du tableau des restrictions
+REQUIRES_HACKING = 1
+REQUIRES_SPECIAL_ACCESS = 2
+
+# Nombre de modifications conservées dans le journal (voir changes_since)
+CHANGE_LOG_SIZE = 4096
+
+# Une connexion en attente de compactage: (code du type, temps, coût, restrictions)
+_Edge = Tuple[int, float, float, int]
+
+
+class ConnectionStore:
+    """
+    Connexions orientées entre lieux, indexées par le rang des lieux.
+    Les lignes modifiées depuis le dernier compactage sont conservées dans des
+    dictionnaires, puis fusionnées dans les tableaux CSR par compact().
+    """
+
+    def __init__(self):
+        """Initialise un stockage vide"""
+        # Rangs des lieux (None pour un lieu supprimé, compacté plus tard)
+        self.location_ids: List[Optional[str]] = []
+        self.index: Dict[str, int] = {}
+
+        # Types de voyage ("standard", "train"...), stockés par code
+        self.travel_types: List[str] = []
+        self._type_codes: Dict[str, int] = {}
+
+        # Tableaux CSR: les connexions du lieu i occupent indptr[i]:indptr[i + 1]
+        self.indptr = array("l", [0])
+        self.indices = array("l")
+        self.travel_time = array("d")
+        self.travel_cost = array("d")
+        self.travel_type = array("H")
+        self.flags = array("B")
+
+        # Lignes modifiées depuis le dernier compactage: {rang: {rang destination: connexion}}
+        self._dirty_rows: Dict[int, Dict[int, _Edge]] = {}
+        self._edge_count = 0
+
+        # Révision des connexions, incrémentée à chaque modification, et journal
+        # des dernières modifications: (révision, départ, arrivée ou None pour un lieu supprimé)
+        self.revision = 0
+        self._change_log: deque = deque(maxlen=CHANGE_LOG_SIZE)
+
+    def __len__(self) -> int:
+        """Nombre de connexions"""
+        return self._edge_count
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Enregistrer une forme compacte (instantané du monde)
+        self.compact()
+        return self.__dict__.copy()
+
+    # ------------------------------------------------------------------
+    # Lieux
+    # ------------------------------------------------------------------
+
+    def add_node(self, location_id: str) -> int:
+        """
+        Enregistre un lieu
+
+        Args:
+            location_id: ID du lieu
+
+        Returns:
+            Rang du lieu
+        """
+        ordinal = self.index.get(location_id)
+        if ordinal is None:
+            ordinal = len(self.location_ids)
+            self.location_ids.append(location_id)
+            self.index[location_id] = ordinal
+        return ordinal
+
+    def remove_node(self, location_id: str) -> None:
+        """Supprime un lieu et toutes ses connexions (entrantes et sortantes)"""
+        ordinal = self.index.pop(location_id, None)
+        if ordinal is None:
+            return
+        self.location_ids[ordinal] = None
+        self._log_change(location_id, None)
+        self._dirty_rows.pop(ordinal, None)
+        for row in self._dirty_rows.values():
+            row.pop(ordinal, None)
+        # Les connexions vers ce lieu sont réparties dans tout le tableau: compactage complet
+        self.compact()
+
+    def ordinal(self, location_id: str) -> Optional[int]:
+        """Rang d'un lieu (None s'il est inconnu)"""
+        return self.index.get(location_id)
+
+    # ------------------------------------------------------------------
+    # Connexions
+    # ------------------------------------------------------------------
+
+    def _type_code(self, travel_type: str) -> int:
+        code = self._type_codes.get(travel_type)
+        if code is None:
+            code = len(self.travel_types)
+            self.travel_types.append(travel_type)
+            self._type_codes[travel_type] = code
+        return code
+
+    def _row(self, ordinal: int) -> Dict[int, _Edge]:
+        """Ligne modifiable d'un lieu (copiée depuis les tableaux CSR au premier accès)"""
+        row = self._dirty_rows.get(ordinal)
+        if row is None:
+            row = dict(self._iter_csr_row(ordinal))
+            self._dirty_rows[ordinal] = row
+        return row
+
+    def _iter_csr_row(self, ordinal: int) -> Iterator[Tuple[int, _Edge]]:
+        if ordinal + 1 >= len(self.indptr):
+            return
+        for k in range(self.indptr[ordinal], self.indptr[ordinal + 1]):
+            yield self.indices[k], (self.travel_type[k], self.travel_time[k], self.travel_cost[k], self.flags[k])
+
+    def _iter_row(self, ordinal: int) -> Iterator[Tuple[int, _Edge]]:
+        """Connexions sortantes d'un lieu, par rang de destination"""
+        row = self._dirty_rows.get(ordinal)
+        if row is not None:
+            return iter(row.items())
+        return self._iter_csr_row(ordinal)
+
+    def set_edge(self, source_id: str, destination_id: str,
+                 travel_type: str = "standard",
+                 travel_time: float = 1.0,
+                 travel_cost: float = 0,
+                 requires_hacking: bool = False,
+                 requires_special_access: bool = False) -> None:
+        """
+        Ajoute ou remplace une connexion (les lieux inconnus sont enregistrés)
+
+        Args:
+            source_id: ID du lieu de départ
+            destination_id: ID du lieu d'arrivée
+            travel_type: Type de voyage
+            travel_time: Temps de voyage en heures
+            travel_cost: Coût du voyage en crédits
+            requires_hacking: Si vrai, nécessite des compétences de hacking
+            requires_special_access: Si vrai, nécessite un accès spécial
+        """
+        source = self.add_node(source_id)
+        destination = self.add_node(destination_id)
+        flags = (REQUIRES_HACKING if requires_hacking else 0) | (REQUIRES_SPECIAL_ACCESS if requires_special_access else 0)
+        row = self._row(source)
+        if destination not in row:
+            self._edge_count += 1
+        # Valeurs absentes de la base (NULL): temps et coût par défaut
+        travel_time = 1.0 if travel_time is None else float(travel_time)
+        travel_cost = 0.0 if travel_cost is None else float(travel_cost)
+        row[destination] = (self._type_code(travel_type), travel_time, travel_cost, flags)
+        self._log_change(source_id, destination_id)
+        self._maybe_compact()
+
+    def remove_edge(self, source_id: str, destination_id: str) -> bool:
+        """
+        Supprime une connexion
+
+        Returns:
+            True si la connexion existait, False sinon
+        """
+        source = self.index.get(source_id)
+        destination = self.index.get(destination_id)
+        if source is None or destination is None or not self.has_edge(source_id, destination_id):
+            return False
+        del self._row(source)[destination]
+        self._edge_count -= 1
+        self._log_change(source_id, destination_id)
+        self._maybe_compact()
+        return True
+
+    def _log_change(self, source_id: str, destination_id: Optional[str]) -> None:
+        self.revision += 1
+        self._change_log.append((self.revision, source_id, destination_id))
+
+    def changes_since(self, revision: int) -> Optional[List[Tuple[str, Optional[str]]]]:
+        """
+        Modifications faites depuis une révision
+
+        Args:
+            revision: Révision connue de l'appelant
+
+        Returns:
+            Liste de couples (départ, arrivée) des connexions ajoutées, modifiées ou supprimées,
+            avec (lieu, None) pour un lieu supprimé; None si le journal ne remonte pas assez loin
+        """
+        if revision == self.revision:
+            return []
+        if revision > self.revision or not self._change_log or self._change_log[0][0] > revision + 1:
+            return None
+        return [(source_id, destination_id) for change_revision, source_id, destination_id in self._change_log
+                if change_revision > revision]
+
+    def has_edge(self, source_id: str, destination_id: str) -> bool:
+        """Indique si une connexion existe"""
+        source = self.index.get(source_id)
+        destination = self.index.get(destination_id)
+        if source is None or destination is None:
+            return False
+        row = self._dirty_rows.get(source)
+        if row is not None:
+            return destination in row
+        if source + 1 >= len(self.indptr):
+            return False
+        return destination in self.indices[self.indptr[source]:self.indptr[source + 1]]
+
+    def _edge_info(self, edge: _Edge) -> Dict[str, Any]:
+        """Informations d'une connexion, au format historique de Location.connection_info"""
+        type_code, travel_time, travel_cost, flags = edge
+        return {
+            "travel_type": self.travel_types[type_code],
+            "travel_time": travel_time,
+            "travel_cost": int(travel_cost) if float(travel_cost).is_integer() else travel_cost,
+            "requires_hacking": bool(flags & REQUIRES_HACKING),
+            "requires_special_access": bool(flags & REQUIRES_SPECIAL_ACCESS)
+        }
+
+    def get_edge(self, source_id: str, destination_id: str) -> Optional[Dict[str, Any]]:
+        """Informations d'une connexion (None si elle n'existe pas)"""
+        source = self.index.get(source_id)
+        destination = self.index.get(destination_id)
+        if source is None or destination is None:
+            return None
+        for neighbour, edge in self._iter_row(source):
+            if neighbour == destination:
+                return self._edge_info(edge)
+        return None
+
+    def destinations(self, source_id: str) -> List[str]:
+        """IDs des lieux accessibles directement depuis un lieu"""
+        source = self.index.get(source_id)
+        if source is None:
+            return []
+        return [self.location_ids[neighbour] for neighbour, _ in self._iter_row(source)]
+
+    def edges_from(self, source_id: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Connexions sortantes d'un lieu: couples (ID de destination, informations)"""
+        source = self.index.get(source_id)
+        if source is None:
+            return
+        for neighbour, edge in self._iter_row(source):
+            yield self.location_ids[neighbour], self._edge_info(edge)
+
+    def neighbours(self, ordinal: int) -> Iterator[Tuple[int, float, float, int]]:
+        """
+        Connexions sortantes d'un lieu par rangs, pour les calculs de chemins
+
+        Args:
+            ordinal: Rang du lieu de départ
+
+        Returns:
+            Itérateur de tuples (rang de destination, temps, coût, restrictions)
+        """
+        for neighbour, (_, travel_time, travel_cost, flags) in self._iter_row(ordinal):
+            yield neighbour, travel_time, travel_cost, flags
+
+    def iter_edges(self) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        """Toutes les connexions: tuples (départ, arrivée, informations)"""
+        for ordinal, source_id in enumerate(self.location_ids):
+            if source_id is None:
+                continue
+            for neighbour, edge in self._iter_row(ordinal):
+                yield source_id, self.location_ids[neighbour], self._edge_info(edge)
+
+    # ------------------------------------------------------------------
+    # Compactage
+    # ------------------------------------------------------------------
+
+    def _maybe_compact(self) -> None:
+        """Compacte quand les lignes modifiées deviennent nombreuses"""
+        if len(self._dirty_rows) > max(256, len(self.location_ids) // 4):
+            self.compact()
+
+    def compact(self) -> None:
+        """Fusionne les lignes modifiées dans les tableaux CSR et retire les lieux supprimés"""
+        if not self._dirty_rows and None not in self.location_ids:
+            return
+
+        # Renumérotation sans les lieux supprimés
+        remap = {}
+        location_ids = []
+        for ordinal, location_id in enumerate(self.location_ids):
+            if location_id is not None:
+                remap[ordinal] = len(location_ids)
+                location_ids.append(location_id)
+
+        indptr = array("l", [0])
+        indices = array("l")
+        travel_time = array("d")
+        travel_cost = array("d")
+        travel_type = array("H")
+        flags = array("B")
+        for ordinal, location_id in enumerate(self.location_ids):
+            if location_id is None:
+                continue
+            for neighbour, (type_code, time_value, cost_value, flag_value) in self._iter_row(ordinal):
+                new_neighbour = remap.get(neighbour)
+                if new_neighbour is None:
+                    continue
+                indices.append(new_neighbour)
+                travel_time.append(time_value)
+                travel_cost.append(cost_value)
+                travel_type.append(type_code)
+                flags.append(flag_value)
+            indptr.append(len(indices))
+
+        self.location_ids = location_ids
+        self.index = {location_id: ordinal for ordinal, location_id in enumerate(location_ids)}
+        self.indptr, self.indices = indptr, indices
+        self.travel_time, self.travel_cost = travel_time, travel_cost
+        self.travel_type, self.flags = travel_type, flags
+        self._dirty_rows = {}
+        self._edge_count = len(indices)
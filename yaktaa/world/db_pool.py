@@ -0,0 +1,268 @@
+"""
+Module de pool de connexions SQLite pour YakTaa
+Ce module fournit un pool de connexions réutilisables, par thread, partagé par
+le WorldLoader, le ShopManager et le CityManager pour éviter d'ouvrir (et de
+laisser fuir) une nouvelle connexion à chaque requête.
+"""
+
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger("YakTaa.World.DBPool")
+
+# Nombre maximal de connexions inactives conservées par thread
+DEFAULT_POOL_SIZE = 4
+
+# PRAGMA appliqués une seule fois à la création de chaque connexion
+DEFAULT_PRAGMAS = {
+    "busy_timeout": 5000,
+    "temp_store": "MEMORY",
+}
+
+# PRAGMA des connexions en lecture seule: les pages du fichier sont lues par
+# projection mémoire et le cache de pages est agrandi (valeur négative: en Kio)
+READ_ONLY_PRAGMAS = {
+    "busy_timeout": 5000,
+    "temp_store": "MEMORY",
+    "mmap_size": 256 * 1024 * 1024,
+    "cache_size": -16 * 1024,
+}
+
+
+class PooledConnection:
+    """
+    Connexion empruntée au pool.
+    Se comporte comme une connexion sqlite3, mais close() rend la connexion
+    au pool au lieu de la fermer réellement.
+    """
+
+    def __init__(self, pool: "ConnectionPool", raw: sqlite3.Connection):
+        self._pool = pool
+        self._raw = raw
+
+    @property
+    def raw(self) -> sqlite3.Connection:
+        """Connexion sqlite3 sous-jacente"""
+        if self._raw is None:
+            raise sqlite3.ProgrammingError("Connexion déjà rendue au pool")
+        return self._raw
+
+    def close(self) -> None:
+        """Rend la connexion au pool"""
+        if self._raw is not None:
+            raw, self._raw = self._raw, None
+            self._pool.release(raw)
+
+    def __getattr__(self, name):
+        return getattr(self.raw, name)
+
+    def __setattr__(self, name, value):
+        if name in ("_pool", "_raw"):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.raw, name, value)
+
+    def __enter__(self) -> "PooledConnection":
+        self.raw.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return self.raw.__exit__(exc_type, exc_value, traceback)
+
+    def __del__(self):
+        # Les appelants qui oublient close() rendent tout de même la connexion
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class ConnectionPool:
+    """
+    Pool de connexions SQLite vers un fichier de base de données.
+    Chaque thread dispose de sa propre pile de connexions inactives; les PRAGMA
+    et la row_factory sont appliqués une seule fois à la création.
+    En lecture seule, le fichier est ouvert via une URI "mode=ro": plusieurs
+    instances du jeu peuvent alors partager la même base sans se verrouiller.
+    """
+
+    def __init__(self, db_path: Union[str, Path], size: int = DEFAULT_POOL_SIZE,
+                 pragmas: Optional[Dict[str, Union[str, int]]] = None, read_only: bool = False):
+        """
+        Initialise le pool
+
+        Args:
+            db_path: Chemin vers le fichier de base de données
+            size: Nombre maximal de connexions inactives conservées par thread
+            pragmas: PRAGMA à appliquer à chaque nouvelle connexion
+            read_only: Ouvre les connexions en lecture seule
+        """
+        self.db_path = str(db_path)
+        self.size = max(1, int(size))
+        self.read_only = read_only
+        if pragmas is None:
+            pragmas = READ_ONLY_PRAGMAS if read_only else DEFAULT_PRAGMAS
+        self.pragmas = dict(pragmas)
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all_connections: List[sqlite3.Connection] = []
+        self._closed = False
+
+        # Statistiques
+        self.created = 0
+        self.reused = 0
+
+    def _idle(self) -> List[sqlite3.Connection]:
+        """Pile des connexions inactives du thread courant"""
+        idle = getattr(self._local, "idle", None)
+        if idle is None:
+            idle = self._local.idle = []
+        return idle
+
+    def _connect(self) -> sqlite3.Connection:
+        """Ouvre une nouvelle connexion configurée"""
+        if self.read_only:
+            uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+            raw = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            raw = sqlite3.connect(self.db_path, check_same_thread=False)
+        raw.row_factory = sqlite3.Row
+        for name, value in self.pragmas.items():
+            raw.execute(f"PRAGMA {name} = {value}")
+
+        with self._lock:
+            self._all_connections.append(raw)
+            self.created += 1
+
+        logger.debug(f"Nouvelle connexion ouverte vers {self.db_path} ({self.created} au total)")
+        return raw
+
+    def acquire(self) -> PooledConnection:
+        """
+        Emprunte une connexion au pool
+
+        Returns:
+            Connexion empruntée, à rendre avec close()
+        """
+        if self._closed:
+            raise sqlite3.ProgrammingError(f"Pool fermé pour {self.db_path}")
+
+        idle = self._idle()
+        if idle:
+            raw = idle.pop()
+            self.reused += 1
+        else:
+            raw = self._connect()
+        return PooledConnection(self, raw)
+
+    def release(self, raw: sqlite3.Connection) -> None:
+        """
+        Rend une connexion au pool
+
+        Args:
+            raw: Connexion sqlite3 à rendre
+        """
+        if self._closed:
+            self._close_raw(raw)
+            return
+
+        try:
+            # Une transaction non validée est annulée, comme à la fermeture d'une connexion
+            if raw.in_transaction:
+                raw.rollback()
+        except sqlite3.Error as e:
+            logger.warning(f"Connexion invalide rendue au pool, fermeture: {e}")
+            self._close_raw(raw)
+            return
+
+        idle = self._idle()
+        if len(idle) < self.size:
+            idle.append(raw)
+        else:
+            self._close_raw(raw)
+
+    @contextmanager
+    def connection(self) -> Iterator[PooledConnection]:
+        """Emprunte une connexion pour la durée d'un bloc with"""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _close_raw(self, raw: sqlite3.Connection) -> None:
+        """Ferme réellement une connexion"""
+        with self._lock:
+            if raw in self._all_connections:
+                self._all_connections.remove(raw)
+        try:
+            raw.close()
+        except sqlite3.Error:
+            pass
+
+    def close_all(self) -> None:
+        """Ferme toutes les connexions du pool, tous threads confondus"""
+        with self._lock:
+            connections, self._all_connections = self._all_connections, []
+            self._closed = True
+
+        for raw in connections:
+            try:
+                raw.close()
+            except sqlite3.Error:
+                pass
+
+        logger.info(f"Pool de connexions fermé pour {self.db_path} ({len(connections)} connexions)")
+
+    @property
+    def open_connections(self) -> int:
+        """Nombre de connexions actuellement ouvertes"""
+        with self._lock:
+            return len(self._all_connections)
+
+
+_pools: Dict[Tuple[str, bool], ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: Union[str, Path], size: Optional[int] = None, read_only: bool = False,
+             pragmas: Optional[Dict[str, Union[str, int]]] = None) -> ConnectionPool:
+    """
+    Récupère le pool partagé pour un fichier de base de données
+
+    Args:
+        db_path: Chemin vers le fichier de base de données
+        size: Taille du pool (appliquée si le pool est créé ou agrandi)
+        read_only: Pool de connexions en lecture seule (distinct du pool en écriture)
+        pragmas: PRAGMA des nouvelles connexions (appliqués à la création du pool)
+
+    Returns:
+        Pool de connexions partagé pour ce fichier
+    """
+    path = str(Path(db_path).resolve())
+    key = (path, read_only)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool._closed:
+            pool = ConnectionPool(path, size or DEFAULT_POOL_SIZE, pragmas=pragmas, read_only=read_only)
+            _pools[key] = pool
+            mode = "lecture seule" if read_only else "lecture-écriture"
+            logger.info(f"Pool de connexions créé pour {path} ({mode}, taille: {pool.size})")
+        elif size and size > pool.size:
+            pool.size = size
+        return pool
+
+
+def close_all_pools() -> None:
+    """Ferme tous les pools de connexions ouverts"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+
+    for pool in pools:
+        pool.close_all()
@@ -0,0 +1,177 @@
+"""
+Module de cache du schéma de la base de données de YakTaa
+Ce module fournit un instantané du schéma (tables et colonnes) construit une
+seule fois par fichier de base de données, pour éviter de relancer
+PRAGMA table_info et des requêtes sur sqlite_master à chaque boutique ou article.
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger("YakTaa.World.DBSchema")
+
+
+class SchemaSnapshot:
+    """
+    Instantané en mémoire du schéma d'une base de données SQLite.
+    L'instantané est invalidé lorsque la date de modification du fichier
+    et le PRAGMA schema_version changent.
+    """
+
+    def __init__(self, db_path: Union[str, Path], connect: Callable):
+        """
+        Initialise l'instantané
+
+        Args:
+            db_path: Chemin vers le fichier de base de données
+            connect: Fonction retournant une connexion (rendue avec close())
+        """
+        self.db_path = str(db_path)
+        self._connect = connect
+        self._lock = threading.RLock()
+
+        self._tables: Optional[Set[str]] = None
+        self._columns: Dict[str, List[str]] = {}
+        self._mtime: Optional[Tuple[int, int]] = None
+        self._schema_version: Optional[int] = None
+
+        # Statistiques
+        self.refreshes = 0
+
+    def _stat_mtime(self) -> Tuple[int, int]:
+        """Dates de modification du fichier et de son journal WAL"""
+        stamps = []
+        for path in (self.db_path, self.db_path + "-wal"):
+            try:
+                stamps.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                stamps.append(0)
+        return stamps[0], stamps[1]
+
+    def _read_schema_version(self, conn) -> int:
+        """Lit le compteur de version du schéma SQLite"""
+        row = conn.execute("PRAGMA schema_version").fetchone()
+        return row[0] if row else 0
+
+    def _ensure_fresh(self) -> None:
+        """Recharge la liste des tables si le schéma a changé"""
+        mtime = self._stat_mtime()
+        if self._tables is not None and mtime == self._mtime:
+            return
+
+        conn = self._connect()
+        try:
+            version = self._read_schema_version(conn)
+            if self._tables is not None and version == self._schema_version:
+                # Le fichier a changé mais pas le schéma (écriture de données)
+                self._mtime = mtime
+                return
+
+            rows = conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+            self._tables = {row[0] for row in rows}
+            self._columns = {}
+            self._schema_version = version
+            self._mtime = mtime
+            self.refreshes += 1
+            logger.debug(f"Schéma chargé pour {self.db_path}: {len(self._tables)} tables (version {version})")
+        finally:
+            conn.close()
+
+    def invalidate(self) -> None:
+        """Force le rechargement du schéma à la prochaine requête"""
+        with self._lock:
+            self._tables = None
+            self._columns = {}
+
+    def tables(self) -> Set[str]:
+        """Ensemble des tables de la base de données"""
+        with self._lock:
+            self._ensure_fresh()
+            return set(self._tables)
+
+    def has_table(self, table: str) -> bool:
+        """
+        Indique si une table existe
+
+        Args:
+            table: Nom de la table
+
+        Returns:
+            True si la table existe, False sinon
+        """
+        with self._lock:
+            self._ensure_fresh()
+            return table in self._tables
+
+    def columns(self, table: str) -> List[str]:
+        """
+        Récupère les colonnes d'une table
+
+        Args:
+            table: Nom de la table
+
+        Returns:
+            Liste des noms de colonnes (vide si la table n'existe pas)
+        """
+        with self._lock:
+            self._ensure_fresh()
+            if table not in self._tables:
+                return []
+
+            columns = self._columns.get(table)
+            if columns is None:
+                conn = self._connect()
+                try:
+                    columns = [col[1] for col in conn.execute(f"PRAGMA table_info({table})").fetchall()]
+                finally:
+                    conn.close()
+                self._columns[table] = columns
+            return list(columns)
+
+    def has_column(self, table: str, column: str) -> bool:
+        """Indique si une colonne existe dans une table"""
+        return column in self.columns(table)
+
+    def pick_column(self, table: str, *candidates: str) -> str:
+        """
+        Choisit le premier nom de colonne existant parmi des candidats
+
+        Args:
+            table: Nom de la table
+            candidates: Noms de colonnes par ordre de préférence
+
+        Returns:
+            Premier candidat présent dans la table, ou le dernier candidat à défaut
+        """
+        columns = self.columns(table)
+        for candidate in candidates:
+            if candidate in columns:
+                return candidate
+        return candidates[-1]
+
+
+_snapshots: Dict[str, SchemaSnapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
+def get_schema(db_path: Union[str, Path], connect: Callable) -> SchemaSnapshot:
+    """
+    Récupère l'instantané de schéma partagé pour un fichier de base de données
+
+    Args:
+        db_path: Chemin vers le fichier de base de données
+        connect: Fonction retournant une connexion vers ce fichier
+
+    Returns:
+        Instantané de schéma partagé
+    """
+    key = str(Path(db_path).resolve())
+    with _snapshots_lock:
+        snapshot = _snapshots.get(key)
+        if snapshot is None:
+            snapshot = SchemaSnapshot(key, connect)
+            _snapshots[key] = snapshot
+        return snapshot
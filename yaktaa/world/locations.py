@@ -3,10 +3,13 @@ Module pour la gestion des lieux dans le monde de YakTaa
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple, Set, Any
+from typing import Dict, List, Optional, Tuple, FrozenSet, Any
 from dataclasses import dataclass, field
 from enum import Enum, auto
 
+from yaktaa.world.connection_store import ConnectionStore
+from yaktaa.world.spatial_index import SpatialIndex
+
 logger = logging.getLogger("YakTaa.World.Locations")
 
 
@@ -52,6 +55,10 @@ class BuildingType(Enum):
 class Location:
     """Classe représentant un lieu dans le monde du jeu"""
     
+    __slots__ = ("id", "name", "description", "coordinates", "security_level", "population",
+                 "services", "tags", "parent_location_id", "is_virtual", "is_special", "is_dangerous",
+                 "_connection_store")
+    
     def __init__(self, 
                  id: str,
                  name: str,
@@ -79,10 +86,38 @@ class Location:
         self.is_special = is_special
         self.is_dangerous = is_dangerous
         
-        # Connexions vers d'autres lieux
-        self.connections: Set[str] = set()
-        # Informations sur les connexions (temps, coût, etc.)
-        self.connection_info: Dict[str, Dict[str, Any]] = {}
+        # Connexions vers d'autres lieux: stockage de la carte du lieu (partagé),
+        # ou stockage propre créé à la première connexion d'un lieu hors carte
+        self._connection_store: Optional[ConnectionStore] = None
+    
+    @property
+    def connections(self) -> FrozenSet[str]:
+        """IDs des lieux connectés (lecture seule, voir add_connection / remove_connection)"""
+        if self._connection_store is None:
+            return frozenset()
+        return frozenset(self._connection_store.destinations(self.id))
+    
+    @property
+    def connection_info(self) -> Dict[str, Dict[str, Any]]:
+        """Informations sur les connexions (temps, coût, etc.), par ID de destination (copie)"""
+        if self._connection_store is None:
+            return {}
+        return dict(self._connection_store.edges_from(self.id))
+    
+    def _attach(self, store: ConnectionStore) -> None:
+        """Rattache le lieu au stockage des connexions d'une carte, en y recopiant ses connexions"""
+        if self._connection_store is store:
+            return
+        for location_id, info in self.connection_info.items():
+            store.set_edge(self.id, location_id, **info)
+        self._connection_store = store
+    
+    def _detach(self) -> None:
+        """Détache le lieu de la carte en conservant ses connexions sortantes"""
+        connection_info = self.connection_info
+        self._connection_store = None
+        for location_id, info in connection_info.items():
+            self.add_connection(location_id, **info)
     
     def add_connection(self, location_id: str, 
                        travel_type: str = "standard", 
@@ -101,25 +136,27 @@ class Location:
             requires_hacking: Si vrai, nécessite des compétences de hacking pour accéder
             requires_special_access: Si vrai, nécessite un accès spécial
         """
-        self.connections.add(location_id)
-        self.connection_info[location_id] = {
-            "travel_type": travel_type,
-            "travel_time": travel_time,
-            "travel_cost": travel_cost,
-            "requires_hacking": requires_hacking,
-            "requires_special_access": requires_special_access
-        }
+        if self._connection_store is None:
+            self._connection_store = ConnectionStore()
+        self._connection_store.set_edge(
+            self.id, location_id, travel_type, travel_time, travel_cost,
+            requires_hacking, requires_special_access
+        )
     
     def remove_connection(self, location_id: str) -> None:
         """Supprime une connexion vers un autre lieu"""
-        if location_id in self.connections:
-            self.connections.remove(location_id)
-            if location_id in self.connection_info:
-                del self.connection_info[location_id]
+        if self._connection_store is not None:
+            self._connection_store.remove_edge(self.id, location_id)
+    
+    def has_connection(self, location_id: str) -> bool:
+        """Indique si le lieu est connecté directement à un autre lieu"""
+        return self._connection_store is not None and self._connection_store.has_edge(self.id, location_id)
     
     def get_connection_info(self, location_id: str) -> Optional[Dict[str, Any]]:
         """Récupère les informations sur une connexion"""
-        return self.connection_info.get(location_id)
+        if self._connection_store is None:
+            return None
+        return self._connection_store.get_edge(self.id, location_id)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convertit le lieu en dictionnaire pour la sauvegarde"""
@@ -178,23 +215,40 @@ class WorldMap:
         """Initialise la carte du monde"""
         self.name = name
         self.locations: Dict[str, Location] = {}
-        self.connections: List[Tuple[str, str, Dict[str, Any]]] = []
+        # Connexions de tous les lieux, au format CSR
+        self.connection_store = ConnectionStore()
+        # Appareils du monde (métadonnées des fichiers incluses, sans leur contenu)
+        self.devices: Dict[str, Dict[str, Any]] = {}
+        self.devices_by_location: Dict[str, List[Dict[str, Any]]] = {}
+        # Oracle des temps de trajet (calculé à la première requête, jamais enregistré)
+        self._travel_oracle = None
+        # Index spatial des lieux par coordonnées (requêtes de proximité)
+        self.spatial_index = SpatialIndex()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Les tables de l'oracle (n x n) ne sont pas enregistrées avec l'instantané du monde
+        state = self.__dict__.copy()
+        state["_travel_oracle"] = None
+        return state
         
     def add_location(self, location: Location) -> None:
         """Ajoute un lieu à la carte"""
         self.locations[location.id] = location
+        self.connection_store.add_node(location.id)
+        location._attach(self.connection_store)
+        self.spatial_index.insert(location.id, location.coordinates)
+        self._travel_oracle = None
         logger.info(f"Lieu ajouté à la carte: {location.name} (ID: {location.id})")
     
     def remove_location(self, location_id: str) -> None:
         """Supprime un lieu de la carte"""
         if location_id in self.locations:
             location = self.locations.pop(location_id)
-            # Supprimer les connexions vers ce lieu
-            for loc in self.locations.values():
-                loc.remove_connection(location_id)
-            # Supprimer les connexions depuis ce lieu
-            self.connections = [conn for conn in self.connections 
-                               if conn[0] != location_id and conn[1] != location_id]
+            self.spatial_index.remove(location_id)
+            location._detach()
+            # Supprimer les connexions depuis et vers ce lieu
+            self.connection_store.remove_node(location_id)
+            self._travel_oracle = None
             logger.info(f"Lieu supprimé de la carte: {location.name} (ID: {location.id})")
     
     def get_location(self, location_id: str) -> Optional[Location]:
@@ -234,33 +288,128 @@ class WorldMap:
             requires_hacking, requires_special_access
         )
         
-        # Ajouter la connexion à la liste des connexions
-        connection_info = {
-            "travel_type": travel_type,
-            "travel_time": travel_time,
-            "travel_cost": travel_cost,
-            "requires_hacking": requires_hacking,
-            "requires_special_access": requires_special_access
-        }
-        self.connections.append((from_id, to_id, connection_info))
-        
         # Si bidirectionnelle, ajouter la connexion inverse
         if bidirectional:
             self.locations[to_id].add_connection(
                 from_id, travel_type, travel_time, travel_cost, 
                 requires_hacking, requires_special_access
             )
-            self.connections.append((to_id, from_id, connection_info))
         
         logger.info(f"Connexion ajoutée: {self.locations[from_id].name} -> {self.locations[to_id].name}")
         return True
     
+    def remove_connection(self, from_id: str, to_id: str, bidirectional: bool = True) -> bool:
+        """
+        Supprime une connexion entre deux lieux
+        
+        Args:
+            from_id: ID du lieu de départ
+            to_id: ID du lieu d'arrivée
+            bidirectional: Si vrai, supprime aussi la connexion inverse
+        
+        Returns:
+            True si au moins une connexion a été supprimée, False sinon
+        """
+        removed = self.connection_store.remove_edge(from_id, to_id)
+        if bidirectional:
+            removed = self.connection_store.remove_edge(to_id, from_id) or removed
+        
+        if removed:
+            logger.info(f"Connexion supprimée: {from_id} -> {to_id}")
+        return removed
+    
+    def get_travel_oracle(self):
+        """
+        Récupère l'oracle des temps de trajet (durées et distances entre toutes les paires de lieux)
+        
+        Les tables sont calculées à la première requête, puis suivent les modifications
+        de connexions de la carte, y compris celles faites directement sur un lieu
+        (Location.add_connection / remove_connection).
+        
+        Returns:
+            TravelTimeOracle de la carte
+        """
+        if self._travel_oracle is None:
+            from yaktaa.world.travel_oracle import TravelTimeOracle
+            self._travel_oracle = TravelTimeOracle(self)
+        return self._travel_oracle
+    
     def connect_locations(self, location_id1: str, location_id2: str, bidirectional: bool = True) -> bool:
         """
         Connecte deux lieux entre eux (version simplifiée de add_connection)
         """
         return self.add_connection(location_id1, location_id2, bidirectional=bidirectional)
     
+    def move_location(self, location_id: str, coordinates: Tuple[float, float]) -> bool:
+        """
+        Déplace un lieu (à utiliser plutôt que de modifier location.coordinates directement,
+        pour garder l'index spatial à jour)
+        
+        Args:
+            location_id: ID du lieu
+            coordinates: Nouvelles coordonnées
+            
+        Returns:
+            True si le lieu a été déplacé, False s'il n'existe pas
+        """
+        location = self.locations.get(location_id)
+        if not location:
+            return False
+        location.coordinates = coordinates
+        self.spatial_index.insert(location_id, coordinates)
+        # Les distances des connexions changent
+        self._travel_oracle = None
+        return True
+    
+    def nearest(self, coordinates: Tuple[float, float], n: int = 1) -> List[Location]:
+        """
+        Récupère les lieux les plus proches d'un point
+        
+        Args:
+            coordinates: Coordonnées du point
+            n: Nombre de lieux à retourner
+            
+        Returns:
+            Les n lieux les plus proches, du plus proche au plus éloigné
+        """
+        return [self.locations[loc_id] for _, loc_id in self.spatial_index.nearest(coordinates, n)]
+    
+    def within_radius(self, coordinates: Tuple[float, float], radius: float) -> List[Location]:
+        """
+        Récupère les lieux situés dans un rayon autour d'un point
+        
+        Args:
+            coordinates: Coordonnées du centre
+            radius: Rayon, en unités de coordonnées (1.0 ≈ 111 km)
+            
+        Returns:
+            Lieux du cercle, du plus proche au plus éloigné
+        """
+        return [self.locations[loc_id] for _, loc_id in self.spatial_index.within_radius(coordinates, radius)]
+    
+    def within_bbox(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[Location]:
+        """
+        Récupère les lieux situés dans un rectangle (par exemple la zone visible de la carte)
+        
+        Args:
+            min_x, min_y: Coin inférieur du rectangle
+            max_x, max_y: Coin supérieur du rectangle
+            
+        Returns:
+            Lieux du rectangle
+        """
+        return [self.locations[loc_id] for loc_id in self.spatial_index.within_bbox(min_x, min_y, max_x, max_y)]
+    
+    @property
+    def revision(self) -> int:
+        """Révision des connexions de la carte, incrémentée à chaque ajout, modification ou suppression"""
+        return self.connection_store.revision
+    
+    @property
+    def connections(self) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """Toutes les connexions de la carte: tuples (départ, arrivée, informations)"""
+        return list(self.connection_store.iter_edges())
+    
     def get_all_locations(self) -> List[Location]:
         """Récupère tous les lieux de la carte"""
         return list(self.locations.values())
@@ -270,7 +419,7 @@ class WorldMap:
         if location_id not in self.locations:
             return []
         
-        connected_ids = self.locations[location_id].connections
+        connected_ids = self.connection_store.destinations(location_id)
         return [self.locations[loc_id] for loc_id in connected_ids if loc_id in self.locations]
     
     def to_dict(self) -> Dict[str, Any]:
@@ -278,7 +427,8 @@ class WorldMap:
         return {
             "name": self.name,
             "locations": {loc_id: loc.to_dict() for loc_id, loc in self.locations.items()},
-            "connections": [(from_id, to_id, info) for from_id, to_id, info in self.connections]
+            # Ordre canonique (départ, arrivée): identique d'une sauvegarde à l'autre
+            "connections": sorted(self.connections, key=lambda connection: (connection[0], connection[1]))
         }
     
     @classmethod
@@ -0,0 +1,191 @@
+"""
+Module d'index spatial de YakTaa
+Ce module fournit une grille uniforme indexant des points (lieux de la carte)
+par leurs coordonnées, pour répondre aux requêtes de proximité (plus proches
+voisins, rayon, rectangle) sans parcourir tous les lieux.
+"""
+
+import heapq
+import logging
+import math
+from typing import Dict, Iterator, List, Tuple
+
+logger = logging.getLogger("YakTaa.World.SpatialIndex")
+
+# Taille d'une cellule de la grille, en unités de coordonnées (0.1 ≈ 11 km):
+# assez fine pour séparer les villes, assez large pour regrouper les quartiers d'une ville
+DEFAULT_CELL_SIZE = 0.1
+
+Coordinates = Tuple[float, float]
+
+
+class SpatialIndex:
+    """
+    Grille uniforme creuse: chaque cellule occupée contient les points qui s'y trouvent.
+    Les requêtes ne visitent que les cellules proches de la zone demandée.
+    """
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        """
+        Initialise un index vide
+
+        Args:
+            cell_size: Taille d'une cellule de la grille, en unités de coordonnées
+        """
+        if cell_size <= 0:
+            raise ValueError(f"Taille de cellule invalide: {cell_size}")
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], Dict[str, Coordinates]] = {}
+        self._positions: Dict[str, Coordinates] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._positions
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        """Cellule contenant des coordonnées"""
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def insert(self, key: str, coordinates: Coordinates) -> None:
+        """
+        Ajoute un point, ou le déplace s'il est déjà indexé
+
+        Args:
+            key: Identifiant du point (ID du lieu)
+            coordinates: Coordonnées (x, y)
+        """
+        if key in self._positions:
+            self.remove(key)
+        position = (float(coordinates[0]), float(coordinates[1]))
+        self._positions[key] = position
+        self._cells.setdefault(self._cell(*position), {})[key] = position
+
+    def remove(self, key: str) -> bool:
+        """
+        Retire un point
+
+        Args:
+            key: Identifiant du point
+
+        Returns:
+            True si le point était indexé, False sinon
+        """
+        position = self._positions.pop(key, None)
+        if position is None:
+            return False
+        cell = self._cell(*position)
+        points = self._cells.get(cell)
+        if points is not None:
+            points.pop(key, None)
+            if not points:
+                del self._cells[cell]
+        return True
+
+    def _cells_in_range(self, min_cell: Tuple[int, int], max_cell: Tuple[int, int]) -> Iterator[Dict[str, Coordinates]]:
+        """Cellules occupées comprises entre deux cellules (bornes incluses)"""
+        width = max_cell[0] - min_cell[0] + 1
+        height = max_cell[1] - min_cell[1] + 1
+        if width <= 0 or height <= 0:
+            return
+        if width * height > len(self._cells):
+            # Zone plus grande que la partie occupée de la grille: parcourir les cellules occupées
+            for (cx, cy), points in self._cells.items():
+                if min_cell[0] <= cx <= max_cell[0] and min_cell[1] <= cy <= max_cell[1]:
+                    yield points
+            return
+        for cx in range(min_cell[0], max_cell[0] + 1):
+            for cy in range(min_cell[1], max_cell[1] + 1):
+                points = self._cells.get((cx, cy))
+                if points:
+                    yield points
+
+    def within_bbox(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[str]:
+        """
+        Points situés dans un rectangle (bornes incluses)
+
+        Args:
+            min_x, min_y: Coin inférieur du rectangle
+            max_x, max_y: Coin supérieur du rectangle
+
+        Returns:
+            Identifiants des points du rectangle
+        """
+        result = []
+        for points in self._cells_in_range(self._cell(min_x, min_y), self._cell(max_x, max_y)):
+            for key, (x, y) in points.items():
+                if min_x <= x <= max_x and min_y <= y <= max_y:
+                    result.append(key)
+        return result
+
+    def within_radius(self, center: Coordinates, radius: float) -> List[Tuple[float, str]]:
+        """
+        Points situés à une distance inférieure ou égale à un rayon
+
+        Args:
+            center: Coordonnées du centre
+            radius: Rayon, en unités de coordonnées
+
+        Returns:
+            Couples (distance, identifiant), du plus proche au plus éloigné
+        """
+        cx, cy = center
+        result = []
+        for points in self._cells_in_range(self._cell(cx - radius, cy - radius), self._cell(cx + radius, cy + radius)):
+            for key, (x, y) in points.items():
+                distance = math.hypot(x - cx, y - cy)
+                if distance <= radius:
+                    result.append((distance, key))
+        result.sort()
+        return result
+
+    def nearest(self, center: Coordinates, n: int = 1) -> List[Tuple[float, str]]:
+        """
+        Plus proches voisins d'un point, par anneaux de cellules croissants autour du centre
+
+        Args:
+            center: Coordonnées du centre
+            n: Nombre de voisins recherchés
+
+        Returns:
+            Couples (distance, identifiant) des n points les plus proches, du plus proche au plus éloigné
+        """
+        if n <= 0 or not self._positions:
+            return []
+        n = min(n, len(self._positions))
+        cx, cy = center
+        origin_x, origin_y = self._cell(cx, cy)
+
+        # Tas des n meilleurs candidats (distances négatives: le pire est en tête)
+        best: List[Tuple[float, str]] = []
+        visited_cells = 0
+        ring = 0
+        while True:
+            if ring == 0:
+                ring_cells = [(origin_x, origin_y)]
+            else:
+                ring_cells = [(origin_x + dx, origin_y + d) for dx in range(-ring, ring + 1) for d in (-ring, ring)]
+                ring_cells += [(origin_x + d, origin_y + dy) for dy in range(-ring + 1, ring) for d in (-ring, ring)]
+
+            if len(ring_cells) > len(self._cells) - visited_cells:
+                # Les anneaux deviennent plus grands que la grille occupée restante: recherche exhaustive
+                candidates = ((math.hypot(x - cx, y - cy), key) for key, (x, y) in self._positions.items())
+                return heapq.nsmallest(n, candidates)
+
+            for cell in ring_cells:
+                points = self._cells.get(cell)
+                if not points:
+                    continue
+                visited_cells += 1
+                for key, (x, y) in points.items():
+                    distance = math.hypot(x - cx, y - cy)
+                    if len(best) < n:
+                        heapq.heappush(best, (-distance, key))
+                    elif distance < -best[0][0]:
+                        heapq.heapreplace(best, (-distance, key))
+
+            # Tout point hors des anneaux visités est à au moins ring * cell_size du centre
+            if len(best) == n and -best[0][0] <= ring * self.cell_size:
+                return sorted((-distance, key) for distance, key in best)
+            ring += 1
@@ -4,17 +4,48 @@ Ce module contient les classes et fonctions nécessaires pour gérer les déplac
 entre les différents lieux du monde, ainsi que les animations et effets visuels associés.
 """
 
+import heapq
 import logging
 import random
 import time
-from typing import Dict, List, Optional, Any, Tuple, Set
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Dict, List, Optional, Any, Tuple, Set, Iterable
 from enum import Enum, auto
 from dataclasses import dataclass
 
+try:
+    import numpy as np
+except ImportError:
+    # NumPy est optionnel: les conditions sont alors mises à jour en Python pur
+    np = None
+
 from yaktaa.world.locations import Location, WorldMap
 
 logger = logging.getLogger("YakTaa.World.Travel")
 
+# Poids par défaut des itinéraires: heures de trajet (météo et congestion comprises),
+# kilomètres parcourus et crédits dépensés
+DEFAULT_ROUTE_WEIGHTS = {"time": 1.0, "distance": 0.01, "cost": 0.01}
+
+# Nombre d'itinéraires calculés conservés en mémoire
+ROUTE_CACHE_SIZE = 1024
+
+# Évolution des conditions à chaque mise à jour: probabilité de changement de météo
+# et amplitude de la variation aléatoire de la congestion
+WEATHER_CHANGE_PROBABILITY = 0.1
+CONGESTION_VARIATION = 0.2
+
+# Intervalle de temps de jeu (heures) entre deux évolutions des conditions pendant
+# une avance rapide du temps, et nombre de pas au-delà duquel la congestion
+# (marche aléatoire bornée) a oublié son état initial
+CONDITIONS_UPDATE_INTERVAL = 1.0
+CONGESTION_MIXING_STEPS = 400
+
+# Nombre de lieux dont les bâtiments générés restent en mémoire (CityManager)
+INTERIOR_CACHE_SIZE = 32
+
 class TravelMethod(Enum):
     """Types de méthodes de déplacement disponibles"""
     WALK = auto()          # Marche à pied (courtes distances)
@@ -44,6 +75,23 @@ class TravelRoute:
     weather_affected: bool = True
     congestion_affected: bool = True
 
+@dataclass
+class PlannedRoute:
+    """Itinéraire en plusieurs étapes calculé par le planificateur de TravelSystem"""
+    source_id: str
+    destination_id: str
+    legs: List[TravelRoute]
+    total_time: float   # en heures, conditions actuelles comprises
+    total_cost: int     # en crédits, conditions actuelles comprises
+    total_distance: float  # en km
+    max_security_risk: int
+    weight: float       # coût pondéré minimisé par le planificateur
+    
+    @property
+    def location_ids(self) -> List[str]:
+        """Lieux traversés, départ et arrivée compris"""
+        return [self.source_id] + [leg.destination_id for leg in self.legs]
+
 class WeatherCondition(Enum):
     """Conditions météorologiques possibles"""
     CLEAR = auto()         # Ciel dégagé
@@ -57,21 +105,227 @@ class WeatherCondition(Enum):
     HEATWAVE = auto()      # Canicule
     EMP_STORM = auto()     # Tempête électromagnétique
 
+# Multiplicateur du temps de trajet selon la météo (1.0 pour les conditions absentes)
+WEATHER_TIME_FACTORS = {
+    WeatherCondition.STORMY: 1.5,
+    WeatherCondition.TOXIC_RAIN: 1.5,
+    WeatherCondition.SANDSTORM: 1.5,
+    WeatherCondition.EMP_STORM: 1.5,
+    WeatherCondition.RAINY: 1.2,
+    WeatherCondition.FOGGY: 1.2,
+    WeatherCondition.SNOWY: 1.2,
+}
+
+class TravelConditions:
+    """
+    Météo et congestion de tous les lieux, rangées dans des tableaux contigus
+    indexés par le rang des lieux et mises à jour par opérations sur tableaux entiers.
+    Utilise NumPy s'il est disponible, le module array sinon; le générateur
+    aléatoire est initialisé par une graine pour des mises à jour reproductibles.
+    """
+    
+    def __init__(self, location_ids: Iterable[str], seed: Optional[int] = None, use_numpy: Optional[bool] = None):
+        """
+        Initialise les conditions avec des valeurs aléatoires
+        
+        Args:
+            location_ids: IDs des lieux
+            seed: Graine du générateur aléatoire (None = non reproductible)
+            use_numpy: Forcer (True) ou désactiver (False) NumPy; None = selon disponibilité
+        """
+        self.location_ids: List[str] = list(location_ids)
+        self.index: Dict[str, int] = {location_id: i for i, location_id in enumerate(self.location_ids)}
+        self.seed = seed
+        self.use_numpy = np is not None and use_numpy is not False
+        if use_numpy and np is None:
+            logger.warning("NumPy indisponible, conditions de voyage calculées en Python pur")
+        
+        # Version des conditions: incrémentée à chaque changement
+        self.version = 0
+        
+        self.weather_states: List[WeatherCondition] = list(WeatherCondition)
+        factors = [WEATHER_TIME_FACTORS.get(weather, 1.0) for weather in self.weather_states]
+        size = len(self.location_ids)
+        state_count = len(self.weather_states)
+        
+        if self.use_numpy:
+            self._rng = np.random.default_rng(seed)
+            self._factor_table = np.array(factors, dtype=np.float64)
+            self.weather = self._rng.integers(0, state_count, size, dtype=np.int8)
+            self.congestion = self._rng.random(size) * 0.5  # entre 0 et 0.5
+        else:
+            self._rng = random.Random(seed)
+            self._factor_table = array("d", factors)
+            rand = self._rng.random
+            self.weather = array("b", [int(rand() * state_count) for _ in range(size)])
+            self.congestion = array("d", [rand() * 0.5 for _ in range(size)])  # entre 0 et 0.5
+        
+        self._refresh_weather_factors()
+    
+    def __len__(self) -> int:
+        return len(self.location_ids)
+    
+    def _refresh_weather_factors(self) -> None:
+        """Recalcule le multiplicateur de temps de trajet dû à la météo de chaque lieu"""
+        if self.use_numpy:
+            self.weather_factor = self._factor_table[self.weather]
+        else:
+            table = self._factor_table
+            self.weather_factor = array("d", [table[state] for state in self.weather])
+    
+    def tick(self) -> None:
+        """Fait évoluer la météo (changement aléatoire) et la congestion (variation de ±0.1) de tous les lieux"""
+        self.advance(1)
+    
+    def advance(self, steps: int) -> None:
+        """
+        Fait évoluer les conditions de plusieurs pas en un saut
+        
+        La météo n'a pas de mémoire: sur n pas, un lieu change de météo avec la probabilité
+        1 - (1 - p)^n, vers un état uniforme, ce qui se calcule directement. La congestion
+        est simulée pas à pas, sur au plus CONGESTION_MIXING_STEPS pas: sa loi stationnaire
+        (marche bornée par écrêtage, avec des masses en 0 et 1) n'a pas de forme simple.
+        
+        Coût: O(min(steps, CONGESTION_MIXING_STEPS) x nombre de lieux). Un long saut
+        (attente, voyage de plusieurs jours) prend de l'ordre de 3 ms pour 500 lieux avec
+        NumPy, et de 70 ms sans NumPy (environ 0.14 ms par lieu).
+        
+        Args:
+            steps: Nombre de pas
+        """
+        if steps <= 0:
+            return
+        size = len(self.location_ids)
+        state_count = len(self.weather_states)
+        change_probability = 1.0 - (1.0 - WEATHER_CHANGE_PROBABILITY) ** steps
+        congestion_steps = min(steps, CONGESTION_MIXING_STEPS)
+        
+        if self.use_numpy:
+            changed = self._rng.random(size) < change_probability
+            count = int(changed.sum())
+            if count:
+                self.weather[changed] = self._rng.integers(0, state_count, count, dtype=np.int8)
+            for _ in range(congestion_steps):
+                self.congestion += (self._rng.random(size) - 0.5) * CONGESTION_VARIATION
+                np.clip(self.congestion, 0.0, 1.0, out=self.congestion)
+        else:
+            rand = self._rng.random
+            weather = self.weather
+            for i in [i for i in range(size) if rand() < change_probability]:
+                weather[i] = int(rand() * state_count)
+            for _ in range(congestion_steps):
+                self.congestion = array("d", [
+                    min(1.0, max(0.0, congestion + (rand() - 0.5) * CONGESTION_VARIATION))
+                    for congestion in self.congestion
+                ])
+        
+        self._refresh_weather_factors()
+        self.version += 1
+    
+    def get_weather(self, location_id: str) -> Optional[WeatherCondition]:
+        """Météo d'un lieu (None si le lieu est inconnu)"""
+        i = self.index.get(location_id)
+        return None if i is None else self.weather_states[int(self.weather[i])]
+    
+    def get_congestion(self, location_id: str) -> Optional[float]:
+        """Congestion d'un lieu, de 0.0 (fluide) à 1.0 (bloqué), None si le lieu est inconnu"""
+        i = self.index.get(location_id)
+        return None if i is None else float(self.congestion[i])
+    
+    def set_weather(self, location_id: str, weather: WeatherCondition) -> None:
+        """Impose la météo d'un lieu"""
+        i = self._ensure_location(location_id)
+        self.weather[i] = self.weather_states.index(weather)
+        self.weather_factor[i] = self._factor_table[self.weather[i]]
+        self.version += 1
+    
+    def set_congestion(self, location_id: str, congestion: float) -> None:
+        """Impose la congestion d'un lieu (bornée entre 0.0 et 1.0)"""
+        i = self._ensure_location(location_id)
+        self.congestion[i] = max(0.0, min(1.0, float(congestion)))
+        self.version += 1
+    
+    def _ensure_location(self, location_id: str) -> int:
+        """Rang d'un lieu, ajouté (temps clair, sans congestion) s'il est inconnu"""
+        i = self.index.get(location_id)
+        if i is not None:
+            return i
+        
+        i = len(self.location_ids)
+        self.location_ids.append(location_id)
+        self.index[location_id] = i
+        clear = self.weather_states.index(WeatherCondition.CLEAR)
+        if self.use_numpy:
+            self.weather = np.append(self.weather, np.int8(clear))
+            self.congestion = np.append(self.congestion, 0.0)
+        else:
+            self.weather.append(clear)
+            self.congestion.append(0.0)
+        self._refresh_weather_factors()
+        return i
+
+
+class _WeatherView(Mapping):
+    """Vue en lecture {location_id: WeatherCondition} des conditions (compatibilité)"""
+    
+    def __init__(self, conditions: TravelConditions):
+        self._conditions = conditions
+    
+    def __getitem__(self, location_id: str) -> WeatherCondition:
+        weather = self._conditions.get_weather(location_id)
+        if weather is None:
+            raise KeyError(location_id)
+        return weather
+    
+    def __iter__(self):
+        return iter(self._conditions.location_ids)
+    
+    def __len__(self) -> int:
+        return len(self._conditions)
+
+
+class _CongestionView(_WeatherView):
+    """Vue en lecture {location_id: congestion} des conditions (compatibilité)"""
+    
+    def __getitem__(self, location_id: str) -> float:
+        congestion = self._conditions.get_congestion(location_id)
+        if congestion is None:
+            raise KeyError(location_id)
+        return congestion
+
 class TravelSystem:
     """
     Système de gestion des déplacements dans le monde
     Gère les itinéraires, les méthodes de transport, et les effets météorologiques
     """
     
-    def __init__(self, world_map: WorldMap):
-        """Initialise le système de déplacement"""
+    def __init__(self, world_map: WorldMap, seed: Optional[int] = None):
+        """
+        Initialise le système de déplacement
+        
+        Args:
+            world_map: Carte du monde
+            seed: Graine de l'évolution de la météo et de la congestion (None = non reproductible)
+        """
         self.world_map = world_map
         self.routes: Dict[str, Dict[str, List[TravelRoute]]] = {}
-        self.current_weather: Dict[str, WeatherCondition] = {}
-        self.congestion_levels: Dict[str, float] = {}  # 0.0 à 1.0 (0 = fluide, 1 = bloqué)
+        self.seed = seed
+        self.conditions: Optional[TravelConditions] = None  # météo et congestion par lieu
         self.player_favorite_routes: Set[Tuple[str, str]] = set()
         self.travel_history: List[Dict[str, Any]] = []
         
+        self._route_cache: "OrderedDict[Tuple, Optional[PlannedRoute]]" = OrderedDict()
+        self._route_cache_epoch = 0
+        self._heuristic_factor: Optional[float] = None
+        
+        # Route par défaut dérivée de chaque connexion de la carte, et révision des
+        # connexions de la carte reflétée dans la table des routes (voir sync_routes)
+        self._connection_routes: Dict[Tuple[str, str], TravelRoute] = {}
+        self._routes_revision = 0
+        
+        # Temps de jeu écoulé (heures) pas encore converti en évolution des conditions
+        self._pending_condition_hours = 0.0
+        
         # Initialiser les routes à partir des connexions existantes
         self._initialize_routes()
         self._initialize_weather()
@@ -80,45 +334,177 @@ class TravelSystem:
     
     def _initialize_routes(self):
         """Initialise les routes à partir des connexions existantes dans la carte"""
+        self._routes_revision = self.world_map.revision
         for location_id, location in self.world_map.locations.items():
             if location_id not in self.routes:
                 self.routes[location_id] = {}
             
-            for connected_id in location.connections:
-                if connected_id not in self.routes[location_id]:
-                    self.routes[location_id][connected_id] = []
-                
-                # Récupérer les informations de connexion
-                connection_info = location.get_connection_info(connected_id)
-                if not connection_info:
-                    continue
-                
-                # Créer une route par défaut basée sur les informations de connexion
-                travel_method = self._determine_travel_method(location, self.world_map.get_location(connected_id))
-                
-                route = TravelRoute(
-                    source_id=location_id,
-                    destination_id=connected_id,
-                    method=travel_method,
-                    travel_time=connection_info.get("travel_time", 1.0),
-                    travel_cost=connection_info.get("travel_cost", 0),
-                    distance=self._calculate_distance(location, self.world_map.get_location(connected_id)),
-                    security_risk=self._calculate_security_risk(location, self.world_map.get_location(connected_id)),
-                    requires_hacking=connection_info.get("requires_hacking", False),
-                    requires_special_access=connection_info.get("requires_special_access", False)
-                )
-                
-                self.routes[location_id][connected_id].append(route)
+            # Connexions sortantes et leurs informations, lues en un passage dans le stockage de la carte
+            for connected_id, connection_info in location.connection_info.items():
+                route = self._create_connection_route(location, connected_id, connection_info)
+                if route:
+                    self.routes[location_id].setdefault(connected_id, []).append(route)
+                    self._connection_routes[(location_id, connected_id)] = route
         
         logger.info(f"Routes initialisées: {sum(len(dest) for src in self.routes.values() for dest in src.values())} routes au total")
     
+    def _create_connection_route(self, location: Location, connected_id: str,
+                                 connection_info: Dict[str, Any]) -> Optional[TravelRoute]:
+        """Crée la route par défaut basée sur les informations d'une connexion de la carte"""
+        destination = self.world_map.get_location(connected_id)
+        if not destination:
+            return None
+        
+        return TravelRoute(
+            source_id=location.id,
+            destination_id=connected_id,
+            method=self._determine_travel_method(location, destination),
+            travel_time=connection_info.get("travel_time", 1.0),
+            travel_cost=connection_info.get("travel_cost", 0),
+            distance=self._calculate_distance(location, destination),
+            security_risk=self._calculate_security_risk(location, destination),
+            requires_hacking=connection_info.get("requires_hacking", False),
+            requires_special_access=connection_info.get("requires_special_access", False)
+        )
+    
+    def add_route(self, route: TravelRoute) -> None:
+        """
+        Ajoute une route à la table des routes (sans modifier la carte)
+        
+        Args:
+            route: Route à ajouter
+        """
+        self.routes.setdefault(route.source_id, {}).setdefault(route.destination_id, []).append(route)
+        self._route_cache.clear()
+        self._lower_heuristic_factor(route)
+    
+    def remove_route(self, source_id: str, destination_id: str, route: Optional[TravelRoute] = None) -> bool:
+        """
+        Retire une route de la table des routes (sans modifier la carte)
+        
+        Args:
+            source_id: ID du lieu de départ
+            destination_id: ID du lieu d'arrivée
+            route: Route à retirer (None = toutes les routes entre les deux lieux)
+            
+        Returns:
+            True si au moins une route a été retirée, False sinon
+        """
+        destinations = self.routes.get(source_id, {})
+        routes = destinations.get(destination_id)
+        if not routes:
+            return False
+        
+        if route is None:
+            del destinations[destination_id]
+            self._connection_routes.pop((source_id, destination_id), None)
+        else:
+            remaining = [existing for existing in routes if existing is not route]
+            if len(remaining) == len(routes):
+                return False
+            if remaining:
+                destinations[destination_id] = remaining
+            else:
+                del destinations[destination_id]
+            if self._connection_routes.get((source_id, destination_id)) is route:
+                del self._connection_routes[(source_id, destination_id)]
+        
+        # Une route retirée ne peut que rallonger les trajets: le facteur de l'heuristique reste admissible
+        self._route_cache.clear()
+        return True
+    
+    def update_route(self, source_id: str, destination_id: str) -> None:
+        """
+        Met à jour la route par défaut d'une connexion après sa modification dans la carte
+        (création, modification ou suppression); les routes personnalisées sont conservées
+        
+        Args:
+            source_id: ID du lieu de départ
+            destination_id: ID du lieu d'arrivée
+        """
+        old_route = self._connection_routes.pop((source_id, destination_id), None)
+        routes = self.routes.get(source_id, {}).get(destination_id, [])
+        position = next((i for i, route in enumerate(routes) if route is old_route), 0)
+        if old_route is not None:
+            self.remove_route(source_id, destination_id, old_route)
+        
+        location = self.world_map.get_location(source_id)
+        connection_info = location.get_connection_info(destination_id) if location else None
+        route = self._create_connection_route(location, destination_id, connection_info) if connection_info else None
+        if route:
+            # La route par défaut garde sa place (index utilisé par travel et unlock_hidden_route)
+            routes = self.routes.setdefault(source_id, {}).setdefault(destination_id, [])
+            routes.insert(min(position, len(routes)), route)
+            self._connection_routes[(source_id, destination_id)] = route
+            self._route_cache.clear()
+            self._lower_heuristic_factor(route)
+    
+    def _remove_location_routes(self, location_id: str) -> None:
+        """Retire toutes les routes depuis et vers un lieu supprimé de la carte"""
+        self.routes.pop(location_id, None)
+        for destinations in self.routes.values():
+            destinations.pop(location_id, None)
+        self._connection_routes = {key: route for key, route in self._connection_routes.items()
+                                   if location_id not in key}
+        self._route_cache.clear()
+    
+    def sync_routes(self) -> int:
+        """
+        Reporte dans la table des routes les connexions modifiées dans la carte depuis la
+        dernière synchronisation, en O(nombre de modifications); reconstruit la table
+        seulement si le journal des modifications de la carte ne remonte pas assez loin
+        
+        Returns:
+            Nombre de connexions mises à jour
+        """
+        revision = self.world_map.revision
+        if revision == self._routes_revision:
+            return 0
+        
+        changes = self.world_map.connection_store.changes_since(self._routes_revision)
+        if changes is None:
+            # Reconstruction complète, en conservant les routes personnalisées
+            default_routes = {id(route) for route in self._connection_routes.values()}
+            custom_routes = [route for destinations in self.routes.values() for routes in destinations.values()
+                             for route in routes if id(route) not in default_routes]
+            self.routes = {}
+            self._connection_routes = {}
+            self._initialize_routes()
+            for route in custom_routes:
+                self.add_route(route)
+            self._invalidate_route_cache()
+            logger.info(f"Table des routes reconstruite (révision {revision})")
+            return len(self._connection_routes)
+        
+        for source_id, destination_id in dict.fromkeys(changes):
+            if destination_id is None:
+                self._remove_location_routes(source_id)
+            else:
+                self.update_route(source_id, destination_id)
+        self._routes_revision = revision
+        logger.debug(f"Table des routes synchronisée: {len(changes)} modification(s) (révision {revision})")
+        return len(changes)
+    
     def _initialize_weather(self):
         """Initialise les conditions météorologiques pour chaque lieu"""
-        for location_id in self.world_map.locations:
-            self.current_weather[location_id] = random.choice(list(WeatherCondition))
-            self.congestion_levels[location_id] = random.random() * 0.5  # Initialisation aléatoire entre 0 et 0.5
+        self.conditions = TravelConditions(self.world_map.locations, seed=self.seed)
         
-        logger.info("Conditions météorologiques initialisées")
+        logger.info(f"Conditions météorologiques initialisées ({'NumPy' if self.conditions.use_numpy else 'Python'})")
+    
+    @property
+    def conditions_epoch(self) -> int:
+        """Époque des conditions (météo, congestion): change à chaque mise à jour et invalide les itinéraires calculés"""
+        return self.conditions.version
+    
+    @property
+    def current_weather(self) -> Mapping:
+        """Météo par lieu ({location_id: WeatherCondition}, en lecture)"""
+        return _WeatherView(self.conditions)
+    
+    @property
+    def congestion_levels(self) -> Mapping:
+        """Congestion par lieu ({location_id: 0.0 à 1.0}, 0 = fluide, 1 = bloqué, en lecture)"""
+        return _CongestionView(self.conditions)
     
     def _determine_travel_method(self, source: Location, destination: Location) -> TravelMethod:
         """Détermine la méthode de transport la plus appropriée entre deux lieux"""
@@ -181,6 +567,7 @@ class TravelSystem:
         Returns:
             Dictionnaire des routes disponibles par destination
         """
+        self.sync_routes()
         if source_id not in self.routes:
             return {}
         
@@ -207,30 +594,28 @@ class TravelSystem:
     def calculate_actual_travel_time(self, route: TravelRoute) -> float:
         """Calcule le temps de voyage réel en tenant compte des conditions actuelles"""
         base_time = route.travel_time
+        i = self.conditions.index.get(route.source_id)
+        if i is None:
+            return base_time
         
         # Ajuster en fonction de la météo
-        if route.weather_affected and route.source_id in self.current_weather:
-            weather = self.current_weather[route.source_id]
-            if weather in [WeatherCondition.STORMY, WeatherCondition.TOXIC_RAIN, WeatherCondition.SANDSTORM, WeatherCondition.EMP_STORM]:
-                base_time *= 1.5
-            elif weather in [WeatherCondition.RAINY, WeatherCondition.FOGGY, WeatherCondition.SNOWY]:
-                base_time *= 1.2
+        if route.weather_affected:
+            base_time *= self.conditions.weather_factor[i]
         
         # Ajuster en fonction de la congestion
-        if route.congestion_affected and route.source_id in self.congestion_levels:
-            congestion = self.congestion_levels[route.source_id]
-            base_time *= (1 + congestion)
+        if route.congestion_affected:
+            base_time *= (1 + self.conditions.congestion[i])
         
-        return base_time
+        return float(base_time)
     
     def calculate_actual_travel_cost(self, route: TravelRoute) -> int:
         """Calcule le coût de voyage réel en tenant compte des conditions actuelles"""
         base_cost = route.travel_cost
         
         # Ajuster en fonction de la demande (congestion élevée = prix plus élevés)
-        if route.congestion_affected and route.source_id in self.congestion_levels:
-            congestion = self.congestion_levels[route.source_id]
-            base_cost = int(base_cost * (1 + congestion * 0.5))
+        i = self.conditions.index.get(route.source_id)
+        if route.congestion_affected and i is not None:
+            base_cost = int(base_cost * (1 + self.conditions.congestion[i] * 0.5))
         
         return base_cost
     
@@ -246,6 +631,7 @@ class TravelSystem:
         Returns:
             Informations sur le voyage effectué
         """
+        self.sync_routes()
         if source_id not in self.routes or destination_id not in self.routes[source_id]:
             return {"success": False, "message": "Route non disponible"}
         
@@ -288,33 +674,38 @@ class TravelSystem:
     
     def _update_conditions(self):
         """Met à jour les conditions météorologiques et de congestion"""
-        # Mise à jour aléatoire de la météo (10% de chance de changement)
-        for location_id in self.current_weather:
-            if random.random() < 0.1:
-                self.current_weather[location_id] = random.choice(list(WeatherCondition))
+        # Météo: 10% de chance de changement; congestion: variation entre -0.1 et +0.1
+        self.conditions.tick()
+    
+    def advance_time(self, hours: float) -> int:
+        """
+        Fait évoluer les conditions pour une durée de jeu écoulée (avance rapide du temps),
+        à raison d'une évolution par CONDITIONS_UPDATE_INTERVAL heures, en un seul saut
         
-        # Mise à jour de la congestion
-        for location_id in self.congestion_levels:
-            # Variation aléatoire entre -0.1 et +0.1
-            variation = (random.random() - 0.5) * 0.2
-            self.congestion_levels[location_id] = max(0.0, min(1.0, self.congestion_levels[location_id] + variation))
+        Args:
+            hours: Durée écoulée en heures de jeu
+            
+        Returns:
+            Nombre d'évolutions des conditions appliquées
+        """
+        self._pending_condition_hours += max(0.0, hours)
+        steps = int(self._pending_condition_hours // CONDITIONS_UPDATE_INTERVAL)
+        if steps:
+            self._pending_condition_hours -= steps * CONDITIONS_UPDATE_INTERVAL
+            self.conditions.advance(steps)
+        return steps
     
     def add_custom_route(self, source_id: str, destination_id: str, route: TravelRoute) -> bool:
         """Ajoute une route personnalisée entre deux lieux"""
         if source_id not in self.world_map.locations or destination_id not in self.world_map.locations:
             return False
         
-        if source_id not in self.routes:
-            self.routes[source_id] = {}
-        
-        if destination_id not in self.routes[source_id]:
-            self.routes[source_id][destination_id] = []
-        
-        self.routes[source_id][destination_id].append(route)
+        self.sync_routes()
+        self.add_route(route)
         
         # S'assurer que la connexion existe aussi dans la carte du monde
         source_location = self.world_map.get_location(source_id)
-        if source_location and destination_id not in source_location.connections:
+        if source_location and not source_location.has_connection(destination_id):
             source_location.add_connection(
                 destination_id,
                 travel_type=route.method.name,
@@ -323,6 +714,10 @@ class TravelSystem:
                 requires_hacking=route.requires_hacking,
                 requires_special_access=route.requires_special_access
             )
+            # La route personnalisée tient lieu de route par défaut pour cette connexion:
+            # la table était synchronisée juste avant, seule notre modification est à ignorer
+            self._connection_routes[(source_id, destination_id)] = route
+            self._routes_revision = self.world_map.revision
         
         logger.info(f"Route personnalisée ajoutée de {source_id} à {destination_id}")
         return True
@@ -337,11 +732,169 @@ class TravelSystem:
         route = self.routes[source_id][destination_id][route_index]
         if route.is_hidden:
             route.is_hidden = False
+            self._invalidate_route_cache()
             logger.info(f"Route cachée déverrouillée de {source_id} à {destination_id}")
             return True
         
         return False
     
+    def _invalidate_route_cache(self) -> None:
+        """Oublie les itinéraires calculés après une modification du graphe des routes"""
+        self._route_cache.clear()
+        self._heuristic_factor = None
+    
+    def _lower_heuristic_factor(self, route: TravelRoute) -> None:
+        """Réduit le facteur de l'heuristique si une nouvelle route est plus courte que la ligne droite"""
+        if self._heuristic_factor is None:
+            return
+        source = self.world_map.get_location(route.source_id)
+        destination = self.world_map.get_location(route.destination_id)
+        if not source or not destination:
+            return
+        straight = self._calculate_distance(source, destination)
+        if straight > 0 and route.distance < straight * self._heuristic_factor:
+            self._heuristic_factor = max(0.0, route.distance / straight)
+    
+    def _get_heuristic_factor(self) -> float:
+        """
+        Facteur appliqué à la distance à vol d'oiseau dans l'heuristique A*.
+        Vaut 1 sauf si une route (personnalisée) annonce une distance plus courte que
+        la ligne droite: l'heuristique est alors réduite d'autant pour rester admissible.
+        """
+        if self._heuristic_factor is None:
+            factor = 1.0
+            for destinations in self.routes.values():
+                for routes in destinations.values():
+                    for route in routes:
+                        source = self.world_map.get_location(route.source_id)
+                        destination = self.world_map.get_location(route.destination_id)
+                        if not source or not destination:
+                            continue
+                        straight = self._calculate_distance(source, destination)
+                        if straight > 0 and route.distance < straight * factor:
+                            factor = max(0.0, route.distance / straight)
+            self._heuristic_factor = factor
+        return self._heuristic_factor
+    
+    def _route_weight(self, route: TravelRoute, weights: Dict[str, float]) -> float:
+        """Coût pondéré d'une étape dans les conditions actuelles"""
+        return (weights.get("time", 0.0) * self.calculate_actual_travel_time(route)
+                + weights.get("distance", 0.0) * route.distance
+                + weights.get("cost", 0.0) * self.calculate_actual_travel_cost(route))
+    
+    def plan_route(self, source_id: str, destination_id: str, player_hacking_level: int = 0,
+                   weights: Optional[Dict[str, float]] = None) -> Optional[PlannedRoute]:
+        """
+        Calcule le meilleur itinéraire, éventuellement en plusieurs étapes, entre deux lieux.
+        Recherche A* sur le graphe des routes, avec la distance euclidienne comme heuristique;
+        les résultats sont mémorisés jusqu'au prochain changement des conditions.
+        
+        Args:
+            source_id: ID du lieu de départ
+            destination_id: ID du lieu d'arrivée
+            player_hacking_level: Niveau de hacking du joueur (pour les routes nécessitant du hacking)
+            weights: Poids des critères "time", "distance" et "cost" (DEFAULT_ROUTE_WEIGHTS par défaut)
+            
+        Returns:
+            Itinéraire trouvé, ou None si la destination est inaccessible
+        """
+        weights = DEFAULT_ROUTE_WEIGHTS if weights is None else weights
+        self.sync_routes()
+        
+        # Les itinéraires d'une époque de conditions précédente sont périmés
+        if self._route_cache_epoch != self.conditions_epoch:
+            self._route_cache.clear()
+            self._route_cache_epoch = self.conditions_epoch
+        
+        can_hack = player_hacking_level >= 1
+        key = (source_id, destination_id, can_hack, tuple(sorted(weights.items())))
+        if key in self._route_cache:
+            self._route_cache.move_to_end(key)
+            return self._route_cache[key]
+        
+        planned = self._search_route(source_id, destination_id, can_hack, weights)
+        
+        self._route_cache[key] = planned
+        while len(self._route_cache) > ROUTE_CACHE_SIZE:
+            self._route_cache.popitem(last=False)
+        return planned
+    
+    def _search_route(self, source_id: str, destination_id: str, can_hack: bool,
+                      weights: Dict[str, float]) -> Optional[PlannedRoute]:
+        """Recherche A* d'un itinéraire (sans cache, voir plan_route)"""
+        goal = self.world_map.get_location(destination_id)
+        if source_id not in self.world_map.locations or not goal:
+            return None
+        
+        # Heuristique: distance restante à vol d'oiseau, jamais supérieure au coût réel
+        heuristic_scale = weights.get("distance", 0.0) * self._get_heuristic_factor()
+        
+        def heuristic(location_id: str) -> float:
+            if heuristic_scale <= 0:
+                return 0.0
+            location = self.world_map.get_location(location_id)
+            return heuristic_scale * self._calculate_distance(location, goal) if location else 0.0
+        
+        best_weight = {source_id: 0.0}
+        came_from: Dict[str, TravelRoute] = {}
+        counter = 0
+        open_heap = [(heuristic(source_id), counter, source_id)]
+        closed: Set[str] = set()
+        
+        while open_heap:
+            _, _, current_id = heapq.heappop(open_heap)
+            if current_id in closed:
+                continue
+            if current_id == destination_id:
+                break
+            closed.add(current_id)
+            
+            for next_id, routes in self.routes.get(current_id, {}).items():
+                if next_id in closed:
+                    continue
+                
+                # Meilleure route praticable vers ce voisin
+                best_route = None
+                best_route_weight = 0.0
+                for route in routes:
+                    if route.is_hidden or (route.requires_hacking and not can_hack):
+                        continue
+                    route_weight = self._route_weight(route, weights)
+                    if best_route is None or route_weight < best_route_weight:
+                        best_route, best_route_weight = route, route_weight
+                if best_route is None:
+                    continue
+                
+                candidate = best_weight[current_id] + best_route_weight
+                if candidate < best_weight.get(next_id, float("inf")):
+                    best_weight[next_id] = candidate
+                    came_from[next_id] = best_route
+                    counter += 1
+                    heapq.heappush(open_heap, (candidate + heuristic(next_id), counter, next_id))
+        
+        if destination_id not in best_weight:
+            return None
+        
+        # Reconstruction des étapes depuis l'arrivée
+        legs: List[TravelRoute] = []
+        location_id = destination_id
+        while location_id != source_id:
+            leg = came_from[location_id]
+            legs.append(leg)
+            location_id = leg.source_id
+        legs.reverse()
+        
+        return PlannedRoute(
+            source_id=source_id,
+            destination_id=destination_id,
+            legs=legs,
+            total_time=sum(self.calculate_actual_travel_time(leg) for leg in legs),
+            total_cost=sum(self.calculate_actual_travel_cost(leg) for leg in legs),
+            total_distance=sum(leg.distance for leg in legs),
+            max_security_risk=max((leg.security_risk for leg in legs), default=0),
+            weight=best_weight[destination_id]
+        )
+    
     def add_to_favorites(self, source_id: str, destination_id: str) -> bool:
         """Ajoute une route aux favoris du joueur"""
         if source_id not in self.world_map.locations or destination_id not in self.world_map.locations:
@@ -385,6 +938,10 @@ class BuildingType(Enum):
 class Building:
     """Représente un bâtiment dans une ville"""
     
+    __slots__ = ("id", "name", "description", "building_type", "security_level", "floors", "owner",
+                 "services", "tags", "parent_location_id", "is_accessible", "requires_hacking",
+                 "requires_special_access", "rooms")
+    
     def __init__(self, 
                  id: str,
                  name: str,
@@ -471,12 +1028,29 @@ class CityManager:
     Permet de gérer les structures urbaines et les points d'intérêt
     """
     
-    def __init__(self, world_map: WorldMap):
-        """Initialise le gestionnaire de villes"""
+    def __init__(self, world_map: WorldMap, world_id: Optional[str] = None,
+                 interior_cache_size: int = INTERIOR_CACHE_SIZE):
+        """
+        Initialise le gestionnaire de villes
+        
+        Args:
+            world_map: Carte du monde
+            world_id: ID du monde, qui détermine la génération des bâtiments (nom de la carte si None)
+            interior_cache_size: Nombre de lieux dont les bâtiments générés restent en mémoire
+        """
         self.world_map = world_map
-        self.buildings: Dict[str, Building] = {}
+        self.world_id = world_id or world_map.name
+        self.buildings: Dict[str, Building] = {}  # Bâtiments ajoutés explicitement
         self.city_districts: Dict[str, List[str]] = {}  # Mapping ville -> districts
         
+        # Bâtiments générés à la première visite d'un lieu (cache LRU, régénérables à l'identique)
+        self.interior_cache_size = max(1, interior_cache_size)
+        self._interiors: "OrderedDict[str, List[Building]]" = OrderedDict()
+        self._building_locations: Dict[str, str] = {}  # ID de bâtiment généré -> ID du lieu
+        
+        # Modifications faites par le joueur aux pièces générées: {bâtiment: {pièce: {champ: valeur}}}
+        self.modified_rooms: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        
         # Initialiser les districts à partir des lieux existants
         self._initialize_districts()
         
@@ -505,17 +1079,139 @@ class CityManager:
         return True
     
     def get_building(self, building_id: str) -> Optional[Building]:
-        """Récupère un bâtiment par son ID"""
-        return self.buildings.get(building_id)
+        """Récupère un bâtiment par son ID (le lieu est régénéré si besoin)"""
+        building = self.buildings.get(building_id)
+        if building is not None:
+            return building
+        
+        location_id = self._building_locations.get(building_id)
+        if location_id is None:
+            return None
+        for building in self._get_interiors(location_id):
+            if building.id == building_id:
+                return building
+        return None
     
     def get_buildings_in_location(self, location_id: str) -> List[Building]:
-        """Récupère tous les bâtiments dans un lieu spécifique"""
-        return [building for building in self.buildings.values() if building.parent_location_id == location_id]
+        """Récupère tous les bâtiments dans un lieu spécifique (générés à la première visite)"""
+        explicit = [building for building in self.buildings.values() if building.parent_location_id == location_id]
+        return explicit + self._get_interiors(location_id)
     
     def get_buildings_by_type(self, location_id: str, building_type: BuildingType) -> List[Building]:
         """Récupère tous les bâtiments d'un type spécifique dans un lieu"""
-        return [building for building in self.buildings.values() 
-                if building.parent_location_id == location_id and building.building_type == building_type]
+        return [building for building in self.get_buildings_in_location(location_id)
+                if building.building_type == building_type]
+    
+    def _get_interiors(self, location_id: str) -> List[Building]:
+        """Bâtiments générés d'un lieu, depuis le cache ou générés à partir de la graine du lieu"""
+        buildings = self._interiors.get(location_id)
+        if buildings is not None:
+            self._interiors.move_to_end(location_id)
+            return buildings
+        
+        if location_id not in self.world_map.locations:
+            return []
+        
+        # Import local: building_generator dépend de ce module
+        from yaktaa.world.building_generator import BuildingGenerator, location_seed
+        
+        try:
+            generator = BuildingGenerator(self, seed=location_seed(self.world_id, location_id))
+            buildings = generator.generate_location_buildings(location_id)
+        except Exception as e:
+            logger.error(f"Erreur lors de la génération des bâtiments du lieu {location_id}: {str(e)}")
+            return []
+        
+        # Réappliquer les modifications du joueur
+        for building in buildings:
+            self._building_locations[building.id] = location_id
+            for room_id, changes in self.modified_rooms.get(building.id, {}).items():
+                room = building.rooms.get(room_id)
+                if room is not None:
+                    room.update(changes)
+        
+        self._interiors[location_id] = buildings
+        while len(self._interiors) > self.interior_cache_size:
+            evicted_id, _ = self._interiors.popitem(last=False)
+            logger.debug(f"Bâtiments du lieu {evicted_id} retirés du cache")
+        
+        logger.debug(f"Bâtiments du lieu {location_id} générés: {len(buildings)}")
+        return buildings
+    
+    def update_room(self, building_id: str, room_id: str, **changes: Any) -> bool:
+        """
+        Modifie une pièce d'un bâtiment (objets déplacés, porte forcée...)
+        Les modifications des bâtiments générés sont conservées et réappliquées à leur régénération.
+        
+        Args:
+            building_id: ID du bâtiment
+            room_id: ID de la pièce
+            **changes: Champs modifiés de la pièce (is_accessible, items...)
+            
+        Returns:
+            True si la pièce a été modifiée, False si elle est introuvable
+        """
+        building = self.get_building(building_id)
+        room = building.get_room(room_id) if building else None
+        if room is None:
+            logger.warning(f"Impossible de modifier la pièce {room_id}: introuvable dans le bâtiment {building_id}")
+            return False
+        
+        room.update(changes)
+        if building_id not in self.buildings:
+            self.modified_rooms.setdefault(building_id, {}).setdefault(room_id, {}).update(changes)
+        return True
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convertit l'état du gestionnaire en dictionnaire pour la sauvegarde.
+        Seuls les bâtiments ajoutés explicitement et les modifications des pièces
+        générées sont enregistrés: le reste est régénéré à partir de la graine du monde.
+        """
+        return {
+            "world_id": self.world_id,
+            "buildings": [building.to_dict() for building in self.buildings.values()],
+            "modified_rooms": self.modified_rooms,
+            "modified_building_locations": {building_id: self._building_locations[building_id]
+                                            for building_id in self.modified_rooms
+                                            if building_id in self._building_locations}
+        }
+    
+    def load_state(self, data: Dict[str, Any]) -> None:
+        """
+        Restaure l'état du gestionnaire depuis une sauvegarde (voir to_dict)
+        
+        Args:
+            data: Données de sauvegarde
+        """
+        self.world_id = data.get("world_id", self.world_id)
+        self.modified_rooms = {building_id: {room_id: dict(changes) for room_id, changes in rooms.items()}
+                               for building_id, rooms in data.get("modified_rooms", {}).items()}
+        self._interiors.clear()
+        self._building_locations = dict(data.get("modified_building_locations", {}))
+        
+        self.buildings = {}
+        for building_data in data.get("buildings", []):
+            try:
+                building = Building(
+                    id=building_data["id"],
+                    name=building_data["name"],
+                    description=building_data.get("description", ""),
+                    building_type=BuildingType[building_data["building_type"]],
+                    security_level=building_data.get("security_level", 1),
+                    floors=building_data.get("floors", 1),
+                    owner=building_data.get("owner", ""),
+                    services=building_data.get("services"),
+                    tags=building_data.get("tags"),
+                    parent_location_id=building_data.get("parent_location_id"),
+                    is_accessible=building_data.get("is_accessible", True),
+                    requires_hacking=building_data.get("requires_hacking", False),
+                    requires_special_access=building_data.get("requires_special_access", False)
+                )
+                building.rooms = building_data.get("rooms", {})
+                self.buildings[building.id] = building
+            except (KeyError, ValueError) as e:
+                logger.error(f"Bâtiment invalide dans la sauvegarde: {str(e)}")
     
     def get_districts(self, city_id: str) -> List[str]:
         """Récupère tous les districts d'une ville"""
@@ -0,0 +1,328 @@
+"""
+Module de l'oracle des temps de trajet de YakTaa
+Ce module calcule, pour un monde, la durée (ETA) et la distance du plus court
+trajet entre toutes les paires de lieux, pour répondre en temps constant aux
+questions "à quelle distance est X de Y" (génération de missions, PNJ, carte).
+Les tables sont calculées à la première requête; au-delà de ORACLE_MAX_LOCATIONS
+lieux, les trajets sont calculés à la demande depuis chaque lieu de départ.
+"""
+
+import heapq
+import logging
+from array import array
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger("YakTaa.World.TravelOracle")
+
+INFINITY = float("inf")
+
+# Nombre maximal de lieux pour les tables complètes: deux tables de n x n flottants
+# (4 Mo pour 500 lieux) et un Dijkstra par lieu et par mesure à leur construction
+ORACLE_MAX_LOCATIONS = 500
+
+# Nombre de lieux de départ dont les trajets sont conservés quand les tables
+# complètes ne sont pas calculées
+ROW_CACHE_SIZE = 64
+
+# Tolérance pour reconnaître une connexion utilisée par un plus court chemin
+_EPSILON = 1e-9
+
+
+def straight_line_distance(coordinates1: Tuple[float, float], coordinates2: Tuple[float, float]) -> float:
+    """Distance approximative en kilomètres entre deux coordonnées (même formule que TravelSystem)"""
+    x1, y1 = coordinates1
+    x2, y2 = coordinates2
+    return ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5 * 111
+
+
+class TravelTimeOracle:
+    """
+    Table des plus courts trajets entre toutes les paires de lieux d'une carte.
+    Les durées (heures, temps de trajet de base des connexions) et les distances (km)
+    sont rangées dans deux tableaux compacts n x n indexés par le rang des lieux,
+    calculés à la première requête puis tenus à jour de façon incrémentale à partir
+    du journal des modifications de connexions de la carte.
+    Au-delà de max_locations lieux, les tableaux ne sont pas calculés: les trajets
+    depuis un lieu sont calculés à sa première requête et conservés dans un cache LRU.
+    """
+
+    def __init__(self, world_map, max_locations: int = ORACLE_MAX_LOCATIONS):
+        """
+        Initialise l'oracle (les tables sont calculées à la première requête)
+
+        Args:
+            world_map: Carte du monde (WorldMap)
+            max_locations: Nombre maximal de lieux pour calculer les tables complètes
+        """
+        self.world_map = world_map
+        self.max_locations = max_locations
+        self.location_ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.eta: Optional[array] = None
+        self.distance: Optional[array] = None
+        self._edges: Dict[Tuple[int, int], Tuple[float, float]] = {}
+        self._adjacency: List[Dict[int, Tuple[float, float]]] = []
+        # Trajets par lieu de départ quand les tables complètes ne sont pas calculées:
+        # {rang: (durées, distances)}
+        self._rows: "OrderedDict[int, Tuple[array, array]]" = OrderedDict()
+        # Révision des connexions prise en compte (None: rien n'est encore calculé)
+        self._revision: Optional[int] = None
+
+    @property
+    def all_pairs(self) -> bool:
+        """Indique si les tables complètes sont calculées"""
+        return self.eta is not None
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    def rebuild(self) -> None:
+        """Recalcule entièrement les tables (Dijkstra depuis chaque lieu)"""
+        self._revision = self.world_map.connection_store.revision
+        self.location_ids = list(self.world_map.locations)
+        self.index = {location_id: i for i, location_id in enumerate(self.location_ids)}
+        size = len(self.location_ids)
+
+        # Poids des connexions connues: {(source, destination): (durée, distance)}
+        self._edges = {}
+        self._adjacency = [{} for _ in range(size)]
+        for location_id in self.location_ids:
+            self._read_edges(location_id)
+        self._rows.clear()
+
+        if size > self.max_locations:
+            self.eta = self.distance = None
+            logger.info(f"Oracle des temps de trajet: {size} lieux (plus de {self.max_locations}), "
+                        f"trajets calculés à la demande par lieu de départ")
+            return
+
+        self.eta = array("d", [INFINITY]) * (size * size)
+        self.distance = array("d", [INFINITY]) * (size * size)
+        for source in range(size):
+            self._dijkstra(source, self.eta, 0)
+            self._dijkstra(source, self.distance, 1)
+
+        logger.info(f"Oracle des temps de trajet calculé pour {size} lieux et {len(self._edges)} connexions")
+
+    def refresh(self) -> None:
+        """
+        Met les tables à jour avec les modifications de connexions faites depuis le dernier
+        calcul (journal de la carte), ou les recalcule si le journal ne remonte pas assez loin
+        """
+        store = self.world_map.connection_store
+        if self._revision == store.revision:
+            return
+        changes = store.changes_since(self._revision) if self._revision is not None else None
+        if changes is None or any(to_id is None for _, to_id in changes):
+            # Premier calcul, journal dépassé ou lieu supprimé
+            self.rebuild()
+            return
+        for from_id, to_id in dict.fromkeys(changes):
+            self.update_connection(from_id, to_id)
+        self._revision = store.revision
+
+    def _edge_weights(self, from_id: str, to_id: str, travel_time: float) -> Optional[Tuple[float, float]]:
+        """Durée et distance d'une connexion, ou None si l'un des lieux n'existe pas"""
+        location = self.world_map.locations.get(from_id)
+        destination = self.world_map.locations.get(to_id)
+        if location is None or destination is None:
+            return None
+        return max(0.0, travel_time), straight_line_distance(location.coordinates, destination.coordinates)
+
+    def _read_edges(self, location_id: str) -> None:
+        """Lit les connexions sortantes d'un lieu dans le stockage CSR de la carte"""
+        store = self.world_map.connection_store
+        source = self.index[location_id]
+        ordinal = store.ordinal(location_id)
+        if ordinal is None:
+            return
+        for neighbour, travel_time, _, _ in store.neighbours(ordinal):
+            destination_id = store.location_ids[neighbour]
+            destination = self.index.get(destination_id)
+            weights = self._edge_weights(location_id, destination_id, travel_time)
+            if weights is None or destination is None or destination == source:
+                continue
+            self._edges[(source, destination)] = weights
+            self._adjacency[source][destination] = weights
+
+    def _dijkstra(self, source: int, table: array, metric: int, row: Optional[int] = None) -> None:
+        """
+        Plus courts trajets depuis un lieu, écrits dans une ligne de la table
+
+        Args:
+            source: Rang du lieu de départ
+            table: Table à remplir
+            metric: 0 pour les durées, 1 pour les distances
+            row: Position de la ligne dans la table (par défaut celle du lieu de départ)
+        """
+        size = len(self.location_ids)
+        if row is None:
+            row = source * size
+        for j in range(size):
+            table[row + j] = INFINITY
+        table[row + source] = 0.0
+
+        heap = [(0.0, source)]
+        while heap:
+            cost, current = heapq.heappop(heap)
+            if cost > table[row + current]:
+                continue
+            for neighbour, weights in self._adjacency[current].items():
+                candidate = cost + weights[metric]
+                if candidate < table[row + neighbour]:
+                    table[row + neighbour] = candidate
+                    heapq.heappush(heap, (candidate, neighbour))
+
+    def _source_rows(self, source: int) -> Tuple[array, array]:
+        """Durées et distances depuis un lieu, sans les tables complètes (cache LRU)"""
+        rows = self._rows.get(source)
+        if rows is not None:
+            self._rows.move_to_end(source)
+            return rows
+        size = len(self.location_ids)
+        rows = (array("d", [INFINITY]) * size, array("d", [INFINITY]) * size)
+        self._dijkstra(source, rows[0], 0, 0)
+        self._dijkstra(source, rows[1], 1, 0)
+        self._rows[source] = rows
+        if len(self._rows) > ROW_CACHE_SIZE:
+            self._rows.popitem(last=False)
+        return rows
+
+    # ------------------------------------------------------------------
+    # Mise à jour incrémentale
+    # ------------------------------------------------------------------
+
+    def update_connection(self, from_id: str, to_id: str) -> None:
+        """
+        Met à jour les tables après l'ajout, la modification ou la suppression
+        d'une connexion (lue dans la carte). Appelée par refresh() pour chaque
+        connexion du journal des modifications.
+
+        Args:
+            from_id: ID du lieu de départ
+            to_id: ID du lieu d'arrivée
+        """
+        if from_id not in self.index or to_id not in self.index:
+            if from_id in self.world_map.locations and to_id in self.world_map.locations:
+                # Nouveau lieu: la taille des tables change
+                self.rebuild()
+            return
+
+        source, destination = self.index[from_id], self.index[to_id]
+        old = self._edges.get((source, destination))
+        info = self.world_map.connection_store.get_edge(from_id, to_id)
+        new = self._edge_weights(from_id, to_id, info["travel_time"]) if info else None
+        if new is not None and source == destination:
+            new = None
+        if old == new:
+            return
+
+        if self.eta is None:
+            # Sans tables complètes: oublier les trajets déjà calculés
+            self._set_edge(source, destination, new)
+            self._rows.clear()
+            return
+
+        # Relever les lignes dont un plus court chemin empruntait l'ancienne connexion
+        # (avant de modifier les tables)
+        stale = set()
+        if old is not None:
+            for table, metric in ((self.eta, 0), (self.distance, 1)):
+                stale.update(self._rows_using_edge(table, source, destination, old[metric]))
+
+        self._set_edge(source, destination, new)
+
+        for table, metric in ((self.eta, 0), (self.distance, 1)):
+            if old is not None and (new is None or new[metric] > old[metric]):
+                # Connexion supprimée ou rallongée: seuls les lieux qui l'utilisaient changent
+                for row in stale:
+                    self._dijkstra(row, table, metric)
+            elif new is not None:
+                # Connexion ajoutée ou raccourcie: relâchement de toutes les paires en O(n²)
+                self._relax_edge(table, source, destination, new[metric])
+
+    def _set_edge(self, source: int, destination: int, weights: Optional[Tuple[float, float]]) -> None:
+        """Enregistre (ou retire si None) les poids d'une connexion"""
+        if weights is None:
+            self._edges.pop((source, destination), None)
+            self._adjacency[source].pop(destination, None)
+        else:
+            self._edges[(source, destination)] = weights
+            self._adjacency[source][destination] = weights
+
+    def _rows_using_edge(self, table: array, source: int, destination: int, weight: float) -> Iterable[int]:
+        """Lieux de départ dont un plus court chemin passe par la connexion source -> destination"""
+        size = len(self.location_ids)
+        for i in range(size):
+            via = table[i * size + source] + weight
+            if via < INFINITY and abs(via - table[i * size + destination]) <= _EPSILON * max(1.0, via):
+                yield i
+
+    def _relax_edge(self, table: array, source: int, destination: int, weight: float) -> None:
+        """Raccourcit les trajets qui gagnent à emprunter la connexion source -> destination"""
+        size = len(self.location_ids)
+        from_destination = table[destination * size:(destination + 1) * size]
+        for i in range(size):
+            to_source = table[i * size + source]
+            if to_source == INFINITY:
+                continue
+            base = to_source + weight
+            row = i * size
+            for j in range(size):
+                candidate = base + from_destination[j]
+                if candidate < table[row + j]:
+                    table[row + j] = candidate
+
+    # ------------------------------------------------------------------
+    # Requêtes (temps constant avec les tables complètes)
+    # ------------------------------------------------------------------
+
+    def _row(self, from_id: str, metric: int):
+        """Durées (metric 0) ou distances (metric 1) depuis un lieu, None s'il est inconnu"""
+        self.refresh()
+        source = self.index.get(from_id)
+        if source is None:
+            return None
+        if self.eta is None:
+            return self._source_rows(source)[metric]
+        size = len(self.location_ids)
+        table = self.eta if metric == 0 else self.distance
+        return memoryview(table)[source * size:(source + 1) * size]
+
+    def _lookup(self, metric: int, from_id: str, to_id: str) -> float:
+        row = self._row(from_id, metric)
+        destination = self.index.get(to_id)
+        if row is None or destination is None:
+            return INFINITY
+        return row[destination]
+
+    def get_eta(self, from_id: str, to_id: str) -> float:
+        """Durée du trajet le plus rapide en heures (inf si inaccessible)"""
+        return self._lookup(0, from_id, to_id)
+
+    def get_distance(self, from_id: str, to_id: str) -> float:
+        """Distance du trajet le plus court en km (inf si inaccessible)"""
+        return self._lookup(1, from_id, to_id)
+
+    def is_reachable(self, from_id: str, to_id: str) -> bool:
+        """Indique si un lieu est accessible depuis un autre"""
+        return self.get_eta(from_id, to_id) < INFINITY
+
+    def reachable_from(self, from_id: str, max_eta: Optional[float] = None) -> List[str]:
+        """
+        Lieux accessibles depuis un lieu
+
+        Args:
+            from_id: ID du lieu de départ
+            max_eta: Durée maximale du trajet en heures (None: sans limite)
+
+        Returns:
+            Liste des IDs des lieux accessibles (le lieu de départ compris)
+        """
+        row = self._row(from_id, 0)
+        if row is None:
+            return []
+        limit = INFINITY if max_eta is None else max_eta
+        return [self.location_ids[j] for j, eta in enumerate(row) if eta < INFINITY and eta <= limit]
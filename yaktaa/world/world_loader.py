@@ -7,23 +7,63 @@ import logging
 import os
 import sqlite3
 import sys
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 
 from yaktaa.world.locations import Location, WorldMap
+from yaktaa.world.db_pool import ConnectionPool, DEFAULT_POOL_SIZE, get_pool
+from yaktaa.world.db_schema import SchemaSnapshot, get_schema
+from yaktaa.world.world_snapshot import WorldSnapshotCache
 from yaktaa.characters.character import Character, Attribute, Skill
 from yaktaa.world.test_world import TestWorldGenerator
 
 logger = logging.getLogger("YakTaa.World.WorldLoader")
 
+# Nombre de contenus de fichiers conservés par défaut dans le cache LRU
+DEFAULT_FILE_CACHE_SIZE = 64
+
+# Profondeur maximale parcourue dans la hiérarchie des lieux (protège des cycles de parent_location_id)
+MAX_LOCATION_DEPTH = 32
+
+# Table de fermeture de la hiérarchie d'un monde: lieu (ou bâtiment) -> (ID du quartier, ID de la ville)
+LocationHierarchy = Dict[str, Tuple[Optional[str], Optional[str]]]
+
 class WorldLoader:
     """
     Classe pour charger des mondes depuis la base de données de l'éditeur YakTaa
     """
     
-    def __init__(self):
-        """Initialise le chargeur de monde"""
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, snapshot_dir: Optional[Path] = None,
+                 file_cache_size: int = DEFAULT_FILE_CACHE_SIZE, read_only: bool = False,
+                 db_pragmas: Optional[Dict[str, Any]] = None, overlay_path: Optional[Path] = None):
+        """
+        Initialise le chargeur de monde
+        
+        Args:
+            pool_size: Nombre maximal de connexions inactives conservées par thread
+            snapshot_dir: Dossier des instantanés binaires des mondes (None pour les désactiver)
+            file_cache_size: Nombre de contenus de fichiers conservés en mémoire
+            read_only: Ouvre la base des mondes en lecture seule
+            db_pragmas: PRAGMA des connexions à la base des mondes (None: valeurs par défaut du pool)
+            overlay_path: Base de surcouche, en écriture, pour l'état modifié en jeu
+                (None: écritures dans la base des mondes, impossibles en lecture seule)
+        """
         self.db_path = self._get_editor_db_path()
+        self.pool_size = pool_size
+        self.read_only = read_only
+        self.db_pragmas = db_pragmas
+        self.overlay_path = Path(overlay_path) if overlay_path else None
+        self._pool: Optional[ConnectionPool] = None
+        self._overlay_pool: Optional[ConnectionPool] = None
+        self.snapshots: Optional[WorldSnapshotCache] = WorldSnapshotCache(snapshot_dir) if snapshot_dir else None
+        
+        # Contenus de fichiers récemment lus (LRU borné)
+        self.file_cache_size = file_cache_size
+        self._file_content_cache: "OrderedDict[str, str]" = OrderedDict()
+        
+        # Hiérarchies des lieux par monde (voir get_location_hierarchy)
+        self._location_hierarchies: Dict[str, LocationHierarchy] = {}
         logger.info(f"Chargeur de monde initialisé avec la base de données: {self.db_path}")
     
     def _get_editor_db_path(self) -> Path:
@@ -139,8 +179,7 @@ class WorldLoader:
             return worlds
         
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            conn.row_factory = sqlite3.Row
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             cursor.execute("SELECT id, name, description FROM worlds")
@@ -163,7 +202,8 @@ class WorldLoader:
     
     def load_world(self, world_id: str) -> Tuple[Optional[WorldMap], Dict[str, Character]]:
         """
-        Charge un monde depuis la base de données
+        Charge un monde, depuis son instantané binaire s'il est encore valide,
+        sinon depuis la base de données (l'instantané est alors reconstruit)
         
         Args:
             world_id: ID du monde à charger
@@ -175,9 +215,32 @@ class WorldLoader:
             logger.warning(f"Base de données non trouvée: {self.db_path}")
             return None, {}
         
+        if self.snapshots:
+            cached = self.snapshots.load(world_id, self.db_path)
+            if cached:
+                return cached
+        
+        world_map, characters = self._load_world_from_db(world_id)
+        # Monde relu depuis la base: sa hiérarchie sera recalculée à la prochaine demande
+        self._location_hierarchies.pop(world_id, None)
+        
+        if self.snapshots and world_map:
+            self.snapshots.save(world_id, self.db_path, world_map, characters)
+        
+        return world_map, characters
+    
+    def _load_world_from_db(self, world_id: str) -> Tuple[Optional[WorldMap], Dict[str, Character]]:
+        """
+        Charge un monde depuis la base de données
+        
+        Args:
+            world_id: ID du monde à charger
+            
+        Returns:
+            Tuple contenant la carte du monde et les personnages, ou (None, {}) en cas d'erreur
+        """
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            conn.row_factory = sqlite3.Row
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             # Vérifier que le monde existe
@@ -230,6 +293,7 @@ class WorldLoader:
                     requires_hacking=bool(conn_data["requires_hacking"]),
                     requires_special_access=bool(conn_data["requires_special_access"])
                 )
+            world_map.connection_store.compact()
             
             # Charger les personnages
             cursor.execute("SELECT * FROM characters WHERE world_id = ?", (world_id,))
@@ -358,10 +422,12 @@ class WorldLoader:
             cursor.execute("SELECT * FROM devices WHERE world_id = ?", (world_id,))
             device_rows = cursor.fetchall()
             
-            # Créer un dictionnaire pour stocker les appareils par emplacement
+            # Index des appareils par ID et par emplacement
+            devices_by_id = {}
             devices_by_location = {}
             
             for device_data in device_rows:
+                device_columns = set(device_data.keys())
                 location_id = device_data["location_id"]
                 if location_id not in devices_by_location:
                     devices_by_location[location_id] = []
@@ -370,43 +436,49 @@ class WorldLoader:
                 device = {
                     "id": device_data["id"],
                     "name": device_data["name"],
-                    "description": device_data["description"] if "description" in device_data else "",
-                    "device_type": device_data["device_type"] if "device_type" in device_data else "unknown",
-                    "os": device_data["os"] if "os" in device_data else "unknown",
-                    "security_level": device_data["security_level"] if "security_level" in device_data else 1,
-                    "is_connected": bool(device_data["is_connected"]) if "is_connected" in device_data else False,
-                    "owner_id": device_data["owner_id"] if "owner_id" in device_data else ""
+                    "location_id": location_id,
+                    "description": device_data["description"] if "description" in device_columns else "",
+                    "device_type": device_data["device_type"] if "device_type" in device_columns else "unknown",
+                    "os": device_data["os_type"] if "os_type" in device_columns else "unknown",
+                    "security_level": device_data["security_level"] if "security_level" in device_columns else 1,
+                    "is_connected": bool(device_data["is_connected"]) if "is_connected" in device_columns else False,
+                    "owner_id": device_data["owner_id"] if "owner_id" in device_columns else "",
+                    "files": []
                 }
                 
                 # Ajouter l'appareil à la liste pour cet emplacement
+                devices_by_id[device["id"]] = device
                 devices_by_location[location_id].append(device)
             
+            world_map.devices = devices_by_id
+            world_map.devices_by_location = devices_by_location
             logger.info(f"Chargé {len(device_rows)} appareils pour {len(devices_by_location)} emplacements")
             
-            # Charger les fichiers
+            # Charger les métadonnées des fichiers (le contenu est lu à la demande)
             try:
-                cursor.execute("SELECT * FROM files WHERE world_id = ?", (world_id,))
-                file_rows = cursor.fetchall()
+                file_columns = set(self.get_schema().columns("files"))
+                metadata_columns = [col for col in file_columns if col != "content"]
+                if metadata_columns:
+                    cursor.execute(f"SELECT {', '.join(metadata_columns)} FROM files WHERE world_id = ?", (world_id,))
+                    file_rows = cursor.fetchall()
+                else:
+                    logger.warning("Table 'files' non trouvée dans la base de données. Les fichiers ne seront pas chargés.")
+                    file_rows = []
                 
                 for file_data in file_rows:
-                    device_id = file_data["device_id"]
-                    # Parcourir tous les appareils dans notre dictionnaire devices_by_location
-                    for location_id, devices in devices_by_location.items():
-                        for device in devices:
-                            if device["id"] == device_id:
-                                if "files" not in device:
-                                    device["files"] = []
-                                
-                                device["files"].append({
-                                    "id": file_data["id"],
-                                    "name": file_data["name"],
-                                    "file_type": file_data["file_type"] if "file_type" in file_data else "txt",
-                                    "content": file_data["content"] if "content" in file_data else "",
-                                    "size": file_data["size"] if "size" in file_data else 0,
-                                    "is_encrypted": bool(file_data["is_encrypted"]) if "is_encrypted" in file_data else False,
-                                    "security_level": file_data["security_level"] if "security_level" in file_data else 1,
-                                    "owner_id": file_data["owner_id"] if "owner_id" in file_data else ""
-                                })
+                    device = devices_by_id.get(file_data["device_id"])
+                    if device is None:
+                        continue
+                    
+                    device["files"].append({
+                        "id": file_data["id"],
+                        "name": file_data["name"],
+                        "file_type": file_data["file_type"] if "file_type" in file_columns else "txt",
+                        "size": file_data["size"] if "size" in file_columns else 0,
+                        "is_encrypted": bool(file_data["is_encrypted"]) if "is_encrypted" in file_columns else False,
+                        "security_level": file_data["security_level"] if "security_level" in file_columns else 1,
+                        "owner_id": file_data["owner_id"] if "owner_id" in file_columns else ""
+                    })
             except sqlite3.OperationalError:
                 logger.warning("Table 'files' non trouvée dans la base de données. Les fichiers ne seront pas chargés.")
             
@@ -444,10 +516,11 @@ class WorldLoader:
     def get_connection(self):
         """
         Fournit une connexion à la base de données des mondes.
-        Cette méthode est utilisée par le ShopManager pour accéder aux données des boutiques.
+        Cette méthode est utilisée par le ShopManager et le CityManager pour accéder aux données.
+        La connexion est empruntée au pool partagé: close() la rend au pool.
         
         Returns:
-            Un objet de connexion sqlite3
+            Une connexion empruntée au pool (interface sqlite3)
         
         Raises:
             Exception: Si la connexion à la base de données échoue
@@ -456,6 +529,7 @@ class WorldLoader:
             if not self.db_path.exists():
                 logger.warning(f"Base de données non trouvable à {self.db_path}. Création d'une DB en mémoire avec structure minimale.")
                 conn = sqlite3.connect(":memory:")
+                conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
                 # Créer les tables minimales nécessaires pour éviter les erreurs
@@ -491,10 +565,163 @@ class WorldLoader:
                 conn.commit()
                 return conn
             
-            return sqlite3.connect(str(self.db_path))
+            if self._pool is None:
+                self._pool = get_pool(self.db_path, self.pool_size, read_only=self.read_only,
+                                      pragmas=self.db_pragmas)
+            return self._pool.acquire()
         except Exception as e:
             logger.error(f"Erreur lors de la connexion à la base de données: {e}")
             raise
+    
+    def get_overlay_connection(self):
+        """
+        Fournit une connexion en écriture pour l'état modifié en jeu (inventaires des boutiques...).
+        Avec une base de surcouche, la base des mondes n'est jamais modifiée; sans surcouche,
+        la connexion est celle de la base des mondes.
+        
+        Returns:
+            Une connexion empruntée au pool (interface sqlite3)
+        
+        Raises:
+            sqlite3.OperationalError: Si la base des mondes est en lecture seule sans surcouche
+        """
+        if self.overlay_path is None:
+            if self.read_only:
+                raise sqlite3.OperationalError(
+                    "Base des mondes ouverte en lecture seule et aucune base de surcouche configurée"
+                )
+            return self.get_connection()
+        
+        try:
+            if self._overlay_pool is None:
+                self.overlay_path.parent.mkdir(parents=True, exist_ok=True)
+                self._overlay_pool = get_pool(self.overlay_path, self.pool_size)
+            return self._overlay_pool.acquire()
+        except Exception as e:
+            logger.error(f"Erreur lors de la connexion à la base de surcouche {self.overlay_path}: {e}")
+            raise
+    
+    def get_file_content(self, file_id: str) -> Optional[str]:
+        """
+        Récupère le contenu d'un fichier, lu à la demande dans la base de données.
+        Les contenus récemment lus sont conservés dans un cache LRU borné.
+        
+        Args:
+            file_id: ID du fichier
+            
+        Returns:
+            Contenu du fichier, ou None s'il est introuvable
+        """
+        content = self._file_content_cache.get(file_id)
+        if content is not None:
+            self._file_content_cache.move_to_end(file_id)
+            return content
+        
+        conn = None
+        try:
+            conn = self.get_connection()
+            row = conn.execute("SELECT content FROM files WHERE id = ?", (file_id,)).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Erreur lors de la lecture du fichier {file_id}: {str(e)}")
+            return None
+        finally:
+            if conn:
+                conn.close()
+        
+        if row is None:
+            return None
+        
+        content = row[0] or ""
+        if self.file_cache_size > 0:
+            self._file_content_cache[file_id] = content
+            while len(self._file_content_cache) > self.file_cache_size:
+                self._file_content_cache.popitem(last=False)
+        return content
+    
+    def get_location_hierarchy(self, world_id: str) -> LocationHierarchy:
+        """
+        Fournit, pour chaque lieu et bâtiment d'un monde, son quartier et sa ville.
+        La table est calculée en une requête (CTE récursive descendant depuis les villes,
+        c'est-à-dire les lieux sans parent) puis conservée pour le monde.
+        
+        Args:
+            world_id: ID du monde
+            
+        Returns:
+            Dictionnaire {ID du lieu ou du bâtiment: (ID du quartier ou None, ID de la ville)}
+        """
+        hierarchy = self._location_hierarchies.get(world_id)
+        if hierarchy is not None:
+            return hierarchy
+        
+        hierarchy = {}
+        if not self.db_path.exists():
+            return hierarchy
+        
+        conn = None
+        try:
+            conn = self.get_connection()
+            schema = self.get_schema()
+            if not schema.has_table("locations"):
+                logger.warning("Table 'locations' non trouvée, hiérarchie des lieux vide")
+                return hierarchy
+            
+            # Le quartier d'un lieu est son ancêtre situé juste sous la ville
+            query = """
+                WITH RECURSIVE hierarchy(location_id, district_id, city_id, depth) AS (
+                    SELECT id, NULL, id, 0
+                    FROM locations
+                    WHERE world_id = ? AND parent_location_id IS NULL
+                    UNION ALL
+                    SELECT child.id, COALESCE(hierarchy.district_id, child.id), hierarchy.city_id, hierarchy.depth + 1
+                    FROM hierarchy
+                    JOIN locations AS child ON child.parent_location_id = hierarchy.location_id
+                    WHERE hierarchy.depth < ?
+                )
+                SELECT location_id, district_id, city_id FROM hierarchy
+            """
+            if schema.has_table("buildings"):
+                query += """
+                UNION ALL
+                SELECT buildings.id, hierarchy.district_id, hierarchy.city_id
+                FROM buildings
+                JOIN hierarchy ON buildings.location_id = hierarchy.location_id
+                """
+            
+            cursor = conn.cursor()
+            cursor.execute(query, (world_id, MAX_LOCATION_DEPTH))
+            for location_id, district_id, city_id in cursor.fetchall():
+                hierarchy.setdefault(location_id, (district_id, city_id))
+            
+            logger.info(f"Hiérarchie des lieux du monde {world_id} calculée: {len(hierarchy)} entrées")
+        except sqlite3.Error as e:
+            logger.error(f"Erreur lors du calcul de la hiérarchie des lieux: {str(e)}")
+            return hierarchy
+        finally:
+            if conn:
+                conn.close()
+        
+        self._location_hierarchies[world_id] = hierarchy
+        return hierarchy
+    
+    def get_schema(self) -> SchemaSnapshot:
+        """
+        Fournit l'instantané du schéma de la base de données des mondes.
+        Il est partagé par tous les chargeurs pointant vers le même fichier.
+        
+        Returns:
+            Instantané du schéma (tables et colonnes)
+        """
+        return get_schema(self.db_path, self.get_connection)
+    
+    def close(self) -> None:
+        """Ferme les connexions du pool associé à ce chargeur"""
+        if self._pool is not None:
+            self._pool.close_all()
+            self._pool = None
+        if self._overlay_pool is not None:
+            self._overlay_pool.close_all()
+            self._overlay_pool = None
 
 
 def get_available_worlds() -> List[Dict[str, Any]]:
@@ -7,6 +7,7 @@ import logging
 from typing import Dict, List, Optional, Any, Set
 
 from yaktaa.world.locations import WorldMap, Location
+from yaktaa.world.travel import TravelSystem
 from yaktaa.world.test_world import create_test_world, setup_test_missions
 from yaktaa.world.world_loader import load_world, load_default_world, get_available_worlds
 
@@ -18,17 +19,24 @@ class WorldManager:
     Gère les lieux, les connexions, et les déplacements du joueur
     """
     
-    def __init__(self, game=None):
-        """Initialise le gestionnaire de monde"""
+    def __init__(self, game=None, world_id: Optional[str] = None):
+        """
+        Initialise le gestionnaire de monde
+        
+        Args:
+            game: Référence au jeu principal
+            world_id: ID du monde à charger, ou None pour le monde par défaut
+        """
         self.game = game
         self.world_map = WorldMap()
         self.current_location_id = None
         self.visited_locations: Set[str] = set()
         self.discovered_locations: Set[str] = set()
         self.characters: Dict[str, Any] = {}  # Stockage des personnages du monde
+        self._travel_system: Optional[TravelSystem] = None  # créé à la demande
         
         # Charger un monde depuis la base de données ou un monde de test par défaut
-        self._load_world()
+        self._load_world(world_id)
     
     def _load_world(self, world_id: Optional[str] = None):
         """
@@ -41,7 +49,12 @@ class WorldManager:
             if world_id:
                 # Charger un monde spécifique depuis la base de données
                 logger.info(f"Chargement du monde depuis la base de données: {world_id}")
-                self.world_map, self.characters = load_world(world_id)
+                world_loader = getattr(self.game, 'world_loader', None)
+                if world_loader:
+                    # Chargeur partagé du jeu: profite de son pool et de ses instantanés
+                    self.world_map, self.characters = world_loader.load_world(world_id)
+                else:
+                    self.world_map, self.characters = load_world(world_id)
                 
                 if not self.world_map:
                     # Fallback sur le monde de test si le chargement échoue
@@ -51,55 +64,14 @@ class WorldManager:
             else:
                 # Charger le monde par défaut (premier monde trouvé ou monde de test)
                 logger.info("Chargement du monde par défaut")
-                self.world_map, self.characters = load_default_world()
+                world_loader = getattr(self.game, 'world_loader', None)
+                if world_loader:
+                    self.world_map, self.characters = world_loader.load_default_world()
+                else:
+                    self.world_map, self.characters = load_default_world()
             
-            # Définir le lieu de départ (Premier lieu valide dans la base de données)
-            location_found = False
-            
-            # Liste des lieux à essayer, par ordre de priorité
-            locations_to_try = []
-            
-            # Si des lieux sont disponibles dans la carte
-            if self.world_map.locations:
-                # Ajouter tous les IDs de villes de la base de données
-                try:
-                    from yaktaa.world.world_loader import WorldLoader
-                    world_loader = WorldLoader()
-                    conn = world_loader.get_connection()
-                    if conn:
-                        cursor = conn.cursor()
-                        cursor.execute("SELECT id FROM locations WHERE type = 'CITY' OR type = 'city'")
-                        for row in cursor.fetchall():
-                            location_id = row[0]
-                            if location_id not in locations_to_try and location_id in self.world_map.locations:
-                                locations_to_try.append(location_id)
-                except Exception as e:
-                    logger.warning(f"Impossible de récupérer les villes depuis la base de données: {str(e)}")
-                
-                # Ajouter tous les autres lieux de la carte comme fallback
-                for location_id in self.world_map.locations:
-                    if location_id not in locations_to_try:
-                        locations_to_try.append(location_id)
-                
-                # Essayer chaque lieu dans l'ordre jusqu'à en trouver un valide
-                for location_id in locations_to_try:
-                    if location_id in self.world_map.locations:
-                        self.current_location_id = location_id
-                        location_found = True
-                        logger.info(f"Position de départ définie: {location_id}")
-                        break
-                
-                # Si aucun lieu n'a été trouvé, prendre le premier disponible
-                if not location_found:
-                    self.current_location_id = next(iter(self.world_map.locations))
-                    logger.warning(f"Aucun lieu prioritaire trouvé, utilisation de: {self.current_location_id}")
-            else:
-                logger.warning("Aucun lieu trouvé dans le monde chargé")
-                self.current_location_id = None
-            
-            if self.current_location_id:
-                self.visited_locations.add(self.current_location_id)
-                self._discover_connected_locations()
+            # Définir le lieu de départ et les lieux déjà connus
+            self._choose_start_location()
             
             # Charger les missions de test si le jeu est initialisé
             if self.game and hasattr(self.game, 'mission_manager'):
@@ -112,6 +84,94 @@ class WorldManager:
             # Fallback sur le monde de test en cas d'erreur
             self._load_test_world()
     
+    def _choose_start_location(self):
+        """Définit le lieu de départ (premier lieu valide) et découvre ses voisins"""
+        location_found = False
+        
+        # Liste des lieux à essayer, par ordre de priorité
+        locations_to_try = []
+        
+        # Si des lieux sont disponibles dans la carte
+        if self.world_map.locations:
+            # Ajouter tous les IDs de villes de la base de données
+            try:
+                from yaktaa.world.world_loader import WorldLoader
+                world_loader = getattr(self.game, 'world_loader', None) or WorldLoader()
+                conn = world_loader.get_connection()
+                if conn:
+                    cursor = conn.cursor()
+                    cursor.execute("SELECT id FROM locations WHERE type = 'CITY' OR type = 'city'")
+                    for row in cursor.fetchall():
+                        location_id = row[0]
+                        if location_id not in locations_to_try and location_id in self.world_map.locations:
+                            locations_to_try.append(location_id)
+                    conn.close()
+            except Exception as e:
+                logger.warning(f"Impossible de récupérer les villes depuis la base de données: {str(e)}")
+            
+            # Ajouter tous les autres lieux de la carte comme fallback
+            for location_id in self.world_map.locations:
+                if location_id not in locations_to_try:
+                    locations_to_try.append(location_id)
+            
+            # Essayer chaque lieu dans l'ordre jusqu'à en trouver un valide
+            for location_id in locations_to_try:
+                if location_id in self.world_map.locations:
+                    self.current_location_id = location_id
+                    location_found = True
+                    logger.info(f"Position de départ définie: {location_id}")
+                    break
+            
+            # Si aucun lieu n'a été trouvé, prendre le premier disponible
+            if not location_found:
+                self.current_location_id = next(iter(self.world_map.locations))
+                logger.warning(f"Aucun lieu prioritaire trouvé, utilisation de: {self.current_location_id}")
+        else:
+            logger.warning("Aucun lieu trouvé dans le monde chargé")
+            self.current_location_id = None
+        
+        if self.current_location_id:
+            self.visited_locations.add(self.current_location_id)
+            self._discover_connected_locations()
+    
+    def reset_progress(self):
+        """
+        Réinitialise la progression du joueur dans le monde chargé (lieu actuel,
+        lieux visités et découverts) sans recharger la carte
+        """
+        self.visited_locations.clear()
+        self.discovered_locations.clear()
+        self._choose_start_location()
+
+    def to_save_data(self) -> Dict[str, Any]:
+        """Convertit la progression du joueur dans le monde en données de sauvegarde"""
+        current_location = self.get_current_location()
+        return {
+            "current_location_id": self.current_location_id,
+            "current_location": current_location.name if current_location else None,
+            "visited_locations": sorted(self.visited_locations),
+            "discovered_locations": sorted(self.discovered_locations)
+        }
+
+    def restore_save_data(self, data: Dict[str, Any]) -> None:
+        """
+        Restaure la progression d'une sauvegarde dans le monde chargé (sans recharger la carte).
+        Les lieux absents du monde chargé sont ignorés.
+
+        Args:
+            data: Données de sauvegarde du monde (voir to_save_data)
+        """
+        locations = self.world_map.locations
+        self.visited_locations = {loc_id for loc_id in data.get("visited_locations", []) if loc_id in locations}
+        self.discovered_locations = {loc_id for loc_id in data.get("discovered_locations", []) if loc_id in locations}
+
+        current_location_id = data.get("current_location_id")
+        if current_location_id in locations:
+            self.current_location_id = current_location_id
+        else:
+            logger.warning(f"Lieu sauvegardé introuvable dans le monde: {current_location_id}, retour au lieu de départ")
+            self._choose_start_location()
+
     def _load_test_world(self):
         """Charge une carte de test pour le développement"""
         # Utiliser notre nouveau générateur de monde de test
@@ -190,8 +250,39 @@ class WorldManager:
             return
         
         # Ajouter tous les lieux connectés aux lieux découverts
-        self.discovered_locations.update(current_location.connections)
-        logger.info(f"Lieux découverts depuis {current_location.name}: {len(current_location.connections)}")
+        connections = current_location.connections
+        self.discovered_locations.update(connections)
+        logger.info(f"Lieux découverts depuis {current_location.name}: {len(connections)}")
+        
+        # Reporter les connexions modifiées dans la table des routes (sans la reconstruire)
+        if self._travel_system is not None and self._travel_system.world_map is self.world_map:
+            self._travel_system.sync_routes()
+    
+    def advance_time(self, seconds: float) -> int:
+        """
+        Avance le monde d'une durée de jeu en un saut (voyage long, attente)
+        
+        Args:
+            seconds: Durée écoulée, en secondes de temps de jeu
+            
+        Returns:
+            Nombre d'évolutions des conditions de voyage appliquées
+        """
+        # Sans système de déplacement, aucune condition n'a encore été tirée
+        if self._travel_system is None or self._travel_system.world_map is not self.world_map:
+            return 0
+        return self._travel_system.advance_time(seconds / 3600.0)
+    
+    def get_travel_system(self) -> TravelSystem:
+        """
+        Récupère le système de déplacement du monde actuel; il n'est recréé qu'au
+        changement de monde, les modifications de connexions étant reportées par révision
+        """
+        if self._travel_system is None or self._travel_system.world_map is not self.world_map:
+            self._travel_system = TravelSystem(self.world_map)
+        else:
+            self._travel_system.sync_routes()
+        return self._travel_system
     
     def get_current_location(self) -> Optional[Location]:
         """Récupère le lieu actuel du joueur"""
@@ -212,6 +303,9 @@ class WorldManager:
             logger.warning(f"Tentative de voyage vers un lieu non connecté: {location_id}")
             return False
         
+        # Durée du trajet, dans les conditions de départ
+        travel_hours = self._get_travel_hours(self.current_location_id, location_id)
+        
         # Déplacer le joueur
         self.current_location_id = location_id
         self.visited_locations.add(location_id)
@@ -219,9 +313,47 @@ class WorldManager:
         # Découvrir les lieux connectés
         self._discover_connected_locations()
         
-        logger.info(f"Voyage vers {self.world_map.locations[location_id].name} réussi")
+        # Le temps de jeu avance d'un saut pendant le trajet
+        self._pass_time(travel_hours)
+        
+        logger.info(f"Voyage vers {self.world_map.locations[location_id].name} réussi ({travel_hours:.1f} h)")
         return True
     
+    def wait(self, hours: float) -> Dict[str, Any]:
+        """
+        Fait attendre le joueur sur place: le temps de jeu avance d'un saut
+        
+        Args:
+            hours: Durée de l'attente, en heures de jeu
+            
+        Returns:
+            Résumé du saut (voir Game.simulate_until)
+        """
+        logger.info(f"Attente de {hours:.1f} h à {self.current_location_id}")
+        return self._pass_time(hours)
+    
+    def _get_travel_hours(self, source_id: Optional[str], destination_id: str) -> float:
+        """Durée d'un trajet direct en heures: conditions actuelles si le système de déplacement existe"""
+        source = self.world_map.get_location(source_id) if source_id else None
+        connection_info = source.get_connection_info(destination_id) if source else None
+        if not connection_info:
+            return 0.0
+        
+        travel_system = self._travel_system
+        if travel_system is not None and travel_system.world_map is self.world_map:
+            travel_system.sync_routes()
+            routes = travel_system.routes.get(source_id, {}).get(destination_id)
+            if routes:
+                return travel_system.calculate_actual_travel_time(routes[0])
+        return float(connection_info.get("travel_time") or 0.0)
+    
+    def _pass_time(self, hours: float) -> Dict[str, Any]:
+        """Avance le jeu d'une durée en un seul saut (Game.simulate_until)"""
+        if hours <= 0 or not self.game or not hasattr(self.game, "simulate_until"):
+            return {}
+        self.game.update_game_time()
+        return self.game.simulate_until(self.game.game_time + hours * 3600.0)
+    
     def get_available_destinations(self) -> List[Location]:
         """Récupère les destinations disponibles depuis le lieu actuel"""
         if not self.current_location_id:
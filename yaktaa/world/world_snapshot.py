@@ -0,0 +1,215 @@
+"""
+Module de cache binaire des mondes de YakTaa
+Ce module enregistre le résultat de WorldLoader.load_world (carte du monde et
+personnages) dans un fichier binaire compact, pour que les démarrages suivants
+rechargent le monde sans requête SQL ni décodage JSON.
+"""
+
+import logging
+import os
+import pickle
+import re
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+logger = logging.getLogger("YakTaa.World.Snapshot")
+
+# En-tête des fichiers d'instantané et version de leur format.
+# Incrémenter SNAPSHOT_FORMAT_VERSION dès que les classes sérialisées changent.
+SNAPSHOT_MAGIC = b"YKWS"
+SNAPSHOT_FORMAT_VERSION = 6
+SNAPSHOT_EXTENSION = ".ykw"
+
+# Position du compteur de schéma dans l'en-tête d'un fichier SQLite
+# (identique à PRAGMA schema_version, lisible sans ouvrir de connexion)
+_SQLITE_HEADER = b"SQLite format 3\x00"
+_SQLITE_SCHEMA_COOKIE_OFFSET = 40
+
+
+def read_schema_version(db_path: Union[str, Path]) -> Optional[int]:
+    """
+    Lit la version du schéma directement dans l'en-tête du fichier SQLite
+
+    Args:
+        db_path: Chemin vers le fichier de base de données
+
+    Returns:
+        Version du schéma, ou None si le fichier n'est pas une base SQLite lisible
+    """
+    try:
+        with open(db_path, "rb") as f:
+            header = f.read(_SQLITE_SCHEMA_COOKIE_OFFSET + 4)
+    except OSError:
+        return None
+
+    if len(header) < _SQLITE_SCHEMA_COOKIE_OFFSET + 4 or not header.startswith(_SQLITE_HEADER):
+        return None
+    return struct.unpack(">I", header[_SQLITE_SCHEMA_COOKIE_OFFSET:])[0]
+
+
+class WorldSnapshotCache:
+    """
+    Cache d'instantanés binaires des mondes chargés.
+    Chaque instantané est associé au monde, au fichier de base de données, à sa
+    date de modification et à sa version de schéma; il est ignoré (et reconstruit
+    par l'appelant) dès que l'un d'eux change.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        """
+        Initialise le cache
+
+        Args:
+            cache_dir: Dossier où sont enregistrés les instantanés
+        """
+        self.cache_dir = Path(cache_dir)
+
+        # Statistiques
+        self.hits = 0
+        self.misses = 0
+
+    def _snapshot_path(self, world_id: str) -> Path:
+        """Chemin du fichier d'instantané d'un monde"""
+        safe_id = re.sub(r"[^A-Za-z0-9_.-]", "_", str(world_id))
+        return self.cache_dir / f"{safe_id}{SNAPSHOT_EXTENSION}"
+
+    def _make_key(self, world_id: str, db_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+        """
+        Construit la clé de validité d'un instantané
+
+        Args:
+            world_id: ID du monde
+            db_path: Chemin vers le fichier de base de données
+
+        Returns:
+            Clé de validité, ou None si la base de données est illisible
+        """
+        db_path = Path(db_path)
+        try:
+            mtime = os.stat(db_path).st_mtime_ns
+        except OSError:
+            return None
+
+        # Les écritures en mode WAL ne modifient que le journal
+        try:
+            wal_mtime = os.stat(f"{db_path}-wal").st_mtime_ns
+        except OSError:
+            wal_mtime = 0
+
+        schema_version = read_schema_version(db_path)
+        if schema_version is None:
+            return None
+
+        return {
+            "world_id": str(world_id),
+            "db_path": str(db_path.resolve()),
+            "mtime": mtime,
+            "wal_mtime": wal_mtime,
+            "schema_version": schema_version,
+        }
+
+    def load(self, world_id: str, db_path: Union[str, Path]) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """
+        Charge l'instantané d'un monde s'il est toujours valide
+
+        Args:
+            world_id: ID du monde
+            db_path: Chemin vers le fichier de base de données
+
+        Returns:
+            Tuple (carte du monde, personnages), ou None si aucun instantané valide
+        """
+        key = self._make_key(world_id, db_path)
+        path = self._snapshot_path(world_id)
+        if key is None or not path.exists():
+            self.misses += 1
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                header = f.read(len(SNAPSHOT_MAGIC) + 1)
+                if header[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC or header[-1] != SNAPSHOT_FORMAT_VERSION:
+                    logger.info(f"Instantané du monde {world_id} dans un format obsolète, reconstruction")
+                    self.misses += 1
+                    return None
+
+                stored_key = pickle.load(f)
+                if stored_key != key:
+                    logger.info(f"Instantané du monde {world_id} périmé, reconstruction")
+                    self.misses += 1
+                    return None
+
+                world_map, characters = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Instantané du monde {world_id} illisible ({path}): {e}")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        logger.info(f"Monde {world_id} chargé depuis l'instantané {path}")
+        return world_map, characters
+
+    def save(self, world_id: str, db_path: Union[str, Path], world_map: Any, characters: Dict[str, Any]) -> bool:
+        """
+        Enregistre l'instantané d'un monde
+
+        Args:
+            world_id: ID du monde
+            db_path: Chemin vers le fichier de base de données dont il est issu
+            world_map: Carte du monde chargée
+            characters: Personnages chargés
+
+        Returns:
+            True si l'instantané a été enregistré, False sinon
+        """
+        key = self._make_key(world_id, db_path)
+        if key is None:
+            return False
+
+        path = self._snapshot_path(world_id)
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+            # Écriture dans un fichier temporaire puis remplacement atomique,
+            # pour qu'un instantané ne soit jamais lu à moitié écrit
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(SNAPSHOT_MAGIC + bytes([SNAPSHOT_FORMAT_VERSION]))
+                pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump((world_map, characters), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            tmp_path = None
+
+            logger.info(f"Instantané du monde {world_id} enregistré: {path}")
+            return True
+        except Exception as e:
+            logger.warning(f"Impossible d'enregistrer l'instantané du monde {world_id}: {e}")
+            return False
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def invalidate(self, world_id: Optional[str] = None) -> None:
+        """
+        Supprime l'instantané d'un monde, ou tous les instantanés
+
+        Args:
+            world_id: ID du monde, ou None pour vider tout le cache
+        """
+        if world_id is not None:
+            paths = [self._snapshot_path(world_id)]
+        elif self.cache_dir.exists():
+            paths = list(self.cache_dir.glob(f"*{SNAPSHOT_EXTENSION}"))
+        else:
+            paths = []
+
+        for path in paths:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Impossible de supprimer l'instantané {path}: {e}")
@@ -21,6 +21,35 @@ logging.basicConfig(
 
 logger = logging.getLogger("YakTaa.WorldEditor.Database")
 
+# Migrations d'index versionnées, suivies via PRAGMA user_version.
+# Chaque entrée associe un numéro de version aux index à créer; une base déjà
+# migrée à cette version ne les recrée pas.
+INDEX_MIGRATIONS: List[Tuple[int, List[Tuple[str, str, str]]]] = [
+    (1, [
+        # (nom de l'index, table, colonnes)
+        ("idx_locations_world_id", "locations", "world_id"),
+        ("idx_locations_parent_location_id", "locations", "parent_location_id"),
+        ("idx_connections_world_id", "connections", "world_id"),
+        ("idx_connections_source_id", "connections", "source_id"),
+        ("idx_connections_destination_id", "connections", "destination_id"),
+        ("idx_characters_world_id", "characters", "world_id"),
+        ("idx_characters_location_id", "characters", "location_id"),
+        ("idx_devices_world_id", "devices", "world_id"),
+        ("idx_devices_location_id", "devices", "location_id"),
+        ("idx_files_world_id", "files", "world_id"),
+        ("idx_files_device_id", "files", "device_id"),
+        ("idx_shops_world_id", "shops", "world_id"),
+        ("idx_shops_location_id", "shops", "location_id"),
+        ("idx_shops_shop_type", "shops", "shop_type"),
+        ("idx_shop_inventory_shop_id", "shop_inventory", "shop_id, item_id"),
+        ("idx_buildings_world_id", "buildings", "world_id"),
+        ("idx_buildings_location_id", "buildings", "location_id"),
+        ("idx_rooms_building_id", "rooms", "building_id"),
+        ("idx_missions_world_id", "missions", "world_id"),
+        ("idx_missions_location_id", "missions", "location_id"),
+    ]),
+]
+
 class WorldDatabase:
     """
     Classe pour gérer la base de données des mondes YakTaa
@@ -47,6 +76,7 @@ class WorldDatabase:
         self._connect()
         self._create_tables()
         self._update_schema()
+        self._apply_index_migrations()
         
         logger.info(f"Base de données initialisée: {db_path}")
     
@@ -1435,6 +1465,45 @@ class WorldDatabase:
             logger.error(f"Erreur lors de la mise à jour du schéma: {str(e)}")
             raise
     
+    def _apply_index_migrations(self) -> None:
+        """
+        Applique les migrations d'index qui ne l'ont pas encore été.
+        La version appliquée est enregistrée dans PRAGMA user_version, seulement quand
+        tous les index de la migration (et des précédentes) existent: si une table ou
+        une colonne manque, la version n'avance pas et la migration est retentée à la
+        prochaine ouverture (CREATE INDEX IF NOT EXISTS rend la reprise sans effet pour
+        les index déjà créés).
+        """
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("PRAGMA user_version")
+            current_version = cursor.fetchone()[0]
+            complete = True  # Toutes les migrations appliquées jusqu'ici sont complètes
+            
+            for version, indexes in INDEX_MIGRATIONS:
+                if version <= current_version:
+                    continue
+                
+                logger.info(f"Application de la migration d'index {version}")
+                for index_name, table, columns in indexes:
+                    try:
+                        cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table}({columns})")
+                    except sqlite3.OperationalError as e:
+                        # Ancienne base sans la table ou la colonne: l'index sera retenté plus tard
+                        logger.warning(f"Index {index_name} non créé sur {table}({columns}): {str(e)}")
+                        complete = False
+                
+                if complete:
+                    cursor.execute(f"PRAGMA user_version = {version}")
+                    current_version = version
+                else:
+                    logger.warning(f"Migration d'index {version} incomplète: version du schéma laissée à {current_version}")
+                self.conn.commit()
+                
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            logger.error(f"Erreur lors de la migration des index: {str(e)}")
+    
     def close(self) -> None:
         """Ferme la connexion à la base de données"""
         if self.conn: